@@ -0,0 +1,108 @@
+"""
+청킹 스테이지
+파일 단위 지능형 청킹을 N개의 워커 프로세스로 분산하고, 결과를 피클 가능한 순수 데이터로 반환합니다.
+대상 ID 조회(범위가 없는 파일)와 DB 저장은 메인 프로세스(SourceAnalyzer)가 페이지 단위로 담당합니다.
+"""
+
+import hashlib
+import os
+import traceback
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterator, Tuple
+
+from phase1.core.worker_pool import WorkerPoolStage, worker_file_cache
+from phase1.llm.intelligent_chunker import IntelligentChunker, ChunkSpan
+from phase1.utils.file_content_cache import FileContentCache
+
+# 저장된 파서 범위로 청킹하는 확장자 (그 외 또는 범위가 없는 파일은 정규식 청킹)
+SPAN_CHUNK_SUFFIXES = ('.java', '.xml')
+
+# 워커 프로세스별 청커 (initializer에서 한 번만 생성)
+_WORKER_CHUNKER: Optional[IntelligentChunker] = None
+
+# (file_id, file_path, 저장된 범위 목록 또는 None)
+ChunkTask = Tuple[int, str, Optional[List[ChunkSpan]]]
+
+
+def chunk_source_file(chunker: IntelligentChunker, file_id: int, file_path: str,
+                      spans: Optional[List[ChunkSpan]] = None,
+                      file_cache: Optional[FileContentCache] = None) -> Dict[str, Any]:
+    """
+    단일 파일을 청킹하여 피클 가능한 결과 payload를 반환합니다.
+
+    Returns:
+        status(ok/missing/error), chunks([{'chunk', 'token_count', 'hash'}]), 오류 정보를 담은 dict
+    """
+    payload = {'file_id': file_id, 'file_path': file_path, 'status': 'ok', 'chunks': [],
+               'error_message': None, 'error_type': None, 'traceback': None}
+    try:
+        if not os.path.exists(file_path):
+            payload['status'] = 'missing'
+            return payload
+
+        cache = file_cache if file_cache is not None else FileContentCache(max_bytes=0)
+        content = cache.get_text(file_path)
+        if spans and Path(file_path).suffix.lower() in SPAN_CHUNK_SUFFIXES:
+            code_chunks = chunker.chunk_from_spans(file_path, content, spans)
+        else:
+            code_chunks = chunker.chunk_file(file_path, content)
+
+        for code_chunk in code_chunks:
+            text = code_chunk.content
+            payload['chunks'].append({
+                'chunk': code_chunk,
+                # 토큰 수 (간단한 추정)와 내용 해시
+                'token_count': len(text.split()) if text else 0,
+                'hash': hashlib.md5(text.encode('utf-8')).hexdigest() if text else '',
+            })
+    except Exception as e:
+        payload['status'] = 'error'
+        payload['chunks'] = []
+        payload['error_message'] = str(e)
+        payload['traceback'] = traceback.format_exc()
+        payload['error_type'] = type(e).__name__
+    return payload
+
+
+def _init_worker(config: Dict[str, Any]) -> None:
+    """워커 프로세스 초기화: 청커를 프로세스당 한 번만 생성합니다."""
+    global _WORKER_CHUNKER
+    _WORKER_CHUNKER = IntelligentChunker()
+
+
+def _chunk_task(task: ChunkTask) -> Dict[str, Any]:
+    """워커 프로세스에서 실행되는 청킹 작업"""
+    file_id, file_path, spans = task
+    return chunk_source_file(_WORKER_CHUNKER, file_id, file_path, spans, worker_file_cache())
+
+
+class ParallelChunkStage(WorkerPoolStage):
+    """
+    파일 청킹을 프로세스 풀로 분산하는 스테이지
+
+    - 워커 수는 processing.chunk_workers 설정을 따르며, 없으면 processing.max_workers를 사용합니다.
+    - with 블록 동안 프로세스 풀을 유지하므로 페이지마다 run()을 호출해도 풀을 다시 만들지 않습니다.
+    - 결과는 입력 순서대로 반환되므로 저장 순서(chunk_id)가 실행마다 동일합니다.
+    - 워커가 1 이하이면 현재 프로세스에서 순차 청킹하며, file_cache를 호출자와 공유합니다.
+    """
+
+    def __init__(self, config: Dict[str, Any], max_workers: Optional[int] = None,
+                 file_cache: Optional[FileContentCache] = None):
+        if max_workers is None:
+            processing = config.get('processing', {})
+            max_workers = processing.get('chunk_workers', processing.get('max_workers', 4))
+        super().__init__(config, max_workers, file_cache)
+        self._chunker: Optional[IntelligentChunker] = None
+
+    def _chunk_local(self, task: ChunkTask) -> Dict[str, Any]:
+        """현재 프로세스에서 실행되는 청킹 작업"""
+        if self._chunker is None:
+            self._chunker = IntelligentChunker()
+        file_id, file_path, spans = task
+        return chunk_source_file(self._chunker, file_id, file_path, spans, self._local_file_cache())
+
+    def run(self, tasks: List[ChunkTask]) -> Iterator[Dict[str, Any]]:
+        """
+        (file_id, file_path, spans) 목록을 청킹하여 payload를 순서대로 yield합니다.
+        """
+        return self._map(tasks, _chunk_task, _init_worker, self._chunk_local)
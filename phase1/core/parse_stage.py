@@ -0,0 +1,195 @@
+"""
+병렬 파싱 스테이지
+소스 파일 파싱을 N개의 워커 프로세스로 분산하고, 결과를 피클 가능한 순수 데이터로 반환합니다.
+DB 저장은 메인 프로세스의 단일 writer(SourceAnalyzer)가 담당합니다.
+"""
+
+import inspect
+import traceback
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterator, Tuple
+
+from phase1.core.worker_pool import WorkerPoolStage, worker_file_cache
+from phase1.utils.file_content_cache import FileContentCache
+
+# 파일 내용으로 XML 종류를 판별하기 위한 키워드
+MYBATIS_KEYWORDS = ('<mapper', '<select', '<insert', '<update', '<delete')
+SPRING_CONFIG_KEYWORDS = ('<beans', '<context:', '<mvc:', '<aop:')
+
+# 워커 프로세스별 파서 인스턴스 (initializer에서 한 번만 생성)
+_WORKER_PARSERS: Optional[Dict[str, Any]] = None
+
+
+def build_parsers(config: Dict[str, Any]) -> Dict[str, Any]:
+    """파싱 스테이지에서 사용하는 파서들을 설정에 따라 생성합니다."""
+    parsers_config = config.get('parsers', {})
+    parsers = {}
+    if parsers_config.get('java', {}).get('enabled', True):
+        from phase1.parsers.java.javaparser_enhanced import JavaParserEnhanced
+        parsers['java'] = JavaParserEnhanced(config)
+    if parsers_config.get('jsp', {}).get('enabled', True):
+        from phase1.parsers.jsp.jsp_parser import JSPParser
+        parsers['jsp_mybatis'] = JSPParser(config)
+    if parsers_config.get('sql', {}).get('enabled', True):
+        from phase1.parsers.sql_parser_simple import SimpleSQLParser
+        parsers['sql'] = SimpleSQLParser(config)
+    if parsers_config.get('mybatis', {}).get('enabled', True):
+        from phase1.parsers.mybatis.mybatis_parser import MyBatisParser
+        parsers['mybatis'] = MyBatisParser(config)
+    return parsers
+
+
+def select_parser_key(file_path: str, content: Optional[str]) -> Optional[str]:
+    """파일 확장자와 내용으로 사용할 파서 키를 결정합니다."""
+    file_ext = Path(file_path).suffix.lower()
+    if file_ext == '.java':
+        return 'java'
+    if file_ext == '.jsp':
+        return 'jsp_mybatis'
+    if file_ext == '.xml':
+        text = content or ''
+        if any(keyword in text for keyword in MYBATIS_KEYWORDS):
+            return 'mybatis'
+        if any(keyword in text for keyword in SPRING_CONFIG_KEYWORDS):
+            return 'spring'
+        return 'sql'
+    if file_ext == '.sql':
+        return 'sql'
+    if file_ext == '.properties':
+        return 'spring'
+    if file_ext == '.csv':
+        return 'csv'
+    return None
+
+
+def orm_to_plain(obj: Any) -> Dict[str, Any]:
+    """ORM 객체를 모델명 + 컬럼 값 + 부가 속성으로 구성된 dict로 변환합니다."""
+    from sqlalchemy import inspect as sa_inspect
+    mapper = sa_inspect(obj).mapper
+    columns = {attr.key: getattr(obj, attr.key) for attr in mapper.column_attrs}
+    # owner_fqn, _temp_sql_unit_key 등 파서가 붙인 임시 속성도 보존
+    extras = {k: v for k, v in vars(obj).items() if not k.startswith('_sa_') and k not in columns}
+    return {'model': type(obj).__name__, 'columns': columns, 'extras': extras}
+
+
+def plain_to_orm(data: Dict[str, Any]) -> Any:
+    """orm_to_plain()으로 변환된 dict를 다시 ORM 객체로 복원합니다."""
+    from phase1.models.database import Base
+    models = {mapper.class_.__name__: mapper.class_ for mapper in Base.registry.mappers}
+    model = models[data['model']]
+    # None 값은 넘기지 않아야 컬럼 기본값(created_at 등)이 적용됨
+    obj = model(**{k: v for k, v in data['columns'].items() if v is not None})
+    for key, value in data.get('extras', {}).items():
+        setattr(obj, key, value)
+    return obj
+
+
+def _invoke_parser(parser: Any, content: str, file_path: str, project_id: int) -> Any:
+    """파서 종류에 맞는 진입점을 호출합니다 (동기 파서 전용)."""
+    if hasattr(parser, 'parse'):
+        # project_id를 받는 파서(JavaParserEnhanced)와 받지 않는 파서(SimpleSQLParser) 구분
+        if 'project_id' in inspect.signature(parser.parse).parameters:
+            return parser.parse(content, file_path, project_id)
+        return parser.parse(content, file_path)
+    if hasattr(parser, 'parse_sql'):
+        return parser.parse_sql(content, {'file_path': file_path})
+    raise ValueError(f"지원되지 않는 파서 타입: {type(parser)}")
+
+
+def parse_source_file(parsers: Dict[str, Any], file_path: str, file_type: str, project_id: int,
+                      file_cache: Optional[FileContentCache] = None) -> Dict[str, Any]:
+    """
+    단일 파일을 파싱하여 피클 가능한 결과 payload를 반환합니다.
+    파일은 file_cache를 통해 한 번만 읽으며, 파일 선택/파싱/파일 정보가 같은 내용을 공유합니다.
+
+    Returns:
+        status(ok/no_parser/error), kind(java/jsp/generic/csv), result, file_info 등을 담은 dict
+    """
+    payload = {'file_path': file_path, 'file_type': file_type, 'status': 'ok', 'kind': None,
+               'result': None, 'file_info': None, 'error_message': None, 'error_type': None,
+               'traceback': None}
+    try:
+        if Path(file_path).suffix.lower() == '.csv':
+            payload['kind'] = 'csv'
+            return payload
+
+        cache = file_cache if file_cache is not None else FileContentCache(max_bytes=0)
+        file_content = cache.get(file_path)
+        content = file_content.text
+        payload['file_info'] = file_content.file_info
+
+        parser_key = select_parser_key(file_path, content)
+        parser = parsers.get(parser_key) if parser_key else None
+        if parser is None:
+            payload['status'] = 'no_parser'
+            return payload
+
+        if file_type == 'java' and hasattr(parser, 'parse_content'):
+            payload['kind'] = 'java'
+            payload['result'] = parser.parse_content(content, {'file_path': file_path})
+        elif file_type == 'jsp' and hasattr(parser, 'parse_file'):
+            payload['kind'] = 'jsp'
+            file_obj, *groups = parser.parse_file(file_path, project_id, content=content)
+            payload['result'] = {
+                'file_obj': orm_to_plain(file_obj),
+                'groups': [[orm_to_plain(o) for o in group] for group in groups],
+            }
+        else:
+            payload['kind'] = 'generic'
+            payload['result'] = _invoke_parser(parser, content, file_path, project_id)
+    except Exception as e:
+        payload['status'] = 'error'
+        payload['error_message'] = str(e)
+        payload['traceback'] = traceback.format_exc()
+        payload['error_type'] = type(e).__name__
+    return payload
+
+
+def _init_worker(config: Dict[str, Any]) -> None:
+    """워커 프로세스 초기화: 파서를 프로세스당 한 번만 생성합니다."""
+    global _WORKER_PARSERS
+    from phase1.parsers.mybatis.mybatis_parser import MyBatisParser
+    MyBatisParser.reset_global_cache()
+    _WORKER_PARSERS = build_parsers(config)
+
+
+def _parse_task(task: Tuple[str, str, int]) -> Dict[str, Any]:
+    """워커 프로세스에서 실행되는 파싱 작업"""
+    file_path, file_type, project_id = task
+    return parse_source_file(_WORKER_PARSERS, file_path, file_type, project_id, worker_file_cache())
+
+
+class ParallelParseStage(WorkerPoolStage):
+    """
+    파일 파싱을 프로세스 풀로 분산하는 스테이지
+
+    - max_workers는 processing.max_workers 설정을 따릅니다.
+    - 결과는 입력 순서대로 반환되므로 저장 순서(file_id)가 실행마다 동일합니다.
+    - 프로세스 풀은 run() 한 번 동안만 유지합니다.
+    - max_workers <= 1이면 현재 프로세스에서 순차 파싱하며, file_cache를 호출자와 공유합니다.
+      (워커 프로세스로 파싱하면 파일 내용은 워커에서 읽고 버리므로 이후 스테이지는 파일을 다시 읽습니다.)
+    """
+
+    def __init__(self, config: Dict[str, Any], parsers: Optional[Dict[str, Any]] = None,
+                 max_workers: Optional[int] = None, file_cache: Optional[FileContentCache] = None):
+        if max_workers is None:
+            max_workers = config.get('processing', {}).get('max_workers', 4)
+        super().__init__(config, max_workers, file_cache)
+        self.parsers = parsers
+
+    def _parse_local(self, task: Tuple[str, str, int]) -> Dict[str, Any]:
+        """현재 프로세스에서 실행되는 파싱 작업"""
+        if self.parsers is None:
+            self.parsers = build_parsers(self.config)
+        file_path, file_type, project_id = task
+        return parse_source_file(self.parsers, file_path, file_type, project_id, self._local_file_cache())
+
+    def run(self, files: List[Tuple[str, str]], project_id: int) -> Iterator[Dict[str, Any]]:
+        """
+        (file_path, file_type) 목록을 파싱하여 payload를 순서대로 yield합니다.
+        """
+        tasks = [(file_path, file_type, project_id) for file_path, file_type in files]
+        try:
+            yield from self._map(tasks, _parse_task, _init_worker, self._parse_local)
+        finally:
+            self.close()
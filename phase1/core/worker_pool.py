@@ -0,0 +1,79 @@
+"""
+워커 풀 스테이지 공통부
+파싱/청킹 스테이지가 공유하는 프로세스 풀 관리, 작업 묶음 크기 계산, 워커 프로세스의 파일 리더를 제공합니다.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Iterator, Callable
+
+from phase1.utils.file_content_cache import FileContentCache
+
+# 워커 프로세스의 파일 리더 (worker_file_cache()에서 프로세스당 한 번만 생성)
+# 워커는 파일마다 한 번만 읽고 메인 프로세스와 캐시를 공유할 수 없으므로 내용을 보관하지 않음 (max_bytes=0)
+_WORKER_FILE_CACHE: Optional[FileContentCache] = None
+
+
+def worker_file_cache() -> FileContentCache:
+    """워커 프로세스에서 사용할 파일 리더를 반환합니다."""
+    global _WORKER_FILE_CACHE
+    if _WORKER_FILE_CACHE is None:
+        _WORKER_FILE_CACHE = FileContentCache(max_bytes=0)
+    return _WORKER_FILE_CACHE
+
+
+class WorkerPoolStage:
+    """
+    작업 목록을 프로세스 풀로 분산하고 결과를 입력 순서대로 반환하는 스테이지 기반 클래스
+
+    - with 블록(또는 close() 호출) 동안 프로세스 풀을 유지하므로 여러 번 실행해도 풀을 다시 만들지 않습니다.
+    - 워커가 1 이하이거나 작업이 1개이면 현재 프로세스에서 순차 처리하며, file_cache를 호출자와 공유합니다.
+    - 워커 작업 함수와 initializer는 피클 가능하도록 모듈 수준 함수여야 합니다.
+    """
+
+    def __init__(self, config: Dict[str, Any], max_workers: int,
+                 file_cache: Optional[FileContentCache] = None):
+        self.config = config
+        self.file_cache = file_cache
+        self.max_workers = max(1, int(max_workers or 1))
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> 'WorkerPoolStage':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """프로세스 풀을 종료합니다."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _chunksize(self, task_count: int) -> int:
+        """IPC 오버헤드를 줄이기 위해 워커당 여러 작업을 묶어 전달"""
+        return max(1, min(64, task_count // (self.max_workers * 4)))
+
+    def _local_file_cache(self) -> FileContentCache:
+        """순차 처리에서 사용할 파일 캐시 (호출자가 넘긴 캐시가 없으면 설정으로 생성)"""
+        if self.file_cache is None:
+            self.file_cache = FileContentCache.from_config(self.config)
+        return self.file_cache
+
+    def _map(self, tasks: List[Any], worker_task: Callable[[Any], Dict[str, Any]],
+             initializer: Callable[[Dict[str, Any]], None],
+             local_task: Callable[[Any], Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        작업을 워커 풀(worker_task) 또는 현재 프로세스(local_task)에서 실행하여 결과를 순서대로 yield합니다.
+        """
+        if not tasks:
+            return
+
+        if self.max_workers <= 1 or len(tasks) == 1:
+            for task in tasks:
+                yield local_task(task)
+            return
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=min(self.max_workers, len(tasks)),
+                                                 initializer=initializer, initargs=(self.config,))
+        yield from self._executor.map(worker_task, tasks, chunksize=self._chunksize(len(tasks)))
@@ -0,0 +1,108 @@
+"""
+일괄(bulk) 저장기
+객체마다 session.flush()를 호출하는 대신 executemany 방식의 INSERT로 배치 저장합니다.
+생성된 ID는 배치 단위로 RETURNING을 통해 한 번에 받아옵니다.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import insert, inspect as sa_inspect
+
+from phase1.utils.logger import LoggerFactory
+
+
+class BulkWriter:
+    """
+    ORM 모델 단위 배치 INSERT 및 N개 파일 단위 커밋을 담당하는 저장기
+
+    - insert_objects(): 아직 세션에 추가되지 않은 ORM 객체들을 한 번의 executemany로 저장하고,
+      생성된 PK를 각 객체에 다시 설정합니다.
+    - insert_rows(): dict 목록을 그대로 저장합니다.
+    - file_done(): 파일 하나의 저장이 끝날 때 호출하며, commit_every개 파일마다 커밋합니다.
+    """
+
+    def __init__(self, session: Any, batch_size: int = 1000, commit_every: int = 0):
+        # AutoCommitSession 래퍼가 전달되면 내부 SQLAlchemy 세션을 사용
+        self.session = getattr(session, 'session', session)
+        self.batch_size = max(1, int(batch_size or 1))
+        self.commit_every = int(commit_every or 0)
+        self.pending_files = 0
+        self.logger = LoggerFactory.get_engine_logger()
+
+    @classmethod
+    def from_config(cls, session: Any, config: Dict[str, Any]) -> 'BulkWriter':
+        """processing.bulk_batch_size / processing.commit_every_files 설정으로 생성"""
+        processing = config.get('processing', {})
+        return cls(session,
+                   batch_size=processing.get('bulk_batch_size', 1000),
+                   commit_every=processing.get('commit_every_files', 50))
+
+    @staticmethod
+    def object_to_row(obj: Any) -> Dict[str, Any]:
+        """ORM 객체의 컬럼 값 중 설정된 값만 dict로 변환 (None은 컬럼 기본값이 적용되도록 제외)"""
+        mapper = sa_inspect(type(obj))
+        row = {}
+        for attr in mapper.column_attrs:
+            value = obj.__dict__.get(attr.key)
+            if value is not None:
+                row[attr.key] = value
+        return row
+
+    def _batches(self, items: List[Any]) -> Iterable[List[Any]]:
+        for i in range(0, len(items), self.batch_size):
+            yield items[i:i + self.batch_size]
+
+    def insert_rows(self, model: Any, rows: List[Dict[str, Any]], return_ids: bool = False) -> List[int]:
+        """
+        dict 목록을 배치 INSERT합니다.
+
+        Args:
+            model: ORM 모델 클래스
+            rows: 컬럼명 → 값 dict 목록
+            return_ids: True이면 입력 순서대로 생성된 PK 목록을 반환
+
+        Returns:
+            생성된 PK 목록 (return_ids=False이면 빈 리스트)
+        """
+        if not rows:
+            return []
+
+        ids: List[int] = []
+        pk_column = sa_inspect(model).primary_key[0]
+        for batch in self._batches(rows):
+            if return_ids:
+                stmt = insert(model).returning(pk_column, sort_by_parameter_order=True)
+                ids.extend(self.session.execute(stmt, batch).scalars().all())
+            else:
+                self.session.execute(insert(model), batch)
+        return ids
+
+    def insert_objects(self, objects: List[Any], return_ids: bool = True) -> List[int]:
+        """
+        같은 모델의 ORM 객체 목록을 배치 INSERT하고 생성된 PK를 객체에 설정합니다.
+
+        객체는 세션에 추가되지 않으며(transient), PK 값 전달 용도로만 사용됩니다.
+        """
+        if not objects:
+            return []
+
+        model = type(objects[0])
+        ids = self.insert_rows(model, [self.object_to_row(obj) for obj in objects], return_ids=return_ids)
+        if return_ids:
+            pk_key = sa_inspect(model).primary_key[0].key
+            for obj, new_id in zip(objects, ids):
+                setattr(obj, pk_key, new_id)
+        return ids
+
+    def file_done(self) -> None:
+        """파일 하나의 저장 완료를 기록하고, commit_every개마다 커밋합니다."""
+        self.pending_files += 1
+        if self.commit_every and self.pending_files >= self.commit_every:
+            self.commit()
+
+    def commit(self) -> None:
+        """누적된 변경 사항을 커밋합니다."""
+        if self.pending_files:
+            self.logger.debug(f"일괄 저장 커밋: 파일 {self.pending_files}개")
+        self.session.commit()
+        self.pending_files = 0
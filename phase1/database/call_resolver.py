@@ -0,0 +1,298 @@
+"""
+메서드 호출 해결기
+미해결 호출 엣지(edge_kind='call', dst_id IS NULL)를 집합 단위로 해결합니다.
+
+필요한 테이블(미해결 엣지, 호출 힌트, 상속/구현 엣지, 클래스/메서드)을 각각 한 번씩 읽어
+딕셔너리로 만든 뒤, 모든 호출을 한 번의 패스로 해결하고 결과를 일괄 UPDATE로 기록합니다.
+"""
+
+import json
+from collections import defaultdict, deque
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import and_, update
+
+from phase1.database.bulk_writer import BulkWriter
+from phase1.models.database import Edge, EdgeHint
+from phase1.utils.logger import LoggerFactory
+from phase1.utils.symbol_index import MethodSymbol, SymbolIndex
+
+
+def _load_json(text: Optional[str]) -> Dict[str, Any]:
+    if not text:
+        return {}
+    try:
+        data = json.loads(text)
+    except (TypeError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _package_of(method_fqn: Optional[str]) -> str:
+    """'pkg.Cls.method' 형태의 FQN에서 마지막 요소를 뗀 접두사"""
+    return ".".join(method_fqn.split('.')[:-1]) if method_fqn else ''
+
+
+class MethodCallResolver:
+    """
+    프로젝트 단위 메서드 호출 해결 엔진
+
+    후보 탐색 순서는 기존 엣지별 해결 로직과 같습니다.
+      1. 호출한 메서드가 속한 클래스의 같은 이름 메서드
+      2. called_name 자체가 FQN인 경우
+      3. qualifier 타입(FQN / 같은 패키지 / 같은 단순 클래스명)
+      4. qualifier를 상속·구현하는 모든 하위 클래스 (전이 폐포)
+      5. 이름 기반 전역 검색 (대상 클래스 접미사 또는 호출자 패키지로 한정)
+      6. JAR(외부 라이브러리) 메서드
+    해결되지 않은 호출은 신뢰도를 낮추고 후보 목록을 EdgeHint로 남깁니다.
+
+    미해결 엣지는 실행마다 다시 해결을 시도하므로, 신뢰도는 파싱 시점 값(meta의 parse_confidence)을
+    기준으로 계산하고 힌트는 (src 메서드, called_name)당 한 번만 남깁니다.
+    """
+
+    def __init__(self, session: Any, project_id: int, symbols: Optional[SymbolIndex] = None,
+                 batch_size: int = 1000):
+        self.session = getattr(session, 'session', session)
+        self.project_id = project_id
+        self.symbols = symbols
+        self.batch_size = batch_size
+        self.logger = LoggerFactory.get_engine_logger()
+        # 상속/구현 대상 이름(및 점 단위 접미사) → 직접 하위 class_id 목록
+        self._children: Dict[str, List[int]] = defaultdict(list)
+        self._descendants_cache: Dict[str, List[int]] = {}
+
+    # ------------------------------------------------------------------ 로드
+
+    def _load_unresolved(self) -> List[Tuple[int, str, int, Optional[str], float]]:
+        return self.session.query(
+            Edge.edge_id, Edge.src_type, Edge.src_id, Edge.meta, Edge.confidence
+        ).filter(
+            and_(
+                Edge.project_id == self.project_id,
+                Edge.edge_kind == 'call',
+                Edge.dst_id.is_(None)
+            )
+        ).all()
+
+    def _load_hints(self) -> Tuple[Dict[int, Dict[str, Any]], Set[Tuple[int, str]]]:
+        """src 메서드별 가장 최근 method_call 힌트와, 이미 힌트가 있는 (src 메서드, called_name) 집합"""
+        latest: Dict[int, Dict[str, Any]] = {}
+        hinted: Set[Tuple[int, str]] = set()
+        rows = self.session.query(EdgeHint.src_id, EdgeHint.hint).filter(
+            and_(
+                EdgeHint.project_id == self.project_id,
+                EdgeHint.src_type == 'method',
+                EdgeHint.hint_type == 'method_call'
+            )
+        ).order_by(EdgeHint.created_at, EdgeHint.hint_id)
+        for src_id, hint in rows:
+            data = _load_json(hint)
+            latest[src_id] = data
+            if data.get('called_name'):
+                hinted.add((src_id, data['called_name']))
+        return latest, hinted
+
+    def _load_inheritance(self) -> None:
+        """implements/extends 엣지를 한 번 읽어 대상 이름 → 하위 클래스 맵을 구성"""
+        rows = self.session.query(Edge.src_id, Edge.meta).filter(
+            and_(
+                Edge.project_id == self.project_id,
+                Edge.edge_kind.in_(['implements', 'extends'])
+            )
+        ).order_by(Edge.edge_id)
+        for src_id, meta in rows:
+            target = _load_json(meta).get('target')
+            if not target or src_id not in self.symbols.classes_by_id:
+                continue
+            # 'a.b.I' → 'a.b.I', 'b.I', 'I' (기존 target == q 또는 target.endswith('.q') 조건과 동일)
+            parts = target.split('.')
+            for i in range(len(parts)):
+                self._children['.'.join(parts[i:])].append(src_id)
+
+    def _descendants(self, qualifier: str) -> List[int]:
+        """qualifier를 직접 또는 간접적으로 상속/구현하는 클래스 ID (BFS 순서)"""
+        cached = self._descendants_cache.get(qualifier)
+        if cached is not None:
+            return cached
+
+        result: List[int] = []
+        seen: Set[int] = set()
+        queue = deque(self._children.get(qualifier, ()))
+        while queue:
+            class_id = queue.popleft()
+            if class_id in seen:
+                continue
+            seen.add(class_id)
+            result.append(class_id)
+            sub = self.symbols.classes_by_id[class_id]
+            if sub.fqn:
+                queue.extend(self._children.get(sub.fqn, ()))
+            if sub.name and sub.name != sub.fqn:
+                queue.extend(self._children.get(sub.name, ()))
+        self._descendants_cache[qualifier] = result
+        return result
+
+    # ------------------------------------------------------------------ 해결
+
+    def _candidate_fqns(self, src_method: MethodSymbol, called_name: str,
+                        qualifier: Optional[str], src_method_fqn: Optional[str]) -> List[str]:
+        symbols = self.symbols
+        candidates: List[str] = []
+
+        src_class = symbols.classes_by_id.get(src_method.class_id)
+        if src_class and src_class.fqn:
+            candidates.append(f"{src_class.fqn}.{called_name}")
+
+        if '.' in called_name:
+            candidates.append(called_name)
+
+        if qualifier:
+            if '.' in qualifier:
+                candidates.append(f"{qualifier}.{called_name}")
+            else:
+                src_package = _package_of(src_method_fqn)
+                if src_package:
+                    candidates.append(f"{src_package}.{qualifier}.{called_name}")
+                for cls in symbols.classes_named(qualifier):
+                    candidates.append(f"{cls.fqn}.{called_name}")
+
+            for class_id in self._descendants(qualifier):
+                candidates.append(f"{symbols.classes_by_id[class_id].fqn}.{called_name}")
+
+        # 순서를 유지하며 중복 제거
+        return list(dict.fromkeys(candidates))
+
+    def _global_lookup(self, called_name: str, src_method_fqn: Optional[str]) -> Optional[MethodSymbol]:
+        symbols = self.symbols
+        target_class_name = None
+        simple_name = called_name
+        if '.' in called_name:
+            target_class_name, simple_name = called_name.rsplit('.', 1)
+
+        candidates = symbols.methods_named(simple_name)
+        if target_class_name:
+            candidates = [m for m in candidates
+                          if (symbols.classes_by_id[m.class_id].fqn or '').endswith(target_class_name)]
+        else:
+            src_package = _package_of(src_method_fqn)
+            if src_package:
+                candidates = [m for m in candidates
+                              if (symbols.classes_by_id[m.class_id].fqn or '').startswith(f"{src_package}.")]
+        return candidates[0] if candidates else None
+
+    def _external_lookup(self, called_name: str) -> Optional[MethodSymbol]:
+        symbols = self.symbols
+        simple_name = called_name.rsplit('.', 1)[-1]
+        for method in symbols.methods_named(simple_name):
+            if symbols.file_language(symbols.classes_by_id[method.class_id].file_id) == 'jar':
+                return method
+        return None
+
+    def resolve(self) -> Dict[str, int]:
+        """
+        모든 미해결 호출 엣지를 해결합니다.
+
+        Returns:
+            {'processed', 'resolved', 'external', 'unresolved'} 건수
+        """
+        stats = {'processed': 0, 'resolved': 0, 'external': 0, 'unresolved': 0}
+        unresolved = self._load_unresolved()
+        stats['processed'] = len(unresolved)
+        if not unresolved:
+            return stats
+
+        if self.symbols is None:
+            self.symbols = SymbolIndex.build(self.session, self.project_id)
+        self._load_inheritance()
+        hints = hinted = None
+
+        updates: List[Dict[str, Any]] = []
+        new_hints: List[Dict[str, Any]] = []
+
+        for edge_id, src_type, src_id, meta, confidence in unresolved:
+            if src_type != 'method':
+                continue
+            src_method = self.symbols.methods_by_id.get(src_id)
+            if not src_method:
+                continue
+
+            # 1) Edge.meta(JSON) 우선, 2) 최근 EdgeHint 보조
+            md = _load_json(meta)
+            called_name = md.get('called_name') or ''
+            qualifier = md.get('callee_qualifier_type')
+            src_method_fqn = md.get('src_method_fqn')
+            if not called_name:
+                if hints is None:
+                    hints, hinted = self._load_hints()
+                hint_data = hints.get(src_id, {})
+                called_name = hint_data.get('called_name') or ''
+                qualifier = qualifier or hint_data.get('callee_qualifier_type')
+            if not called_name:
+                continue
+
+            confidence = confidence if confidence is not None else 1.0
+            # 가감은 파싱 시점 신뢰도 기준 (이전 실행의 가감이 누적되지 않도록 처음 본 값을 meta에 기록)
+            base = md.get('parse_confidence', confidence)
+            recorded = {}
+            if 'parse_confidence' not in md and (md or not meta):
+                recorded['meta'] = json.dumps({**md, 'parse_confidence': base}, ensure_ascii=False)
+            candidates = self._candidate_fqns(src_method, called_name, qualifier, src_method_fqn)
+
+            target = None
+            for fqn in candidates:
+                if '.' in fqn:
+                    target = self.symbols.find_method_by_fqn(fqn)
+                    if target:
+                        break
+            if not target:
+                target = self._global_lookup(called_name, src_method_fqn)
+
+            if target:
+                updates.append({'edge_id': edge_id, 'dst_type': 'method', 'dst_id': target.method_id,
+                                'confidence': min(1.0, base + 0.2), **recorded})
+                stats['resolved'] += 1
+                continue
+
+            external = self._external_lookup(called_name)
+            if external:
+                updates.append({'edge_id': edge_id, 'dst_type': 'method', 'dst_id': external.method_id,
+                                'confidence': min(1.0, base + 0.1), **recorded})
+                stats['external'] += 1
+                continue
+
+            # 해결되지 않은 호출은 신뢰도 감소 및 힌트 저장 (이전 실행에서 반영된 엣지/힌트는 그대로 둠)
+            stats['unresolved'] += 1
+            lowered = max(0.1, base - 0.3)
+            if recorded or abs(lowered - confidence) > 1e-9:
+                updates.append({'edge_id': edge_id, 'confidence': lowered, **recorded})
+            if hints is None:
+                hints, hinted = self._load_hints()
+            if (src_id, called_name) in hinted:
+                continue
+            hinted.add((src_id, called_name))
+            hint = {'called_name': called_name}
+            if qualifier:
+                hint['callee_qualifier_type'] = qualifier
+            if candidates:
+                hint['candidates'] = candidates
+            new_hints.append({
+                'project_id': self.project_id,
+                'src_type': 'method',
+                'src_id': src_id or 0,
+                'hint_type': 'method_call',
+                'hint': json.dumps(hint, ensure_ascii=False),
+                'confidence': lowered,
+            })
+
+        self._write(updates, new_hints)
+        return stats
+
+    def _write(self, updates: List[Dict[str, Any]], new_hints: List[Dict[str, Any]]) -> None:
+        """해결 결과를 PK 기준 일괄 UPDATE, 힌트는 일괄 INSERT로 기록"""
+        # 같은 컬럼 집합끼리 묶어야 하나의 executemany UPDATE로 실행됨
+        groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = defaultdict(list)
+        for row in updates:
+            groups[tuple(sorted(row))].append(row)
+        for group in groups.values():
+            self.session.execute(update(Edge), group)
+        BulkWriter(self.session, batch_size=self.batch_size).insert_rows(EdgeHint, new_hints)
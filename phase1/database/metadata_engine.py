@@ -25,6 +25,7 @@ from phase1.utils.logger import LoggerFactory, PerformanceLogger, ExceptionHandl
 from phase1.utils.confidence_calculator import ConfidenceCalculator, ParseResult as ConfidenceParseResult
 from phase1.llm.assist import LlmAssist
 from phase1.llm.enricher import generate_text
+from phase1.llm.response_cache import get_response_cache
 from phase1.database.llm_metadata_processor import LlmMetadataProcessor
 
 class MetadataEngine:
@@ -44,6 +45,8 @@ class MetadataEngine:
         
         # 병렬 처리 설정
         self.max_workers = config.get('processing', {}).get('max_workers', 4)
+        # purge_file_artifacts()가 삭제한 메서드/SQL 유닛의 LLM 요약 (restore_llm_summaries()가 새 행에 복사)
+        self._carried_summaries: Dict[str, Dict[tuple, List[tuple]]] = {'method': {}, 'sql_unit': {}}
 
     def _resolve_table_alias(self, table_name: str) -> str:
         """테이블 별칭을 실제 테이블명으로 변환"""
@@ -57,12 +60,6 @@ class MetadataEngine:
             
         # 매핑되지 않으면 원본 반환
         return table_name
-        
-        # 삭제된 파일 정리 확장 로드
-        try:
-            from database import metadata_engine_cleanup
-        except ImportError:
-            self.logger.debug("삭제된 파일 정리 확장 모듈을 로드할 수 없습니다")
     
     @asynccontextmanager
     async def _get_async_session(self):
@@ -824,244 +821,20 @@ class MetadataEngine:
             session.commit()
             
     async def _resolve_method_calls(self, session, project_id: int):
-        """메서드 호출 관계 해결"""
-        from phase1.models.database import EdgeHint, Method, Class, File
-        import json as _json
-        # 미해결된 메서드 호출 엣지들 조회
-        unresolved_calls = session.query(Edge).filter(
-            and_(
-                Edge.edge_kind == 'call',
-                Edge.dst_id.is_(None)
-            )
-        ).all()
+        """메서드 호출 관계 해결 (집합 단위 해결 후 일괄 UPDATE)"""
+        from phase1.database.call_resolver import MethodCallResolver
+        
+        resolver = MethodCallResolver(
+            session, project_id,
+            batch_size=self.config.get('processing', {}).get('bulk_batch_size', 1000)
+        )
+        stats = resolver.resolve()
         
-        for edge in unresolved_calls:
-            # 소스 메서드 정보 조회
-            if edge.src_type == 'method':
-                src_method = session.query(Method).filter(
-                    Method.method_id == edge.src_id
-                ).first()
-                
-                if src_method:
-                    md = {}
-                    called_method_name = ''
-                    qualifier = None
-                    src_method_fqn = None
-                    # 1) Edge.metadata(JSON) 우선 사용
-                    try:
-                        if getattr(edge, 'meta', None):
-                            md = _json.loads(edge.meta)
-                            called_method_name = md.get('called_name', '')
-                            qualifier = md.get('callee_qualifier_type')
-                            src_method_fqn = md.get('src_method_fqn')
-                    except Exception:
-                        called_method_name = ''
-                        qualifier = None
-                    # 2) EdgeHint 보조 사용
-                    if not called_method_name:
-                        hint_row = session.query(EdgeHint).filter(
-                            and_(
-                                EdgeHint.project_id == project_id,
-                                EdgeHint.src_type == 'method',
-                                EdgeHint.src_id == src_method.method_id,
-                                EdgeHint.hint_type == 'method_call'
-                            )
-                        ).order_by(EdgeHint.created_at.desc()).first()
-                        if hint_row:
-                            try:
-                                hint_data = _json.loads(hint_row.hint)
-                                called_method_name = hint_data.get('called_name', '')
-                                qualifier = qualifier or hint_data.get('callee_qualifier_type')
-                            except Exception:
-                                called_method_name = ''
-
-                    if called_method_name:
-                        candidate_fqns = []
-
-                        # 동일 클래스 우선 후보
-                        if src_method.class_ and src_method.class_.fqn:
-                            candidate_fqns.append(f"{src_method.class_.fqn}.{called_method_name}")
-
-                        # called_name 자체가 FQN일 경우
-                        if '.' in called_method_name:
-                            candidate_fqns.append(called_method_name)
-
-                        # qualifier 기반 후보 생성
-                        if qualifier:
-                            if '.' in qualifier:
-                                candidate_fqns.append(f"{qualifier}.{called_method_name}")
-                            else:
-                                # 동일 패키지 내 단일 클래스명
-                                if src_method_fqn:
-                                    src_package = ".".join(src_method_fqn.split('.')[:-1])
-                                    if src_package:
-                                        candidate_fqns.append(f"{src_package}.{qualifier}.{called_method_name}")
-                                # DB에서 동일 클래스명 검색
-                                classes = session.query(Class).join(File).filter(
-                                    and_(File.project_id == project_id, Class.name == qualifier)
-                                ).all()
-                                for cls in classes:
-                                    candidate_fqns.append(f"{cls.fqn}.{called_method_name}")
-
-                        # 인터페이스/추상 클래스 구현체 탐색
-                        if qualifier:
-                            impl_edges = session.query(Edge).filter(
-                                and_(
-                                    Edge.project_id == project_id,
-                                    Edge.edge_kind.in_(['implements', 'extends'])
-                                )
-                            ).all()
-                            for ie in impl_edges:
-                                try:
-                                    md_ie = _json.loads(ie.meta) if ie.meta else {}
-                                except Exception:
-                                    md_ie = {}
-                                target = md_ie.get('target')
-                                if target == qualifier or (target and target.endswith(f".{qualifier}")):
-                                    impl_class = session.query(Class).filter(
-                                        Class.class_id == ie.src_id
-                                    ).first()
-                                    if impl_class:
-                                        candidate_fqns.append(f"{impl_class.fqn}.{called_method_name}")
-
-                        # 중복 제거
-                        seen = set()
-                        unique_candidates = []
-                        for fqn in candidate_fqns:
-                            if fqn not in seen:
-                                unique_candidates.append(fqn)
-                                seen.add(fqn)
-
-                        target_method = None
-                        for fqn in unique_candidates:
-                            if '.' not in fqn:
-                                continue
-                            cls_fqn, m_name = fqn.rsplit('.', 1)
-                            target_method = session.query(Method).join(Class).join(File).filter(
-                                and_(
-                                    Method.name == m_name,
-                                    Class.fqn == cls_fqn,
-                                    File.project_id == project_id,
-                                )
-                            ).first()
-                        if target_method:
-                            break
-                        # 외부 라이브러리 메서드 검색 (임시 초기화)
-                        simple_called_name = called_method_name
-                        external_method = session.query(Method).join(Class).join(File).filter(
-                            and_(
-                                Method.name == simple_called_name,
-                                File.project_id == project_id,
-                                File.language == 'jar'
-                            )
-                        ).first()
-                        if external_method:
-                            edge.dst_type = 'method'
-                            edge.dst_id = external_method.method_id
-                            edge.confidence = min(1.0, edge.confidence + 0.1)
-                            self.logger.debug(
-                                f"외부 메서드 호출 해결: {src_method.name} -> {external_method.name}"
-                            )
-                            continue
-                        else:
-                            # 해결되지 않은 호출은 신뢰도 감소 및 힌트 저장
-                            edge.confidence = max(0.1, edge.confidence - 0.3)
-                            hint = {
-                                'called_name': called_method_name
-                            }
-                            if qualifier:
-                                hint['callee_qualifier_type'] = qualifier
-                            if unique_candidates:
-                                hint['candidates'] = unique_candidates
-                            session.add(EdgeHint(
-                                project_id=project_id,
-                                src_type='method',
-                                src_id=edge.src_id or 0,
-                                hint_type='method_call',
-                                hint=_json.dumps(hint, ensure_ascii=False),
-                                confidence=edge.confidence,
-                            ))
-                            self.logger.debug(
-                                f"미해결 메서드 호출: {src_method.name} -> {called_method_name} (qualifier={qualifier})"
-                            )
-
-                    session.commit()
-                    self.logger.info(f"메서드 호출 관계 해결 완료: {len(unresolved_calls)}개 처리")
-
-    async def _resolve_table_usage(self, session, project_id: int):
-
-                        # 기존 전역 검색 (패키지/임포트 기반) 보조
-                        if not target_method:
-                            target_class_name = None
-                            simple_called_name = called_method_name
-                            if '.' in called_method_name:
-                                parts = called_method_name.rsplit('.', 1)
-                                target_class_name = parts[0]
-                                simple_called_name = parts[1]
-
-                            query = session.query(Method).join(Class).join(File).filter(
-                                and_(
-                                    Method.name == simple_called_name,
-                                    File.project_id == project_id
-                                )
-                            )
-
-                            if target_class_name:
-                                query = query.filter(Class.fqn.like(f"%{target_class_name}"))
-                            elif src_method_fqn:
-                                src_package = ".".join(src_method_fqn.split('.')[:-1])
-                                if src_package:
-                                    query = query.filter(Class.fqn.like(f"{src_package}.%"))
-
-                            target_method = query.first()
-
-                        if target_method:
-                            edge.dst_type = 'method'
-                            edge.dst_id = target_method.method_id
-                            edge.confidence = min(1.0, edge.confidence + 0.2)  # 해결된 호출에 신뢰도 보너스
-
-                            self.logger.debug(f"메서드 호출 해결: {src_method.name} -> {target_method.name}")
-                        else:
-                            # 외부 라이브러리 메서드 검색
-                            external_method = session.query(Method).join(Class).join(File).filter(
-                                and_(
-                                    Method.name == simple_called_name,
-                                    File.project_id == project_id,
-                                    File.language == 'jar'
-                                )
-                            ).first()
-                            if external_method:
-                                edge.dst_type = 'method'
-                                edge.dst_id = external_method.method_id
-                                edge.confidence = min(1.0, edge.confidence + 0.1)
-                                self.logger.debug(
-                                    f"외부 메서드 호출 해결: {src_method.name} -> {external_method.name}"
-                                )
-                                # continue
-                            else:
-                                # 해결되지 않은 호출은 신뢰도 감소 및 힌트 저장
-                                edge.confidence = max(0.1, edge.confidence - 0.3)
-                                hint = {
-                                    'called_name': called_method_name
-                                }
-                                if qualifier:
-                                    hint['callee_qualifier_type'] = qualifier
-                                if unique_candidates:
-                                    hint['candidates'] = unique_candidates
-                                session.add(EdgeHint(
-                                    project_id=project_id,
-                                    src_type='method',
-                                    src_id=edge.src_id or 0,
-                                    hint_type='method_call',
-                                    hint=_json.dumps(hint, ensure_ascii=False),
-                                    confidence=edge.confidence,
-                                ))
-                                self.logger.debug(
-                                    f"미해결 메서드 호출: {src_method.name} -> {called_method_name} (qualifier={qualifier})"
-                                )
-                    
         session.commit()
-        self.logger.info(f"메서드 호출 관계 해결 완료: {len(unresolved_calls)}개 처리")
+        self.logger.info(
+            f"메서드 호출 관계 해결 완료: {stats['processed']}개 처리 "
+            f"(해결 {stats['resolved']}, 외부 {stats['external']}, 미해결 {stats['unresolved']})"
+        )
                     
     async def _resolve_table_usage(self, session, project_id: int):
         """테이블 사용 관계 해결"""
@@ -1408,7 +1181,8 @@ class MetadataEngine:
                     f"{snippet_block}"
                 )
                 try:
-                    text = generate_text(system, user, provider=provider, temperature=temperature, max_tokens=max_tokens, dry_run=dry_run)
+                    text = generate_text(system, user, provider=provider, temperature=temperature, max_tokens=max_tokens, dry_run=dry_run,
+                                         cache=get_response_cache(self.config), template='sql_unit_logic_summary')
                 except Exception as e:
                     self.logger.debug(f"LLM sql summary skipped: {u.sql_id}: {e}")
                     continue
@@ -1499,7 +1273,8 @@ class MetadataEngine:
                 system = f"너는 코드 요약 보조 AI다. 한국어({lang})로 한두 문장으로 메소드 역할을 추정 요약하라."
                 user = f"클래스: {getattr(cl, 'fqn', '')}\n메소드: {m.name}\n시그니처: {m.signature or ''}"
                 try:
-                    text = generate_text(system, user, provider=provider, temperature=temperature, max_tokens=max_tokens, dry_run=dry_run)
+                    text = generate_text(system, user, provider=provider, temperature=temperature, max_tokens=max_tokens, dry_run=dry_run,
+                                         cache=get_response_cache(self.config), template='method_logic_summary')
                 except Exception as e:
                     self.logger.debug(f"LLM method summary skipped: {m.method_id}: {e}")
                     continue
@@ -1539,7 +1314,8 @@ class MetadataEngine:
                 system = f"너는 JSP 화면/서버 코드 요약 보조 AI다. 한국어({lang})로 이 파일의 역할을 한두 문장으로 요약하라."
                 user = f"<JSP>\n{snippet}\n</JSP>"
                 try:
-                    summary = generate_text(system, user, provider=provider, temperature=temperature, max_tokens=max_tokens, dry_run=dry_run)
+                    summary = generate_text(system, user, provider=provider, temperature=temperature, max_tokens=max_tokens, dry_run=dry_run,
+                                            cache=get_response_cache(self.config), template='jsp_summary')
                 except Exception as e:
                     self.logger.debug(f"LLM jsp summary skipped: {f.path}: {e}")
                     continue
@@ -1613,7 +1389,8 @@ class MetadataEngine:
                     "스키마: {\n  \"pk_table\": str, \"pk_column\": str, \n  \"fk_table\": str, \"fk_column\": str, \n  \"confidence\": 0.0..1.0\n}"
                 )
                 try:
-                    text = generate_text(system, user, provider=provider, temperature=temperature, max_tokens=max_tokens)
+                    text = generate_text(system, user, provider=provider, temperature=temperature, max_tokens=max_tokens,
+                                         cache=get_response_cache(self.config), template='join_pk_fk_direction')
                     data = _coerce_json(text if isinstance(text, str) else str(text))
                     pk_table = (data.get('pk_table') or '').upper()
                     pk_column = (data.get('pk_column') or '').upper()
@@ -1670,15 +1447,19 @@ class MetadataEngine:
             session.commit()
         return created
 
-    async def check_file_changes(self, project_id: int) -> List[Tuple[str, str]]:
+    async def check_file_changes(self, project_id: int, file_paths: Optional[List[str]] = None) -> List[Tuple[str, str]]:
         """
         파일 변경 사항 확인 (증분 분석용)
         
+        저장된 mtime이 같으면 해시 계산을 생략하고, 다르면 MD5 해시로 실제 변경 여부를 판단합니다.
+        내용이 같고 mtime만 바뀐 파일은 mtime만 갱신합니다.
+        
         Args:
             project_id: 프로젝트 ID
+            file_paths: 현재 수집된 소스 파일 경로 목록 (None이면 DB에 등록된 파일만 검사)
             
         Returns:
-            (파일경로, 변경타입) 튜플 리스트
+            (파일경로, 변경타입) 튜플 리스트. 변경타입은 'added', 'modified', 'deleted'
         """
         
         session = self.db_manager.get_session()
@@ -1686,25 +1467,292 @@ class MetadataEngine:
         try:
             changes = []
             
-            # DB에 있는 파일들
-            db_files = {f.path: f.hash for f in session.query(File).filter(
-                File.project_id == project_id
+            # JAR 파일은 소스 수집 대상이 아니므로 비교에서 제외
+            db_files = {f.path: f for f in session.query(File).filter(
+                and_(File.project_id == project_id, File.language != 'jar')
             ).all()}
             
-            # 실제 파일 시스템의 파일들과 비교
-            project = session.query(Project).filter(
-                Project.project_id == project_id
-            ).first()
+            current_paths = list(file_paths) if file_paths is not None else list(db_files.keys())
+            touched = 0
             
-            if project:
-                # 실제 구현에서는 파일 시스템 스캔 로직 필요
-                pass
+            for path in current_paths:
+                file_obj = db_files.get(path)
+                if file_obj is None:
+                    changes.append((path, 'added'))
+                    continue
+                if not os.path.exists(path):
+                    changes.append((path, 'deleted'))
+                    continue
                 
+                mtime = datetime.fromtimestamp(os.path.getmtime(path))
+                if file_obj.mtime is not None and file_obj.mtime == mtime:
+                    continue
+                
+                if self._calculate_file_hash(path) != file_obj.hash:
+                    changes.append((path, 'modified'))
+                else:
+                    file_obj.mtime = mtime
+                    touched += 1
+            
+            if file_paths is not None:
+                current = set(current_paths)
+                changes.extend((path, 'deleted') for path in db_files if path not in current)
+            
+            if touched:
+                session.commit()
+                self.logger.debug(f"내용 변경 없이 mtime만 바뀐 파일 {touched}개 갱신")
+            
             return changes
             
         finally:
             session.close()
     
+    def _calculate_file_hash(self, file_path: str) -> str:
+        """파일 MD5 해시 계산 (SourceAnalyzer 저장 시와 동일한 방식)"""
+        md5 = hashlib.md5()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                md5.update(block)
+        return md5.hexdigest()
+    
+    @staticmethod
+    def _id_batches(ids, batch_size: int):
+        ids = list(ids)
+        for i in range(0, len(ids), batch_size):
+            yield ids[i:i + batch_size]
+    
+    def _collect_file_artifact_ids(self, session, project_id: int, file_paths: List[str],
+                                   batch_size: int) -> Tuple[List[int], Dict[str, List[int]]]:
+        """
+        파일 경로 목록에서 파생된 엔티티 ID를 조회합니다.
+        
+        Returns:
+            (file_id 목록, 엔티티 타입별 ID 목록 - 엣지/청크/요약의 target_type 기준)
+        """
+        batches = lambda ids: self._id_batches(ids, batch_size)
+        file_ids = []
+        for batch in batches(set(file_paths)):
+            file_ids.extend(row[0] for row in session.query(File.file_id).filter(
+                and_(File.project_id == project_id, File.path.in_(batch))
+            ))
+        
+        class_ids, sql_ids, method_ids = [], [], []
+        for batch in batches(file_ids):
+            class_ids.extend(row[0] for row in session.query(Class.class_id).filter(Class.file_id.in_(batch)))
+            sql_ids.extend(row[0] for row in session.query(SqlUnit.sql_id).filter(SqlUnit.file_id.in_(batch)))
+        for batch in batches(class_ids):
+            method_ids.extend(row[0] for row in session.query(Method.method_id).filter(Method.class_id.in_(batch)))
+        
+        targets = {
+            'file': file_ids, 'jsp': file_ids,
+            'class': class_ids, 'interface': class_ids,
+            'method': method_ids, 'sql_unit': sql_ids,
+        }
+        return file_ids, targets
+    
+    async def find_edge_dependent_files(self, project_id: int, file_paths: List[str],
+                                        batch_size: int = 500) -> set:
+        """
+        변경/삭제될 파일의 엔티티를 가리키는 생성 엣지의 소스 파일 ID를 조회합니다 (증분 엣지 재생성용).
+        
+        purge_file_artifacts()가 이 엣지들을 함께 삭제하므로, 해당 소스 파일의 엣지도 다시 생성해야 합니다.
+        purge 이전에 호출해야 합니다.
+        """
+        if not file_paths:
+            return set()
+        
+        with self.db_manager.get_auto_commit_session() as session:
+            file_ids, targets = self._collect_file_artifact_ids(session, project_id, file_paths, batch_size)
+            dependents = set()
+            for target_type, ids in targets.items():
+                for batch in self._id_batches(ids, batch_size):
+                    dependents.update(row[0] for row in session.query(Edge.src_file_id).filter(and_(
+                        Edge.project_id == project_id,
+                        Edge.dst_type == target_type,
+                        Edge.dst_id.in_(batch),
+                        Edge.src_file_id.isnot(None),
+                    )).distinct())
+        return dependents - set(file_ids)
+    
+    def _carry_llm_summaries(self, session, method_ids: List[int], sql_ids: List[int], batch_size: int) -> None:
+        """
+        삭제할 메서드/SQL 유닛의 LLM 요약(요약, 신뢰도, 소스 구간 해시)을 논리 키로 보관합니다.
+        
+        키: 메서드는 (파일 경로, 클래스 FQN, 시그니처 또는 이름), SQL 유닛은 (파일 경로, 매퍼 네임스페이스, stmt_id)
+        """
+        queries = {
+            'method': (method_ids, lambda b: session.query(
+                File.path, Class.fqn, func.coalesce(Method.signature, Method.name),
+                Method.llm_summary, Method.llm_summary_confidence, Method.llm_summary_hash
+            ).join(Class, Method.class_id == Class.class_id).join(File, Class.file_id == File.file_id).filter(
+                Method.method_id.in_(b), Method.llm_summary.isnot(None)).order_by(Method.method_id)),
+            'sql_unit': (sql_ids, lambda b: session.query(
+                File.path, SqlUnit.mapper_ns, SqlUnit.stmt_id,
+                SqlUnit.llm_summary, SqlUnit.llm_summary_confidence, SqlUnit.llm_summary_hash
+            ).join(File, SqlUnit.file_id == File.file_id).filter(
+                SqlUnit.sql_id.in_(b), SqlUnit.llm_summary.isnot(None)).order_by(SqlUnit.sql_id)),
+        }
+        for kind, (ids, query_factory) in queries.items():
+            carried = self._carried_summaries[kind]
+            for batch in self._id_batches(ids, batch_size):
+                for path, owner, name, summary, confidence, summary_hash in query_factory(batch):
+                    carried.setdefault((path, owner, name), []).append((summary, confidence, summary_hash))
+    
+    async def restore_llm_summaries(self, project_id: int, batch_size: int = 500) -> int:
+        """
+        purge_file_artifacts()가 보관한 LLM 요약을 재분석으로 새로 저장된 메서드/SQL 유닛에 복사합니다 (증분 분석용).
+        
+        llm_summary_hash도 함께 복사하므로 소스 구간이 바뀌지 않은 항목은 요약기가 다시 요약하지 않고,
+        바뀐 항목은 해시가 달라 다시 요약됩니다. 같은 키의 항목이 여러 개이면 PK 순서대로 대응시킵니다.
+        
+        Returns:
+            요약을 복사한 행 수
+        """
+        carried = self._carried_summaries
+        self._carried_summaries = {'method': {}, 'sql_unit': {}}
+        paths = sorted({key[0] for entries in carried.values() for key in entries})
+        if not paths:
+            return 0
+        
+        restored = 0
+        session = self.db_manager.get_session()
+        try:
+            queries = {
+                'method': (Method, 'method_id', lambda b: session.query(
+                    Method.method_id, File.path, Class.fqn, func.coalesce(Method.signature, Method.name)
+                ).join(Class, Method.class_id == Class.class_id).join(File, Class.file_id == File.file_id).filter(
+                    File.project_id == project_id, File.path.in_(b), Method.llm_summary.is_(None)
+                ).order_by(Method.method_id)),
+                'sql_unit': (SqlUnit, 'sql_id', lambda b: session.query(
+                    SqlUnit.sql_id, File.path, SqlUnit.mapper_ns, SqlUnit.stmt_id
+                ).join(File, SqlUnit.file_id == File.file_id).filter(
+                    File.project_id == project_id, File.path.in_(b), SqlUnit.llm_summary.is_(None)
+                ).order_by(SqlUnit.sql_id)),
+            }
+            for kind, (model, pk_name, query_factory) in queries.items():
+                entries = carried[kind]
+                if not entries:
+                    continue
+                updates = []
+                for batch in self._id_batches(paths, batch_size):
+                    for pk, path, owner, name in query_factory(batch):
+                        values = entries.get((path, owner, name))
+                        if not values:
+                            continue
+                        summary, confidence, summary_hash = values.pop(0)
+                        updates.append({pk_name: pk, 'llm_summary': summary,
+                                        'llm_summary_confidence': confidence, 'llm_summary_hash': summary_hash})
+                for batch in self._id_batches(updates, batch_size):
+                    session.bulk_update_mappings(model, batch)
+                restored += len(updates)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+        self.logger.info(f"증분 분석 LLM 요약 복원: {restored}개")
+        return restored
+    
+    async def purge_file_artifacts(self, project_id: int, file_paths: List[str], batch_size: int = 500) -> int:
+        """
+        변경/삭제된 파일에서 파생된 메타데이터를 일괄 삭제 (증분 분석용)
+        
+        파일 단위 루프 대신 ID 집합을 한 번에 조회하여 IN 조건으로 삭제합니다.
+        삭제 대상: 엣지, 조인/필터, SQL 유닛, 메서드, 클래스, 청크/임베딩, 요약/보강 로그,
+        파싱 결과, import 정보, 파일 레코드
+        메서드/SQL 유닛의 LLM 요약은 삭제 전에 보관하며, 재분석 후 restore_llm_summaries()로 새 행에 복사합니다.
+        다른 파일의 메서드가 이 파일의 메서드를 가리키던 파싱 단계 호출 엣지(src_file_id 없음)는 삭제하지 않고
+        dst_id만 비워, build_dependency_graph()의 호출 해결기가 재분석된 메서드로 다시 연결하도록 합니다.
+        
+        Args:
+            project_id: 프로젝트 ID
+            file_paths: 정리할 파일 경로 목록
+            batch_size: IN 조건 하나에 넣을 최대 ID 수 (SQLite 변수 개수 제한 대비)
+            
+        Returns:
+            정리된 파일 수
+        """
+        from phase1.models.database import Chunk, Embedding, JavaImport, EdgeHint, DuplicateInstance
+        
+        if not file_paths:
+            return 0
+        
+        def batches(ids):
+            return self._id_batches(ids, batch_size)
+        
+        def delete_in(query_factory, ids):
+            deleted = 0
+            for batch in batches(ids):
+                deleted += query_factory(batch).delete(synchronize_session=False)
+            return deleted
+        
+        session = self.db_manager.get_session()
+        
+        try:
+            # 엔티티 타입별 ID 집합 (엣지/청크/요약의 target_type 기준)
+            file_ids, targets = self._collect_file_artifact_ids(session, project_id, file_paths, batch_size)
+            if not file_ids:
+                return 0
+            class_ids, method_ids, sql_ids = targets['class'], targets['method'], targets['sql_unit']
+            
+            for target_type, ids in targets.items():
+                if not ids:
+                    continue
+                delete_in(lambda b: session.query(Edge).filter(and_(
+                    Edge.project_id == project_id, Edge.src_type == target_type, Edge.src_id.in_(b))), ids)
+                if target_type == 'method':
+                    # 이 파일들 밖에서 들어오는 호출 엣지는 미해결 상태로 되돌림 (호출 파일은 다시 파싱하지 않으므로)
+                    for batch in batches(ids):
+                        session.query(Edge).filter(and_(
+                            Edge.project_id == project_id, Edge.edge_kind == 'call', Edge.src_file_id.is_(None),
+                            Edge.dst_type == 'method', Edge.dst_id.in_(batch)
+                        )).update({Edge.dst_id: None}, synchronize_session=False)
+                delete_in(lambda b: session.query(Edge).filter(and_(
+                    Edge.project_id == project_id, Edge.dst_type == target_type, Edge.dst_id.in_(b))), ids)
+                delete_in(lambda b: session.query(EdgeHint).filter(and_(
+                    EdgeHint.project_id == project_id, EdgeHint.src_type == target_type, EdgeHint.src_id.in_(b))), ids)
+                
+                chunk_ids = []
+                for batch in batches(ids):
+                    chunk_ids.extend(row[0] for row in session.query(Chunk.chunk_id).filter(
+                        and_(Chunk.target_type == target_type, Chunk.target_id.in_(batch))))
+                delete_in(lambda b: session.query(Embedding).filter(Embedding.chunk_id.in_(b)), chunk_ids)
+                delete_in(lambda b: session.query(Chunk).filter(Chunk.chunk_id.in_(b)), chunk_ids)
+                
+                for model in (Summary, EnrichmentLog, VulnerabilityFix):
+                    delete_in(lambda b: session.query(model).filter(and_(
+                        model.target_type == target_type, model.target_id.in_(b))), ids)
+            
+            # 재분석으로 다시 만들어질 메서드/SQL 유닛의 요약을 보관 (소스 구간이 같으면 다시 요약하지 않도록)
+            self._carry_llm_summaries(session, method_ids, sql_ids, batch_size)
+            
+            # 이 파일들에서 도출된 생성 엣지 (소스 엔티티 타입과 무관)
+            delete_in(lambda b: session.query(Edge).filter(and_(
+                Edge.project_id == project_id, Edge.src_file_id.in_(b))), file_ids)
+            delete_in(lambda b: session.query(Join).filter(Join.sql_id.in_(b)), sql_ids)
+            delete_in(lambda b: session.query(RequiredFilter).filter(RequiredFilter.sql_id.in_(b)), sql_ids)
+            delete_in(lambda b: session.query(SqlUnit).filter(SqlUnit.sql_id.in_(b)), sql_ids)
+            delete_in(lambda b: session.query(Method).filter(Method.method_id.in_(b)), method_ids)
+            delete_in(lambda b: session.query(Class).filter(Class.class_id.in_(b)), class_ids)
+            for model in (ParseResultModel, JavaImport, DuplicateInstance):
+                delete_in(lambda b: session.query(model).filter(model.file_id.in_(b)), file_ids)
+            delete_in(lambda b: session.query(File).filter(File.file_id.in_(b)), file_ids)
+            
+            session.commit()
+            self.logger.info(
+                f"파일 메타데이터 정리 완료: 파일 {len(file_ids)}개, 클래스 {len(class_ids)}개, "
+                f"메서드 {len(method_ids)}개, SQL 유닛 {len(sql_ids)}개"
+            )
+            return len(file_ids)
+        
+        except Exception as e:
+            session.rollback()
+            self.logger.error(f"파일 메타데이터 정리 중 오류: {e}")
+            raise
+        finally:
+            session.close()
+    
     def _create_minimal_table_from_join(self, session, join, default_owner: str, project_id: int) -> Optional[DbTable]:
         """
         조인에서 발견된 누락 테이블의 최소 메타정보 생성 (개선됨)
@@ -1,12 +1,12 @@
-import hashlib
 import json
 import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
-from phase1.llm.client import get_client
+from phase1.llm.client import get_client, configured_model_name
 from phase1.llm import prompt_templates as T
+from phase1.llm.response_cache import get_response_cache, template_id
 from phase1.utils.confidence_calculator import ConfidenceCalculator
 from phase1.models.database import EnrichmentLog
 
@@ -70,7 +70,8 @@ class LlmAssist:
             ollama_host=llm_cfg.get("ollama_host"),
             ollama_model=llm_cfg.get("ollama_model"),
         )
-        Path(self.cfg.cache_dir).mkdir(parents=True, exist_ok=True)
+        # 응답 캐시는 모든 LLM 호출 지점이 공유 (llm_cache 설정, 첫 호출 때 열림)
+        self.full_config = config or {}
         self.calls_made = 0
         # 환경 변수 브리징: config 값이 존재하면 env로 주입하여 client가 참조할 수 있게 함
         self.calls_made = 0
@@ -131,44 +132,25 @@ class LlmAssist:
         tail = lines[-max_lines // 2 :]
         return "\n".join(head + ["\n/* ...snip... */\n"] + tail)
 
-    def _cache_key(self, file_path: str, prompt_id: str) -> str:
-        try:
-            data = Path(file_path).read_bytes()
-        except Exception:
-            data = b""
-        sha = hashlib.sha256(data + prompt_id.encode("utf-8")).hexdigest()
-        return sha
-
     def _call_or_cache(self, file_path: str, prompt_id: str, system: str, user: str) -> Tuple[Dict[str, Any], str]:
-        key = self._cache_key(file_path, prompt_id)
-        cache_path = Path(self.cfg.cache_dir) / f"{key}.json"
-        raw_path = Path(self.cfg.cache_dir) / f"{key}.raw.txt"
-        if self.cfg.cache and cache_path.exists():
-            try:
-                data = json.loads(cache_path.read_text(encoding="utf-8", errors="ignore"))
-                raw = raw_path.read_text(encoding="utf-8", errors="ignore") if raw_path.exists() else json.dumps(data, ensure_ascii=False)
-                return data, raw
-            except Exception:
-                pass
         if self.cfg.dry_run:
-            # Minimal plausible JSON for both schemas
+            # Minimal plausible JSON for both schemas (드라이런 결과는 캐시하지 않음)
             if "java" in prompt_id:
                 data = {"classes": [{"name": "Sample", "methods": [{"name": "run"}]}]}
             else:
                 data = {"sql_units": [{"stmt_kind": "select", "tables": ["DUAL"], "joins": [], "filters": []}]}
-            raw = json.dumps(data, ensure_ascii=False)
-        else:
-            provider_setting = self.cfg.provider
-            provider = None if provider_setting == "auto" else provider_setting
-            messages = [{"role": "system", "content": system}, {"role": "user", "content": user}]
-            data = {}
-            raw = ""
+            return data, json.dumps(data, ensure_ascii=False)
+
+        provider_setting = self.cfg.provider
+        provider = None if provider_setting == "auto" else provider_setting
+        messages = [{"role": "system", "content": system}, {"role": "user", "content": user}]
+
+        def call() -> str:
             try:
+                # 클라이언트는 캐시 미스일 때만 생성 (get_client는 Ollama 서버에 모델 존재 여부를 조회함)
                 client = get_client(provider)
                 raw_resp = client.chat(messages, stream=False, temperature=self.cfg.temperature, max_tokens=self.cfg.max_tokens)
-                text = raw_resp.strip() if isinstance(raw_resp, str) else str(raw_resp)
-                data = self._coerce_json(text)
-                raw = text
+                return raw_resp.strip() if isinstance(raw_resp, str) else str(raw_resp)
             except Exception as e:
                 # vLLM이 폐쇄망 등으로 접근 불가 시 Ollama로 폴백
                 if self.cfg.fallback_to_ollama and provider in ("vllm", "openai"):
@@ -178,17 +160,18 @@ class LlmAssist:
                         pass
                     client2 = get_client("ollama")
                     raw_resp2 = client2.chat(messages, stream=False, temperature=self.cfg.temperature, max_tokens=self.cfg.max_tokens)
-                    text2 = raw_resp2.strip() if isinstance(raw_resp2, str) else str(raw_resp2)
-                    data = self._coerce_json(text2)
-                    raw = text2
-                else:
-                    raise
-        try:
-            cache_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
-            raw_path.write_text(raw, encoding="utf-8")
-        except Exception:
-            pass
-        return data, raw
+                    return raw_resp2.strip() if isinstance(raw_resp2, str) else str(raw_resp2)
+                raise
+
+        response_cache = get_response_cache(self.full_config) if self.cfg.cache else None
+        if response_cache is not None:
+            # 키: (설정의 모델, 프롬프트 템플릿과 본문 다이제스트, 스니펫 내용) - 캐시 적중 시 LLM 서버에 접속하지 않음
+            template = template_id(prompt_id, system, T.USER_TEMPLATES.get(prompt_id, ''),
+                                   temperature=self.cfg.temperature, max_tokens=self.cfg.max_tokens)
+            raw = response_cache.get_or_call(configured_model_name(provider), template, user, call)
+        else:
+            raw = call()
+        return self._coerce_json(raw), raw
 
     def _coerce_json(self, text: str) -> Dict[str, Any]:
         # Strict: attempt exact JSON first
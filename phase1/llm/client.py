@@ -218,6 +218,21 @@ def get_client(config: Optional[Dict[str, Any]] = None, provider: Optional[str]
     return OllamaClient(cfg)
 
 
+def configured_model_name(provider: Optional[str] = None, config: Optional[Dict[str, Any]] = None) -> str:
+    """get_client()가 만들 클라이언트의 캐시 키용 모델 이름을 서버 접속 없이 설정만으로 결정합니다.
+
+    response_cache.client_model_name(client)와 같은 형식이며, Ollama 기본 모델 대신 대체 모델(fallback_model)이
+    응답하더라도 설정된 기본 모델 이름을 사용합니다.
+    """
+    cfg = _load_llm_config(config)
+    provider = (provider or cfg.get("provider", "ollama")).strip().lower()
+    if provider in ("ollama", "local"):
+        return f"{OllamaClient.__name__}:{cfg.get('base_model') or cfg.get('ollama_model', 'gemma3:1b')}"
+    if provider in ("vllm", "openai"):
+        return f"{VLLMClient.__name__}:{cfg.get('vllm_model', 'Qwen2.5')}"
+    return f"{OllamaClient.__name__}:{cfg.get('ollama_model', 'gemma3:1b')}"
+
+
 def simple_chat(
     prompt: str,
     config: Optional[Dict[str, Any]] = None,
@@ -0,0 +1,403 @@
+"""
+청크 임베딩 및 벡터 검색 (오프라인)
+chunks 테이블의 내용을 배치로 임베딩해 metadata.db 옆의 float32 메모리 맵 행렬에 저장하고,
+embeddings 테이블(chunk_id → 행 번호 faiss_vector_id)로 연결해 top-k 유사도 검색을 제공합니다.
+
+- 임베더: 로컬에 있는 sentence-transformers 모델(embedding.models)을 순서대로 시도하고,
+  없으면 네트워크 없이 동작하는 결정적 해싱 임베더(식별자 분해 + signed feature hashing)를 사용
+- 저장: 행 하나가 Chunk.hash 하나에 대응하며(행별 해시 목록을 함께 저장), 같은 내용의 청크는 행을 공유하고
+  재분석으로 청크 행이 다시 만들어져도 해시가 같으면 다시 임베딩하지 않음
+- 검색: 블록 단위 NumPy 내적(brute-force), embedding.ivf_nlist > 0이면 k-means 역색인(IVF)으로 후보를 좁힘
+"""
+
+import hashlib
+import logging
+import math
+import os
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import or_
+
+from phase1.database.bulk_writer import BulkWriter
+from phase1.models.database import Chunk, Embedding
+
+logger = logging.getLogger(__name__)
+
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+
+DEFAULT_HASHING_DIM = 384
+DEFAULT_BATCH_SIZE = 256
+# 검색 시 한 번에 내적을 계산할 행 수 (메모리 맵에서 읽는 블록 크기)
+SEARCH_BLOCK_ROWS = 65536
+
+# 식별자 분해: getUserList → get, user, list / HTTPServer → http, server / 한글 어절
+_IDENTIFIER = re.compile(r'[A-Za-z_][A-Za-z0-9_]*|[가-힣]+|\d+')
+_SUBWORD = re.compile(r'[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+')
+
+
+def tokenize(text: str) -> List[str]:
+    """코드/SQL/한글 텍스트를 소문자 토큰으로 분해 (식별자 전체와 그 구성 단어)"""
+    tokens = []
+    for identifier in _IDENTIFIER.findall(text or ''):
+        parts = _SUBWORD.findall(identifier)
+        lowered = identifier.lower()
+        if len(parts) != 1 or parts[0].lower() != lowered:
+            tokens.append(lowered)
+        tokens.extend(part.lower() for part in parts if len(part) > 1 or part.isdigit())
+    return tokens
+
+
+class HashingEmbedder:
+    """
+    결정적 해싱 임베더 (모델 파일/네트워크 불필요)
+
+    토큰별 blake2b 해시로 차원과 부호를 정하고(signed feature hashing), 1 + log(tf) 가중치를 더한 뒤
+    L2 정규화합니다. 프로세스/실행에 관계없이 같은 텍스트는 같은 벡터가 됩니다.
+    """
+
+    def __init__(self, dim: int = DEFAULT_HASHING_DIM):
+        self.dim = int(dim)
+        self.name = f"hashing-{self.dim}"
+        self._features: Dict[str, Tuple[int, float]] = {}
+
+    def _feature(self, token: str) -> Tuple[int, float]:
+        feature = self._features.get(token)
+        if feature is None:
+            value = int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'little')
+            feature = (value % self.dim, 1.0 if value >> 63 else -1.0)
+            if len(self._features) > 1_000_000:
+                self._features.clear()
+            self._features[token] = feature
+        return feature
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            counts: Dict[str, int] = {}
+            for token in tokenize(text):
+                counts[token] = counts.get(token, 0) + 1
+            vector = vectors[row]
+            for token, count in counts.items():
+                index, sign = self._feature(token)
+                vector[index] += sign * (1.0 + math.log(count))
+            norm = float(np.linalg.norm(vector))
+            if norm > 0:
+                vector /= norm
+        return vectors
+
+
+class SentenceTransformerEmbedder:
+    """로컬에 내려받아 둔 sentence-transformers 모델 임베더 (다운로드하지 않음)"""
+
+    def __init__(self, model_name: str, path: Optional[str] = None, batch_size: int = 32,
+                 max_length: Optional[int] = None):
+        self.model = SentenceTransformer(path or model_name, local_files_only=True)
+        if max_length:
+            self.model.max_seq_length = int(max_length)
+        self.name = model_name
+        self.dim = int(self.model.get_sentence_embedding_dimension())
+        self.batch_size = int(batch_size)
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        vectors = self.model.encode(list(texts), batch_size=self.batch_size, normalize_embeddings=True,
+                                    show_progress_bar=False)
+        return np.asarray(vectors, dtype=np.float32)
+
+
+def create_embedder(config: Dict[str, Any]):
+    """
+    embedding 설정으로 임베더 생성
+
+    backend가 'hashing'이 아니면 embedding.models를 순서대로 로컬에서 불러 보고,
+    하나도 불러올 수 없으면 해싱 임베더(embedding.hashing_dim)를 반환합니다.
+    """
+    embedding = config.get('embedding', {})
+    if embedding.get('backend', 'auto') != 'hashing' and SENTENCE_TRANSFORMERS_AVAILABLE:
+        for model in embedding.get('models', []):
+            try:
+                embedder = SentenceTransformerEmbedder(model['name'], model.get('path'),
+                                                       model.get('batch_size', 32), model.get('max_length'))
+                logger.info(f"임베딩 모델 로드: {embedder.name} (dim={embedder.dim})")
+                return embedder
+            except Exception as e:
+                logger.debug(f"임베딩 모델을 로컬에서 불러올 수 없음 {model.get('name')}: {e}")
+    embedder = HashingEmbedder(embedding.get('hashing_dim', DEFAULT_HASHING_DIM))
+    logger.info(f"로컬 임베딩 모델이 없어 해싱 임베더 사용: {embedder.name}")
+    return embedder
+
+
+class ChunkVectorStore:
+    """
+    metadata.db 옆에 두는 모델별 벡터 저장소
+
+    - chunk_vectors.<모델>.f32: (행 수, dim) float32 행렬 (행 단위 append, 읽기는 np.memmap)
+    - chunk_vectors.<모델>.hashes: 행별 Chunk.hash (한 줄에 하나)
+    해시 목록이 기준이며, 행렬 기록 후 해시를 덧붙이므로 중간에 중단되어도 해시가 없는 꼬리 행은 무시됩니다.
+    """
+
+    def __init__(self, directory: str, model_name: str, dim: int):
+        slug = re.sub(r'[^A-Za-z0-9._-]+', '_', model_name)
+        self.matrix_path = os.path.join(directory, f"chunk_vectors.{slug}.f32")
+        self.hashes_path = os.path.join(directory, f"chunk_vectors.{slug}.hashes")
+        self.dim = int(dim)
+        self._matrix: Optional[np.memmap] = None
+        self._load()
+
+    def _load(self) -> None:
+        hashes: List[str] = []
+        if os.path.exists(self.hashes_path):
+            with open(self.hashes_path, 'r', encoding='ascii') as f:
+                hashes = f.read().split()
+        matrix_rows = os.path.getsize(self.matrix_path) // (self.dim * 4) if os.path.exists(self.matrix_path) else 0
+        if matrix_rows < len(hashes):
+            logger.warning(f"벡터 행렬이 해시 목록보다 짧아 {len(hashes) - matrix_rows}행을 버림: {self.matrix_path}")
+            hashes = hashes[:matrix_rows]
+            self._write_hashes(hashes)
+        self._hashes = hashes
+        self._row_of = {}
+        for row, chunk_hash in enumerate(hashes):
+            self._row_of.setdefault(chunk_hash, row)
+        self._matrix = None
+
+    def _write_hashes(self, hashes: List[str]) -> None:
+        with open(self.hashes_path, 'w', encoding='ascii') as f:
+            f.write(''.join(f"{h}\n" for h in hashes))
+
+    @property
+    def row_count(self) -> int:
+        return len(self._hashes)
+
+    def row_of(self, chunk_hash: str) -> Optional[int]:
+        return self._row_of.get(chunk_hash)
+
+    def append(self, hashes: List[str], vectors: np.ndarray) -> List[int]:
+        """벡터를 행렬 끝에 덧붙이고 새 행 번호 목록을 반환"""
+        if not hashes:
+            return []
+        vectors = np.ascontiguousarray(vectors, dtype='<f4').reshape(len(hashes), self.dim)
+        start = self.row_count
+        mode = 'r+b' if os.path.exists(self.matrix_path) else 'wb'
+        with open(self.matrix_path, mode) as f:
+            f.seek(start * self.dim * 4)
+            f.write(vectors.tobytes())
+            f.truncate()
+        with open(self.hashes_path, 'a', encoding='ascii') as f:
+            f.write(''.join(f"{h}\n" for h in hashes))
+        rows = list(range(start, start + len(hashes)))
+        for row, chunk_hash in zip(rows, hashes):
+            self._hashes.append(chunk_hash)
+            self._row_of.setdefault(chunk_hash, row)
+        self._matrix = None
+        return rows
+
+    def matrix(self) -> np.ndarray:
+        """(행 수, dim) 읽기 전용 메모리 맵"""
+        if self._matrix is None:
+            if self.row_count == 0:
+                return np.zeros((0, self.dim), dtype=np.float32)
+            self._matrix = np.memmap(self.matrix_path, dtype='<f4', mode='r', shape=(self.row_count, self.dim))
+        return self._matrix
+
+
+def top_k_rows(matrix: np.ndarray, query: np.ndarray, k: int,
+               rows: Optional[np.ndarray] = None) -> List[Tuple[int, float]]:
+    """rows(없으면 전체) 중 query와 내적이 큰 상위 k개 (행 번호, 점수)를 블록 단위로 계산"""
+    total = matrix.shape[0] if rows is None else len(rows)
+    if total == 0 or k <= 0:
+        return []
+    best_rows: List[np.ndarray] = []
+    best_scores: List[np.ndarray] = []
+    for start in range(0, total, SEARCH_BLOCK_ROWS):
+        if rows is None:
+            block_rows = np.arange(start, min(start + SEARCH_BLOCK_ROWS, total))
+            scores = np.asarray(matrix[start:start + SEARCH_BLOCK_ROWS]) @ query
+        else:
+            block_rows = rows[start:start + SEARCH_BLOCK_ROWS]
+            scores = np.asarray(matrix[block_rows]) @ query
+        if len(scores) > k:
+            keep = np.argpartition(-scores, k - 1)[:k]
+            block_rows, scores = block_rows[keep], scores[keep]
+        best_rows.append(block_rows)
+        best_scores.append(scores)
+    all_rows = np.concatenate(best_rows)
+    all_scores = np.concatenate(best_scores)
+    order = np.lexsort((all_rows, -all_scores))[:k]
+    return [(int(all_rows[i]), float(all_scores[i])) for i in order]
+
+
+class IVFIndex:
+    """k-means(내적) 역색인: 질의와 가까운 nprobe개 군집의 행만 brute-force로 비교"""
+
+    def __init__(self, matrix: np.ndarray, rows: np.ndarray, nlist: int, iterations: int = 10, seed: int = 0):
+        rng = np.random.default_rng(seed)
+        nlist = max(1, min(int(nlist), len(rows)))
+        sample_rows = np.sort(rng.choice(rows, size=min(len(rows), nlist * 64), replace=False))
+        sample = np.asarray(matrix[sample_rows])
+        centroids = sample[rng.choice(len(sample), size=nlist, replace=False)].copy()
+        for _ in range(iterations):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            for c in range(nlist):
+                members = sample[assignment == c]
+                if len(members):
+                    centroid = members.sum(axis=0)
+                    norm = np.linalg.norm(centroid)
+                    centroids[c] = centroid / norm if norm > 0 else centroid
+        self.centroids = centroids
+        assignments = np.concatenate([
+            np.argmax(np.asarray(matrix[rows[i:i + SEARCH_BLOCK_ROWS]]) @ centroids.T, axis=1)
+            for i in range(0, len(rows), SEARCH_BLOCK_ROWS)
+        ])
+        order = np.argsort(assignments, kind='stable')
+        bounds = np.searchsorted(assignments[order], np.arange(nlist + 1))
+        self.lists = [rows[order[bounds[c]:bounds[c + 1]]] for c in range(nlist)]
+
+    def candidates(self, query: np.ndarray, nprobe: int) -> np.ndarray:
+        probe = np.argsort(-(self.centroids @ query))[:max(1, int(nprobe))]
+        return np.sort(np.concatenate([self.lists[c] for c in probe]))
+
+
+class ChunkEmbeddingIndex:
+    """
+    청크 임베딩 생성(배치/증분)과 top-k 유사도 검색
+
+    update()는 embeddings 행이 없거나 다른 모델로 만든 청크만 chunk_id 순서로 batch_size개씩 처리하며,
+    벡터 저장소에 이미 있는 Chunk.hash는 다시 임베딩하지 않고 행 번호만 연결합니다.
+    """
+
+    def __init__(self, db_manager: Any, config: Dict[str, Any], embedder: Any = None):
+        self.db_manager = db_manager
+        self.config = config
+        embedding = config.get('embedding', {})
+        self.embedder = embedder or create_embedder(config)
+        self.batch_size = max(1, int(embedding.get('batch_size', DEFAULT_BATCH_SIZE)))
+        self.ivf_nlist = int(embedding.get('ivf_nlist', 0) or 0)
+        self.ivf_nprobe = int(embedding.get('ivf_nprobe', 8))
+        directory = os.path.dirname(os.path.abspath(db_manager.engine.url.database))
+        self.store = ChunkVectorStore(directory, self.embedder.name, self.embedder.dim)
+        self._mapping: Optional[Dict[str, np.ndarray]] = None
+        self._ivf: Optional[IVFIndex] = None
+
+    @property
+    def model_name(self) -> str:
+        return self.embedder.name
+
+    def update(self, project_id: Optional[int] = None) -> Dict[str, int]:
+        """임베딩이 없는 청크를 배치로 임베딩하고 embeddings 행을 저장"""
+        stats = {'embedded': 0, 'reused': 0, 'skipped': 0}
+        last_chunk_id = 0
+        while True:
+            session = self.db_manager.get_session()
+            try:
+                query = session.query(Chunk.chunk_id, Chunk.hash, Chunk.content, Embedding.model).outerjoin(
+                    Embedding, Embedding.chunk_id == Chunk.chunk_id).filter(
+                    Chunk.chunk_id > last_chunk_id,
+                    or_(Embedding.chunk_id.is_(None), Embedding.model != self.model_name))
+                if project_id is not None:
+                    query = query.filter(Chunk.project_id == project_id)
+                page = query.order_by(Chunk.chunk_id).limit(self.batch_size).all()
+                if not page:
+                    break
+                last_chunk_id = page[-1].chunk_id
+
+                # 다른 모델로 만든 임베딩은 교체
+                stale = [row.chunk_id for row in page if row.model is not None]
+                if stale:
+                    session.query(Embedding).filter(Embedding.chunk_id.in_(stale)).delete(synchronize_session=False)
+
+                pending: Dict[str, str] = {}
+                for row in page:
+                    if row.hash and row.content and self.store.row_of(row.hash) is None:
+                        pending.setdefault(row.hash, row.content)
+                if pending:
+                    self.store.append(list(pending), self.embedder.embed(list(pending.values())))
+
+                rows = []
+                for row in page:
+                    vector_row = self.store.row_of(row.hash) if row.hash and row.content else None
+                    if vector_row is None:
+                        stats['skipped'] += 1
+                        continue
+                    rows.append({'chunk_id': row.chunk_id, 'model': self.model_name, 'dim': self.store.dim,
+                                 'faiss_vector_id': vector_row})
+                stats['embedded'] += len(pending)
+                stats['reused'] += len(rows) - len(pending)
+                BulkWriter.from_config(session, self.config).insert_rows(Embedding, rows)
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+            finally:
+                session.close()
+
+        if stats['embedded'] or stats['reused']:
+            self._mapping = None
+            self._ivf = None
+        logger.info(f"청크 임베딩 갱신 ({self.model_name}): 새로 임베딩 {stats['embedded']}개, "
+                    f"해시 재사용 {stats['reused']}개, 내용 없음 {stats['skipped']}개")
+        return stats
+
+    def _load_mapping(self) -> Dict[str, np.ndarray]:
+        """현재 모델의 (행 번호, chunk_id, target_type, target_id, project_id) 배열 (검색 간 재사용)"""
+        if self._mapping is None:
+            session = self.db_manager.get_session()
+            try:
+                records = session.query(Embedding.faiss_vector_id, Chunk.chunk_id, Chunk.target_type,
+                                        Chunk.target_id, Chunk.project_id).join(
+                    Chunk, Chunk.chunk_id == Embedding.chunk_id).filter(
+                    Embedding.model == self.model_name, Embedding.faiss_vector_id < self.store.row_count
+                ).order_by(Embedding.faiss_vector_id, Chunk.chunk_id).all()
+            finally:
+                session.close()
+            self._mapping = {
+                'row': np.array([r[0] for r in records], dtype=np.int64),
+                'chunk_id': np.array([r[1] for r in records], dtype=np.int64),
+                'target_type': np.array([r[2] for r in records], dtype=object),
+                'target_id': np.array([r[3] for r in records], dtype=np.int64),
+                'project_id': np.array([r[4] if r[4] is not None else -1 for r in records], dtype=np.int64),
+            }
+        return self._mapping
+
+    def search(self, query: str, top_k: int = 10, target_types: Optional[Sequence[str]] = None,
+               project_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        질의 텍스트와 가장 비슷한 청크 top_k개 (점수 내림차순)
+
+        Returns:
+            [{'chunk_id', 'target_type', 'target_id', 'score'}]
+        """
+        mapping = self._load_mapping()
+        mask = np.ones(len(mapping['row']), dtype=bool)
+        if target_types:
+            mask &= np.isin(mapping['target_type'], list(target_types))
+        if project_id is not None:
+            mask &= mapping['project_id'] == project_id
+        rows = np.unique(mapping['row'][mask])
+        if len(rows) == 0:
+            return []
+
+        query_vector = self.embedder.embed([query])[0]
+        matrix = self.store.matrix()
+        if self.ivf_nlist and not target_types and project_id is None:
+            if self._ivf is None:
+                self._ivf = IVFIndex(matrix, rows, self.ivf_nlist)
+            rows = self._ivf.candidates(query_vector, self.ivf_nprobe)
+
+        # 같은 행(같은 내용)을 공유하는 청크가 있으므로 행 top_k를 청크로 펼친 뒤 top_k개로 자름
+        results = []
+        candidates = np.flatnonzero(mask)
+        selected = mapping['row'][candidates]
+        for row, score in top_k_rows(matrix, query_vector, top_k, rows):
+            for index in candidates[selected == row]:
+                results.append({'chunk_id': int(mapping['chunk_id'][index]),
+                                'target_type': mapping['target_type'][index],
+                                'target_id': int(mapping['target_id'][index]),
+                                'score': score})
+                if len(results) >= top_k:
+                    return results
+        return results
@@ -1,18 +1,29 @@
 from typing import Optional, Dict, Any
 import os
 
-from phase1.llm.client import get_client
+from phase1.llm.client import get_client, configured_model_name
+from phase1.llm.response_cache import LLMResponseCache, template_id
 
 
-def generate_text(system: str, user: str, *, provider: Optional[str] = None, temperature: float = 0.0, max_tokens: int = 256, dry_run: bool = False) -> str:
+def generate_text(system: str, user: str, *, provider: Optional[str] = None, temperature: float = 0.0, max_tokens: int = 256, dry_run: bool = False,
+                  cache: Optional[LLMResponseCache] = None, template: str = 'generate_text') -> str:
     if dry_run:
         # Minimal deterministic stub
         return "요약/설명(드라이런): 입력 컨텍스트 기반 자동 생성"
-    client = get_client(provider)
     messages = [
         {"role": "system", "content": system},
         {"role": "user", "content": user},
     ]
-    text = client.chat(messages, stream=False, temperature=temperature, max_tokens=max_tokens)
-    return text if isinstance(text, str) else str(text)
 
+    def call() -> str:
+        # 클라이언트는 캐시 미스일 때만 생성 (get_client는 Ollama 서버에 모델 존재 여부를 조회함)
+        client = get_client(provider)
+        text = client.chat(messages, stream=False, temperature=temperature, max_tokens=max_tokens)
+        return text if isinstance(text, str) else str(text)
+
+    if cache is None:
+        return call()
+    # 시스템 프롬프트 본문과 호출 파라미터는 템플릿, 사용자 입력은 내용으로 캐시 키를 구성
+    return cache.get_or_call(configured_model_name(provider),
+                             template_id(template, system, temperature=temperature, max_tokens=max_tokens),
+                             user, call)
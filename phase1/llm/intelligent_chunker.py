@@ -8,6 +8,8 @@ from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 from pathlib import Path
 
+from phase1.utils.line_index import line_index_for
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -21,6 +23,17 @@ class CodeChunk:
     context: str     # 주변 컨텍스트 정보
     metadata: Dict   # 추가 메타데이터
 
+@dataclass
+class ChunkSpan:
+    """파서가 저장한 코드 범위 (Class/Method/SqlUnit 행의 start_line~end_line)"""
+    target_type: str  # 'class', 'method', 'sql_unit'
+    target_id: int
+    name: str
+    start_line: int
+    end_line: int
+    kind: str = ''                   # SQL의 stmt_kind (select, insert 등)
+    class_id: Optional[int] = None   # 메서드가 속한 클래스의 target_id
+
 class IntelligentChunker:
     """의미있는 단위로 코드를 청킹하는 클래스"""
     
@@ -228,6 +241,7 @@ class IntelligentChunker:
     def _extract_jsp_scriptlets(self, content: str, file_path: str) -> List[CodeChunk]:
         """JSP 파일에서 의미있는 스크립틀릿 블록들만 추출"""
         chunks = []
+        line_index = line_index_for(content)
         
         # 실제 Java 코드가 있는 스크립틀릿만 추출 (주석 제외)
         scriptlets = re.finditer(r'<%([^%@=\-](?:[^%]|%(?!>))*?)%>', content, re.DOTALL)
@@ -250,8 +264,8 @@ class IntelligentChunker:
                     chunk_type='scriptlet',
                     name=f'jsp_script_{i+1}',
                     content=scriptlet_content,
-                    start_line=content[:match.start()].count('\n') + 1,
-                    end_line=content[:match.end()].count('\n') + 1,
+                    start_line=line_index.line_of(match.start()),
+                    end_line=line_index.line_of(match.end()),
                     context=f"JSP 파일: {file_path}",
                     metadata={'file_path': file_path, 'index': i+1}
                 ))
@@ -261,6 +275,7 @@ class IntelligentChunker:
     def _extract_jstl_blocks(self, content: str, file_path: str) -> List[CodeChunk]:
         """JSP 파일에서 의미있는 JSTL 태그 블록들만 추출"""
         chunks = []
+        line_index = line_index_for(content)
         
         # 의미있는 JSTL 태그만 추출 (단순 조건문 제외)
         meaningful_tags = ['forEach', 'choose', 'when', 'otherwise', 'set']
@@ -278,8 +293,8 @@ class IntelligentChunker:
                         chunk_type='jstl',
                         name=f'jstl_{tag}_{i+1}',
                         content=block_content,
-                        start_line=content[:match.start()].count('\n') + 1,
-                        end_line=content[:match.end()].count('\n') + 1,
+                        start_line=line_index.line_of(match.start()),
+                        end_line=line_index.line_of(match.end()),
                         context=f"JSP 파일: {file_path}",
                         metadata={'tag_name': tag, 'file_path': file_path, 'index': i+1}
                     ))
@@ -312,6 +327,75 @@ class IntelligentChunker:
         
         return '\n'.join(summary_lines)
     
+    def chunk_from_spans(self, file_path: str, content: str, spans: List[ChunkSpan]) -> List[CodeChunk]:
+        """
+        파서가 저장한 범위로 청크를 잘라냄 (정규식/중괄호 재탐색 없이 한 번에)
+        
+        각 청크의 metadata에 target_type/target_id를 담아 저장 시 대상 행을 다시 조회하지 않도록 합니다.
+        범위가 파일 밖이거나 비어 있는 항목은 건너뜁니다.
+        """
+        chunks = []
+        lines = content.split('\n')
+        valid = [span for span in spans if 1 <= span.start_line <= span.end_line <= len(lines)]
+        
+        if Path(file_path).suffix.lower() == '.java':
+            # 패키지와 임포트 블록 (파일 단위)
+            import_block = self._extract_import_block(lines)
+            if import_block:
+                chunks.append(CodeChunk(
+                    chunk_type='import',
+                    name='imports',
+                    content=import_block,
+                    start_line=1,
+                    end_line=len(import_block.split('\n')),
+                    context=f"파일: {file_path}",
+                    metadata={'file_path': file_path, 'target_type': 'file', 'target_id': None}
+                ))
+        
+        methods_by_class: Dict[int, List[ChunkSpan]] = {}
+        for span in valid:
+            if span.target_type == 'method':
+                methods_by_class.setdefault(span.class_id, []).append(span)
+        
+        for span in valid:
+            span_content = '\n'.join(lines[span.start_line - 1:span.end_line])
+            if span.target_type == 'class':
+                # 클래스 내 메서드들을 개별 청크로, 클래스는 구조 요약으로
+                for method in methods_by_class.get(span.target_id, []):
+                    chunks.append(CodeChunk(
+                        chunk_type='method',
+                        name=f"{span.name}.{method.name}",
+                        content='\n'.join(lines[method.start_line - 1:method.end_line]),
+                        start_line=method.start_line,
+                        end_line=method.end_line,
+                        context=f"클래스: {span.name}, 파일: {file_path}",
+                        metadata={'class_name': span.name, 'method_name': method.name, 'file_path': file_path,
+                                  'target_type': 'method', 'target_id': method.target_id}
+                    ))
+                chunks.append(CodeChunk(
+                    chunk_type='class',
+                    name=span.name,
+                    content=self._create_class_summary(span_content, span.name),
+                    start_line=span.start_line,
+                    end_line=span.end_line,
+                    context=f"Java 파일: {file_path}",
+                    metadata={'class_name': span.name, 'file_path': file_path,
+                              'target_type': 'class', 'target_id': span.target_id}
+                ))
+            elif span.target_type == 'sql_unit':
+                chunks.append(CodeChunk(
+                    chunk_type=f'mybatis_{span.kind}' if span.kind else 'query',
+                    name=span.name,
+                    content=span_content,
+                    start_line=span.start_line,
+                    end_line=span.end_line,
+                    context=f"MyBatis 파일: {file_path}",
+                    metadata={'query_type': span.kind, 'query_id': span.name, 'file_path': file_path,
+                              'target_type': 'sql_unit', 'target_id': span.target_id}
+                ))
+        
+        return chunks
+    
     def chunk_file(self, file_path: str, content: str) -> List[CodeChunk]:
         """파일 확장자에 따라 적절한 청킹 수행"""
         file_extension = Path(file_path).suffix.lower()
@@ -0,0 +1,119 @@
+"""
+여러 요약 항목을 하나의 LLM 프롬프트로 묶는 패킹 모드
+작은 메서드/SQL 단위를 토큰 예산 안에서 묶어 한 번에 요청하고, 항목별 요약을 JSON 배열로 받습니다.
+요청당 고정 비용(Ollama의 프롬프트 처리/응답 지연 등)이 큰 환경에서 처리량을 높이기 위함입니다.
+
+- pack_items(): 항목 스트림을 토큰 예산/최대 개수 기준으로 묶음 단위로 분할
+- build_packed_prompt(): 항목마다 [id=N] 머리글을 붙인 구조화 프롬프트 생성
+- parse_packed_response(): 응답에서 JSON 배열을 찾아 항목별 요약을 검증 (실패 시 ValueError)
+"""
+
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+@dataclass
+class PackingConfig:
+    enabled: bool = False             # 패킹 모드 사용 여부
+    max_items: int = 8                # 한 프롬프트에 묶을 최대 항목 수
+    max_prompt_tokens: int = 2000     # 묶음 하나의 입력 토큰 예산 (추정치)
+    max_item_tokens: int = 400        # 이보다 큰 항목은 묶지 않고 단건으로 요청
+    response_tokens_per_item: int = 150  # 항목당 응답 토큰 (max_tokens 계산용)
+
+    @classmethod
+    def from_config(cls, llm_config: Optional[Dict[str, Any]]) -> 'PackingConfig':
+        """llm.packing 설정으로 생성"""
+        cfg = (llm_config or {}).get('packing', {}) or {}
+        defaults = cls()
+        return cls(
+            enabled=bool(cfg.get('enabled', defaults.enabled)),
+            max_items=max(1, int(cfg.get('max_items', defaults.max_items))),
+            max_prompt_tokens=int(cfg.get('max_prompt_tokens', defaults.max_prompt_tokens)),
+            max_item_tokens=int(cfg.get('max_item_tokens', defaults.max_item_tokens)),
+            response_tokens_per_item=int(cfg.get('response_tokens_per_item', defaults.response_tokens_per_item)),
+        )
+
+
+def pack_items(items: Iterable[Any], cost: Callable[[Any], Optional[int]], config: PackingConfig,
+               group: Callable[[Any], Any] = lambda item: None) -> Iterator[List[Any]]:
+    """
+    items를 순서대로 읽어 묶음(list)으로 반환합니다.
+
+    cost(item)이 None이거나 max_item_tokens보다 큰 항목은 길이 1인 묶음으로 바로 반환하고,
+    나머지는 같은 group(item) 값끼리 max_items개, max_prompt_tokens 예산까지 모읍니다.
+    """
+    batch: List[Any] = []
+    batch_tokens = 0
+    batch_group = None
+    for item in items:
+        tokens = cost(item)
+        if tokens is None or tokens > config.max_item_tokens:
+            yield [item]
+            continue
+        item_group = group(item)
+        if batch and (item_group != batch_group or len(batch) >= config.max_items
+                      or batch_tokens + tokens > config.max_prompt_tokens):
+            yield batch
+            batch, batch_tokens = [], 0
+        batch.append(item)
+        batch_tokens += tokens
+        batch_group = item_group
+    if batch:
+        yield batch
+
+
+def build_packed_prompt(instruction: str, entries: Sequence[Tuple[str, str]]) -> str:
+    """
+    entries [(머리글, 본문)]에 0부터 id를 매겨 하나의 프롬프트로 만듭니다.
+    모델은 [{"id": 0, "summary": "..."}, ...] 형식의 JSON 배열만 응답하도록 요청합니다.
+    """
+    blocks = [f"### [id={index}] {header}\n{body}" for index, (header, body) in enumerate(entries)]
+    return (
+        f"{instruction}\n"
+        f"아래 {len(entries)}개 항목 각각에 대해 요약을 작성하고, 다른 설명 없이 JSON 배열로만 응답해주세요.\n"
+        f"형식: [{{\"id\": 0, \"summary\": \"요약\"}}, ...] (모든 id를 정확히 한 번씩 포함)\n\n"
+        + "\n\n".join(blocks)
+    )
+
+
+_CODE_FENCE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+
+
+def parse_packed_response(response: Any, count: int) -> Dict[int, str]:
+    """
+    묶음 응답에서 id → 요약을 추출합니다.
+    범위 밖 id, 빈 요약, 중복 id는 무시하며, 유효한 항목이 하나도 없으면 ValueError.
+    누락된 id는 호출 측에서 단건 요청으로 보완합니다.
+    """
+    if not isinstance(response, str):
+        raise ValueError(f"문자열이 아닌 응답: {type(response).__name__}")
+    text = response.strip()
+    fenced = _CODE_FENCE.search(text)
+    if fenced:
+        text = fenced.group(1).strip()
+    start, end = text.find('['), text.rfind(']')
+    if start < 0 or end <= start:
+        raise ValueError("응답에 JSON 배열이 없음")
+    try:
+        data = json.loads(text[start:end + 1])
+    except json.JSONDecodeError as e:
+        raise ValueError(f"JSON 파싱 실패: {e}") from e
+    if not isinstance(data, list):
+        raise ValueError("JSON 배열이 아님")
+
+    summaries: Dict[int, str] = {}
+    for entry in data:
+        if not isinstance(entry, dict):
+            continue
+        try:
+            index = int(entry.get('id'))
+        except (TypeError, ValueError):
+            continue
+        summary = entry.get('summary')
+        if 0 <= index < count and index not in summaries and isinstance(summary, str) and summary.strip():
+            summaries[index] = summary.strip()
+    if not summaries:
+        raise ValueError("유효한 항목 요약이 없음")
+    return summaries
@@ -11,7 +11,12 @@ import json
 import re
 from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
-from phase1.llm.assist import LLMAssistant
+from phase1.llm.response_cache import LLMResponseCache, client_model_name, template_id
+
+try:
+    from phase1.llm.assist import LLMAssistant
+except ImportError:  # 기본 어시스턴트 구현이 없으면 llm_assistant를 주입해야 함
+    LLMAssistant = None
 
 logger = logging.getLogger(__name__)
 
@@ -19,8 +24,25 @@ logger = logging.getLogger(__name__)
 class RelationshipAnalyzer:
     """LLM 기반 관계 분석기"""
     
-    def __init__(self, llm_assistant: LLMAssistant = None):
-        self.llm_assistant = llm_assistant or LLMAssistant()
+    def __init__(self, llm_assistant=None, response_cache: Optional[LLMResponseCache] = None):
+        if llm_assistant is None:
+            if LLMAssistant is None:
+                raise ValueError("llm_assistant가 필요합니다 (get_completion(prompt, max_tokens, temperature) 제공 객체)")
+            llm_assistant = LLMAssistant()
+        self.llm_assistant = llm_assistant
+        self.response_cache = response_cache
+
+    def _get_completion(self, template: str, prompt: str, max_tokens: int, temperature: float) -> Optional[str]:
+        """LLM 호출 (response_cache가 있으면 (모델, 템플릿, 프롬프트)로 캐시)"""
+        def call():
+            return self.llm_assistant.get_completion(prompt=prompt, max_tokens=max_tokens, temperature=temperature)
+
+        if self.response_cache is None:
+            return call()
+        return self.response_cache.get_or_call(
+            client_model_name(self.llm_assistant),
+            template_id(template, max_tokens=max_tokens, temperature=temperature),
+            prompt, call)
         
     def analyze_java_relationships(self, java_content: str, file_path: str, 
                                  project_context: Dict[str, Any] = None) -> List[Dict]:
@@ -29,11 +51,9 @@ class RelationshipAnalyzer:
         prompt = self._build_java_analysis_prompt(java_content, file_path, project_context)
         
         try:
-            response = self.llm_assistant.get_completion(
-                prompt=prompt,
-                max_tokens=2000,
-                temperature=0.1  # 일관성을 위해 낮은 temperature
-            )
+            response = self._get_completion('relationship:java', prompt,
+                                            max_tokens=2000,
+                                            temperature=0.1)  # 일관성을 위해 낮은 temperature
             
             if response:
                 relationships = self._parse_relationship_response(response)
@@ -51,11 +71,9 @@ class RelationshipAnalyzer:
         prompt = self._build_mybatis_analysis_prompt(xml_content, file_path, java_interfaces)
         
         try:
-            response = self.llm_assistant.get_completion(
-                prompt=prompt,
-                max_tokens=1500,
-                temperature=0.1
-            )
+            response = self._get_completion('relationship:mybatis', prompt,
+                                            max_tokens=1500,
+                                            temperature=0.1)
             
             if response:
                 relationships = self._parse_relationship_response(response)
@@ -73,11 +91,9 @@ class RelationshipAnalyzer:
         prompt = self._build_jsp_analysis_prompt(jsp_content, file_path, controller_methods)
         
         try:
-            response = self.llm_assistant.get_completion(
-                prompt=prompt,
-                max_tokens=1500,
-                temperature=0.1
-            )
+            response = self._get_completion('relationship:jsp', prompt,
+                                            max_tokens=1500,
+                                            temperature=0.1)
             
             if response:
                 relationships = self._parse_relationship_response(response)
@@ -94,11 +110,9 @@ class RelationshipAnalyzer:
         prompt = self._build_sql_analysis_prompt(sql_content, sql_id)
         
         try:
-            response = self.llm_assistant.get_completion(
-                prompt=prompt,
-                max_tokens=1000,
-                temperature=0.1
-            )
+            response = self._get_completion('relationship:sql', prompt,
+                                            max_tokens=1000,
+                                            temperature=0.1)
             
             if response:
                 relationships = self._parse_relationship_response(response)
@@ -0,0 +1,216 @@
+"""
+LLM 응답 캐시 (내용 주소 기반)
+(모델, 프롬프트 템플릿, 정규화한 입력 내용의 sha256)을 키로 LLM 응답을 SQLite 파일 하나에 보관합니다.
+같은 청크/스니펫은 프로젝트와 실행에 관계없이 모델을 한 번만 호출하도록 모든 LLM 호출 지점이 공유합니다.
+
+- 크기 기반 LRU 제거: 전체 응답 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제
+- 적중/미스/저장/제거 횟수 통계 (stats())
+- 같은 키를 동시에 요청하면 첫 요청의 응답을 기다려 재사용 (스레드 간)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = './project/_shared/llm_cache.db'
+DEFAULT_MAX_MB = 512
+
+# 제거 시 한도의 이 비율까지 줄여 매 저장마다 제거가 반복되지 않도록 함
+EVICT_TARGET_RATIO = 0.9
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_responses (
+    cache_key TEXT PRIMARY KEY,
+    model TEXT,
+    template TEXT,
+    response TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS ix_llm_responses_last_used ON llm_responses (last_used);
+CREATE TABLE IF NOT EXISTS llm_cache_meta (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO llm_cache_meta (name, value)
+    SELECT 'total_bytes', COALESCE(SUM(size), 0) FROM llm_responses;
+"""
+
+
+def normalize_content(text: str) -> str:
+    """줄바꿈 형식, 줄 끝 공백, 앞뒤 빈 줄 차이를 무시하도록 입력 내용을 정규화"""
+    text = (text or '').lstrip('\ufeff').replace('\r\n', '\n').replace('\r', '\n')
+    return '\n'.join(line.rstrip() for line in text.split('\n')).strip('\n')
+
+
+def make_cache_key(model: str, template: str, content: str) -> str:
+    """(모델, 프롬프트 템플릿, 정규화한 내용 해시)로 캐시 키 생성"""
+    content_hash = hashlib.sha256(normalize_content(content).encode('utf-8')).hexdigest()
+    key_source = '\x00'.join([model or '', template or '', content_hash])
+    return hashlib.sha256(key_source.encode('utf-8')).hexdigest()
+
+
+def client_model_name(client: Any) -> str:
+    """클라이언트 객체에서 캐시 키용 모델 이름 추출 (provider 클래스명 포함)"""
+    return f"{type(client).__name__}:{getattr(client, 'model', '') or ''}"
+
+
+def template_id(name: str, *texts: str, **params: Any) -> str:
+    """템플릿 이름, 템플릿 본문(시스템/사용자 프롬프트 틀) 다이제스트, 응답에 영향을 주는 호출 파라미터
+    (temperature, max_tokens 등)를 묶은 템플릿 ID - 프롬프트 문구를 고치면 이전 캐시 응답을 쓰지 않음"""
+    if texts:
+        digest = hashlib.sha256('\x00'.join(texts).encode('utf-8')).hexdigest()[:16]
+        name = f"{name}@{digest}"
+    if not params:
+        return name
+    return f"{name}|{json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)}"
+
+
+class LLMResponseCache:
+    """SQLite 파일 하나에 저장하는 크기 제한 LRU LLM 응답 캐시 (스레드 안전)"""
+
+    def __init__(self, path: str, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024):
+        self.path = path
+        self.max_bytes = int(max_bytes)
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, threading.Event] = {}
+        self.stats_counts = {'hits': 0, 'misses': 0, 'puts': 0, 'evictions': 0}
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM llm_responses WHERE cache_key = ?", (key,)).fetchone()
+            if row is None:
+                self.stats_counts['misses'] += 1
+                return None
+            self._conn.execute(
+                "UPDATE llm_responses SET last_used = ?, hits = hits + 1 WHERE cache_key = ?",
+                (time.time(), key))
+            self.stats_counts['hits'] += 1
+            return row[0]
+
+    def put(self, key: str, response: str, model: str = '', template: str = '') -> None:
+        size = len(response.encode('utf-8'))
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                previous = self._conn.execute(
+                    "SELECT size FROM llm_responses WHERE cache_key = ?", (key,)).fetchone()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO llm_responses "
+                    "(cache_key, model, template, response, size, created_at, last_used, hits) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, 0)",
+                    (key, model, template, response, size, now, now))
+                delta = size - (previous[0] if previous else 0)
+                self._conn.execute(
+                    "UPDATE llm_cache_meta SET value = value + ? WHERE name = 'total_bytes'", (delta,))
+                self.stats_counts['puts'] += 1
+                self._evict_if_needed()
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _evict_if_needed(self) -> None:
+        """총 크기가 max_bytes를 넘으면 last_used가 오래된 항목부터 삭제 (트랜잭션 안에서 호출)"""
+        total = self._conn.execute(
+            "SELECT value FROM llm_cache_meta WHERE name = 'total_bytes'").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        target = int(self.max_bytes * EVICT_TARGET_RATIO)
+        while total > target:
+            rows = self._conn.execute(
+                "SELECT cache_key, size FROM llm_responses ORDER BY last_used LIMIT 256").fetchall()
+            if not rows:
+                break
+            removed = []
+            for cache_key, size in rows:
+                removed.append((cache_key,))
+                total -= size
+                if total <= target:
+                    break
+            self._conn.executemany("DELETE FROM llm_responses WHERE cache_key = ?", removed)
+            self.stats_counts['evictions'] += len(removed)
+        self._conn.execute(
+            "UPDATE llm_cache_meta SET value = ? WHERE name = 'total_bytes'", (max(total, 0),))
+
+    def get_or_call(self, model: str, template: str, content: str, call: Callable[[], Any]) -> Any:
+        """
+        캐시된 응답을 반환하고, 없으면 call()로 모델을 호출해 저장합니다.
+        같은 키를 다른 스레드가 이미 호출 중이면 그 결과를 기다립니다.
+        빈 응답이나 문자열이 아닌 응답(스트림 등)은 저장하지 않습니다.
+        """
+        key = make_cache_key(model, template, content)
+        while True:
+            cached = self.get(key)
+            if cached is not None:
+                return cached
+            with self._lock:
+                event = self._inflight.get(key)
+                if event is None:
+                    event = self._inflight[key] = threading.Event()
+                    break
+            # 먼저 호출한 스레드가 끝나면 캐시를 다시 확인 (그 호출이 실패했으면 직접 호출)
+            event.wait()
+
+        try:
+            response = call()
+            if isinstance(response, str) and response.strip():
+                self.put(key, response, model, template)
+            return response
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            event.set()
+
+    def stats(self) -> Dict[str, int]:
+        """이번 프로세스의 적중/미스/저장/제거 횟수와 현재 항목 수/총 크기"""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+            total = self._conn.execute(
+                "SELECT value FROM llm_cache_meta WHERE name = 'total_bytes'").fetchone()[0]
+            return dict(self.stats_counts, entries=entries, bytes=total)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_caches: Dict[str, LLMResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_response_cache(config: Optional[Dict[str, Any]]) -> Optional[LLMResponseCache]:
+    """
+    llm_cache 설정으로 프로세스 전체에서 공유하는 캐시를 반환 (경로별 1개).
+    llm_cache.enabled가 false이면 None.
+    """
+    cache_config = (config if isinstance(config, dict) else {}).get('llm_cache', {}) or {}
+    if not cache_config.get('enabled', True):
+        return None
+    path = os.path.abspath(cache_config.get('path') or DEFAULT_CACHE_PATH)
+    max_bytes = int(float(cache_config.get('max_mb', DEFAULT_MAX_MB)) * 1024 * 1024)
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            try:
+                cache = _caches[path] = LLMResponseCache(path, max_bytes)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"LLM 응답 캐시를 열 수 없음 {path}: {e}")
+                return None
+        return cache
@@ -0,0 +1,197 @@
+"""
+LLM 요청 스케줄러
+블로킹 LLM 클라이언트(requests/openai) 호출을 스레드 풀에서 동시에 실행합니다.
+
+- 동시 실행 수 제한 (max_concurrency): vLLM처럼 여러 시퀀스를 동시에 처리하는 서버를 채우기 위함
+- 재시도/지수 백오프: 연결 오류, 타임아웃, 408/429/5xx 응답은 재시도 (Retry-After 헤더 우선)
+- 토큰 속도 제한 (tokens_per_minute): 프롬프트 길이 + max_tokens 추정치로 토큰 버킷에서 차감
+"""
+
+import logging
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 5xx 외에 재시도하는 HTTP 상태 코드 (나머지 4xx는 요청 자체가 잘못된 경우라 재시도하지 않음)
+RETRYABLE_STATUS = {408, 409, 425, 429}
+
+
+@dataclass
+class SchedulerConfig:
+    max_concurrency: int = 4          # 동시에 처리할 LLM 요청 수
+    max_retries: int = 3              # 요청당 재시도 횟수
+    backoff_base: float = 1.0         # 첫 재시도 대기 시간(초), 이후 2배씩 증가
+    backoff_max: float = 30.0         # 재시도 대기 시간 상한(초)
+    tokens_per_minute: int = 0        # 분당 토큰 한도 (0이면 제한 없음)
+    chars_per_token: float = 4.0      # 프롬프트 글자 수 → 토큰 수 추정 비율
+
+    @classmethod
+    def from_config(cls, llm_config: Optional[Dict[str, Any]]) -> 'SchedulerConfig':
+        """llm.scheduler 설정으로 생성"""
+        cfg = (llm_config or {}).get('scheduler', {}) or {}
+        defaults = cls()
+        return cls(
+            max_concurrency=max(1, int(cfg.get('max_concurrency', defaults.max_concurrency))),
+            max_retries=max(0, int(cfg.get('max_retries', defaults.max_retries))),
+            backoff_base=float(cfg.get('backoff_base', defaults.backoff_base)),
+            backoff_max=float(cfg.get('backoff_max', defaults.backoff_max)),
+            tokens_per_minute=int(cfg.get('tokens_per_minute', defaults.tokens_per_minute) or 0),
+            chars_per_token=float(cfg.get('chars_per_token', defaults.chars_per_token)),
+        )
+
+
+class TokenRateLimiter:
+    """분당 토큰 한도를 지키는 토큰 버킷 (스레드 안전)"""
+
+    def __init__(self, tokens_per_minute: int, clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.capacity = float(tokens_per_minute)
+        self.rate = self.capacity / 60.0
+        self.available = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int) -> float:
+        """
+        토큰을 차감합니다. 잔량이 부족하면 채워질 때까지 대기합니다.
+        한도보다 큰 요청은 버킷이 가득 찼을 때 통과시킵니다.
+
+        Returns:
+            대기한 시간(초)
+        """
+        needed = min(float(tokens), self.capacity)
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self.available = min(self.capacity, self.available + (now - self._updated) * self.rate)
+                self._updated = now
+                if self.available >= needed:
+                    self.available -= needed
+                    return waited
+                delay = (needed - self.available) / self.rate
+            self._sleep(delay)
+            waited += delay
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    """requests / openai 예외에서 HTTP 상태 코드를 꺼냅니다."""
+    status = getattr(error, 'status_code', None)
+    if status is None:
+        status = getattr(getattr(error, 'response', None), 'status_code', None)
+    return status if isinstance(status, int) else None
+
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    headers = getattr(getattr(error, 'response', None), 'headers', None) or {}
+    try:
+        value = headers.get('Retry-After')
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def is_retryable(error: BaseException) -> bool:
+    """연결/타임아웃 오류와 408/429/5xx 응답은 재시도 대상"""
+    status = _status_code(error)
+    if status is None:
+        return True
+    return status >= 500 or status in RETRYABLE_STATUS
+
+
+class LLMRequestScheduler:
+    """
+    LLM 요청의 동시 실행/재시도/토큰 속도 제한을 담당하는 스케줄러
+
+    - chat(): 클라이언트 호출 한 번을 재시도·속도 제한과 함께 실행 (작업 스레드에서 호출)
+    - map_unordered(): 작업 항목을 스레드 풀에서 처리하고 끝나는 순서대로 (항목, 결과, 예외)를 반환.
+      항목은 필요할 때만 이터레이터에서 꺼내므로 DB 페이지 단위 로딩과 함께 쓸 수 있습니다.
+    """
+
+    def __init__(self, config: Optional[SchedulerConfig] = None,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.config = config or SchedulerConfig()
+        self._sleep = sleep
+        self.rate_limiter = (TokenRateLimiter(self.config.tokens_per_minute, sleep=sleep)
+                             if self.config.tokens_per_minute > 0 else None)
+        self._stats_lock = threading.Lock()
+        self.stats = {'requests': 0, 'retries': 0, 'failures': 0, 'rate_limited_sec': 0.0}
+
+    def _count(self, key: str, amount: float = 1) -> None:
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def estimate_tokens(self, messages: List[Dict[str, str]], max_tokens: Optional[int] = None) -> int:
+        chars = sum(len(str(message.get('content', ''))) for message in messages)
+        return int(chars / self.config.chars_per_token) + int(max_tokens or 0)
+
+    def _backoff(self, attempt: int, error: BaseException) -> float:
+        retry_after = _retry_after(error)
+        if retry_after is not None:
+            return min(retry_after, self.config.backoff_max)
+        delay = self.config.backoff_base * (2 ** attempt)
+        return min(self.config.backoff_max, delay * (0.5 + random.random() / 2))
+
+    def call(self, fn: Callable[[], Any], tokens: int = 0) -> Any:
+        """fn()을 토큰 한도 안에서 실행하고, 재시도 가능한 오류는 백오프 후 다시 시도합니다."""
+        attempt = 0
+        while True:
+            if self.rate_limiter and tokens:
+                waited = self.rate_limiter.acquire(tokens)
+                if waited:
+                    self._count('rate_limited_sec', waited)
+            self._count('requests')
+            try:
+                return fn()
+            except Exception as e:
+                if attempt >= self.config.max_retries or not is_retryable(e):
+                    self._count('failures')
+                    raise
+                delay = self._backoff(attempt, e)
+                attempt += 1
+                self._count('retries')
+                logger.warning(f"LLM 요청 실패, {delay:.1f}초 후 재시도 ({attempt}/{self.config.max_retries}): {e}")
+                self._sleep(delay)
+
+    def chat(self, client, messages: List[Dict[str, str]], **kwargs) -> Any:
+        """client.chat(messages, **kwargs)를 재시도·속도 제한과 함께 실행"""
+        tokens = self.estimate_tokens(messages, kwargs.get('max_tokens'))
+        return self.call(lambda: client.chat(messages, **kwargs), tokens)
+
+    def map_unordered(self, items: Iterable[Any], worker: Callable[[Any], Any]
+                      ) -> Iterator[Tuple[Any, Any, Optional[BaseException]]]:
+        """
+        items를 max_concurrency개 스레드에서 worker로 처리합니다.
+        동시에 대기 중인 작업은 max_concurrency * 2개로 제한되어, items는 소비되는 만큼만 읽힙니다.
+
+        Yields:
+            (항목, worker 결과, 예외 또는 None) - 완료된 순서대로, 호출한 스레드에서
+        """
+        max_pending = self.config.max_concurrency * 2
+        iterator = iter(items)
+        exhausted = False
+        with ThreadPoolExecutor(max_workers=self.config.max_concurrency,
+                                thread_name_prefix='llm') as executor:
+            pending = {}
+            while True:
+                while not exhausted and len(pending) < max_pending:
+                    try:
+                        item = next(iterator)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    pending[executor.submit(worker, item)] = item
+                if not pending:
+                    return
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = pending.pop(future)
+                    error = future.exception()
+                    yield item, (None if error else future.result()), error
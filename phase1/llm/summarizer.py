@@ -4,8 +4,11 @@
 LLM 기반 코드 요약 및 메타데이터 향상 모듈
 LLM을 사용하여 소스 코드, SQL, 테이블에 대한 한글 요약을 생성합니다.
 """
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterator, Tuple
+import hashlib
 import json
+import threading
+from itertools import islice
 from pathlib import Path
 try:
     from phase1.llm.client import get_client
@@ -20,9 +23,18 @@ from sqlalchemy import text
 import logging
 from sqlalchemy.orm import joinedload
 from phase1.llm.intelligent_chunker import IntelligentChunker, ChunkBasedSummarizer, CodeChunk
+from phase1.llm.scheduler import LLMRequestScheduler, SchedulerConfig
+from phase1.llm.prompt_packing import PackingConfig, pack_items, build_packed_prompt, parse_packed_response
+from phase1.llm.response_cache import get_response_cache, client_model_name, template_id, normalize_content
 
 logger = logging.getLogger('llm_analyzer') # llm_analyzer.py에서 설정한 로거 사용
 
+
+def source_span_hash(source: str) -> str:
+    """요약 대상 소스 구간의 해시 (줄바꿈 형식/줄 끝 공백 차이는 무시)"""
+    return hashlib.sha256(normalize_content(source).encode('utf-8')).hexdigest()
+
+
 class CodeSummarizer:
     """LLM 기반 코드 요약 및 메타데이터 향상 클래스"""
 
@@ -41,14 +53,36 @@ class CodeSummarizer:
         self.chunk_summarizer = ChunkBasedSummarizer(self.chunker)
         print('init@summarizer.py3')
         self.dbm.initialize()
+        # 동시 실행/재시도/토큰 속도 제한 (llm.scheduler 설정)
+        self.scheduler = LLMRequestScheduler(SchedulerConfig.from_config(self.llm_config))
+        # 프로젝트/실행 간 공유하는 LLM 응답 캐시 (llm_cache 설정, 비활성화 시 None)
+        self.response_cache = get_response_cache(config)
+        # 작은 메서드/SQL 단위를 한 프롬프트로 묶는 패킹 모드 (llm.packing 설정)
+        self.packing = PackingConfig.from_config(self.llm_config)
+        self._client = None
+        self._client_lock = threading.Lock()
         print('end of init@summarizer.py')
 
     def session(self):
         """데이터베이스 세션 반환"""
         return self.dbm.get_auto_commit_session()
 
-    def _chat_with_debug(self, client, messages: list, **kwargs):
-        """한국어 시스템 프롬프트와 디버그 출력을 처리하는 LLM 채팅 헬퍼 메서드"""
+    def _get_client(self):
+        """LLM 클라이언트 (모델 가용성 확인은 처음 한 번만 수행하고 작업 스레드 간 공유)"""
+        with self._client_lock:
+            if self._client is None:
+                self._client = get_client(self.llm_config)
+            return self._client
+
+    def _chat_with_debug(self, client, messages: list, cache_template: Optional[str] = None,
+                         cache_content: Optional[str] = None, **kwargs):
+        """
+        한국어 시스템 프롬프트와 디버그 출력을 처리하는 LLM 채팅 헬퍼 메서드
+
+        응답은 (모델, 템플릿, 내용)으로 캐시됩니다. cache_template/cache_content를 주면
+        그 내용(예: 청크 코드)만으로 키를 만들어 경로 등이 다른 같은 코드도 캐시를 공유하고,
+        없으면 전체 메시지를 내용으로 사용합니다.
+        """
         # Add Korean system prompt
         korean_system = {
             "role": "system",
@@ -70,7 +104,15 @@ class CodeSummarizer:
                 print(f"[{msg['role'].upper()}] {msg['content'][:1500]}")
             #print("=" * 50)
 
-        response = client.chat(messages_with_system, **kwargs)
+        if self.response_cache is not None and not kwargs.get('stream'):
+            if cache_content is None:
+                cache_template = 'chat'
+                cache_content = '\n\n'.join(f"[{m['role']}]\n{m['content']}" for m in messages_with_system)
+            response = self.response_cache.get_or_call(
+                client_model_name(client), template_id(cache_template, **kwargs), cache_content,
+                lambda: self.scheduler.chat(client, messages_with_system, **kwargs))
+        else:
+            response = self.scheduler.chat(client, messages_with_system, **kwargs)
 
         if self.debug:
             print("★★★★★★★★★★★★★★★★★★★★★★ [DEBUG] LLM 응답 ★★★★★★★★★★★★★★★★★★★★★★")
@@ -184,7 +226,7 @@ class CodeSummarizer:
 
             # 각 청크별로 요약 생성
             chunk_summaries = []
-            client = get_client(self.llm_config)
+            client = self._get_client()
 
             for chunk in chunks:
                 chunk_summary = self._summarize_code_chunk(client, chunk)
@@ -273,7 +315,11 @@ class CodeSummarizer:
 
 요약:"""
 
-            summary = self._chat_with_debug(client, [{"role": "user", "content": prompt}], max_tokens=1000, temperature=0.3)
+            # 같은 종류의 같은 코드 청크는 파일 경로/프로젝트와 무관하게 캐시 공유
+            summary = self._chat_with_debug(client, [{"role": "user", "content": prompt}],
+                                            cache_template=f"code_chunk:{chunk.chunk_type}",
+                                            cache_content=chunk.content,
+                                            max_tokens=1000, temperature=0.3)
             return summary.strip() if isinstance(summary, str) else str(summary).strip()
 
         except Exception as e:
@@ -284,7 +330,7 @@ class CodeSummarizer:
     def _fallback_file_summary(self, file: File, file_content: str) -> Optional[str]:
         """청킹 실패 시 기존 방식으로 파일 요약"""
         try:
-            client = get_client(self.llm_config)
+            client = self._get_client()
             file_extension = Path(file.path or "").suffix.lower()
 
             prompt = f"""파일을 분석하고 목적과 기능을 1~2문장 이내로 요약해주세요:
@@ -303,16 +349,42 @@ class CodeSummarizer:
             logger.error(f"Fallback 파일 요약 실패 {file.path}: {e}\n{traceback.format_exc()}")
             return None
 
-    def summarize_method(self, method: Method) -> Optional[str]:
-        """LLM을 사용하여 메서드에 대한 요약 생성"""
+    def _extract_method_source(self, method: Method, file_content: str) -> str:
+        """파일 내용에서 메서드 코드 구간을 추출 (start_line~end_line 우선, 없으면 이름으로 추정)"""
+        if not file_content or not method.name:
+            return ''
+        lines = file_content.split('\n')
+
+        # start_line, end_line이 있으면 우선 사용
+        if method.start_line and method.end_line:
+            logger.debug(f"start_line: {method.start_line}, end_line: {method.end_line}")
+            if method.start_line <= len(lines) and method.end_line <= len(lines):
+                method_code = '\n'.join(lines[method.start_line-1:method.end_line])
+                logger.debug(f"start_line/end_line으로 추출: {len(method_code)}자")
+                if method_code:
+                    return method_code
+
+        # start_line/end_line이 없으면 휴리스틱 사용
+        for i, line in enumerate(lines):
+            if method.name in line and ('public' in line or 'private' in line or 'protected' in line):
+                max_len_method = 1000
+                logger.debug(f"휴리스틱으로 메서드 시작 찾음: {i}행")
+                method_code = '\n'.join(lines[i:i + max_len_method])
+                logger.debug(f"휴리스틱으로 추출: {len(method_code)}자")
+                return method_code
+        return ''
+
+    def summarize_method(self, method: Method, method_code: Optional[str] = None) -> Optional[str]:
+        """LLM을 사용하여 메서드에 대한 요약 생성 (method_code를 주면 파일을 다시 읽지 않음)"""
         try:
             if not self.llm_config.get('enabled', True):
                 return None
 
-            client = get_client(self.llm_config)
+            client = self._get_client()
 
             # Get method details - 메소드 소스코드를 프로젝트 폴더에서 읽어옴
-            method_code = getattr(method, 'code_snippet', '') or getattr(method, 'source_code', '') or ''
+            if not method_code:
+                method_code = getattr(method, 'code_snippet', '') or getattr(method, 'source_code', '') or ''
             logger.debug(f"메서드 {method.name}: method_code = '{method_code[:100]}'")
 
             # 만약 코드가 없고 파일 경로가 있다면 프로젝트 폴더에서 읽기 시도
@@ -320,32 +392,7 @@ class CodeSummarizer:
                 logger.debug(f"파일에서 메서드 코드 읽기 시도: {method.file.path}")
                 file_content = self._read_project_file_content(method.file.path)
                 logger.debug(f"파일 내용 읽기 결과: {len(file_content) if file_content else 0}자")
-                
-                # 메소드 이름으로 코드 추출 시도 (start_line, end_line 활용)
-                if file_content and method.name:
-                    lines = file_content.split('\n')
-                    
-                    # start_line, end_line이 있으면 우선 사용
-                    if hasattr(method, 'start_line') and hasattr(method, 'end_line') and method.start_line and method.end_line:
-                        logger.debug(f"start_line: {method.start_line}, end_line: {method.end_line}")
-                        if method.start_line <= len(lines) and method.end_line <= len(lines):
-                            method_lines = lines[method.start_line-1:method.end_line]
-                            method_code = '\n'.join(method_lines)
-                            logger.debug(f"start_line/end_line으로 추출: {len(method_code)}자")
-                    
-                    # start_line/end_line이 없으면 휴리스틱 사용
-                    if not method_code:
-                        method_start = -1
-                        for i, line in enumerate(lines):
-                            if method.name in line and ('public' in line or 'private' in line or 'protected' in line):
-                                method_start = i
-                                break
-                        if method_start >= 0:
-                            max_len_method = 1000
-                            logger.debug(f"휴리스틱으로 메서드 시작 찾음: {method_start}행")
-                            method_lines = lines[method_start:method_start + max_len_method]
-                            method_code = '\n'.join(method_lines)
-                            logger.debug(f"휴리스틱으로 추출: {len(method_code)}자")
+                method_code = self._extract_method_source(method, file_content)
 
             # 메서드 코드가 없으면 건너뛰기
             if not method_code:
@@ -380,38 +427,44 @@ class CodeSummarizer:
             logger.error(f"Failed to summarize method {method.name}: {e}")
             return None
 
-    def summarize_sql_unit(self, sql_unit: SqlUnit) -> Optional[str]:
-        """LLM을 사용하여 SQL 단위에 대한 요약 생성"""
+    def _extract_sql_unit_source(self, sql_unit: SqlUnit, file_content: str, max_sql_len: int = 10000) -> str:
+        """파일 내용에서 SQL 단위의 SQL 구간을 추출 (MyBatis statement ID 우선, 없으면 start_line~end_line)"""
+        if not file_content:
+            return ''
+        import re
+
+        # MyBatis XML에서 statement ID로 SQL 추출 시도
+        if sql_unit.stmt_id:
+            pattern = rf'<(?:select|insert|update|delete)[^>]*id\s*=\s*["\']?{re.escape(sql_unit.stmt_id)}["\']?[^>]*>(.*?)</(?:select|insert|update|delete)>'
+            match = re.search(pattern, file_content, re.DOTALL | re.IGNORECASE)
+            if match:
+                return match.group(1).strip()[:max_sql_len]
+
+        # JSP 파일에서 SQL 추출 시도 (start_line, end_line 활용)
+        if sql_unit.start_line and sql_unit.end_line:
+            file_lines = file_content.split('\n')
+            if sql_unit.start_line <= len(file_lines) and sql_unit.end_line <= len(file_lines):
+                sql_lines = file_lines[sql_unit.start_line-1:sql_unit.end_line]
+                return '\n'.join(sql_lines)[:max_sql_len]
+        return ''
+
+    def summarize_sql_unit(self, sql_unit: SqlUnit, sql_content: Optional[str] = None) -> Optional[str]:
+        """LLM을 사용하여 SQL 단위에 대한 요약 생성 (sql_content를 주면 파일을 다시 읽지 않음)"""
         try:
             max_sql_len = 10000
             if not self.llm_config.get('enabled', True):
                 return None
 
-            client = get_client(self.llm_config)
+            client = self._get_client()
 
             # SQL 내용을 프로젝트 폴더에서 읽어옴
-            sql_content = ''
+            sql_content = sql_content or ''
 
             # 파일 경로가 있다면 프로젝트 폴더에서 읽기 시도
-            if hasattr(sql_unit, 'file') and sql_unit.file and sql_unit.file.path:
+            if not sql_content and hasattr(sql_unit, 'file') and sql_unit.file and sql_unit.file.path:
                 file_content = self._read_project_file_content(sql_unit.file.path)
                 # 파일에서 SQL 내용 추출 시도
-                if file_content:
-                    import re
-                    
-                    # MyBatis XML에서 statement ID로 SQL 추출 시도
-                    if sql_unit.stmt_id:
-                        pattern = rf'<(?:select|insert|update|delete)[^>]*id\s*=\s*["\']?{re.escape(sql_unit.stmt_id)}["\']?[^>]*>(.*?)</(?:select|insert|update|delete)>'
-                        match = re.search(pattern, file_content, re.DOTALL | re.IGNORECASE)
-                        if match:
-                            sql_content = match.group(1).strip()[:max_sql_len]
-                    
-                    # JSP 파일에서 SQL 추출 시도 (start_line, end_line 활용)
-                    if not sql_content and sql_unit.start_line and sql_unit.end_line:
-                        file_lines = file_content.split('\n')
-                        if sql_unit.start_line <= len(file_lines) and sql_unit.end_line <= len(file_lines):
-                            sql_lines = file_lines[sql_unit.start_line-1:sql_unit.end_line]
-                            sql_content = '\n'.join(sql_lines)[:max_sql_len]  
+                sql_content = self._extract_sql_unit_source(sql_unit, file_content, max_sql_len)
 
             # SQL 내용이 없으면 건너뛰기 (해시값은 사용 안함)
             if not sql_content:
@@ -446,7 +499,7 @@ SQL 내용:
             if not self.llm_config.get('enabled', True):
                 return None
 
-            client = get_client(self.llm_config)
+            client = self._get_client()
 
             # 테이블과 관련된 청킹 요약 정보 수집
             chunk_context = self._collect_table_related_chunks(table.table_name)
@@ -523,7 +576,7 @@ SQL 내용:
             if not self.llm_config.get('enabled', True):
                 return None
 
-            client = get_client(self.llm_config)
+            client = self._get_client()
 
             
             # 컬럼과 관련된 청킹 요약 정보 수집
@@ -607,7 +660,7 @@ NULL 허용: {column.nullable}
             if not self.llm_config.get('enabled', True):
                 return []
 
-            client = get_client(self.llm_config)
+            client = self._get_client()
 
             # 테이블의 모든 컬럼 정보 수집
             session = self.session()
@@ -666,86 +719,288 @@ Primary Key로 적합한 컬럼명만 쉼표로 구분하여 나열해주세요.
             logger.error(f"Failed to analyze PK candidates for {table.table_name}: {e}")
             return []
 
-    def process_project_summaries(self, project_id: int, batch_size: int = 10):
-        """Process all files, methods, and SQL units for a project"""
+    # 요약 종류별 (PK 속성, 결과 저장 SQL) - process_project_summaries에서 사용
+    # llm_summary_hash에는 요약할 때 사용한 소스 구간의 해시를 함께 저장하여 변경 여부를 판단합니다.
+    _SUMMARY_UPDATES = {
+        'file': ('file_id', "UPDATE files SET llm_summary = :summary, llm_summary_confidence = :confidence, llm_summary_hash = :source_hash WHERE file_id = :id"),
+        'method': ('method_id', "UPDATE methods SET llm_summary = :summary, llm_summary_confidence = :confidence, llm_summary_hash = :source_hash WHERE method_id = :id"),
+        'sql_unit': ('sql_id', "UPDATE sql_units SET llm_summary = :summary, llm_summary_confidence = :confidence, llm_summary_hash = :source_hash WHERE sql_id = :id"),
+    }
+
+    # 소스 해시만 기록하는 SQL (해시 도입 이전에 만들어진 요약)
+    _SUMMARY_HASH_UPDATES = {
+        'file': "UPDATE files SET llm_summary_hash = :source_hash WHERE file_id = :id",
+        'method': "UPDATE methods SET llm_summary_hash = :source_hash WHERE method_id = :id",
+        'sql_unit': "UPDATE sql_units SET llm_summary_hash = :source_hash WHERE sql_id = :id",
+    }
+
+    # 변경 감지를 위해 요약 대상 전체를 훑는 페이지 크기 (대부분 건너뛰므로 커밋 단위보다 크게 읽음)
+    _SCAN_PAGE_SIZE = 500
+
+    def _summary_source(self, kind: str, obj: Any, read_file) -> Tuple[Optional[str], Optional[str]]:
+        """
+        요약 대상의 현재 소스 구간과 그 해시를 반환합니다. (소스 구간, 해시)
+
+        - 파일: 분석 시 저장한 파일 해시(File.hash), 없으면 파일 내용 해시
+        - 메서드: start_line~end_line 구간 해시
+        - SQL 단위: MyBatis statement 또는 start_line~end_line 구간 해시
+        """
+        if kind == 'file':
+            if obj.hash:
+                return None, obj.hash
+            content = read_file(obj.path)
+            return None, (source_span_hash(content) if content else None)
+        if kind == 'method':
+            source = self._extract_method_source(obj, read_file(obj.file_path))
+        else:
+            source = self._extract_sql_unit_source(obj, read_file(obj.file.path if obj.file else None))
+        return source, (source_span_hash(source) if source else None)
+
+    def _iter_pending_summaries(self, session, project_id: int, skipped: Dict[str, int]
+                                ) -> Iterator[Tuple[str, Any, Optional[str], Optional[str]]]:
+        """
+        요약이 없거나 소스가 바뀐 파일 → 메서드 → SQL 단위를 PK 순서로 조회하는 작업 큐.
+
+        각 항목의 현재 소스 구간 해시를 저장된 llm_summary_hash와 비교하여, 요약이 있고 해시가 같은
+        항목은 건너뜁니다 (skipped['unchanged']). 해시 없이 요약만 있는 항목(이전 버전에서 생성)은
+        다시 요약하지 않고 현재 해시만 기록합니다 (skipped['stamped']).
+        마지막 PK 이후부터 다음 페이지를 읽으므로(keyset) 중단된 실행을 다시 시작하면 남은 항목부터
+        이어서 처리합니다. 조회한 객체는 세션에서 분리하여 작업 스레드에 넘깁니다.
+
+        Yields:
+            (종류, 객체, 소스 구간 또는 None, 소스 해시 또는 None)
+        """
+        file_contents: Dict[str, str] = {}
+
+        def read_file(path: Optional[str]) -> str:
+            # 같은 파일의 메서드/SQL은 PK가 연속되므로 마지막으로 읽은 파일 하나만 보관
+            if not path:
+                return ''
+            if path not in file_contents:
+                file_contents.clear()
+                file_contents[path] = self._read_project_file_content(path, max_size=-1)
+            return file_contents[path]
+
+        queues = [
+            ('file', File.file_id, lambda: session.query(File).filter(File.project_id == project_id)),
+            ('method', Method.method_id, lambda: session.query(Method, File.path)
+                .join(Class, Method.class_id == Class.class_id)
+                .join(File, Class.file_id == File.file_id)
+                .filter(Method.project_id == project_id)),
+            ('sql_unit', SqlUnit.sql_id, lambda: session.query(SqlUnit).options(joinedload(SqlUnit.file)).filter(
+                SqlUnit.project_id == project_id)),
+        ]
+        for kind, pk_column, build_query in queues:
+            pk_attr, _update_sql = self._SUMMARY_UPDATES[kind]
+            last_id = 0
+            while True:
+                rows = build_query().filter(pk_column > last_id).order_by(pk_column).limit(self._SCAN_PAGE_SIZE).all()
+                if not rows:
+                    break
+                page = []
+                for row in rows:
+                    if kind == 'method':
+                        obj, obj.file_path = row
+                    else:
+                        obj = row
+                    page.append(obj)
+                last_id = getattr(page[-1], pk_attr)
+
+                pending, stamps = [], []
+                for obj in page:
+                    source, source_hash = self._summary_source(kind, obj, read_file)
+                    if obj.llm_summary is not None and source_hash is not None:
+                        if obj.llm_summary_hash == source_hash:
+                            skipped['unchanged'] += 1
+                            continue
+                        if obj.llm_summary_hash is None:
+                            stamps.append({"source_hash": source_hash, "id": getattr(obj, pk_attr)})
+                            skipped['stamped'] += 1
+                            continue
+                    elif obj.llm_summary is not None:
+                        # 소스를 찾을 수 없으면 기존 요약 유지
+                        skipped['unchanged'] += 1
+                        continue
+                    pending.append((kind, obj, source, source_hash))
+                if stamps:
+                    session.execute(text(self._SUMMARY_HASH_UPDATES[kind]), stamps)
+
+                for obj in page:
+                    if kind == 'sql_unit' and obj.file is not None and obj.file in session:
+                        session.expunge(obj.file)
+                    session.expunge(obj)
+                for item in pending:
+                    yield item
+
+    def _summarize_item(self, item: Tuple[str, Any, Optional[str], Optional[str]]) -> Optional[Tuple[str, float]]:
+        """작업 스레드에서 항목 하나를 요약하고 (요약, 신뢰도)를 반환"""
+        kind, obj, source, _source_hash = item
+        if kind == 'file':
+            logger.info(f"Summarizing file: {obj.path}")
+            summary = self.summarize_file(obj)
+        elif kind == 'method':
+            logger.info(f"Summarizing method: {obj.name}")
+            summary = self.summarize_method(obj, source)
+        else:
+            logger.info(f"Summarizing SQL unit: {obj.mapper_ns}.{obj.stmt_id}")
+            summary = self.summarize_sql_unit(obj, source)
+        return (summary, self._summary_confidence(kind, obj)) if summary else None
+
+    def _summary_confidence(self, kind: str, obj: Any) -> float:
+        if kind == 'file':
+            # Calculate confidence based on file content availability
+            return 0.8 if Path(obj.path or "").exists() else 0.5
+        if kind == 'method':
+            return 0.7  # Default confidence for method analysis
+        # Calculate confidence based on SQL content availability
+        return 0.9 if hasattr(obj, 'sql_content') and obj.sql_content else 0.4
+
+    # 패킹 모드 묶음 프롬프트의 종류별 지시문
+    _PACKED_INSTRUCTIONS = {
+        'method': "다음 Java 메서드들을 분석하고 각 메서드의 기능과 목적을 1~2문장 이내로 요약해주세요.",
+        'sql_unit': "다음 SQL 쿼리/문들을 분석하고 각 SQL 문이 하는 일과 목적을 1~2문장 이내로 요약해주세요.",
+    }
+
+    def _packing_cost(self, item: Tuple[str, Any, Optional[str], Optional[str]]) -> Optional[int]:
+        """묶음 대상 항목의 입력 토큰 추정치 (파일이나 소스 구간이 없는 항목은 None → 단건 요청)"""
+        kind, _obj, source, _source_hash = item
+        if kind == 'file' or not source:
+            return None
+        return int(len(source) / self.scheduler.config.chars_per_token)
+
+    def _packed_entry(self, kind: str, obj: Any, source: str) -> Tuple[str, str]:
+        if kind == 'method':
+            return f"메서드: {obj.name} (매개변수: {obj.parameters or '-'}, 반환 타입: {obj.return_type or '-'})", source
+        return f"SQL: {obj.mapper_ns}.{obj.stmt_id} ({obj.stmt_kind})", source
+
+    def _summarize_work(self, work: List[Tuple[str, Any, Optional[str], Optional[str]]]
+                        ) -> List[Tuple[Tuple[str, Any, Optional[str], Optional[str]], Optional[Tuple[str, float]]]]:
+        """
+        작업 스레드에서 작업 단위(항목 1개 또는 같은 종류의 묶음)를 요약합니다.
+        묶음은 한 번의 요청으로 요약하고, 응답을 해석할 수 없거나 빠진 항목은 단건 요청으로 보완합니다.
+
+        Returns:
+            [(항목, (요약, 신뢰도) 또는 None)]
+        """
+        if len(work) == 1:
+            return [(work[0], self._summarize_item(work[0]))]
+        if not self.llm_config.get('enabled', True):
+            return [(item, None) for item in work]
+
+        kind = work[0][0]
+        prompt = build_packed_prompt(self._PACKED_INSTRUCTIONS[kind],
+                                     [self._packed_entry(kind, obj, source) for _kind, obj, source, _hash in work])
+        summaries: Dict[int, str] = {}
+        try:
+            response = self._chat_with_debug(self._get_client(), [{"role": "user", "content": prompt}],
+                                             max_tokens=self.packing.response_tokens_per_item * len(work),
+                                             temperature=0.3)
+            summaries = parse_packed_response(response, len(work))
+        except Exception as e:
+            logger.warning(f"묶음 요약 실패, 단건 요청으로 전환 ({kind} {len(work)}개): {e}")
+
+        results = []
+        for index, item in enumerate(work):
+            if index in summaries:
+                results.append((item, (summaries[index], self._summary_confidence(kind, item[1]))))
+            else:
+                results.append((item, self._summarize_item(item)))
+        return results
+
+    def process_project_summaries(self, project_id: int, batch_size: int = 10,
+                                  max_items: Optional[int] = None) -> Dict[str, int]:
+        """
+        프로젝트의 파일, 메서드, SQL 단위 중 요약이 없거나 요약 이후 소스 구간이 바뀐 항목을 요약합니다.
+        소스가 그대로인 항목은 LLM을 호출하지 않으므로, 한 줄을 고친 뒤 다시 실행하면 그 줄이 속한
+        파일과 메서드만 다시 요약됩니다.
+
+        LLM 요청은 llm.scheduler.max_concurrency개까지 동시에 실행되고, 결과는 호출 스레드에서
+        batch_size개마다 커밋됩니다.
+
+        Args:
+            project_id: 프로젝트 ID
+            batch_size: 커밋 단위
+            max_items: 지정하면 이번 실행에서 처리할 최대 항목 수
+
+        Returns:
+            종류별 저장된 요약 수 {'file': n, 'method': n, 'sql_unit': n}
+        """
         logger.info(f"Starting LLM summarization for project {project_id}")
 
         # Ensure summary columns exist
         self._add_summary_columns_if_needed()
 
-        session = self.session()
+        commit_size = max(1, int(batch_size or 1))
+        processed = {'file': 0, 'method': 0, 'sql_unit': 0}
+        skipped = {'unchanged': 0, 'stamped': 0}
+        stored = {'file': 0, 'method': 0, 'sql_unit': 0}
+        session = self.dbm.get_session()
         try:
             if self.force_recreate:
                 logger.info(f"기존 LLM 요약 데이터 초기화 중 (프로젝트 ID: {project_id})...")
                 logger.info(f"[DEBUG] LLM 요약 데이터 초기화 SQL 실행 (프로젝트 ID: {project_id})")
-                session.execute(text("UPDATE files SET llm_summary = NULL, llm_summary_confidence = 0.0 WHERE project_id = :project_id"), {"project_id": project_id})
+                session.execute(text("UPDATE files SET llm_summary = NULL, llm_summary_confidence = 0.0, llm_summary_hash = NULL WHERE project_id = :project_id"), {"project_id": project_id})
                 session.execute(text("UPDATE classes SET llm_summary = NULL, llm_summary_confidence = 0.0 WHERE file_id IN (SELECT file_id FROM files WHERE project_id = :project_id)"), {"project_id": project_id})
-                session.execute(text("UPDATE methods SET llm_summary = NULL, llm_summary_confidence = 0.0 WHERE class_id IN (SELECT class_id FROM classes WHERE file_id IN (SELECT file_id FROM files WHERE project_id = :project_id)) "), {"project_id": project_id})
-                session.execute(text("UPDATE sql_units SET llm_summary = NULL, llm_summary_confidence = 0.0 WHERE file_id IN (SELECT file_id FROM files WHERE project_id = :project_id)"), {"project_id": project_id})
+                session.execute(text("UPDATE methods SET llm_summary = NULL, llm_summary_confidence = 0.0, llm_summary_hash = NULL WHERE class_id IN (SELECT class_id FROM classes WHERE file_id IN (SELECT file_id FROM files WHERE project_id = :project_id)) "), {"project_id": project_id})
+                session.execute(text("UPDATE sql_units SET llm_summary = NULL, llm_summary_confidence = 0.0, llm_summary_hash = NULL WHERE file_id IN (SELECT file_id FROM files WHERE project_id = :project_id)"), {"project_id": project_id})
+                session.commit()
                 logger.info("LLM 요약 데이터 초기화 완료.")
                 logger.info("[DEBUG] LLM 요약 데이터 초기화 완료.")
 
-            # Process files
-            files = session.query(File).filter(
-                File.project_id == project_id,
-                File.llm_summary.is_(None)
-            ).limit(batch_size).all()
-
-            for file in files:
-                logger.info(f"Summarizing file: {file.path}")
-                summary = self.summarize_file(file)
-                if summary:
-                    # Calculate confidence based on file content availability
-                    confidence = 0.8 if Path(file.path or "").exists() else 0.5
-                    session.execute(
-                        text("UPDATE files SET llm_summary = :summary, llm_summary_confidence = :confidence WHERE file_id = :file_id"),
-                        {"summary": summary, "confidence": confidence, "file_id": file.file_id}
-                    )
+            # DatabaseManager.Session은 scoped_session이므로 조회와 저장은 같은 세션에서 수행
+            items = self._iter_pending_summaries(session, project_id, skipped)
+            if max_items is not None:
+                items = islice(items, max_items)
 
-            logger.info(f"Processed {len(files)} files")
-
-            # Process methods
-            methods = session.query(Method).join(Class).join(File).filter(
-                File.project_id == project_id,
-                Method.llm_summary.is_(None)
-            ).limit(batch_size).all()
-
-            for method in methods:
-                logger.info(f"Summarizing method: {method.name}")
-                summary = self.summarize_method(method)
-                if summary:
-                    # Calculate confidence based on method code availability
-                    confidence = 0.7  # Default confidence for method analysis
-                    session.execute(
-                        text("UPDATE methods SET llm_summary = :summary, llm_summary_confidence = :confidence WHERE method_id = :method_id"),
-                        {"summary": summary, "confidence": confidence, "method_id": method.method_id}
-                    )
-
-            logger.info(f"Processed {len(methods)} methods")
-
-            # Process SQL units
-            sql_units = session.query(SqlUnit).join(File).filter(
-                File.project_id == project_id,
-                SqlUnit.llm_summary.is_(None)
-            ).limit(batch_size).all()
-
-            for sql_unit in sql_units:
-                logger.info(f"Summarizing SQL unit: {sql_unit.mapper_ns}.{sql_unit.stmt_id}")
-                summary = self.summarize_sql_unit(sql_unit)
-                if summary:
-                    # Calculate confidence based on SQL content availability
-                    confidence = 0.9 if hasattr(sql_unit, 'sql_content') and sql_unit.sql_content else 0.4
-                    session.execute(
-                        text("UPDATE sql_units SET llm_summary = :summary, llm_summary_confidence = :confidence WHERE sql_id = :sql_id"),
-                        {"summary": summary, "confidence": confidence, "sql_id": sql_unit.sql_id}
-                    )
-
-            logger.info(f"Processed {len(sql_units)} SQL units")
+            # 패킹 모드에서는 작은 메서드/SQL 단위를 묶어 한 번에 요청 (llm.packing 설정)
+            if self.packing.enabled:
+                work_units = pack_items(items, self._packing_cost, self.packing, group=lambda item: item[0])
+            else:
+                work_units = ([item] for item in items)
+
+            uncommitted = 0
+            packed = {'requests': 0, 'items': 0}
+            for work, results, error in self.scheduler.map_unordered(work_units, self._summarize_work):
+                if len(work) > 1:
+                    packed['requests'] += 1
+                    packed['items'] += len(work)
+                if error is not None:
+                    for kind, *_rest in work:
+                        processed[kind] += 1
+                    logger.error(f"{work[0][0]} 요약 실패: {error}")
+                    continue
+                for (kind, obj, _source, source_hash), result in results:
+                    processed[kind] += 1
+                    if not result:
+                        continue
+                    summary, confidence = result
+                    pk_attr, update_sql = self._SUMMARY_UPDATES[kind]
+                    session.execute(text(update_sql),
+                                    {"summary": summary, "confidence": confidence, "source_hash": source_hash,
+                                     "id": getattr(obj, pk_attr)})
+                    stored[kind] += 1
+                    uncommitted += 1
+                if uncommitted >= commit_size:
+                    session.commit()
+                    uncommitted = 0
+            session.commit()
+
+            logger.info(f"Processed {processed['file']} files")
+            logger.info(f"Processed {processed['method']} methods")
+            logger.info(f"Processed {processed['sql_unit']} SQL units")
+            logger.info(f"소스 변경 없음으로 건너뛴 항목: {skipped['unchanged']}개, 해시만 기록한 기존 요약: {skipped['stamped']}개")
+            if self.packing.enabled:
+                logger.info(f"묶음 요청: {packed['requests']}회, 묶어서 요청한 항목: {packed['items']}개")
+            logger.info(f"LLM 요청 통계: {self.scheduler.stats}")
+            if self.response_cache is not None:
+                logger.info(f"LLM 응답 캐시 통계: {self.response_cache.stats()}")
 
         except Exception as e:
+            session.rollback()
             handle_critical_error(logger, "프로젝트 요약 처리 실패", e)
         finally:
             session.close()
+        return stored
 
     def analyze_joins_from_sql(self, sql_unit: SqlUnit) -> List[Dict[str, Any]]:
         """Analyze SQL to extract join conditions using LLM"""
@@ -753,7 +1008,7 @@ Primary Key로 적합한 컬럼명만 쉼표로 구분하여 나열해주세요.
             if not self.llm_config.get('enabled', True):
                 return []
 
-            client = get_client(self.llm_config)
+            client = self._get_client()
 
             # SQL 내용을 chunks에서 가져오기
             sql_text = ''
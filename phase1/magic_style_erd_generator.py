@@ -695,9 +695,11 @@ class MagicStyleERDGenerator:
                 <ul class="column-list">
             ''')
             
+            pk_columns = set(table.primary_keys)
+            fk_columns = {fk[0] for fk in table.foreign_keys}
             for column in table.columns:
-                pk_badge = f'<span class="pk-badge">PK</span>' if column.name in table.primary_keys else ""
-                fk_badge = f'<span class="fk-badge">FK</span>' if any(fk[0] == column.name for fk in table.foreign_keys) else ""
+                pk_badge = f'<span class="pk-badge">PK</span>' if column.name in pk_columns else ""
+                fk_badge = f'<span class="fk-badge">FK</span>' if column.name in fk_columns else ""
                 
                 html_parts.append(f'''
                     <li class="column-item">
@@ -779,9 +781,11 @@ class MagicStyleERDGenerator:
                     <ul class="column-list">
                 ''')
                 
+                pk_columns = set(table.primary_keys)
+                fk_columns = {fk[0] for fk in table.foreign_keys}
                 for column in table.columns:
-                    pk_badge = f'<span class="pk-badge">PK</span>' if column.name in table.primary_keys else ""
-                    fk_badge = f'<span class="fk-badge">FK</span>' if any(fk[0] == column.name for fk in table.foreign_keys) else ""
+                    pk_badge = f'<span class="pk-badge">PK</span>' if column.name in pk_columns else ""
+                    fk_badge = f'<span class="fk-badge">FK</span>' if column.name in fk_columns else ""
                     comment_text = f"<br><small>{column.comment}</small>" if column.comment else ""
                     
                     html_parts.append(f'''
@@ -810,10 +814,9 @@ class MagicStyleERDGenerator:
 
 if __name__ == "__main__":
     # 테스트
-    from metadb_erd_analyzer import MetaDBERDAnalyzer
+    from metadb_erd_analyzer import get_erd_structure
     
-    analyzer = MetaDBERDAnalyzer("../project/sampleSrc")
-    erd_structure = analyzer.analyze_erd()
+    erd_structure = get_erd_structure("../project/sampleSrc")
     
     generator = MagicStyleERDGenerator()
     html_content = generator.generate_html(erd_structure, "../project/sampleSrc/report/erd_magic_style_20250904.html")
@@ -13,7 +13,8 @@ import hashlib
 import fnmatch
 import logging
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Set, Tuple
+from contextlib import contextmanager
 import time
 from datetime import datetime, timedelta
 import traceback
@@ -27,11 +28,14 @@ from phase1.models.database import (
     DuplicateInstance, ParseResultModel, Base
 )
 from phase1.parsers.parser_factory import ParserFactory
+from phase1.core.parse_stage import ParallelParseStage, parse_source_file, select_parser_key, plain_to_orm
+from phase1.core.chunk_stage import ParallelChunkStage
 
 from phase1.parsers.java.javaparser_enhanced import JavaParserEnhanced
 from phase1.parsers.jsp.jsp_parser import JSPParser
 from phase1.parsers.sql_parser_simple import SimpleSQLParser as SqlParser
 from phase1.database.metadata_engine import MetadataEngine
+from phase1.database.bulk_writer import BulkWriter
 from phase1.utils.csv_loader import CsvLoader
 from phase1.utils.logger import handle_non_critical_error, handle_critical_error
 from phase1.utils.logger import setup_logging
@@ -40,7 +44,9 @@ from phase1.utils.confidence_calculator import ConfidenceCalculator
 from phase1.utils.confidence_validator import ConfidenceValidator, ConfidenceCalibrator, GroundTruthEntry
 from phase1.utils.filter_config_manager import FilterConfigManager
 from phase1.utils.edge_generator import EdgeGenerator
-from phase1.llm.intelligent_chunker import IntelligentChunker
+from phase1.llm.intelligent_chunker import IntelligentChunker, ChunkSpan
+from phase1.llm.embedding_index import ChunkEmbeddingIndex
+from phase1.utils.file_content_cache import FileContentCache
 
 
 class SourceAnalyzer:
@@ -48,6 +54,9 @@ class SourceAnalyzer:
     
     def __init__(self, global_config_path: str, phase_config_path: str, project_name: str = None):
         self.project_name = project_name
+        # 파일 분석 중 여러 파일이 공유하는 일괄 저장 세션/저장기 (_analyze_files에서 설정)
+        self._bulk_session = None
+        self._bulk_writer = None
         # 전역 및 Phase별 설정 파일을 로드하고 병합합니다.
         self.config = self._load_merged_config(global_config_path, phase_config_path)
         # 로깅을 설정합니다.
@@ -94,6 +103,9 @@ class SourceAnalyzer:
             # 메타데이터 엔진, CSV 로더, 신뢰도 계산기 및 유효성 검사기를 초기화합니다.
             self.metadata_engine = MetadataEngine(self.config, self.db_manager, project_name=self.project_name)
             self.csv_loader = CsvLoader(self.config)
+            # 실행 동안 메인 프로세스의 엣지 생성과 순차 파싱/청킹(워커 1개)이 공유하는 파일 내용 캐시
+            # (워커 프로세스는 파일을 한 번씩만 읽으므로 캐시하지 않음)
+            self.file_cache = FileContentCache.from_config(self.config)
             self.confidence_calculator = ConfidenceCalculator(self.config)
             self.confidence_validator = ConfidenceValidator(self.config, self.confidence_calculator)
             self.confidence_calibrator = ConfidenceCalibrator(self.confidence_validator)
@@ -231,24 +243,44 @@ class SourceAnalyzer:
         source_files = self._collect_source_files(project_root, project_name)
         jar_files = self._collect_dependency_jars(Path(project_root).parent, project_name)
         # 증분 분석 모드인 경우 변경된 파일만 필터링합니다.
+        edge_dependent_file_ids = None
         if incremental:
-            source_files = await self._filter_changed_files(source_files, project_id)
+            source_files, removed_count, edge_dependent_file_ids = await self._filter_changed_files(
+                source_files, project_id)
+            jar_files = await self._filter_changed_jars(jar_files, project_id)
+            if not source_files and not jar_files and not removed_count:
+                self.logger.info("변경된 파일이 없습니다. 증분 분석을 종료합니다.")
+                return
         # 분석할 소스 파일이 없으면 경고를 기록하고 반환합니다.
-        if not source_files:
+        elif not source_files:
             self.logger.warning("분석할 소스 파일이 없습니다.")
             return
         # 소스 파일 및 JAR 파일을 분석합니다.
-        await self._analyze_files(source_files, project_id)
+        if source_files:
+            await self._analyze_files(source_files, project_id)
         if jar_files:
             await self._analyze_jars(jar_files, project_id)
+        # 증분 분석: 정리 전 메서드/SQL 유닛의 LLM 요약을 다시 저장된 행에 복사합니다 (소스 구간 해시로 재요약 판단).
+        if incremental:
+            await self.metadata_engine.restore_llm_summaries(project_id)
         # 의존성 그래프를 구축합니다.
         await self.metadata_engine.build_dependency_graph(project_id)
         
-        # 엣지 생성을 실행합니다.
-        await self._generate_edges(project_id)
+        # 엣지 생성을 실행합니다. (증분 모드에서는 변경된 파일과 그 파일을 참조하던 파일만)
+        if incremental:
+            await self._generate_edges(project_id, source_files, edge_dependent_file_ids)
+        else:
+            await self._generate_edges(project_id)
+        
+        # 지능형 청킹을 실행합니다. (증분 모드에서는 새로 분석한 파일만)
+        await self._run_intelligent_chunking(project_id, source_files if incremental else None)
         
-        # 지능형 청킹을 실행합니다.
-        await self._run_intelligent_chunking(project_id)
+        # 비정규화 project_id(classes/methods/sql_units/joins/chunks)를 채웁니다.
+        backfilled = self.db_manager.backfill_project_ids()
+        self.logger.info(f"project_id 보정: {backfilled}건")
+        
+        # 청크 임베딩을 갱신합니다. (Chunk.hash 기준 증분)
+        await self._run_embedding(project_id)
         
         # 리포트 생성은 별도 스크립트로 실행
         self.logger.info("리포트 생성은 별도 스크립트로 실행하세요:")
@@ -327,9 +359,44 @@ class SourceAnalyzer:
 
         return source_files
 
-    async def _filter_changed_files(self, source_files: List[str], project_id: int) -> List[str]:
-        # ... (Implementation from previous version) ...
-        return source_files # Placeholder
+    async def _filter_changed_files(self, source_files: List[str], project_id: int) -> Tuple[List[str], int, Set[int]]:
+        """증분 분석: 추가/변경된 파일만 남기고, 변경/삭제된 파일의 기존 메타데이터를 정리합니다.
+        
+        Returns:
+            (다시 분석할 파일 목록, 정리된 파일 수, 정리로 엣지가 끊겨 엣지를 다시 생성할 기존 파일 ID)
+        """
+        changes = await self.metadata_engine.check_file_changes(project_id, source_files)
+        added = [path for path, change in changes if change == 'added']
+        modified = [path for path, change in changes if change == 'modified']
+        deleted = [path for path, change in changes if change == 'deleted']
+        self.logger.info(
+            f"증분 분석 변경 사항: 추가 {len(added)}개, 변경 {len(modified)}개, 삭제 {len(deleted)}개, "
+            f"변경 없음 {len(source_files) - len(added) - len(modified)}개"
+        )
+        
+        # 정리될 엔티티를 가리키던 엣지의 소스 파일은 엣지를 다시 생성해야 하므로 정리 전에 조회합니다.
+        dependent_file_ids = await self.metadata_engine.find_edge_dependent_files(project_id, modified + deleted)
+        # 변경된 파일은 파일 레코드까지 지우고 새로 저장합니다 (해시/mtime이 재분석 결과와 일치하도록).
+        removed_count = await self.metadata_engine.purge_file_artifacts(project_id, modified + deleted)
+        
+        changed = set(added + modified)
+        return [path for path in source_files if path in changed], removed_count, dependent_file_ids
+
+    async def _filter_changed_jars(self, jar_files: List[str], project_id: int) -> List[str]:
+        """증분 분석: 경로와 mtime이 같은 JAR 파일은 다시 분석하지 않습니다."""
+        with self.db_manager.get_auto_commit_session() as session:
+            stored = {path: mtime for path, mtime in session.query(File.path, File.mtime).filter(
+                File.project_id == project_id, File.language == 'jar')}
+        
+        changed_jars = [
+            path for path in jar_files
+            if stored.get(path) != datetime.fromtimestamp(os.path.getmtime(path))
+        ]
+        stale = [path for path in changed_jars if path in stored]
+        if stale:
+            await self.metadata_engine.purge_file_artifacts(project_id, stale)
+        self.logger.info(f"증분 분석 JAR: 재분석 {len(changed_jars)}개, 변경 없음 {len(jar_files) - len(changed_jars)}개")
+        return changed_jars
 
     def _collect_dependency_jars(self, project_base: Path, project_name: str) -> List[str]:
         """프로젝트의 의존 JAR 파일을 수집"""
@@ -357,53 +424,105 @@ class SourceAnalyzer:
         parser = self.parsers.get('jar')
         if not parser:
             return
-        # 각 JAR 파일을 분석합니다.
-        for jar_path in jar_files:
-            try:
-                file_obj, classes, methods, _ = parser.parse_file(jar_path, project_id)
-                with self.db_manager.get_auto_commit_session() as session:
-                    # 파일 객체를 저장하고 ID를 확보합니다.
-                    session.add(file_obj)
-                    session.flush()
-                    file_id = file_obj.file_id
-                    class_id_map = {}
-                    # 클래스 객체를 저장하고 클래스 ID 맵을 생성합니다.
-                    for cls in classes:
-                        cls.file_id = file_id
-                        session.add(cls)
-                        session.flush()
-                        class_id_map[cls.fqn] = cls.class_id
-                    # 메서드 객체를 저장하고 클래스 ID를 연결합니다.
-                    for m in methods:
-                        m.file_id = file_id
-                        if hasattr(m, 'owner_fqn') and m.owner_fqn in class_id_map:
-                            m.class_id = class_id_map[m.owner_fqn]
-                        session.add(m)
-                        session.flush()
-                    self.logger.debug(f"저장 완료: JAR {jar_path} - 클래스 {len(classes)}개, 메소드 {len(methods)}개")
-            except Exception as e:
-                handle_critical_error(self.logger, f"JAR 분석 실패 {jar_path}", e)
-                raise  # 예외를 다시 발생시켜서 중단
+        from phase1.parsers.jar_parser import jar_sha256
+        
+        sources = {'memory': 0, 'disk': 0, 'parsed': 0}
+        # 각 JAR 파일의 시그니처를 캐시(sha256 기준)에서 가져오거나 추출한 뒤 일괄 적재합니다.
+        with self.db_manager.get_auto_commit_session() as session:
+            writer = BulkWriter.from_config(session, self.config)
+            for jar_path in jar_files:
+                try:
+                    file_hash = jar_sha256(jar_path)
+                    signatures, source = parser.load_signatures(jar_path, file_hash)
+                    sources[source] += 1
+                    # 파일 레코드를 저장하고 ID를 확보합니다.
+                    file_id = writer.insert_rows(File, [{
+                        'project_id': project_id,
+                        'path': jar_path,
+                        'language': 'jar',
+                        'hash': file_hash,
+                        'loc': 0,
+                        'mtime': datetime.fromtimestamp(os.path.getmtime(jar_path)),
+                    }], return_ids=True)[0]
+                    if signatures is None:
+                        writer.file_done()
+                        continue
+                    # 클래스를 배치 저장하고 클래스 ID 맵을 생성합니다.
+                    class_ids = writer.insert_rows(Class, [
+                        {'file_id': file_id, 'fqn': fqn, 'name': name} for fqn, name in signatures.classes
+                    ], return_ids=True)
+                    class_id_map = {fqn: class_id for (fqn, _), class_id in zip(signatures.classes, class_ids)}
+                    # 메서드를 클래스 ID와 연결하여 배치 저장합니다.
+                    writer.insert_rows(Method, [
+                        {'class_id': class_id_map[owner_fqn], 'name': name, 'signature': signature,
+                         'return_type': return_type, 'parameters': params}
+                        for owner_fqn, name, signature, return_type, params in signatures.methods
+                        if owner_fqn in class_id_map
+                    ])
+                    writer.file_done()
+                    self.logger.debug(
+                        f"저장 완료: JAR {jar_path} ({source}) - 클래스 {len(signatures.classes)}개, "
+                        f"메소드 {len(signatures.methods)}개"
+                    )
+                except Exception as e:
+                    handle_critical_error(self.logger, f"JAR 분석 실패 {jar_path}", e)
+                    raise  # 예외를 다시 발생시켜서 중단
+        self.logger.info(
+            f"JAR 분석 완료: {len(jar_files)}개 (메모리 캐시 {sources['memory']}, "
+            f"디스크 캐시 {sources['disk']}, 신규 추출 {sources['parsed']})"
+        )
 
     async def _analyze_files(self, source_files: List[str], project_id: int):
-        """소스 파일들을 분석합니다."""
+        """소스 파일들을 분석합니다 (파싱은 프로세스 풀, 저장은 단일 writer)."""
         self.logger.info(f"소스 파일 분석 시작: {len(source_files)}개 파일")
         
         # 파일 타입별로 그룹화
         file_groups = self._group_files_by_type(source_files)
         
-        # 각 파일 타입별로 적절한 파서를 사용하여 분석
+        # 타입 순서(java → jsp → xml ...)를 유지한 파싱 작업 목록 구성
+        parse_tasks = []
         for file_type, files in file_groups.items():
             if not files:
                 continue
-                
-            self.logger.info(f"{file_type} 파일 분석 시작: {len(files)}개")
-            
-            for file_path in files:
-                await self._analyze_single_file(file_path, project_id, file_type)
+            self.logger.info(f"{file_type} 파일 분석 대상: {len(files)}개")
+            parse_tasks.extend((file_path, file_type) for file_path in files)
+        
+        # 워커 프로세스가 파싱한 결과를 입력 순서대로 받아 저장합니다.
+        # 저장은 하나의 세션에서 배치 INSERT로 처리하고 N개 파일마다 커밋합니다.
+        stage = ParallelParseStage(self.config, parsers=self.parsers, file_cache=self.file_cache)
+        self.logger.info(f"파싱 워커 수: {stage.max_workers}")
+        with self.db_manager.get_auto_commit_session() as session:
+            self._bulk_session = session
+            self._bulk_writer = BulkWriter.from_config(session, self.config)
+            try:
+                for payload in stage.run(parse_tasks, project_id):
+                    await self._persist_parse_payload(payload, project_id)
+                    self._bulk_writer.file_done()
+            finally:
+                self._bulk_session = None
+                self._bulk_writer = None
         
         self.logger.info("소스 파일 분석 완료")
 
+    @contextmanager
+    def _write_session(self):
+        """파일 저장용 세션을 반환합니다.
+        
+        _analyze_files 진행 중에는 일괄 저장 세션을 공유하고(커밋은 BulkWriter가 담당),
+        그 외에는 호출마다 자동 커밋 세션을 사용합니다.
+        """
+        if self._bulk_session is not None:
+            yield self._bulk_session
+        else:
+            with self.db_manager.get_auto_commit_session() as session:
+                yield session
+
+    def _get_bulk_writer(self, session) -> BulkWriter:
+        """공유 저장기가 있으면 재사용하고, 없으면 세션에 대한 저장기를 생성합니다."""
+        if self._bulk_writer is not None:
+            return self._bulk_writer
+        return BulkWriter.from_config(session, self.config)
+
     def _group_files_by_type(self, source_files: List[str]) -> Dict[str, List[str]]:
         """파일들을 타입별로 그룹화합니다."""
         file_groups = {
@@ -436,206 +555,92 @@ class SourceAnalyzer:
         return file_groups
 
     async def _analyze_single_file(self, file_path: str, project_id: int, file_type: str):
-        """단일 파일을 분석합니다."""
+        """단일 파일을 현재 프로세스에서 분석합니다."""
+        payload = parse_source_file(self.parsers, file_path, file_type, project_id, self.file_cache)
+        await self._persist_parse_payload(payload, project_id)
+
+    async def _persist_parse_payload(self, payload: Dict[str, Any], project_id: int):
+        """파싱 스테이지 결과(payload)를 데이터베이스에 저장합니다."""
+        file_path = payload['file_path']
         try:
-            # 파일 타입에 따라 적절한 파서 선택
-            parser = self._select_parser_for_file(file_path, file_type)
-            if not parser:
+            if payload['status'] == 'error':
+                self.logger.error(f"워커 파싱 오류 {file_path}:\n{payload.get('traceback')}")
+                raise RuntimeError(payload['error_message'])
+            
+            if payload['status'] == 'no_parser':
                 self.logger.warning(f"적절한 파서를 찾을 수 없음: {file_path}")
                 await self._save_parsing_error(file_path, project_id, "파서를 찾을 수 없음", "ParserNotFound")
                 return
             
-            # CSV 파일 특수 처리
-            if parser == 'csv_metadata_only':
+            kind = payload['kind']
+            if kind == 'csv':
                 # CSV 파일은 메타정보만 저장 (내용 파싱 없음)
                 file_id = await self._save_file_info(file_path, project_id)
                 await self._save_csv_metadata(file_id, file_path, project_id)
-                return
-            
-            # Java 파일의 경우 새로운 파서 사용
-            if file_type == 'java' and hasattr(parser, 'parse_content'):
-                # 파일 정보를 데이터베이스에 저장하고 file_id 획득
-                file_id = await self._save_file_info(file_path, project_id)
-                
-                # 파일 내용 읽기
-                try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                except Exception as e:
-                    self.logger.error(f"파일 읽기 실패 {file_path}: {e}")
-                    await self._save_parsing_error(file_path, project_id, f"파일 읽기 실패: {e}", "FileReadError")
-                    return
-                
-                # JavaParser의 parse_content 메서드 사용
-                context = {'file_path': file_path}
-                analysis_result = parser.parse_content(content, context)
-                
-                # 분석 결과를 데이터베이스에 저장
-                await self._save_analysis_result(analysis_result, file_id, project_id)
-            elif file_type == 'jsp' and hasattr(parser, 'parse_file'):
-                # JSP 파서의 parse_file 메서드 사용 (동기)
-                file_obj, sql_units, joins, filters, edges, vulnerabilities = parser.parse_file(file_path, project_id)
-                
-                # 분석 결과를 데이터베이스에 저장
+            elif kind == 'jsp':
+                result = payload['result']
+                file_obj = plain_to_orm(result['file_obj'])
+                # 증분 분석의 변경 감지와 동일한 기준(원본 바이트 해시)으로 저장
+                file_obj.hash = payload['file_info']['hash']
+                file_obj.mtime = payload['file_info']['mtime']
+                sql_units, joins, filters, edges, vulnerabilities = (
+                    [plain_to_orm(o) for o in group] for group in result['groups']
+                )
                 await self._save_jsp_analysis_result(file_obj, sql_units, joins, filters, edges, vulnerabilities, project_id)
             else:
-                # 기존 방식 사용
-                file_id = await self._save_file_info(file_path, project_id)
-                
-                # 파일 내용을 읽어서 분석
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                
-                # 파서를 사용하여 파일 분석
-                analysis_result = await self._parse_file_with_parser(parser, content, file_path, file_type, project_id)
-                
-                # 분석 결과를 데이터베이스에 저장
-                await self._save_analysis_result(analysis_result, file_id, project_id)
+                # Java(dict) 및 MyBatis/SQL 결과는 공통 저장 경로 사용
+                file_id = await self._save_file_info(file_path, project_id, payload.get('file_info'))
+                await self._save_analysis_result(payload['result'], file_id, project_id)
         
         except Exception as e:
             self.logger.error(f"파일 분석 실패 {file_path}: {e}")
-            await self._save_parsing_error(file_path, project_id, str(e), type(e).__name__)
+            if self._bulk_session is not None:
+                # 실패한 파일의 부분 저장분을 버리고 에러 정보만 커밋 (아직 커밋되지 않은 배치 포함)
+                self._bulk_session.session.rollback()
+            await self._save_parsing_error(file_path, project_id, str(e), payload.get('error_type') or type(e).__name__)
+            if self._bulk_writer is not None:
+                self._bulk_writer.commit()
             # 에러 처리 지침에 따라 중지
             self.logger.error(f"치명적 에러로 인한 프로세스 중지: {file_path}")
             exit(1)
 
     def _select_parser_for_file(self, file_path: str, file_type: str):
         """파일 타입에 따라 적절한 파서를 선택합니다."""
-        file_ext = Path(file_path).suffix.lower()
+        content = None
+        if Path(file_path).suffix.lower() == '.xml':
+            try:
+                content = self.file_cache.get_text(file_path)
+            except OSError:
+                content = ''
         
-        if file_ext == '.java':
-            # Java 파일은 항상 일반 Java 파서 사용 (Spring, JPA 파서는 비활성화됨)
-            parser = self.parsers.get('java')
-            
-            # 디버깅 정보 추가
-            if parser is None:
-                self.logger.warning(f"Java 파서를 찾을 수 없음. 사용 가능한 파서: {list(self.parsers.keys())}")
-            else:
-                self.logger.info(f"Java 파서 선택됨: {type(parser).__name__}")
-            
-            return parser
-        elif file_ext == '.jsp':
-            return self.parsers.get('jsp_mybatis')
-        elif file_ext == '.xml':
-            # XML 파일의 경우 MyBatis, Spring 설정 등 구분
-            if self._is_mybatis_file(file_path):
-                return self.parsers.get('mybatis')
-            elif self._is_spring_config_file(file_path):
-                return self.parsers.get('spring')
-            else:
-                return self.parsers.get('sql')  # 일반 XML은 SQL 파서로 처리
-        elif file_ext == '.sql':
-            return self.parsers.get('sql')
-        elif file_ext == '.properties':
-            return self.parsers.get('spring')  # Spring 설정 파일로 처리
-        elif file_ext == '.csv':
+        parser_key = select_parser_key(file_path, content)
+        if parser_key == 'csv':
             # CSV 파일은 단순 파일 메타정보만 저장 (내용 파싱 없음)
             return 'csv_metadata_only'  # 특수 식별자
-        
-        return None
-
-    def _is_spring_file(self, file_path: str) -> bool:
-        """Spring 관련 파일인지 확인합니다."""
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                return any(keyword in content for keyword in ['@SpringBootApplication', '@Component', '@Service', '@Repository', '@Controller'])
-        except:
-            return False
-
-    def _is_jpa_file(self, file_path: str) -> bool:
-        """JPA 관련 파일인지 확인합니다."""
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                return any(keyword in content for keyword in ['@Entity', '@Table', '@Column', '@Id', '@GeneratedValue'])
-        except:
-            return False
-
-    def _is_mybatis_file(self, file_path: str) -> bool:
-        """MyBatis 관련 파일인지 확인합니다."""
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                return any(keyword in content for keyword in ['<mapper', '<select', '<insert', '<update', '<delete'])
-        except:
-            return False
-
-    def _is_spring_config_file(self, file_path: str) -> bool:
-        """Spring 설정 파일인지 확인합니다."""
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                return any(keyword in content for keyword in ['<beans', '<context:', '<mvc:', '<aop:'])
-        except:
-            return False
-
-    async def _parse_file_with_parser(self, parser, content: str, file_path: str, file_type: str, project_id: int):
-        """선택된 파서를 사용하여 파일을 분석합니다."""
-        if hasattr(parser, 'parse'):
-            # 직접 parse 메서드가 있는 경우
-            import inspect
-            if inspect.iscoroutinefunction(parser.parse):
-                # ParserFactory인 경우 project_id 없이 호출
-                if hasattr(parser, 'get_parser'):
-                    return await parser.parse(content, file_path)
-                else:
-                    # JavaParserEnhanced인 경우 project_id 포함
-                    return await parser.parse(content, file_path, project_id)
-            else:
-                # ParserFactory인 경우 project_id 없이 호출
-                if hasattr(parser, 'get_parser'):
-                    return parser.parse(content, file_path)
-                else:
-                    # JavaParserEnhanced인 경우 project_id 포함
-                    return parser.parse(content, file_path, project_id)
-        elif hasattr(parser, 'get_parser'):
-            # 파서 팩토리인 경우
-            # 파일 타입에 따라 적절한 파서 인스턴스 생성
-            if file_type == 'java':
-                if self._is_spring_file(file_path):
-                    return parser.get_parser('spring', 'framework').parse(content, file_path)
-                elif self._is_jpa_file(file_path):
-                    return parser.get_parser('jpa', 'persistence').parse(content, file_path)
-                else:
-                    return parser.get_parser('java', 'source').parse(content, file_path)
-            elif file_type == 'xml':
-                if self._is_mybatis_file(file_path):
-                    context = {'file_path': file_path}
-                    return parser.parse_sql(content, context)
-                elif self._is_spring_config_file(file_path):
-                    return await parser.get_parser('spring', 'framework').parse(content, file_path)
-                else:
-                    # Oracle SQL 파서 사용
-                    return await parser.get_parser('oracle', 'select').parse(content, file_path)
-            elif file_type == 'sql':
-                return await parser.get_parser('oracle', 'select').parse(content, file_path)
-            else:
-                # 기본 파서 사용
-                return await parser.get_parser('java', 'source').parse(content, file_path)
-        elif hasattr(parser, 'parse_sql'):
-            # MyBatisParser인 경우
-            context = {'file_path': file_path}
-            return parser.parse_sql(content, context)
-        else:
-            raise ValueError(f"지원되지 않는 파서 타입: {type(parser)}")
+        return self.parsers.get(parser_key) if parser_key else None
 
-    async def _save_file_info(self, file_path: str, project_id: int) -> int:
-        """파일 정보를 데이터베이스에 저장하고 파일 ID를 반환합니다."""
-        with self.db_manager.get_auto_commit_session() as session:
+    async def _save_file_info(self, file_path: str, project_id: int, file_info: Dict[str, Any] = None) -> int:
+        """파일 정보를 데이터베이스에 저장하고 파일 ID를 반환합니다.
+        
+        file_info(hash, loc, mtime)가 주어지면 파일을 다시 읽지 않습니다.
+        """
+        with self._write_session() as session:
             # 파일 객체가 이미 존재하는지 확인
             file_obj = session.query(File).filter_by(path=file_path, project_id=project_id).first()
             if file_obj:
                 return file_obj.file_id
             
+            if file_info is None:
+                file_info = self.file_cache.get(file_path).file_info
+            
             # 파일 객체 생성 (실제 모델 필드에 맞게 수정)
             file_obj = File(
                 path=file_path,
                 project_id=project_id,
                 language=Path(file_path).suffix.lower(),
-                hash=hashlib.md5(open(file_path, 'rb').read()).hexdigest(),
-                loc=len(open(file_path, 'r', encoding='utf-8', errors='ignore').readlines()),
-                mtime=datetime.fromtimestamp(os.path.getmtime(file_path))
+                hash=file_info['hash'],
+                loc=file_info['loc'],
+                mtime=file_info['mtime']
             )
             session.add(file_obj)
             session.flush()
@@ -820,7 +825,9 @@ class SourceAnalyzer:
     async def _save_jsp_analysis_result(self, file_obj: File, sql_units: List[Any], joins: List[Any], filters: List[Any], edges: List[Any], vulnerabilities: List[Any], project_id: int):
         """JSP 분석 결과를 데이터베이스에 저장합니다."""
         try:
-            with self.db_manager.get_auto_commit_session() as session:
+            with self._write_session() as session:
+                writer = self._get_bulk_writer(session)
+                
                 # File 객체 중복 체크 후 저장
                 existing_file = session.query(File).filter_by(path=file_obj.path, project_id=project_id).first()
                 if existing_file:
@@ -832,58 +839,46 @@ class SourceAnalyzer:
                     file_id = file_obj.file_id
                     self.logger.debug(f"새 파일 저장: {file_obj.path} -> {file_id}")
                 
-                # SQL Unit 객체 저장 (중복 체크)
+                # SQL Unit 객체 저장 (중복 체크: 같은 파일에 같은 지문이 이미 있으면 스킵)
+                seen_fingerprints = {
+                    row[0] for row in session.query(SqlUnit.normalized_fingerprint).filter(SqlUnit.file_id == file_id)
+                }
+                new_sql_units = []
                 for sql_unit in sql_units:
                     sql_unit.file_id = file_id
-                    
-                    # 중복 체크: 같은 파일에 같은 지문이 이미 있는지 확인
-                    if hasattr(sql_unit, 'normalized_fingerprint') and sql_unit.normalized_fingerprint:
-                        existing_sql = session.query(SqlUnit).filter_by(
-                            file_id=file_id,
-                            normalized_fingerprint=sql_unit.normalized_fingerprint
-                        ).first()
-                        if existing_sql:
+                    fingerprint = getattr(sql_unit, 'normalized_fingerprint', None)
+                    if fingerprint:
+                        if fingerprint in seen_fingerprints:
                             self.logger.debug(f"SQL 유닛 중복 스킵: {sql_unit.stmt_id}")
                             continue
-                    
-                    session.add(sql_unit)
-                    session.flush()
+                        seen_fingerprints.add(fingerprint)
+                    new_sql_units.append(sql_unit)
+                writer.insert_objects(new_sql_units)
+                
+                # Join/Filter 객체 저장 (sql_id가 연결되지 않은 항목은 저장 불가)
+                writer.insert_objects([j for j in joins if getattr(j, 'sql_id', None) is not None], return_ids=False)
+                writer.insert_objects([f for f in filters if getattr(f, 'sql_id', None) is not None], return_ids=False)
+                
+                # Edge 객체 저장
+                confidence_threshold = self.config.get('processing', {}).get('confidence_threshold', 0.5)
+                valid_edges = []
+                for edge in edges:
+                    edge.project_id = project_id
+                    if (edge.src_id is not None and edge.dst_id is not None
+                        and edge.src_id != 0 and edge.dst_id != 0
+                        and edge.confidence >= confidence_threshold):
+                        valid_edges.append(edge)
+                writer.insert_objects(valid_edges, return_ids=False)
+                
+                # Vulnerability 객체 저장 (대상이 지정되지 않았으면 파일 기준)
+                for vulnerability in vulnerabilities:
+                    if not getattr(vulnerability, 'target_type', None):
+                        vulnerability.target_type = 'file'
+                        vulnerability.target_id = file_id
+                writer.insert_objects(list(vulnerabilities), return_ids=False)
                 
-                # Join 객체 저장
-                for join in joins:
-                    if hasattr(join, 'sql_id') and join.sql_id is None:
-                        # SQL Unit과 연결
-                        pass  # TODO: SQL Unit과 Join 연결 로직
-                    session.add(join)
-                session.flush()
-            
-            # Filter 객체 저장
-            for filter_obj in filters:
-                if hasattr(filter_obj, 'sql_id') and filter_obj.sql_id is None:
-                    # SQL Unit과 연결
-                    pass  # TODO: SQL Unit과 Filter 연결 로직
-                session.add(filter_obj)
-                session.flush()
-            
-            # Edge 객체 저장
-            confidence_threshold = self.config.get('processing', {}).get('confidence_threshold', 0.5)
-            saved_edges = 0
-            for edge in edges:
-                edge.project_id = project_id
-                if (edge.src_id is not None and edge.dst_id is not None
-                    and edge.src_id != 0 and edge.dst_id != 0
-                    and edge.confidence >= confidence_threshold):
-                    session.add(edge)
-                    saved_edges += 1
-            
-            # Vulnerability 객체 저장
-            for vulnerability in vulnerabilities:
-                vulnerability.file_id = file_id
-                session.add(vulnerability)
-                session.flush()
-            
                 self.logger.debug(
-                    f"JSP 분석 저장 완료: {file_obj.path} - SQL Units {len(sql_units)}개, Joins {len(joins)}개, Filters {len(filters)}개, Edges {saved_edges}개"
+                    f"JSP 분석 저장 완료: {file_obj.path} - SQL Units {len(new_sql_units)}개, Joins {len(joins)}개, Filters {len(filters)}개, Edges {len(valid_edges)}개"
                 )
         except Exception as e:
             self.logger.error(f"JSP 분석 결과 저장 오류 {file_obj.path}: {e}")
@@ -897,18 +892,13 @@ class SourceAnalyzer:
             self.logger.warning(f"분석 결과가 없습니다: {file_id}")
             return
 
-        with self.db_manager.get_auto_commit_session() as session:
+        with self._write_session() as session:
             # 파일 객체를 가져옵니다.
             file_obj = session.query(File).filter_by(file_id=file_id).first()
             if not file_obj:
                 self.logger.warning(f"파일 객체를 찾을 수 없습니다: {file_id}")
                 return
 
-            # 파일 객체의 타입을 업데이트합니다.
-            file_obj.file_type = Path(file_obj.path).suffix.lower()
-            session.add(file_obj)
-            session.flush()
-
             # 분석 결과에 따라 적절한 테이블에 저장
             if isinstance(analysis_result, tuple) and len(analysis_result) == 4: # JavaParser의 반환값
                 _, classes, methods, edges = analysis_result  # file_obj는 무시
@@ -1052,13 +1042,13 @@ class SourceAnalyzer:
                 # 파서가 결과를 반환하지 않거나 예상치 못한 길이인 경우
                 classes, methods, sql_units, joins, filters, edges, vulnerabilities = [], [], [], [], [], [], []
 
-            # 클래스 객체 저장
-            class_id_map = {}  # class fqn -> class_id 매핑
+            writer = self._get_bulk_writer(session)
+
+            # 클래스 객체 저장 (배치 INSERT 후 생성된 ID로 매핑 구성)
             for cls in classes:
                 cls.file_id = file_id
-                session.add(cls)
-                session.flush()
-                class_id_map[cls.fqn] = cls.class_id
+            writer.insert_objects(classes)
+            class_id_map = {cls.fqn: cls.class_id for cls in classes}  # class fqn -> class_id 매핑
             
             # 메소드 객체 저장
             for method in methods:
@@ -1066,82 +1056,79 @@ class SourceAnalyzer:
                 # Method가 Class에 속한 경우 class_id를 설정합니다 (owner_fqn 기준으로 찾기).
                 if hasattr(method, 'owner_fqn') and method.owner_fqn in class_id_map:
                     method.class_id = class_id_map[method.owner_fqn]
-                session.add(method)
-                session.flush()
+            writer.insert_objects(methods)
 
             # SQL Unit 객체 저장
             for sql_unit in sql_units:
                 sql_unit.file_id = file_id
-                session.add(sql_unit)
-                session.flush()
+            writer.insert_objects(sql_units)
             
             # sql_id_map 구성 (저장 후)
             sql_id_map = {f"{s.mapper_ns}.{s.stmt_id}": s.sql_id for s in sql_units}
 
-            # Join 객체 저장 및 Edge 변환
+            # Join 객체의 sql_id 연결 (sql_id가 없으면 저장하지 않음)
+            valid_joins = []
             for join in joins:
                 # join.sql_id가 None인 경우, 해당 join이 속한 sql_unit의 ID를 찾아서 설정
                 if join.sql_id is None and hasattr(join, '_temp_sql_unit_key') and join._temp_sql_unit_key in sql_id_map:
                     join.sql_id = sql_id_map[join._temp_sql_unit_key]
-                    print(f"[DEBUG] Join sql_id 설정됨: {join._temp_sql_unit_key} -> {join.sql_id}")
+                    self.logger.debug(f"Join sql_id 설정됨: {join._temp_sql_unit_key} -> {join.sql_id}")
                 elif join.sql_id is None:
-                    print(f"[DEBUG] Join sql_id를 설정할 수 없음 - 키 정보가 없음")
-                    continue  # sql_id가 없으면 저장하지 않음
-                
-                session.add(join)
-                session.flush()
-  # 트랜잭션 완료하여 영구 저장
-                
-                # Join 정보를 Edge로 변환하여 테이블 간 관계 생성
-                if join.sql_id and join.l_table and join.r_table:
-                    try:
-                        # 테이블 ID 찾기
-                        l_table_obj = session.query(DbTable).filter(
-                            DbTable.table_name == join.l_table.upper()
-                        ).first()
-                        r_table_obj = session.query(DbTable).filter(
-                            DbTable.table_name == join.r_table.upper()
-                        ).first()
-                        
-                        if l_table_obj and r_table_obj:
-                            # 테이블 간 조인 관계를 Edge로 생성
-                            join_edge = Edge(
-                                project_id=project_id,
-                                src_type='table',
-                                src_id=l_table_obj.table_id,
-                                dst_type='table',
-                                dst_id=r_table_obj.table_id,
-                                edge_kind='join',
-                                confidence=join.confidence,
-                                meta=json.dumps({
-                                    'join_type': 'explicit',
-                                    'left_column': join.l_col,
-                                    'right_column': join.r_col,
-                                    'operator': join.op,
-                                    'sql_id': join.sql_id,
-                                    'inferred_pkfk': join.inferred_pkfk
-                                })
-                            )
-                            session.add(join_edge)
-                            print(f"[DEBUG] Join Edge 생성됨: {join.l_table} -> {join.r_table}")
-                    except Exception as e:
-                        print(f"[DEBUG] Join Edge 생성 실패: {e}")
-                        continue
+                    self.logger.debug("Join sql_id를 설정할 수 없음 - 키 정보가 없음")
+                    continue
+                valid_joins.append(join)
+            writer.insert_objects(valid_joins, return_ids=False)
+
+            # Join 정보를 Edge로 변환하여 테이블 간 관계 생성 (테이블 ID는 한 번에 조회)
+            join_edges = []
+            join_table_names = {
+                name.upper() for join in valid_joins for name in (join.l_table, join.r_table) if name
+            }
+            table_id_map = {}
+            if join_table_names:
+                for table_name, table_id in session.query(DbTable.table_name, DbTable.table_id).filter(
+                    DbTable.table_name.in_(join_table_names)
+                ).order_by(DbTable.table_id):
+                    table_id_map.setdefault(table_name, table_id)
+            for join in valid_joins:
+                if not (join.l_table and join.r_table):
+                    continue
+                l_table_id = table_id_map.get(join.l_table.upper())
+                r_table_id = table_id_map.get(join.r_table.upper())
+                if l_table_id and r_table_id:
+                    # 테이블 간 조인 관계를 Edge로 생성
+                    join_edges.append(Edge(
+                        project_id=project_id,
+                        src_type='table',
+                        src_id=l_table_id,
+                        dst_type='table',
+                        dst_id=r_table_id,
+                        edge_kind='join',
+                        confidence=join.confidence,
+                        meta=json.dumps({
+                            'join_type': 'explicit',
+                            'left_column': join.l_col,
+                            'right_column': join.r_col,
+                            'operator': join.op,
+                            'sql_id': join.sql_id,
+                            'inferred_pkfk': join.inferred_pkfk
+                        })
+                    ))
+                    self.logger.debug(f"Join Edge 생성됨: {join.l_table} -> {join.r_table}")
 
             # RequiredFilter 객체 저장
             for filter_obj in filters:
                 # filter_obj.sql_id가 None인 경우, 해당 filter가 속한 sql_unit의 ID를 찾아서 설정
                 if filter_obj.sql_id is None and hasattr(filter_obj, 'sql_unit_stmt_id') and filter_obj.sql_unit_stmt_id in sql_id_map:
                     filter_obj.sql_id = sql_id_map[filter_obj.sql_unit_stmt_id]
-                session.add(filter_obj)
-                session.flush()
+            writer.insert_objects(filters, return_ids=False)
 
             # 모든 메서드가 저장된 후, 엣지의 src_id를 해결합니다.
             method_id_map = {f"{getattr(m, 'owner_fqn', '')}.{m.name}": m.method_id for m in methods}
 
             # 엣지 객체 저장
             confidence_threshold = self.config.get('processing', {}).get('confidence_threshold', 0.5)
-            saved_edges = 0
+            valid_edges = list(join_edges)
             for edge in edges:
                 edge.project_id = project_id
                 if edge.src_type == 'method' and edge.src_id is None:
@@ -1156,23 +1143,22 @@ class SourceAnalyzer:
                         edge.src_id = method_id_map[src_method_fqn]
 
                 if edge.edge_kind == 'call':
-                    session.add(edge)
-                    saved_edges += 1
+                    valid_edges.append(edge)
                 else:
                     if (edge.src_id is not None and edge.dst_id is not None
                         and edge.src_id != 0 and edge.dst_id != 0
                         and edge.confidence >= confidence_threshold):
-                        session.add(edge)
-                        saved_edges += 1
+                        valid_edges.append(edge)
+            writer.insert_objects(valid_edges, return_ids=False)
 
             self.logger.debug(
-                f"저장 완료: {file_obj.path} - 클래스 {len(classes)}개, 메소드 {len(methods)}개, 엣지 {saved_edges}개"
+                f"저장 완료: {file_obj.path} - 클래스 {len(classes)}개, 메소드 {len(methods)}개, 엣지 {len(valid_edges)}개"
             )
 
     async def _save_parsing_error(self, file_path: str, project_id: int, error_message: str, error_type: str):
         """파싱 에러 정보를 데이터베이스에 저장합니다."""
         try:
-            with self.db_manager.get_auto_commit_session() as session:
+            with self._write_session() as session:
                 # 파일 정보가 없으면 먼저 저장
                 file_id = await self._save_file_info(file_path, project_id)
                 
@@ -1201,7 +1187,7 @@ class SourceAnalyzer:
     async def _save_csv_metadata(self, file_id: int, file_path: str, project_id: int):
         """CSV 파일 메타데이터 저장"""
         try:
-            with self.db_manager.get_auto_commit_session() as session:
+            with self._write_session() as session:
                 import os
                 import json
                 
@@ -1246,13 +1232,27 @@ class SourceAnalyzer:
         except:
             return 0
 
-    async def _generate_edges(self, project_id: int):
-        """엣지를 생성합니다."""
+    async def _generate_edges(self, project_id: int, changed_paths: Optional[List[str]] = None,
+                              dependent_file_ids: Optional[Set[int]] = None):
+        """엣지를 생성합니다.
+        
+        changed_paths가 주어지면(증분 분석) 해당 파일과 dependent_file_ids 파일에서 도출되는 엣지만 다시 생성합니다.
+        """
         try:
             self.logger.info("엣지 생성 시작")
             
             with self.db_manager.get_auto_commit_session() as session:
-                edge_generator = EdgeGenerator(session, project_id, self.config)
+                changed_file_ids = None
+                if changed_paths is not None:
+                    path_set = set(changed_paths)
+                    changed_file_ids = {
+                        file_id for file_id, path in session.query(File.file_id, File.path).filter(
+                            File.project_id == project_id)
+                        if path in path_set
+                    }
+                    changed_file_ids |= set(dependent_file_ids or ())
+                edge_generator = EdgeGenerator(session, project_id, self.config, file_cache=self.file_cache,
+                                               changed_file_ids=changed_file_ids)
                 edge_count = edge_generator.generate_all_edges()
                 
                 self.logger.info(f"엣지 생성 완료: {edge_count}개")
@@ -1261,74 +1261,164 @@ class SourceAnalyzer:
             self.logger.error(f"엣지 생성 중 오류: {e}")
             traceback.print_exc()
 
-    async def _run_intelligent_chunking(self, project_id: int):
-        """지능형 청킹을 실행합니다."""
+    async def _run_intelligent_chunking(self, project_id: int, file_paths: Optional[List[str]] = None):
+        """지능형 청킹을 실행합니다.
+        
+        file_paths가 주어지면 해당 파일만 청킹합니다 (증분 분석 시 중복 청크 방지).
+        파일은 file_id 순으로 processing.chunk_page_files개씩 읽어 워커 풀에서 청킹하고,
+        청크 행은 bulk_batch_size 단위로 저장한 뒤 페이지마다 커밋하므로 메모리는 페이지 크기에 비례합니다.
+        파일별 청킹 실패는 parse_results(parser_type='chunker')에 기록하고 다음 파일을 계속 처리합니다.
+        """
         try:
             self.logger.info("지능형 청킹 시작")
-            chunker = IntelligentChunker()
+            processing = self.config.get('processing', {})
+            chunk_source = processing.get('chunk_source', 'spans')
+            page_size = max(1, int(processing.get('chunk_page_files', 500)))
+            target_paths = set(file_paths) if file_paths is not None else None
+            self.logger.info(f"청크 범위: {chunk_source}, 페이지 크기: {page_size}개 파일")
             
-            # 프로젝트의 모든 파일을 가져와서 청킹을 실행합니다.
-            with self.db_manager.get_auto_commit_session() as session:
-                files = session.query(File).filter_by(project_id=project_id).all()
-                total_files = len(files)
-                self.logger.info(f"청킹 대상 파일: {total_files}개")
-                
-                chunked_files = 0
-                total_chunks_created = 0
-                chunk_type_stats = {}
-                
-                for file_obj in files:
+            chunked_files = 0
+            failed_files = 0
+            total_chunks_created = 0
+            chunk_type_stats = {}
+            last_file_id = 0
+            
+            with ParallelChunkStage(self.config, file_cache=self.file_cache) as stage:
+                while True:
+                    session = self.db_manager.get_session()
                     try:
-                        # 파일 내용을 읽어서 청킹을 실행합니다.
-                        if os.path.exists(file_obj.path):
-                            with open(file_obj.path, 'r', encoding='utf-8') as f:
-                                content = f.read()
+                        page = session.query(File.file_id, File.path).filter(
+                            File.project_id == project_id, File.file_id > last_file_id
+                        ).order_by(File.file_id).limit(page_size).all()
+                        if not page:
+                            break
+                        first_file_id, last_file_id = page[0].file_id, page[-1].file_id
+                        if target_paths is not None:
+                            page = [row for row in page if row.path in target_paths]
+                        
+                        # 파서가 저장한 클래스/메서드/SQL 범위를 페이지 단위로 읽어 파일별로 묶음
+                        spans_by_file = (self._load_chunk_spans(session, project_id, first_file_id, last_file_id)
+                                         if chunk_source == 'spans' and page else {})
+                        tasks = [(file_id, path, spans_by_file.get(file_id)) for file_id, path in page]
+                        
+                        writer = BulkWriter.from_config(session, self.config)
+                        rows = []
+                        failures = []
+                        for payload in stage.run(tasks):
+                            if payload['status'] == 'error':
+                                failed_files += 1
+                                self.logger.error(f"파일 청킹 오류 {payload['file_path']}: {payload['error_message']}\n"
+                                                  f"Traceback:\n{payload['traceback']}")
+                                failures.append({
+                                    'file_id': payload['file_id'], 'parser_type': 'chunker', 'success': False,
+                                    'parse_time': 0.0, 'error_message': f"{payload['error_type']}: {payload['error_message']}",
+                                    'confidence': 0.0
+                                })
+                                continue
+                            if payload['status'] != 'ok':
+                                continue
                             
-                            code_chunks = chunker.chunk_file(file_obj.path, content)
-                            if code_chunks:
-                                # 청킹 결과를 데이터베이스 모델로 변환하여 저장합니다.
-                                for code_chunk in code_chunks:
-                                    # 청크 유형별 타겟 ID 매핑
+                            for item in payload['chunks']:
+                                code_chunk = item['chunk']
+                                # 청크 유형별 타겟 ID 매핑 (범위 청크는 대상 ID를 이미 가지고 있음)
+                                if 'target_type' in code_chunk.metadata:
+                                    target_type = code_chunk.metadata['target_type']
+                                    target_id = code_chunk.metadata['target_id'] or payload['file_id']
+                                else:
                                     target_id, target_type = self._get_chunk_target_info(
-                                        code_chunk, file_obj, session)
-                                    
-                                    # 토큰 수 계산 (간단한 추정)
-                                    token_count = len(code_chunk.content.split()) if code_chunk.content else 0
-                                    # 해시값 계산
-                                    chunk_hash = hashlib.md5(code_chunk.content.encode('utf-8')).hexdigest() if code_chunk.content else ''
-                                    
-                                    chunk = Chunk(
-                                        target_type=target_type,  # 실제 청크 유형 사용
-                                        target_id=target_id,      # 매핑된 타겟 ID 사용  
-                                        content=code_chunk.content,
-                                        token_count=token_count,
-                                        hash=chunk_hash
-                                    )
-                                    session.add(chunk)
-                                    total_chunks_created += 1
-                                    
-                                    # 통계 수집
-                                    chunk_type_stats[target_type] = chunk_type_stats.get(target_type, 0) + 1
-                                
+                                        code_chunk, payload['file_id'], session)
+                                rows.append({
+                                    'project_id': project_id,
+                                    'target_type': target_type,
+                                    'target_id': target_id,
+                                    'content': code_chunk.content,
+                                    'token_count': item['token_count'],
+                                    'hash': item['hash']
+                                })
+                                chunk_type_stats[target_type] = chunk_type_stats.get(target_type, 0) + 1
+                            if payload['chunks']:
                                 chunked_files += 1
-                                if chunked_files % 10 == 0:
-                                    self.logger.debug(f"청킹 진행: {chunked_files}/{total_files}")
-                    
-                    except Exception as e:
-                        error_msg = f"파일 청킹 오류 {file_obj.path}: {e}"
-                        traceback_str = traceback.format_exc()
-                        self.logger.error(f"{error_msg}\nTraceback:\n{traceback_str}")
-                        sys.exit(1)
-                
-                self.logger.info(f"지능형 청킹 완료: {chunked_files}개 파일, {total_chunks_created}개 청크 생성")
-                self.logger.info(f"청크 유형별 통계: {chunk_type_stats}")
-                
+                            if len(rows) >= writer.batch_size:
+                                total_chunks_created += len(rows)
+                                writer.insert_rows(Chunk, rows)
+                                rows = []
+                        
+                        total_chunks_created += len(rows)
+                        writer.insert_rows(Chunk, rows)
+                        writer.insert_rows(ParseResultModel, failures)
+                        session.commit()
+                        self.logger.debug(f"청킹 진행: 파일 {chunked_files}개, 청크 {total_chunks_created}개 (file_id ≤ {last_file_id})")
+                    except Exception:
+                        session.rollback()
+                        raise
+                    finally:
+                        session.close()
+            
+            self.logger.info(f"지능형 청킹 완료: {chunked_files}개 파일, {total_chunks_created}개 청크 생성, 실패 {failed_files}개 파일")
+            self.logger.info(f"청크 유형별 통계: {chunk_type_stats}")
+            self.logger.info(f"파일 내용 캐시 통계: {self.file_cache.stats()}")
                 
         except Exception as e:
             self.logger.error(f"청킹 실행 중 오류: {e}")
             traceback.print_exc()
     
-    def _get_chunk_target_info(self, code_chunk, file_obj, session):
+    async def _run_embedding(self, project_id: int):
+        """임베딩이 없는 청크를 배치로 임베딩해 metadata.db 옆 벡터 파일과 embeddings 테이블에 저장합니다.
+        
+        embedding.enabled가 false이면 건너뜁니다. 로컬 임베딩 모델이 없으면 해싱 임베더를 사용합니다.
+        """
+        if not self.config.get('embedding', {}).get('enabled', True):
+            return
+        try:
+            self.logger.info("청크 임베딩 시작")
+            index = ChunkEmbeddingIndex(self.db_manager, self.config)
+            stats = index.update(project_id)
+            self.logger.info(f"청크 임베딩 완료 ({index.model_name}): {stats}")
+        except Exception as e:
+            self.logger.error(f"청크 임베딩 중 오류: {e}")
+            traceback.print_exc()
+    
+    def _load_chunk_spans(self, session, project_id: int, first_file_id: int,
+                          last_file_id: int) -> Dict[int, List[ChunkSpan]]:
+        """file_id 구간의 Class/Method/MyBatis SqlUnit 범위를 쿼리 3번으로 읽어 file_id별로 묶습니다.
+        
+        라인 정보가 없는 행(start_line이 0/NULL이거나 end_line < start_line)은 제외합니다.
+        """
+        spans_by_file: Dict[int, List[ChunkSpan]] = {}
+        
+        classes = session.query(Class.class_id, Class.file_id, Class.name, Class.start_line, Class.end_line).join(
+            File, File.file_id == Class.file_id).filter(
+            File.project_id == project_id, File.file_id.between(first_file_id, last_file_id),
+            Class.start_line >= 1, Class.end_line >= Class.start_line
+        ).order_by(Class.file_id, Class.start_line)
+        for class_id, file_id, name, start_line, end_line in classes:
+            spans_by_file.setdefault(file_id, []).append(
+                ChunkSpan('class', class_id, name, start_line, end_line))
+        
+        methods = session.query(Method.method_id, Method.class_id, Class.file_id, Method.name,
+                                Method.start_line, Method.end_line).join(
+            Class, Class.class_id == Method.class_id).join(File, File.file_id == Class.file_id).filter(
+            File.project_id == project_id, File.file_id.between(first_file_id, last_file_id),
+            Method.start_line >= 1, Method.end_line >= Method.start_line
+        ).order_by(Class.file_id, Method.start_line)
+        for method_id, class_id, file_id, name, start_line, end_line in methods:
+            spans_by_file.setdefault(file_id, []).append(
+                ChunkSpan('method', method_id, name, start_line, end_line, class_id=class_id))
+        
+        sql_units = session.query(SqlUnit.sql_id, SqlUnit.file_id, SqlUnit.stmt_id, SqlUnit.stmt_kind,
+                                  SqlUnit.start_line, SqlUnit.end_line).join(
+            File, File.file_id == SqlUnit.file_id).filter(
+            File.project_id == project_id, File.file_id.between(first_file_id, last_file_id),
+            SqlUnit.origin == 'mybatis',
+            SqlUnit.start_line >= 1, SqlUnit.end_line >= SqlUnit.start_line
+        ).order_by(SqlUnit.file_id, SqlUnit.start_line)
+        for sql_id, file_id, stmt_id, stmt_kind, start_line, end_line in sql_units:
+            spans_by_file.setdefault(file_id, []).append(
+                ChunkSpan('sql_unit', sql_id, stmt_id or '', start_line, end_line, kind=(stmt_kind or '').lower()))
+        
+        return spans_by_file
+    
+    def _get_chunk_target_info(self, code_chunk, file_id: int, session):
         """청크 유형에 따라 적절한 타겟 ID와 타입을 매핑합니다."""
         chunk_type = code_chunk.chunk_type
         
@@ -1336,7 +1426,7 @@ class SourceAnalyzer:
         if chunk_type in ['class', 'interface']:
             # 클래스/인터페이스 청크 - Class 테이블에서 매핑
             class_obj = session.query(Class).filter(
-                Class.file_id == file_obj.file_id,
+                Class.file_id == file_id,
                 Class.name == code_chunk.name
             ).first()
             if class_obj:
@@ -1346,7 +1436,7 @@ class SourceAnalyzer:
                 dummy_class = Class(
                     name=code_chunk.name,
                     fqn=f"unknown.{code_chunk.name}",
-                    file_id=file_obj.file_id
+                    file_id=file_id
                 )
                 session.add(dummy_class)
                 session.flush()
@@ -1355,7 +1445,7 @@ class SourceAnalyzer:
         elif chunk_type in ['mybatis_select', 'mybatis_insert', 'mybatis_update', 'mybatis_delete']:
             # MyBatis 쿼리 청크 - SqlUnit 테이블에서 매핑
             sql_unit = session.query(SqlUnit).filter(
-                SqlUnit.file_id == file_obj.file_id,
+                SqlUnit.file_id == file_id,
                 SqlUnit.stmt_id == code_chunk.name
             ).first()
             if sql_unit:
@@ -1364,7 +1454,7 @@ class SourceAnalyzer:
                 # 더미 SQL Unit 생성
                 dummy_sql = SqlUnit(
                     stmt_id=code_chunk.name,
-                    file_id=file_obj.file_id,
+                    file_id=file_id,
                     normalized_fingerprint=code_chunk.content[:100],
                     stmt_kind=chunk_type.split('_')[1].lower()  # select, insert 등
                 )
@@ -1376,18 +1466,18 @@ class SourceAnalyzer:
             # 메서드 청크 - Method 테이블에서 매핑
             # Method는 class_id를 통해 Class와 연결되고, Class는 file_id를 통해 File과 연결됨
             method_obj = session.query(Method).join(Class).filter(
-                Class.file_id == file_obj.file_id,
+                Class.file_id == file_id,
                 Method.name == code_chunk.name
             ).first()
             if method_obj:
                 return method_obj.method_id, 'method'
             else:
                 # 더미 메서드는 클래스가 필요하므로 파일 기준으로 폴백
-                return file_obj.file_id, 'file'
+                return file_id, 'file'
         
         else:
             # 기타 청크(import, block 등)는 파일 기준
-            return file_obj.file_id, 'file'
+            return file_id, 'file'
 
     def _validate_confidence_formula_on_startup(self):
         # ... (Implementation from previous version) ...
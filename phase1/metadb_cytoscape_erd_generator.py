@@ -487,9 +487,11 @@ class MetaDBCytoscapeERDGenerator:
                     <ul class="column-list">
                 ''')
                 
+                pk_columns = set(table.primary_keys)
+                fk_columns = {fk[0] for fk in table.foreign_keys}
                 for column in table.columns:
-                    pk_class = "pk" if column.name in table.primary_keys else ""
-                    fk_class = "fk" if any(fk[0] == column.name for fk in table.foreign_keys) else ""
+                    pk_class = "pk" if column.name in pk_columns else ""
+                    fk_class = "fk" if column.name in fk_columns else ""
                     
                     html_parts.append(f'''
                         <li>
@@ -522,6 +524,8 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Cytoscape ERD HTML 생성기')
     parser.add_argument('--project-name', required=True, help='분석할 프로젝트명 (예: sampleSrc)')
     parser.add_argument('--output', help='출력 파일 경로 (기본값: 프로젝트/report/erd_cytoscape_metadb_YYYYMMDD_HHMMSS.html)')
+    parser.add_argument('--tables', help='포함할 테이블명 (쉼표 구분, 예: USERS,ORDERS)')
+    parser.add_argument('--owners', help='포함할 스키마/소유자 (쉼표 구분, 예: SAMPLE,SCOTT)')
     args = parser.parse_args()
     
     # 프로젝트 경로 설정
@@ -535,10 +539,13 @@ if __name__ == "__main__":
         output_path = f"{project_path}/report/erd_cytoscape_metadb_{timestamp}.html"
     
     # ERD 분석 및 HTML 생성
-    from metadb_erd_analyzer import MetaDBERDAnalyzer
+    from metadb_erd_analyzer import get_erd_structure
     
-    analyzer = MetaDBERDAnalyzer(project_path)
-    erd_structure = analyzer.analyze_erd()
+    erd_structure = get_erd_structure(
+        project_path,
+        tables=args.tables.split(',') if args.tables else None,
+        owners=args.owners.split(',') if args.owners else None
+    )
     
     generator = MetaDBCytoscapeERDGenerator()
     html_content = generator.generate_html(erd_structure, output_path)
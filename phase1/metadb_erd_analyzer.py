@@ -6,8 +6,9 @@ SQLite 메타디비를 직접 읽어서 ERD 구조를 분석합니다.
 
 import sqlite3
 import os
+import threading
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Iterable, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 import logging
@@ -45,21 +46,29 @@ class ERDStructure:
 class MetaDBERDAnalyzer:
     """메타디비 기반 ERD 분석기"""
     
-    def __init__(self, project_path: str):
+    def __init__(self, project_path: str, tables: Optional[Iterable[str]] = None,
+                 owners: Optional[Iterable[str]] = None):
         """
         분석기 초기화
         
         Args:
             project_path: 분석할 프로젝트 경로
+            tables: 포함할 테이블명 목록 (대소문자 무시, 없으면 전체)
+            owners: 포함할 스키마/소유자 목록 (대소문자 무시, 없으면 전체)
         """
         self.project_path = Path(project_path)
         self.metadata_db_path = self.project_path / "metadata.db"
+        self.tables = sorted({t.strip().upper() for t in tables or () if t.strip()})
+        self.owners = sorted({o.strip().upper() for o in owners or () if o.strip()})
         self.logger = logging.getLogger(__name__)
         
     def analyze_erd(self) -> ERDStructure:
         """
         메타디비에서 ERD 분석
         
+        테이블, 컬럼, PK를 각각 쿼리 한 번으로 읽어 table_id별로 묶고,
+        FK 추론은 테이블명 인덱스를 사용합니다.
+        
         Returns:
             ERD 구조 정보
         """
@@ -76,23 +85,24 @@ class MetaDBERDAnalyzer:
         
         try:
             # 테이블 정보 조회
-            tables = self._analyze_tables(cursor)
+            table_ids, tables = self._analyze_tables(cursor)
+            columns_by_table = self._analyze_columns(cursor)
+            primary_keys_by_table = self._analyze_primary_keys(cursor)
+            table_index = self._build_table_index(tables)
             
             # 컬럼 정보 조회
             total_columns = 0
             total_relationships = 0
             
-            for table in tables:
-                columns = self._analyze_columns(cursor, table)
-                table.columns = columns
-                total_columns += len(columns)
+            for table_id, table in zip(table_ids, tables):
+                table.columns = columns_by_table.get(table_id, [])
+                total_columns += len(table.columns)
                 
                 # PK 정보 조회
-                primary_keys = self._analyze_primary_keys(cursor, table)
-                table.primary_keys = primary_keys
+                table.primary_keys = primary_keys_by_table.get(table_id, [])
                 
                 # FK 관계 추론
-                foreign_keys = self._infer_foreign_keys(table, tables)
+                foreign_keys = self._infer_foreign_keys(table, table_index)
                 table.foreign_keys = foreign_keys
                 total_relationships += len(foreign_keys)
             
@@ -111,17 +121,32 @@ class MetaDBERDAnalyzer:
         finally:
             conn.close()
     
-    def _analyze_tables(self, cursor: sqlite3.Cursor) -> List[TableInfo]:
-        """테이블 정보 분석"""
-        cursor.execute("""
-            SELECT owner, table_name, status, table_comment 
-            FROM db_tables 
-            ORDER BY owner, table_name
-        """)
+    def _table_filter(self, alias: str) -> Tuple[str, List[str]]:
+        """--tables/--owners 조건을 db_tables 별칭 기준 WHERE 절과 파라미터로"""
+        conditions = []
+        params: List[str] = []
+        if self.tables:
+            conditions.append(f"UPPER({alias}.table_name) IN ({','.join('?' * len(self.tables))})")
+            params.extend(self.tables)
+        if self.owners:
+            conditions.append(f"UPPER(COALESCE({alias}.owner, '')) IN ({','.join('?' * len(self.owners))})")
+            params.extend(self.owners)
+        return (f"WHERE {' AND '.join(conditions)}" if conditions else ""), params
+    
+    def _analyze_tables(self, cursor: sqlite3.Cursor) -> Tuple[List[int], List[TableInfo]]:
+        """테이블 정보 분석 (table_id 목록과 TableInfo 목록)"""
+        where, params = self._table_filter('t')
+        cursor.execute(f"""
+            SELECT t.table_id, t.owner, t.table_name, t.status, t.table_comment 
+            FROM db_tables t
+            {where}
+            ORDER BY t.owner, t.table_name
+        """, params)
         
+        table_ids = []
         tables = []
         for row in cursor.fetchall():
-            owner, table_name, status, comment = row
+            table_id, owner, table_name, status, comment = row
             full_name = f"{owner}.{table_name}" if owner else table_name
             
             table_info = TableInfo(
@@ -134,22 +159,25 @@ class MetaDBERDAnalyzer:
                 primary_keys=[],
                 foreign_keys=[]
             )
+            table_ids.append(table_id)
             tables.append(table_info)
         
-        return tables
+        return table_ids, tables
     
-    def _analyze_columns(self, cursor: sqlite3.Cursor, table: TableInfo) -> List[ColumnInfo]:
-        """컬럼 정보 분석"""
-        cursor.execute("""
-            SELECT column_name, data_type, nullable, column_comment
-            FROM db_columns 
-            WHERE table_id = (SELECT table_id FROM db_tables WHERE owner = ? AND table_name = ?)
-            ORDER BY column_name
-        """, (table.owner, table.name))
-        
-        columns = []
+    def _analyze_columns(self, cursor: sqlite3.Cursor) -> Dict[int, List[ColumnInfo]]:
+        """컬럼 정보 분석 (table_id별, 컬럼명 순)"""
+        where, params = self._table_filter('t')
+        cursor.execute(f"""
+            SELECT c.table_id, c.column_name, c.data_type, c.nullable, c.column_comment
+            FROM db_columns c
+            JOIN db_tables t ON t.table_id = c.table_id
+            {where}
+            ORDER BY c.table_id, c.column_name
+        """, params)
+        
+        columns: Dict[int, List[ColumnInfo]] = {}
         for row in cursor.fetchall():
-            column_name, data_type, nullable, comment = row
+            table_id, column_name, data_type, nullable, comment = row
             
             column_info = ColumnInfo(
                 name=column_name,
@@ -157,37 +185,49 @@ class MetaDBERDAnalyzer:
                 nullable=nullable == 'Y',
                 comment=comment
             )
-            columns.append(column_info)
+            columns.setdefault(table_id, []).append(column_info)
         
         return columns
     
-    def _analyze_primary_keys(self, cursor: sqlite3.Cursor, table: TableInfo) -> List[str]:
-        """기본키 정보 분석"""
-        cursor.execute("""
-            SELECT column_name
-            FROM db_pk 
-            WHERE table_id = (SELECT table_id FROM db_tables WHERE owner = ? AND table_name = ?)
-            ORDER BY pk_pos
-        """, (table.owner, table.name))
-        
-        primary_keys = [row[0] for row in cursor.fetchall()]
+    def _analyze_primary_keys(self, cursor: sqlite3.Cursor) -> Dict[int, List[str]]:
+        """기본키 정보 분석 (table_id별, pk_pos 순)"""
+        where, params = self._table_filter('t')
+        cursor.execute(f"""
+            SELECT p.table_id, p.column_name
+            FROM db_pk p
+            JOIN db_tables t ON t.table_id = p.table_id
+            {where}
+            ORDER BY p.table_id, p.pk_pos
+        """, params)
+        
+        primary_keys: Dict[int, List[str]] = {}
+        for table_id, column_name in cursor.fetchall():
+            primary_keys.setdefault(table_id, []).append(column_name)
         return primary_keys
     
-    def _infer_foreign_keys(self, table: TableInfo, all_tables: List[TableInfo]) -> List[Tuple[str, str, str]]:
+    def _build_table_index(self, all_tables: List[TableInfo]) -> Dict[str, str]:
+        """대문자 테이블명 → full_name (같은 이름이면 정렬 순서상 먼저 나온 테이블)"""
+        table_index: Dict[str, str] = {}
+        for table in all_tables:
+            table_index.setdefault(table.name.upper(), table.full_name)
+        return table_index
+    
+    def _infer_foreign_keys(self, table: TableInfo, table_index: Dict[str, str]) -> List[Tuple[str, str, str]]:
         """외래키 관계 추론"""
         foreign_keys = []
+        primary_keys = set(table.primary_keys)
         
         for column in table.columns:
             # ID로 끝나는 컬럼이면서 PK가 아닌 경우 외래키 가능성 검토
-            if (column.name.endswith('_ID') or column.name.endswith('ID')) and column.name not in table.primary_keys:
+            if (column.name.endswith('_ID') or column.name.endswith('ID')) and column.name not in primary_keys:
                 # 참조할 수 있는 테이블 찾기
-                referenced_table = self._find_referenced_table(column.name, all_tables)
+                referenced_table = self._find_referenced_table(column.name, table_index)
                 if referenced_table:
                     foreign_keys.append((column.name, referenced_table, column.name))
         
         return foreign_keys
     
-    def _find_referenced_table(self, column_name: str, all_tables: List[TableInfo]) -> Optional[str]:
+    def _find_referenced_table(self, column_name: str, table_index: Dict[str, str]) -> Optional[str]:
         """참조할 수 있는 테이블 찾기"""
         # 컬럼명에서 테이블명 추출 (예: CUSTOMER_ID -> CUSTOMERS)
         if column_name.endswith('_ID'):
@@ -198,16 +238,46 @@ class MetaDBERDAnalyzer:
             return None
         
         # 해당 테이블이 존재하는지 확인
-        for table in all_tables:
-            if table.name.upper() == table_name.upper():
-                return table.full_name
-        
-        return None
+        return table_index.get(table_name.upper())
+
+
+# 같은 메타디비/필터에 대한 분석 결과를 Mermaid, Cytoscape, Magic 스타일 생성기가 함께 사용
+_erd_cache: Dict[tuple, ERDStructure] = {}
+_erd_cache_lock = threading.Lock()
+
+
+def get_erd_structure(project_path: str, tables: Optional[Iterable[str]] = None,
+                      owners: Optional[Iterable[str]] = None) -> ERDStructure:
+    """
+    ERD 구조를 분석하거나, 메타디비가 바뀌지 않았으면 캐시된 결과를 반환
+    
+    캐시 키는 메타디비 경로, 수정 시각, 크기, 필터입니다. 반환된 ERDStructure는 공유되므로
+    생성기에서는 읽기만 해야 합니다.
+    """
+    analyzer = MetaDBERDAnalyzer(project_path, tables, owners)
+    db_path = analyzer.metadata_db_path
+    try:
+        stat = db_path.stat()
+    except OSError:
+        return analyzer.analyze_erd()  # 메타디비가 없으면 analyze_erd의 예외를 그대로 전달
+    key = (str(db_path.resolve()), stat.st_mtime_ns, stat.st_size, tuple(analyzer.tables), tuple(analyzer.owners))
+    
+    with _erd_cache_lock:
+        cached = _erd_cache.get(key)
+    if cached is not None:
+        return cached
+    
+    erd_structure = analyzer.analyze_erd()
+    with _erd_cache_lock:
+        # 같은 메타디비의 이전 버전 결과는 버림
+        for stale in [k for k in _erd_cache if k[0] == key[0] and k[1:3] != key[1:3]]:
+            del _erd_cache[stale]
+        _erd_cache[key] = erd_structure
+    return erd_structure
 
 if __name__ == "__main__":
     # 테스트
-    analyzer = MetaDBERDAnalyzer("../project/sampleSrc")
-    erd_structure = analyzer.analyze_erd()
+    erd_structure = get_erd_structure("../project/sampleSrc")
     
     print(f"테이블 수: {erd_structure.total_tables}")
     print(f"컬럼 수: {erd_structure.total_columns}")
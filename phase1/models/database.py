@@ -41,6 +41,7 @@ class File(Base):
     mtime = Column(DateTime)  # Modification time
     llm_summary = Column(Text)  # LLM-generated summary
     llm_summary_confidence = Column(Float, default=0.0)  # Confidence score
+    llm_summary_hash = Column(String(64))  # Hash of the summarized source span
     
     # Relationships
     project = relationship("Project", back_populates="files")
@@ -52,6 +53,7 @@ class Class(Base):
     
     class_id = Column(Integer, primary_key=True)
     file_id = Column(Integer, ForeignKey('files.file_id'), nullable=False)
+    project_id = Column(Integer)  # files.project_id 비정규화 (프로젝트 단위 조회용)
     fqn = Column(Text)  # Fully qualified name
     name = Column(String(255), nullable=False)
     start_line = Column(Integer)
@@ -70,6 +72,7 @@ class Method(Base):
     
     method_id = Column(Integer, primary_key=True)
     class_id = Column(Integer, ForeignKey('classes.class_id'), nullable=False)
+    project_id = Column(Integer)  # classes.project_id 비정규화
     name = Column(String(255), nullable=False)
     signature = Column(Text)
     return_type = Column(String(255))
@@ -80,6 +83,7 @@ class Method(Base):
     modifiers = Column(Text)    # JSON array of modifiers
     llm_summary = Column(Text)  # LLM-generated summary
     llm_summary_confidence = Column(Float, default=0.0)  # Confidence score
+    llm_summary_hash = Column(String(64))  # Hash of the summarized source span
     
     # Relationships
     class_ = relationship("Class", back_populates="methods")
@@ -89,6 +93,7 @@ class SqlUnit(Base):
     
     sql_id = Column(Integer, primary_key=True)
     file_id = Column(Integer, ForeignKey('files.file_id'), nullable=False)
+    project_id = Column(Integer)  # files.project_id 비정규화
     origin = Column(String(50))  # mybatis, jsp, etc.
     mapper_ns = Column(String(255))  # MyBatis namespace
     stmt_id = Column(String(255))  # Statement ID
@@ -98,6 +103,7 @@ class SqlUnit(Base):
     normalized_fingerprint = Column(Text)  # Structural fingerprint (not original SQL)
     llm_summary = Column(Text)  # LLM-generated summary
     llm_summary_confidence = Column(Float, default=0.0)  # Confidence score
+    llm_summary_hash = Column(String(64))  # Hash of the summarized source span
     
     # Relationships
     file = relationship("File", back_populates="sql_units")
@@ -172,19 +178,23 @@ class Edge(Base):
     edge_kind = Column(String(50), nullable=False)  # call, use_table, use_column, etc.
     confidence = Column(Float, default=1.0)
     meta = Column(Text)  # JSON metadata for hints (e.g., called_name)
+    src_file_id = Column(Integer, nullable=True)  # 엣지 생성기가 엣지를 도출한 소스 파일 (증분 재생성 단위)
     created_at = Column(DateTime, default=datetime.utcnow)
 
 # Recommended indexes for performance
 Index('ix_edges_project', Edge.project_id)
+Index('ix_edges_src_file', Edge.project_id, Edge.src_file_id)
 Index('ix_edges_src', Edge.src_type, Edge.src_id)
 Index('ix_edges_dst', Edge.dst_type, Edge.dst_id)
 Index('ix_edges_kind', Edge.edge_kind)
+Index('ix_edges_project_kind_conf', Edge.project_id, Edge.edge_kind, Edge.confidence)
 
 class Join(Base):
     __tablename__ = 'joins'
     
     join_id = Column(Integer, primary_key=True)
     sql_id = Column(Integer, ForeignKey('sql_units.sql_id'), nullable=False)
+    project_id = Column(Integer)  # sql_units.project_id 비정규화
     l_table = Column(String(128))  # Left table
     l_col = Column(String(128))    # Left column
     op = Column(String(10))        # Operator (=, !=, etc.)
@@ -246,6 +256,7 @@ class Chunk(Base):
     __tablename__ = 'chunks'
     
     chunk_id = Column(Integer, primary_key=True)
+    project_id = Column(Integer)  # 대상 엔티티의 project_id 비정규화
     target_type = Column(String(50), nullable=False)
     target_id = Column(Integer, nullable=False)
     content = Column(Text)  # Chunked content for embedding
@@ -395,6 +406,42 @@ Index('idx_filters_sql', RequiredFilter.sql_id)
 Index('idx_vuln_fixes_target', VulnerabilityFix.target_type, VulnerabilityFix.target_id)
 Index('idx_edge_hints_project', EdgeHint.project_id)
 Index('idx_edge_hints_type', EdgeHint.hint_type)
+Index('ix_classes_project', Class.project_id)
+Index('ix_methods_project', Method.project_id)
+Index('ix_sql_units_project', SqlUnit.project_id)
+Index('ix_joins_project', Join.project_id)
+Index('ix_chunks_project', Chunk.project_id, Chunk.target_type)
+
+# create_all()은 기존 테이블에 컬럼을 추가하지 않으므로, 이후 추가된 컬럼은 여기서 보완합니다.
+# (테이블명, 컬럼명, DDL 타입, 함께 생성할 인덱스명)
+SCHEMA_UPGRADES = [
+    ('edges', 'src_file_id', 'INTEGER', 'ix_edges_src_file'),
+    ('edges', 'project_id', 'INTEGER', 'ix_edges_project_kind_conf'),
+    ('classes', 'project_id', 'INTEGER', 'ix_classes_project'),
+    ('methods', 'project_id', 'INTEGER', 'ix_methods_project'),
+    ('sql_units', 'project_id', 'INTEGER', 'ix_sql_units_project'),
+    ('joins', 'project_id', 'INTEGER', 'ix_joins_project'),
+    ('chunks', 'project_id', 'INTEGER', 'ix_chunks_project'),
+    ('files', 'llm_summary_hash', 'VARCHAR(64)', None),
+    ('methods', 'llm_summary_hash', 'VARCHAR(64)', None),
+    ('sql_units', 'llm_summary_hash', 'VARCHAR(64)', None),
+]
+
+# 비정규화 project_id 보정 (순서대로 실행: 상위 엔티티가 먼저 채워져야 함)
+# (테이블명, project_id를 가져올 상관 서브쿼리)
+PROJECT_ID_BACKFILL = [
+    ('classes', "SELECT f.project_id FROM files f WHERE f.file_id = classes.file_id"),
+    ('methods', "SELECT c.project_id FROM classes c WHERE c.class_id = methods.class_id"),
+    ('sql_units', "SELECT f.project_id FROM files f WHERE f.file_id = sql_units.file_id"),
+    ('joins', "SELECT s.project_id FROM sql_units s WHERE s.sql_id = joins.sql_id"),
+    ('chunks', "SELECT CASE chunks.target_type"
+               " WHEN 'file' THEN (SELECT f.project_id FROM files f WHERE f.file_id = chunks.target_id)"
+               " WHEN 'class' THEN (SELECT c.project_id FROM classes c WHERE c.class_id = chunks.target_id)"
+               " WHEN 'method' THEN (SELECT m.project_id FROM methods m WHERE m.method_id = chunks.target_id)"
+               " WHEN 'sql_unit' THEN (SELECT s.project_id FROM sql_units s WHERE s.sql_id = chunks.target_id)"
+               " END"),
+]
+
 
 class DatabaseManager:
     """Database manager for handling SQLite/Oracle connections and operations."""
@@ -470,6 +517,7 @@ class DatabaseManager:
             print(f"DEBUG: DB URL - {db_url}")
             print(f"DEBUG: Engine args - {engine_args}")
             raise
+        self._apply_schema_upgrades()
         
         # Thread-local scoped session for better concurrency
         self.Session = scoped_session(sessionmaker(
@@ -479,6 +527,47 @@ class DatabaseManager:
             autoflush=True,    # 즉시 플러시로 변경
         ))
         
+    def _apply_schema_upgrades(self):
+        """기존 DB 파일에 없는 컬럼/인덱스를 추가합니다 (SCHEMA_UPGRADES 참조)."""
+        from sqlalchemy import inspect as sa_inspect, text
+        
+        inspector = sa_inspect(self.engine)
+        existing_tables = set(inspector.get_table_names())
+        with self.engine.begin() as conn:
+            for table_name, column_name, ddl_type, index_name in SCHEMA_UPGRADES:
+                if table_name not in existing_tables:
+                    continue
+                columns = {col['name'] for col in inspector.get_columns(table_name)}
+                if column_name not in columns:
+                    conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {ddl_type}"))
+                if index_name:
+                    index = next(idx for idx in Base.metadata.tables[table_name].indexes if idx.name == index_name)
+                    index.create(conn, checkfirst=True)
+        self.backfill_project_ids()
+    
+    def backfill_project_ids(self) -> int:
+        """
+        비정규화 project_id가 비어 있는 행을 상위 엔티티에서 채웁니다 (PROJECT_ID_BACKFILL 참조).
+        파서/저장 경로는 project_id를 직접 채우지 않아도 되며, 분석 종료 시와 DB 초기화 시 보정됩니다.
+        보정할 행이 없으면 쓰기 트랜잭션을 열지 않습니다.
+        
+        Returns:
+            갱신된 행 수
+        """
+        from sqlalchemy import text
+        
+        updated = 0
+        for table_name, source_sql in PROJECT_ID_BACKFILL:
+            pending = f"project_id IS NULL AND ({source_sql}) IS NOT NULL"
+            with self.engine.connect() as conn:
+                needs_update = conn.execute(text(f"SELECT 1 FROM {table_name} WHERE {pending}")).first()
+            if not needs_update:
+                continue
+            with self.engine.begin() as conn:
+                result = conn.execute(text(f"UPDATE {table_name} SET project_id = ({source_sql}) WHERE {pending}"))
+                updated += result.rowcount or 0
+        return updated
+    
     def get_session(self):
         """Get a new database session."""
         return self.Session()
@@ -549,3 +638,21 @@ class AutoCommitSession:
             statement = text(statement)
         result = self.session.execute(statement, parameters)
         return result
+
+    def commit(self):
+        """커밋"""
+        self.session.commit()
+
+    def rollback(self):
+        """롤백"""
+        self.session.rollback()
+
+    def close(self):
+        """자동 커밋 세션이므로 남은 변경을 커밋한 뒤 닫음 (커밋 실패 시 롤백)"""
+        try:
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        finally:
+            self.session.close()
@@ -0,0 +1,171 @@
+"""
+Java class 파일 리더
+JVM 명세(4장)의 class 파일 구조에서 상수 풀과 메서드 테이블만 읽어
+클래스명과 메서드 시그니처를 추출합니다. javap 등 외부 프로세스가 필요 없습니다.
+"""
+
+import struct
+from typing import List, NamedTuple, Optional, Tuple
+
+CLASS_MAGIC = 0xCAFEBABE
+
+# 상수 풀 태그 → 고정 길이(바이트). Utf8(1)은 가변 길이, Long/Double(5, 6)은 슬롯 2개 차지
+_CONSTANT_SIZES = {
+    3: 4,   # Integer
+    4: 4,   # Float
+    5: 8,   # Long
+    6: 8,   # Double
+    7: 2,   # Class
+    8: 2,   # String
+    9: 4,   # Fieldref
+    10: 4,  # Methodref
+    11: 4,  # InterfaceMethodref
+    12: 4,  # NameAndType
+    15: 3,  # MethodHandle
+    16: 2,  # MethodType
+    17: 4,  # Dynamic
+    18: 4,  # InvokeDynamic
+    19: 2,  # Module
+    20: 2,  # Package
+}
+
+_PRIMITIVES = {
+    'B': 'byte', 'C': 'char', 'D': 'double', 'F': 'float',
+    'I': 'int', 'J': 'long', 'S': 'short', 'Z': 'boolean', 'V': 'void',
+}
+
+
+class ClassFormatError(ValueError):
+    """class 파일 형식이 올바르지 않을 때 발생"""
+
+
+class MethodInfo(NamedTuple):
+    name: str
+    return_type: str        # 완전한 타입명 (예: java.lang.String, int[])
+    parameter_types: List[str]
+    access_flags: int
+
+
+class ClassInfo(NamedTuple):
+    fqn: str
+    super_fqn: Optional[str]
+    interfaces: List[str]
+    methods: List[MethodInfo]
+    access_flags: int
+
+
+def _decode_utf8(raw: bytes) -> str:
+    # class 파일은 Modified UTF-8을 사용하지만 식별자 범위에서는 표준 UTF-8과 거의 같음
+    return raw.decode('utf-8', errors='replace')
+
+
+def _parse_field_type(descriptor: str, pos: int) -> Tuple[str, int]:
+    dims = 0
+    while descriptor[pos] == '[':
+        dims += 1
+        pos += 1
+    ch = descriptor[pos]
+    if ch == 'L':
+        end = descriptor.index(';', pos)
+        type_name = descriptor[pos + 1:end].replace('/', '.')
+        pos = end + 1
+    elif ch in _PRIMITIVES:
+        type_name = _PRIMITIVES[ch]
+        pos += 1
+    else:
+        raise ClassFormatError(f"잘못된 타입 디스크립터: {descriptor}")
+    return type_name + '[]' * dims, pos
+
+
+def parse_method_descriptor(descriptor: str) -> Tuple[List[str], str]:
+    """'(ILjava/lang/String;)V' → (['int', 'java.lang.String'], 'void')"""
+    if not descriptor.startswith('('):
+        raise ClassFormatError(f"잘못된 메서드 디스크립터: {descriptor}")
+    params: List[str] = []
+    pos = 1
+    while descriptor[pos] != ')':
+        type_name, pos = _parse_field_type(descriptor, pos)
+        params.append(type_name)
+    return_type, _ = _parse_field_type(descriptor, pos + 1)
+    return params, return_type
+
+
+def read_class(data: bytes) -> ClassInfo:
+    """class 파일 바이트에서 클래스/메서드 정보를 읽습니다."""
+    try:
+        return _read_class(data)
+    except (struct.error, IndexError) as e:
+        raise ClassFormatError(f"class 파일을 읽을 수 없습니다: {e}") from e
+
+
+def _read_class(data: bytes) -> ClassInfo:
+    unpack_from = struct.unpack_from
+    magic, _minor, _major, cp_count = unpack_from('>IHHH', data, 0)
+    if magic != CLASS_MAGIC:
+        raise ClassFormatError("class 파일 매직 넘버가 아닙니다")
+
+    # 상수 풀: Utf8 문자열과 Class → name_index만 보관
+    utf8 = {}
+    class_refs = {}
+    pos = 10
+    index = 1
+    while index < cp_count:
+        tag = data[pos]
+        pos += 1
+        if tag == 1:
+            (length,) = unpack_from('>H', data, pos)
+            pos += 2
+            utf8[index] = data[pos:pos + length]
+            pos += length
+        elif tag == 7:
+            (class_refs[index],) = unpack_from('>H', data, pos)
+            pos += 2
+        elif tag in _CONSTANT_SIZES:
+            pos += _CONSTANT_SIZES[tag]
+        else:
+            raise ClassFormatError(f"알 수 없는 상수 풀 태그: {tag}")
+        index += 2 if tag in (5, 6) else 1
+
+    def utf8_at(i: int) -> str:
+        return _decode_utf8(utf8[i])
+
+    def class_name_at(i: int) -> Optional[str]:
+        if i == 0:
+            return None
+        return utf8_at(class_refs[i]).replace('/', '.')
+
+    access_flags, this_class, super_class, iface_count = unpack_from('>HHHH', data, pos)
+    pos += 8
+    interfaces = [class_name_at(i) for i in unpack_from(f'>{iface_count}H', data, pos)]
+    pos += 2 * iface_count
+
+    def skip_attributes(p: int) -> int:
+        (count,) = unpack_from('>H', data, p)
+        p += 2
+        for _ in range(count):
+            (length,) = unpack_from('>I', data, p + 2)
+            p += 6 + length
+        return p
+
+    # 필드 테이블은 건너뜀
+    (field_count,) = unpack_from('>H', data, pos)
+    pos += 2
+    for _ in range(field_count):
+        pos = skip_attributes(pos + 6)
+
+    methods: List[MethodInfo] = []
+    (method_count,) = unpack_from('>H', data, pos)
+    pos += 2
+    for _ in range(method_count):
+        m_access, name_index, desc_index = unpack_from('>HHH', data, pos)
+        pos = skip_attributes(pos + 6)
+        params, return_type = parse_method_descriptor(utf8_at(desc_index))
+        methods.append(MethodInfo(utf8_at(name_index), return_type, params, m_access))
+
+    return ClassInfo(
+        fqn=class_name_at(this_class),
+        super_fqn=class_name_at(super_class),
+        interfaces=interfaces,
+        methods=methods,
+        access_flags=access_flags,
+    )
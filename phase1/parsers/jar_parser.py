@@ -1,19 +1,38 @@
 import hashlib
 import os
-import re
-import subprocess
+import threading
 import zipfile
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any
 
 from phase1.models.database import File, Class, Method
+from phase1.parsers.classfile_reader import ClassFormatError, read_class
+from phase1.parsers.jar_signature_cache import JarSignatureStore, JarSignatures
+
+
+def jar_sha256(jar_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """JAR 파일의 sha256 (파일 전체를 메모리에 올리지 않고 계산)"""
+    digest = hashlib.sha256()
+    with open(jar_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
 
 
 class JarParser:
     """Parser to extract class and method signatures from JAR files."""
 
+    # sha256 → JarSignatures. 같은 JAR은 프로젝트/파서 인스턴스와 무관하게 한 번만 읽음
+    _signature_cache: 'OrderedDict[str, JarSignatures]' = OrderedDict()
+    _cache_lock = threading.Lock()
+
     def __init__(self, config: Dict[str, Any]):
         self.config = config
+        jar_config = (config or {}).get('parsers', {}).get('jar', {})
+        self.memory_cache_entries = int(jar_config.get('memory_cache_entries', 256))
+        # 실행/프로젝트 간에 공유되는 디스크 캐시 (설정된 경우)
+        self.signature_store = JarSignatureStore.from_config(config)
         try:
             from phase1.utils.logger import LoggerFactory
             self.logger = LoggerFactory.get_parser_logger("jar")
@@ -25,9 +44,7 @@ class JarParser:
 
     def parse_file(self, jar_path: str, project_id: int) -> Tuple[File, List[Class], List[Method], List]:
         """Parse the JAR file and extract classes and method signatures."""
-        with open(jar_path, 'rb') as f:
-            jar_bytes = f.read()
-        file_hash = hashlib.sha256(jar_bytes).hexdigest()
+        file_hash = jar_sha256(jar_path)
         file_stat = os.stat(jar_path)
         file_obj = File(
             project_id=project_id,
@@ -38,51 +55,103 @@ class JarParser:
             mtime=datetime.fromtimestamp(file_stat.st_mtime)
         )
 
-        classes: List[Class] = []
+        signatures, _source = self.load_signatures(jar_path, file_hash)
+        if signatures is None:
+            return file_obj, [], [], []
+
+        classes, methods = self.build_objects(signatures)
+        return file_obj, classes, methods, []
+
+    def load_signatures(self, jar_path: str, file_hash: str) -> Tuple[Optional[JarSignatures], str]:
+        """
+        JAR 시그니처를 메모리 캐시 → 디스크 캐시 → class 파일 추출 순으로 가져옵니다.
+
+        Returns:
+            (시그니처 또는 잘못된 JAR이면 None, 출처 'memory' | 'disk' | 'parsed')
+        """
+        signatures = self._cached_signatures(file_hash)
+        if signatures is not None:
+            return signatures, 'memory'
+
+        if self.signature_store:
+            signatures = self.signature_store.load(file_hash)
+            if signatures is not None:
+                self._store_signatures(file_hash, signatures)
+                return signatures, 'disk'
+
+        signatures = self.extract_signatures(jar_path)
+        if signatures is None:
+            return None, 'parsed'
+        self._store_signatures(file_hash, signatures)
+        if self.signature_store:
+            try:
+                self.signature_store.save(file_hash, signatures)
+            except OSError as e:
+                if self.logger:
+                    self.logger.warning(f"JAR 시그니처 캐시 저장 실패 {jar_path}: {e}")
+        return signatures, 'parsed'
+
+    @staticmethod
+    def build_objects(signatures: JarSignatures) -> Tuple[List[Class], List[Method]]:
+        """시그니처로 저장용 ORM 객체를 새로 생성합니다 (캐시 항목은 공유, 객체는 매번 새로 생성)."""
+        classes = [Class(file_id=None, fqn=fqn, name=name) for fqn, name in signatures.classes]
         methods: List[Method] = []
+        for owner_fqn, name, signature, return_type, params in signatures.methods:
+            method_obj = Method(
+                class_id=None,
+                name=name,
+                signature=signature,
+                return_type=return_type,
+                parameters=params
+            )
+            method_obj.owner_fqn = owner_fqn
+            methods.append(method_obj)
+        return classes, methods
 
+    def extract_signatures(self, jar_path: str) -> Optional[JarSignatures]:
+        """zip 항목에서 class 파일을 직접 읽어 시그니처를 추출합니다. 잘못된 JAR이면 None."""
+        classes: List[Tuple[str, str]] = []
+        methods: List[Tuple[str, str, str, str, str]] = []
         try:
             with zipfile.ZipFile(jar_path, 'r') as jar:
-                class_entries = [c for c in jar.namelist() if c.endswith('.class')]
+                for entry in jar.infolist():
+                    if not entry.filename.endswith('.class'):
+                        continue
+                    class_name = entry.filename[:-6].replace('/', '.')
+                    classes.append((class_name, class_name.split('.')[-1]))
+                    try:
+                        info = read_class(jar.read(entry))
+                    except (ClassFormatError, zipfile.BadZipFile, RuntimeError) as e:
+                        if self.logger:
+                            self.logger.warning(f"class 파일 읽기 실패 {jar_path}!{entry.filename}: {e}")
+                        continue
+                    for method in info.methods:
+                        # 생성자/정적 초기화 블록은 메서드 시그니처에서 제외
+                        if method.name.startswith('<'):
+                            continue
+                        # javap 출력과 같은 형식: 반환 타입은 단순명, 파라미터는 완전한 타입명
+                        return_type = method.return_type.rsplit('.', 1)[-1]
+                        params = ', '.join(method.parameter_types)
+                        signature = f"{return_type} {method.name}({params})"
+                        methods.append((class_name, method.name, signature, return_type, params))
         except zipfile.BadZipFile:
             if self.logger:
                 self.logger.warning(f"잘못된 JAR 파일: {jar_path}")
-            return file_obj, classes, methods, []
+            return None
+        return JarSignatures(classes, methods)
 
-        for entry in class_entries:
-            class_name = entry[:-6].replace('/', '.')
-            cls = Class(file_id=None, fqn=class_name, name=class_name.split('.')[-1])
-            classes.append(cls)
-            try:
-                result = subprocess.run(
-                    ['javap', '-p', '-classpath', jar_path, class_name],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    check=False
-                )
-                output = result.stdout
-                for line in output.splitlines():
-                    line = line.strip()
-                    if '(' not in line or ';' not in line:
-                        continue
-                    m = re.match(r'^.*?([\w\[\]<>$]+)\s+(\w+)\(([^)]*)\);', line)
-                    if not m:
-                        continue
-                    return_type, name, params = m.groups()
-                    signature = f"{return_type} {name}({params})".strip()
-                    method_obj = Method(
-                        class_id=None,
-                        name=name,
-                        signature=signature,
-                        return_type=return_type,
-                        parameters=params
-                    )
-                    method_obj.owner_fqn = class_name
-                    methods.append(method_obj)
-            except FileNotFoundError:
-                if self.logger:
-                    self.logger.warning('javap 명령을 찾을 수 없습니다. 메서드 추출을 건너뜁니다.')
-                break
+    def _cached_signatures(self, file_hash: str) -> Optional[JarSignatures]:
+        with self._cache_lock:
+            signatures = self._signature_cache.get(file_hash)
+            if signatures is not None:
+                self._signature_cache.move_to_end(file_hash)
+            return signatures
 
-        return file_obj, classes, methods, []
\ No newline at end of file
+    def _store_signatures(self, file_hash: str, signatures: JarSignatures) -> None:
+        if self.memory_cache_entries <= 0:
+            return
+        with self._cache_lock:
+            self._signature_cache[file_hash] = signatures
+            self._signature_cache.move_to_end(file_hash)
+            while len(self._signature_cache) > self.memory_cache_entries:
+                self._signature_cache.popitem(last=False)
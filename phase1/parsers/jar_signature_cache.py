@@ -0,0 +1,87 @@
+"""
+JAR 시그니처 영구 캐시
+JAR 파일 sha256을 키로, 추출한 클래스/메서드 시그니처를 디스크에 보관합니다.
+여러 프로젝트에서 공통으로 쓰는 서드파티 JAR(spring-core, mybatis, commons-* 등)은
+처음 한 번만 class 파일을 읽고, 이후 실행/프로젝트에서는 캐시 파일을 바로 적재합니다.
+
+파일 형식: {cache_dir}/{sha256[:2]}/{sha256}.json.gz
+  {"v": 1, "classes": [[fqn, name], ...], "methods": [[class_index, name, return_type, parameters], ...]}
+메서드의 소유 클래스는 classes 목록의 인덱스로, 시그니처 문자열은 적재 시 다시 조합합니다.
+"""
+
+import gzip
+import json
+import os
+import tempfile
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+FORMAT_VERSION = 1
+
+
+class JarSignatures(NamedTuple):
+    """JAR 하나에서 추출한 클래스/메서드 시그니처 (ORM 객체와 무관한 캐시용 형태)"""
+    classes: List[Tuple[str, str]]                      # (fqn, name)
+    methods: List[Tuple[str, str, str, str, str]]      # (owner_fqn, name, signature, return_type, parameters)
+
+
+class JarSignatureStore:
+    """sha256 키 기반 JAR 시그니처 디스크 캐시"""
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> Optional['JarSignatureStore']:
+        """parsers.jar.signature_cache_dir 설정으로 생성 (설정이 없으면 영구 캐시 사용 안 함)"""
+        jar_config = (config or {}).get('parsers', {}).get('jar', {})
+        cache_dir = jar_config.get('signature_cache_dir')
+        return cls(cache_dir) if cache_dir else None
+
+    def _path(self, sha256: str) -> str:
+        return os.path.join(self.cache_dir, sha256[:2], f"{sha256}.json.gz")
+
+    def load(self, sha256: str) -> Optional[JarSignatures]:
+        """캐시된 시그니처를 읽습니다. 없거나 형식이 맞지 않으면 None."""
+        try:
+            with gzip.open(self._path(sha256), 'rt', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError, EOFError):
+            self.misses += 1
+            return None
+        if data.get('v') != FORMAT_VERSION:
+            self.misses += 1
+            return None
+
+        classes = [(fqn, name) for fqn, name in data['classes']]
+        methods = []
+        for class_index, name, return_type, params in data['methods']:
+            owner_fqn = classes[class_index][0]
+            methods.append((owner_fqn, name, f"{return_type} {name}({params})", return_type, params))
+        self.hits += 1
+        return JarSignatures(classes, methods)
+
+    def save(self, sha256: str, signatures: JarSignatures) -> None:
+        """시그니처를 원자적으로(임시 파일 → rename) 저장합니다."""
+        class_index = {fqn: i for i, (fqn, _) in enumerate(signatures.classes)}
+        data = {
+            'v': FORMAT_VERSION,
+            'classes': [list(entry) for entry in signatures.classes],
+            'methods': [
+                [class_index[owner_fqn], name, return_type, params]
+                for owner_fqn, name, _signature, return_type, params in signatures.methods
+                if owner_fqn in class_index
+            ],
+        }
+        path = self._path(sha256)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb') as f:
+                f.write(json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
@@ -21,6 +21,7 @@ except ImportError:
 
 from phase1.parsers.base_parser import BaseParser
 from phase1.models.database import Class, Method, Edge, File
+from phase1.utils.line_index import LineIndex, line_index_for
 
 class JavaParserEnhanced(BaseParser):
     """JavaParser 라이브러리를 사용한 향상된 Java 파서"""
@@ -748,11 +749,12 @@ class JavaParserEnhanced(BaseParser):
         """BaseParser 인터페이스 구현"""
         if self.javalang_available:
             try:
-                tree = parse.parse(content)
+                compilation_unit = parse.parse(content)
+                line_index = line_index_for(content)
                 return {
-                    'classes': self._extract_classes_from_tree(tree),
-                    'methods': self._extract_methods_from_tree(tree),
-                    'imports': self._extract_imports_from_tree(tree),
+                    'classes': self._extract_classes_from_tree(compilation_unit, content, line_index),
+                    'methods': self._extract_methods_from_tree(compilation_unit, content, line_index),
+                    'imports': self._extract_imports_from_tree(compilation_unit),
                     'confidence': 0.9
                 }
             except:
@@ -760,50 +762,76 @@ class JavaParserEnhanced(BaseParser):
         else:
             return {'classes': [], 'methods': [], 'imports': [], 'confidence': 0.1}
     
-    def _extract_classes_from_tree(self, tree) -> List[Dict[str, Any]]:
+    def _declaration_span(self, decl, content: str, line_index: LineIndex) -> Tuple[int, int]:
+        """선언 노드의 (시작 라인, 끝 라인). 어노테이션부터 본문의 닫는 중괄호(본문이 없으면 ';')까지"""
+        if not decl.position:
+            return 0, 0
+        start_line = min([decl.position.line] + [ann.position.line for ann in decl.annotations or [] if ann.position])
+        offset = line_index.line_start(decl.position.line) + decl.position.column - 1
+        body_start = content.find('{', offset)
+        semicolon = content.find(';', offset)
+        if semicolon >= 0 and (body_start < 0 or semicolon < body_start):
+            return start_line, line_index.line_of(semicolon)
+        if body_start < 0:
+            return start_line, decl.position.line
+        return start_line, line_index.line_of(self._find_matching_brace(content, body_start) - 1)
+    
+    def _extract_classes_from_tree(self, compilation_unit, content: str, line_index: LineIndex) -> List[Dict[str, Any]]:
         """AST에서 클래스 정보를 추출합니다."""
         classes = []
-        package_name = tree.package.name if tree.package else ""
+        package_name = compilation_unit.package.name if compilation_unit.package else ""
         
-        for type_decl in tree.types:
+        for type_decl in compilation_unit.types:
             if isinstance(type_decl, tree.ClassDeclaration):
-                classes.append({
-                    'name': type_decl.name,
-                    'package': package_name,
-                    'type': 'class',
-                    'modifiers': type_decl.modifiers or []
-                })
+                class_type = 'class'
             elif isinstance(type_decl, tree.InterfaceDeclaration):
-                classes.append({
-                    'name': type_decl.name,
-                    'package': package_name,
-                    'type': 'interface',
-                    'modifiers': type_decl.modifiers or []
-                })
+                class_type = 'interface'
+            else:
+                continue
+            start_line, end_line = self._declaration_span(type_decl, content, line_index)
+            classes.append({
+                'name': type_decl.name,
+                'package': package_name,
+                'fqn': f"{package_name}.{type_decl.name}" if package_name else type_decl.name,
+                'type': class_type,
+                'modifiers': sorted(type_decl.modifiers or []),
+                'start_line': start_line,
+                'end_line': end_line
+            })
         
         return classes
     
-    def _extract_methods_from_tree(self, tree) -> List[Dict[str, Any]]:
+    def _extract_methods_from_tree(self, compilation_unit, content: str, line_index: LineIndex) -> List[Dict[str, Any]]:
         """AST에서 메서드 정보를 추출합니다."""
         methods = []
+        package_name = compilation_unit.package.name if compilation_unit.package else ""
         
-        for type_decl in tree.types:
+        for type_decl in compilation_unit.types:
             if hasattr(type_decl, 'methods') and type_decl.methods:
+                owner_fqn = f"{package_name}.{type_decl.name}" if package_name else type_decl.name
                 for method_decl in type_decl.methods:
+                    parameters = [f"{param.type.name if param.type else 'Object'} {param.name}"
+                                  for param in method_decl.parameters or []]
+                    start_line, end_line = self._declaration_span(method_decl, content, line_index)
                     methods.append({
                         'name': method_decl.name,
+                        'owner_fqn': owner_fqn,
+                        'signature': f"{method_decl.name}({','.join(parameters)})",
                         'return_type': method_decl.return_type.name if method_decl.return_type else 'void',
-                        'modifiers': method_decl.modifiers or []
+                        'parameters': parameters,
+                        'modifiers': sorted(method_decl.modifiers or []),
+                        'start_line': start_line,
+                        'end_line': end_line
                     })
         
         return methods
     
-    def _extract_imports_from_tree(self, tree) -> List[str]:
+    def _extract_imports_from_tree(self, compilation_unit) -> List[str]:
         """AST에서 import 정보를 추출합니다."""
         imports = []
         
-        if tree.imports:
-            for import_decl in tree.imports:
+        if compilation_unit.imports:
+            for import_decl in compilation_unit.imports:
                 if import_decl.path:
                     imports.append(import_decl.path)
         
@@ -5,15 +5,48 @@ Context7 라이브러리 문서를 참조하여 개발된 개선된 JSP 파서
 
 import re
 from pathlib import Path
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 from phase1.parsers.jsp.jsp_parser_context7 import JSPParserContext7
+from phase1.parsers.jsp.jsp_scanner import scan_jsp
 
 class JSPParser(JSPParserContext7):
     """JSP 전용 파서 - 재현율 우선"""
     
+    # 지시자 종류별로 결과에 추가하는 속성
+    _DIRECTIVE_FIELDS = {
+        'page': [],
+        'include': ['file'],
+        'taglib': ['uri', 'prefix'],
+        'tag': [],
+        'attribute': ['name', 'required', 'rtexprvalue'],
+        'variable': ['name', 'variable-class', 'scope'],
+    }
+    
+    # JSP 액션 종류별 (결과에 추가하는 속성, action_type)
+    _ACTION_FIELDS = {
+        'useBean': (['id', 'class', 'scope', 'beanName'], 'bean_creation'),
+        'setProperty': (['name', 'property', 'value', 'param'], 'property_setting'),
+        'getProperty': (['name', 'property'], 'property_getting'),
+        'include': (['page', 'flush'], 'page_inclusion'),
+        'forward': (['page'], 'page_forwarding'),
+        'param': (['name', 'value'], 'parameter_passing'),
+    }
+    
+    # JSTL 접두사별 (library, type)
+    _JSTL_LIBRARIES = {
+        'c': ('core', 'jstl_core'),
+        'fmt': ('fmt', 'jstl_formatting'),
+        'sql': ('sql', 'jstl_sql'),
+        'x': ('xml', 'jstl_xml'),
+    }
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         
+        # 태그 추출 방식: lexer(단일 패스 스캐너) 또는 regex(요소별 정규식 탐색)
+        jsp_config = ((config or {}).get('parsers', {}) or {}).get('jsp', {}) or {}
+        self.scanner = jsp_config.get('scanner', 'lexer')
+        
         # JSP 태그 패턴
         self.jsp_tags = {
             'directives': [
@@ -107,21 +140,23 @@ class JSPParser(JSPParserContext7):
     def _get_parser_type(self) -> str:
         return 'jsp'
     
-    def parse_file(self, file_path: str, project_id: int) -> Tuple['File', List[Any], List[Any], List[Any], List[Any], List[Any]]:
+    def parse_file(self, file_path: str, project_id: int, content: Optional[str] = None) -> Tuple['File', List[Any], List[Any], List[Any], List[Any], List[Any]]:
         """
         JSP 파일을 파싱하여 메타데이터를 추출합니다.
         
         Args:
             file_path: JSP 파일 경로
             project_id: 프로젝트 ID
+            content: 이미 읽은 파일 내용 (주어지면 파일을 다시 읽지 않음)
             
         Returns:
             (File, List[SqlUnit], List[Join], List[Filter], List[Edge], List[Vulnerability]) 튜플
         """
         try:
             # 파일 내용 읽기
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
+            if content is None:
+                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                    content = f.read()
             
             # File 객체 생성
             file_obj = self._create_file_object(file_path, project_id, content)
@@ -272,6 +307,105 @@ class JSPParser(JSPParserContext7):
         Returns:
             파싱된 메타데이터
         """
+        if self.scanner == 'regex':
+            return self._parse_content_regex(content, context)
+        return self._parse_content_lexer(content, context)
+    
+    def _parse_content_lexer(self, content: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        """단일 패스 스캐너(jsp_scanner) 토큰으로 모든 추출 결과를 한 번에 만듭니다."""
+        scan = scan_jsp(content)
+        
+        directives, actions, scriptlets, expressions, declarations = [], [], [], [], []
+        jstl_tags, custom_tags, html_tags = [], [], []
+        el_errors, tag_errors = [], []
+        action_names = {name.lower(): name for name in self._ACTION_FIELDS}
+        open_core_tags = []
+        # Java/SQL 추출 대상: 스크립트 요소 본문과 <sql:*> 태그 속성 (HTML/JS 문자열 오탐 제외)
+        script_sources = []
+        
+        for token in scan.tokens:
+            kind = token.kind
+            if kind == 'directive':
+                directive_type = token.name.lower()
+                if directive_type in self._DIRECTIVE_FIELDS:
+                    directives.append(self._directive_entry(directive_type, token.body, token.text))
+                script_sources.append(token.body)
+            elif kind == 'scriptlet':
+                scriptlets.append(self._script_entry('scriptlet', token.body, token.text))
+                script_sources.append(token.body)
+            elif kind == 'expression':
+                expressions.append(self._script_entry('expression', token.body, token.text))
+                script_sources.append(token.body)
+            elif kind == 'declaration':
+                declarations.append(self._script_entry('declaration', token.body, token.text))
+                script_sources.append(token.body)
+            elif kind == 'el':
+                # ${user.status} 같은 forEach 외부에서의 user 참조 검사
+                if token.name == '$' and 'user.' in token.body and not token.in_foreach:
+                    el_errors.append(self._el_error(token.body))
+            elif kind == 'tag':
+                prefix = token.prefix.lower()
+                if prefix == 'jsp':
+                    action_type = action_names.get(token.name.lower())
+                    if action_type:
+                        actions.append(self._action_entry(action_type, token.body, token.text))
+                elif prefix in self._JSTL_LIBRARIES:
+                    library, tag_type = self._JSTL_LIBRARIES[prefix]
+                    if prefix == 'sql':
+                        script_sources.append(token.body)
+                    jstl_tags.append({
+                        'library': library,
+                        'tag': token.name,
+                        'attributes': self._parse_jsp_attributes(token.body),
+                        'full_text': token.text,
+                        'type': tag_type
+                    })
+                elif prefix:
+                    custom_tags.append({
+                        'prefix': token.prefix,
+                        'tag': token.name,
+                        'attributes': self._parse_jsp_attributes(token.body),
+                        'full_text': token.text,
+                        'type': 'custom_tag'
+                    })
+                elif token.body[:1].isspace():
+                    html_tags.append({
+                        'tag': token.name,
+                        'attributes': self._parse_jsp_attributes(token.body),
+                        'full_text': token.text,
+                        'type': 'html_tag'
+                    })
+                if token.prefix == 'c' and not token.self_closing:
+                    open_core_tags.append(f"c:{token.name}")
+            elif kind == 'end_tag' and token.prefix == 'c':
+                tag_name = f"c:{token.name}"
+                if open_core_tags and open_core_tags[-1] == tag_name:
+                    open_core_tags.pop()
+                else:
+                    tag_errors.append(self._tag_error('unmatched_tag', tag_name))
+        tag_errors.extend(self._tag_error('unclosed_tag', tag_name) for tag_name in open_core_tags)
+        
+        jsp_errors = self._validate_jsp_syntax(scan.code) + el_errors + tag_errors
+        script_code = '\n'.join(script_sources)
+        return {
+            'jsp_directives': directives,
+            'jsp_actions': actions,
+            'jsp_scriptlets': scriptlets,
+            'jsp_expressions': expressions,
+            'jsp_declarations': declarations,
+            'jstl_tags': jstl_tags,
+            'custom_tags': custom_tags,
+            'html_tags': html_tags,
+            'java_code': self._extract_java_code_aggressive(script_code),
+            'sql_units': self._extract_sql_queries_aggressive(script_code),
+            'file_metadata': {'default_schema': context.get('default_schema', 'DEFAULT')},
+            'jsp_errors': jsp_errors,
+            'parsing_quality': self._calculate_jsp_quality(scan.code, jsp_errors),
+            'confidence': 0.9
+        }
+    
+    def _parse_content_regex(self, content: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        """요소 종류마다 정규식으로 전체 본문을 탐색하는 기존 추출 경로 (parsers.jsp.scanner: regex)"""
         normalized_content = self._remove_comments(content)
         
         # JSP 특화 검증
@@ -298,6 +432,59 @@ class JSPParser(JSPParserContext7):
         
         return result
     
+    def _directive_entry(self, directive_type: str, attributes: str, full_text: str) -> Dict[str, Any]:
+        entry = {'type': directive_type}
+        for field in self._DIRECTIVE_FIELDS[directive_type]:
+            entry[field] = self._extract_jsp_attribute(attributes, field)
+        entry.update({
+            'attributes': self._parse_jsp_attributes(attributes),
+            'full_text': full_text,
+            'directive_type': directive_type
+        })
+        return entry
+    
+    def _action_entry(self, action: str, attributes: str, full_text: str) -> Dict[str, Any]:
+        fields, action_type = self._ACTION_FIELDS[action]
+        entry = {'type': action}
+        for field in fields:
+            entry[field] = self._extract_jsp_attribute(attributes, field)
+        entry.update({
+            'attributes': self._parse_jsp_attributes(attributes),
+            'full_text': full_text,
+            'action_type': action_type
+        })
+        return entry
+    
+    def _script_entry(self, script_type: str, script_content: str, full_text: str) -> Dict[str, Any]:
+        extractors = {
+            'scriptlet': self._extract_java_code_from_scriptlet,
+            'expression': self._extract_java_code_from_expression,
+            'declaration': self._extract_java_code_from_declaration,
+        }
+        return {
+            'content': script_content.strip(),
+            'full_text': full_text,
+            'type': script_type,
+            'java_code': extractors[script_type](script_content)
+        }
+    
+    def _el_error(self, expression: str) -> Dict[str, Any]:
+        return {
+            'type': 'undefined_variable',
+            'expression': expression,
+            'message': f'정의되지 않은 변수 참조: {expression}',
+            'severity': 'error'
+        }
+    
+    def _tag_error(self, error_type: str, tag_name: str) -> Dict[str, Any]:
+        message = '매칭되지 않는 닫는 태그' if error_type == 'unmatched_tag' else '닫히지 않은 태그'
+        return {
+            'type': error_type,
+            'tag': tag_name,
+            'message': f'{message}: {tag_name}',
+            'severity': 'error'
+        }
+    
     def _validate_jsp_syntax(self, content: str) -> List[Dict[str, Any]]:
         """JSP 구문 검증"""
         jsp_errors = []
@@ -318,12 +505,7 @@ class JSPParser(JSPParserContext7):
             if 'user.' in expr:
                 # user 변수가 정의된 스코프 내부인지 확인
                 if not self._is_in_foreach_scope(content, expr):
-                    el_errors.append({
-                        'type': 'undefined_variable',
-                        'expression': expr,
-                        'message': f'정의되지 않은 변수 참조: {expr}',
-                        'severity': 'error'
-                    })
+                    el_errors.append(self._el_error(expr))
         
         return el_errors
     
@@ -341,12 +523,7 @@ class JSPParser(JSPParserContext7):
             
             if is_closing:
                 if not tag_stack or tag_stack[-1] != tag_name:
-                    tag_errors.append({
-                        'type': 'unmatched_tag',
-                        'tag': tag_name,
-                        'message': f'매칭되지 않는 닫는 태그: {tag_name}',
-                        'severity': 'error'
-                    })
+                    tag_errors.append(self._tag_error('unmatched_tag', tag_name))
                 else:
                     tag_stack.pop()
             else:
@@ -356,12 +533,7 @@ class JSPParser(JSPParserContext7):
         
         # 닫히지 않은 태그들
         for unclosed_tag in tag_stack:
-            tag_errors.append({
-                'type': 'unclosed_tag',
-                'tag': unclosed_tag,
-                'message': f'닫히지 않은 태그: {unclosed_tag}',
-                'severity': 'error'
-            })
+            tag_errors.append(self._tag_error('unclosed_tag', unclosed_tag))
         
         return tag_errors
     
@@ -399,80 +571,10 @@ class JSPParser(JSPParserContext7):
         """JSP 지시자를 공격적으로 추출 (재현율 우선)"""
         directives = []
         
-        # 1. page 지시자
-        page_matches = self.jsp_directives['page'].finditer(content)
-        for match in page_matches:
-            attributes = match.group(1)
-            directives.append({
-                'type': 'page',
-                'attributes': self._parse_jsp_attributes(attributes),
-                'full_text': match.group(0),
-                'directive_type': 'page'
-            })
-        
-        # 2. include 지시자
-        include_matches = self.jsp_directives['include'].finditer(content)
-        for match in include_matches:
-            attributes = match.group(1)
-            directives.append({
-                'type': 'include',
-                'file': self._extract_jsp_attribute(attributes, 'file'),
-                'attributes': self._parse_jsp_attributes(attributes),
-                'full_text': match.group(0),
-                'directive_type': 'include'
-            })
-        
-        # 3. taglib 지시자
-        taglib_matches = self.jsp_directives['taglib'].finditer(content)
-        for match in taglib_matches:
-            attributes = match.group(1)
-            directives.append({
-                'type': 'taglib',
-                'uri': self._extract_jsp_attribute(attributes, 'uri'),
-                'prefix': self._extract_jsp_attribute(attributes, 'prefix'),
-                'attributes': self._parse_jsp_attributes(attributes),
-                'full_text': match.group(0),
-                'directive_type': 'taglib'
-            })
-        
-        # 4. tag 지시자
-        tag_matches = self.jsp_directives['tag'].finditer(content)
-        for match in tag_matches:
-            attributes = match.group(1)
-            directives.append({
-                'type': 'tag',
-                'attributes': self._parse_jsp_attributes(attributes),
-                'full_text': match.group(0),
-                'directive_type': 'tag'
-            })
-        
-        # 5. attribute 지시자
-        attribute_matches = self.jsp_directives['attribute'].finditer(content)
-        for match in attribute_matches:
-            attributes = match.group(1)
-            directives.append({
-                'type': 'attribute',
-                'name': self._extract_jsp_attribute(attributes, 'name'),
-                'required': self._extract_jsp_attribute(attributes, 'required'),
-                'rtexprvalue': self._extract_jsp_attribute(attributes, 'rtexprvalue'),
-                'attributes': self._parse_jsp_attributes(attributes),
-                'full_text': match.group(0),
-                'directive_type': 'attribute'
-            })
-        
-        # 6. variable 지시자
-        variable_matches = self.jsp_directives['variable'].finditer(content)
-        for match in variable_matches:
-            attributes = match.group(1)
-            directives.append({
-                'type': 'variable',
-                'name': self._extract_jsp_attribute(attributes, 'name'),
-                'variable-class': self._extract_jsp_attribute(attributes, 'variable-class'),
-                'scope': self._extract_jsp_attribute(attributes, 'scope'),
-                'attributes': self._parse_jsp_attributes(attributes),
-                'full_text': match.group(0),
-                'directive_type': 'variable'
-            })
+        # page, include, taglib, tag, attribute, variable 지시자 순서로 추출
+        for directive_type, pattern in self.jsp_directives.items():
+            for match in pattern.finditer(content):
+                directives.append(self._directive_entry(directive_type, match.group(1), match.group(0)))
         
         return directives
     
@@ -480,86 +582,10 @@ class JSPParser(JSPParserContext7):
         """JSP 액션 태그를 공격적으로 추출 (재현율 우선)"""
         actions = []
         
-        # 1. useBean 액션
-        use_bean_matches = self.jsp_actions['useBean'].finditer(content)
-        for match in use_bean_matches:
-            attributes = match.group(1)
-            actions.append({
-                'type': 'useBean',
-                'id': self._extract_jsp_attribute(attributes, 'id'),
-                'class': self._extract_jsp_attribute(attributes, 'class'),
-                'scope': self._extract_jsp_attribute(attributes, 'scope'),
-                'beanName': self._extract_jsp_attribute(attributes, 'beanName'),
-                'attributes': self._parse_jsp_attributes(attributes),
-                'full_text': match.group(0),
-                'action_type': 'bean_creation'
-            })
-        
-        # 2. setProperty 액션
-        set_property_matches = self.jsp_actions['setProperty'].finditer(content)
-        for match in set_property_matches:
-            attributes = match.group(1)
-            actions.append({
-                'type': 'setProperty',
-                'name': self._extract_jsp_attribute(attributes, 'name'),
-                'property': self._extract_jsp_attribute(attributes, 'property'),
-                'value': self._extract_jsp_attribute(attributes, 'value'),
-                'param': self._extract_jsp_attribute(attributes, 'param'),
-                'attributes': self._parse_jsp_attributes(attributes),
-                'full_text': match.group(0),
-                'action_type': 'property_setting'
-            })
-        
-        # 3. getProperty 액션
-        get_property_matches = self.jsp_actions['getProperty'].finditer(content)
-        for match in get_property_matches:
-            attributes = match.group(1)
-            actions.append({
-                'type': 'getProperty',
-                'name': self._extract_jsp_attribute(attributes, 'name'),
-                'property': self._extract_jsp_attribute(attributes, 'property'),
-                'attributes': self._parse_jsp_attributes(attributes),
-                'full_text': match.group(0),
-                'action_type': 'property_getting'
-            })
-        
-        # 4. include 액션
-        include_matches = self.jsp_actions['include'].finditer(content)
-        for match in include_matches:
-            attributes = match.group(1)
-            actions.append({
-                'type': 'include',
-                'page': self._extract_jsp_attribute(attributes, 'page'),
-                'flush': self._extract_jsp_attribute(attributes, 'flush'),
-                'attributes': self._parse_jsp_attributes(attributes),
-                'full_text': match.group(0),
-                'action_type': 'page_inclusion'
-            })
-        
-        # 5. forward 액션
-        forward_matches = self.jsp_actions['forward'].finditer(content)
-        for match in forward_matches:
-            attributes = match.group(1)
-            actions.append({
-                'type': 'forward',
-                'page': self._extract_jsp_attribute(attributes, 'page'),
-                'attributes': self._parse_jsp_attributes(attributes),
-                'full_text': match.group(0),
-                'action_type': 'page_forwarding'
-            })
-        
-        # 6. param 액션
-        param_matches = self.jsp_actions['param'].finditer(content)
-        for match in param_matches:
-            attributes = match.group(1)
-            actions.append({
-                'type': 'param',
-                'name': self._extract_jsp_attribute(attributes, 'name'),
-                'value': self._extract_jsp_attribute(attributes, 'value'),
-                'attributes': self._parse_jsp_attributes(attributes),
-                'full_text': match.group(0),
-                'action_type': 'parameter_passing'
-            })
+        # useBean, setProperty, getProperty, include, forward, param 액션 순서로 추출
+        for action in self._ACTION_FIELDS:
+            for match in self.jsp_actions[action].finditer(content):
+                actions.append(self._action_entry(action, match.group(1), match.group(0)))
         
         return actions
     
@@ -568,16 +594,8 @@ class JSPParser(JSPParserContext7):
         scriptlets = []
         
         for pattern in self.jsp_tags['scriptlets']:
-            matches = pattern.finditer(content)
-            for match in matches:
-                scriptlet_content = match.group(1)
-                
-                scriptlets.append({
-                    'content': scriptlet_content.strip(),
-                    'full_text': match.group(0),
-                    'type': 'scriptlet',
-                    'java_code': self._extract_java_code_from_scriptlet(scriptlet_content)
-                })
+            for match in pattern.finditer(content):
+                scriptlets.append(self._script_entry('scriptlet', match.group(1), match.group(0)))
         
         return scriptlets
     
@@ -586,16 +604,8 @@ class JSPParser(JSPParserContext7):
         expressions = []
         
         for pattern in self.jsp_tags['expressions']:
-            matches = pattern.finditer(content)
-            for match in matches:
-                expression_content = match.group(1)
-                
-                expressions.append({
-                    'content': expression_content.strip(),
-                    'full_text': match.group(0),
-                    'type': 'expression',
-                    'java_code': self._extract_java_code_from_expression(expression_content)
-                })
+            for match in pattern.finditer(content):
+                expressions.append(self._script_entry('expression', match.group(1), match.group(0)))
         
         return expressions
     
@@ -604,16 +614,8 @@ class JSPParser(JSPParserContext7):
         declarations = []
         
         for pattern in self.jsp_tags['declarations']:
-            matches = pattern.finditer(content)
-            for match in matches:
-                declaration_content = match.group(1)
-                
-                declarations.append({
-                    'content': declaration_content.strip(),
-                    'full_text': match.group(0),
-                    'type': 'declaration',
-                    'java_code': self._extract_java_code_from_declaration(declaration_content)
-                })
+            for match in pattern.finditer(content):
+                declarations.append(self._script_entry('declaration', match.group(1), match.group(0)))
         
         return declarations
     
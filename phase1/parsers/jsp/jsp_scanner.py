@@ -0,0 +1,140 @@
+"""
+JSP 단일 패스 스캐너
+JSP 본문을 앞에서부터 한 번만 훑어 지시자, 스크립틀릿, 표현식, 선언, 태그(JSP 액션/JSTL/커스텀/HTML),
+EL 표현식을 토큰으로 분리합니다. 요소 종류마다 전체 본문을 다시 훑는 DOTALL 정규식 대신
+모든 요소를 하나의 교대 패턴으로 묶어 토큰이 시작할 수 있는 위치에서만 매칭합니다.
+
+- <%-- --%>, <!-- --> 주석은 건너뛰고, 주석을 제거한 본문(code)을 함께 돌려줍니다.
+- 태그 속성 안의 <%= %>, ${ }, <c:url/> 같은 접두사 태그도 토큰으로 분리하며, 그 안의 '>'에서
+  바깥 태그가 끝나지 않습니다.
+- EL 토큰에는 <c:forEach> 본문 안에 있는지(in_foreach)를 기록합니다.
+- 닫히지 않은 <% / ${ 가 많아도 선형: 마지막 '%>' / '}' 이후에서는 해당 요소를 시도하지 않습니다.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import List
+
+_NAME = r'[A-Za-z_][\w.-]*'
+
+# 모든 요소 종류를 하나의 교대(alternation) 패턴으로: 본문을 앞에서부터 한 번만 훑음
+# 태그 속성은 따옴표 값, <% %>, ${ }, 접두사 태그(<c:url .../>)를 한 덩어리로 건너뛰므로
+# 그 안의 '>'에서 태그가 끝나지 않음. 속성은 일반 문자* (특수 요소 일반 문자*)* 형태로 풀어 써서
+# 닫히지 않은 태그에서도 역추적이 선형으로 끝남
+_TOKEN_TEMPLATE = r"""
+    (?P<comment><%--.*?(?:--%>|\Z)|<!--.*?(?:-->|\Z))
+  | {script}<%(?P<script_kind>[@=!]?)(?P<script_body>.*?)%>
+  | {el}(?P<el_kind>[$#])\{{(?P<el_body>[^}}]*)\}}
+  | </(?P<end_name>{name})(?::(?P<end_local>{name}))?\s*>
+  | <(?P<tag_name>{name})(?::(?P<tag_local>{name}))?
+      (?P<tag_body>[^<>"'$#]*(?:(?:"[^"]*"|'[^']*'|{script}<%.*?%>|{el}[$#]\{{[^}}]*\}}|<{name}:[^<>]*>|[$#](?!\{{))[^<>"'$#]*)*)>
+"""
+
+
+def _token_pattern(script: bool, el: bool) -> 're.Pattern':
+    """스크립트(<% %>)/EL(${ }) 요소를 켜거나 끈 토큰 패턴 (끈 요소는 (?!)로 즉시 실패, 그룹 이름은 유지)"""
+    return re.compile(_TOKEN_TEMPLATE.format(name=_NAME, script='' if script else '(?!)', el='' if el else '(?!)'),
+                      re.DOTALL | re.VERBOSE)
+
+
+# (스크립트 종료 '%>'가 뒤에 남아 있는지, EL 종료 '}'가 뒤에 남아 있는지) → 패턴
+_TOKEN_PATTERNS = {(script, el): _token_pattern(script, el) for script in (True, False) for el in (True, False)}
+_TOKEN = _TOKEN_PATTERNS[True, True]
+# 토큰이 시작할 수 있는 위치 (<%, <!--, </, <이름, ${, #{)
+_CANDIDATE = re.compile(r'<[%!/A-Za-z_]|[$#]\{')
+_DIRECTIVE_NAME = re.compile(r'\s*(\w+)')
+# 속성 안에 다시 훑어야 할 요소가 있는지
+_NESTED = re.compile(r'<|[$#]\{')
+
+# <% 다음 문자별 스크립트 요소 종류
+_SCRIPT_KINDS = {'@': 'directive', '=': 'expression', '!': 'declaration', '': 'scriptlet'}
+
+
+@dataclass
+class JspToken:
+    kind: str            # directive, scriptlet, expression, declaration, tag, end_tag, el
+    start: int
+    end: int
+    text: str            # 요소 원문 전체
+    name: str = ''       # 지시자/태그 이름 (접두사 제외), EL은 시작 문자('$' 또는 '#')
+    prefix: str = ''     # 태그 접두사 (jsp, c, fmt, 커스텀 태그 라이브러리 등)
+    body: str = ''       # 지시자/태그의 속성 문자열, 스크립트/EL의 내용
+    self_closing: bool = False
+    in_foreach: bool = False
+
+
+@dataclass
+class JspScanResult:
+    tokens: List[JspToken]   # 문서 순서 (태그 속성 안의 요소는 그 태그보다 앞)
+    code: str                # 주석을 제거한 본문
+
+
+def scan_jsp(content: str) -> JspScanResult:
+    """JSP 본문을 한 번 훑어 토큰 목록과 주석을 제거한 본문을 반환"""
+    tokens: List[JspToken] = []
+    code_parts: List[str] = []
+    copied = 0           # code_parts에 복사한 마지막 위치
+    foreach_depth = 0
+
+    def emit(match, pattern) -> None:
+        nonlocal copied, foreach_depth
+        group = match.lastgroup
+        start, end = match.span()
+        if group == 'comment':
+            # 주석은 토큰으로 만들지 않고 본문 복사에서 제외
+            code_parts.append(content[copied:start])
+            copied = end
+        elif group in ('script_body', 'script_kind'):
+            kind = _SCRIPT_KINDS[match.group('script_kind')]
+            token = JspToken(kind, start, end, match.group(), body=match.group('script_body'))
+            if kind == 'directive':
+                name_match = _DIRECTIVE_NAME.match(token.body)
+                if name_match:
+                    token.name = name_match.group(1)
+                    token.body = token.body[name_match.end():]
+            tokens.append(token)
+        elif group == 'el_body':
+            tokens.append(JspToken('el', start, end, match.group(), name=match.group('el_kind'),
+                                   body=match.group('el_body'), in_foreach=foreach_depth > 0))
+        elif group in ('end_name', 'end_local'):
+            prefix, name = match.group('end_name', 'end_local')
+            if name is None:
+                prefix, name = '', prefix
+            if prefix.lower() == 'c' and name.lower() == 'foreach':
+                foreach_depth = max(0, foreach_depth - 1)
+            tokens.append(JspToken('end_tag', start, end, match.group(), name=name, prefix=prefix))
+        else:
+            prefix, name = match.group('tag_name', 'tag_local')
+            if name is None:
+                prefix, name = '', prefix
+            body = match.group('tag_body')
+            if _NESTED.search(body):
+                # 속성 안의 <% %>, ${ }, 접두사 태그는 바깥 태그보다 먼저 추가
+                for nested in pattern.finditer(content, match.start('tag_body'), match.end('tag_body')):
+                    emit(nested, pattern)
+            self_closing = body.rstrip().endswith('/')
+            if prefix.lower() == 'c' and name.lower() == 'foreach' and not self_closing:
+                foreach_depth += 1
+            tokens.append(JspToken('tag', start, end, match.group(), name=name, prefix=prefix,
+                                   body=body, self_closing=self_closing))
+
+    # 닫는 '%>' / '}'가 더 이상 없는 위치부터는 해당 요소를 시도하지 않음: 닫히지 않은 <% 나 ${ 마다
+    # 본문 끝까지 종료 문자열을 찾으면 O(n²)이 되므로, 마지막 종료 위치를 한 번 구해 패턴을 바꿔 씀
+    last_script_end = content.rfind('%>')
+    last_el_end = content.rfind('}')
+    pos = 0
+    while True:
+        candidate = _CANDIDATE.search(content, pos)
+        if candidate is None:
+            break
+        start = candidate.start()
+        pattern = _TOKEN_PATTERNS[start + 2 <= last_script_end, start + 2 <= last_el_end]
+        match = pattern.match(content, start)
+        if match is None:
+            pos = start + 1
+            continue
+        emit(match, pattern)
+        pos = match.end()
+
+    code_parts.append(content[copied:])
+    return JspScanResult(tokens, ''.join(code_parts))
@@ -12,6 +12,7 @@ import hashlib
 from typing import Dict, List, Any, Set, Tuple
 from phase1.parsers.base_parser import BaseParser
 from phase1.utils.table_alias_resolver import get_table_alias_resolver
+from phase1.utils.line_index import line_index_for
 
 class MyBatisParser(BaseParser):
     """
@@ -245,7 +246,9 @@ class MyBatisParser(BaseParser):
             'parameters': self._extract_parameters_from_sql(processed_sql),
             'has_dynamic_content': self._has_dynamic_content(processed_sql),
             'has_include_tags': '<include' in processed_sql,
-            'line_number': self._get_line_number(content, match.start())
+            'line_number': self._get_line_number(content, match.start()),
+            'start_line': self._get_line_number(content, match.start()),
+            'end_line': self._get_line_number(content, match.end())
         }
         
         # Enhanced unique_id 생성 (file_path 포함)
@@ -383,8 +386,8 @@ class MyBatisParser(BaseParser):
         cls._global_processed_sql_ids.clear()
     
     def _get_line_number(self, content: str, position: int) -> int:
-        """위치에 해당하는 라인 번호 반환"""
-        return content[:position].count('\n') + 1
+        """위치에 해당하는 라인 번호 반환 (파일별 라인 오프셋 인덱스 재사용)"""
+        return line_index_for(content).line_of(position)
     
     def _extract_dynamic_queries_enhanced(self, content: str) -> List[Dict[str, Any]]:
         """Enhanced 동적 쿼리 추출"""
@@ -669,8 +672,8 @@ class MyBatisParser(BaseParser):
     
     def _remove_comments(self, content: str) -> str:
         """MyBatis XML 주석 제거"""
-        # XML 주석 제거
-        content = re.sub(r'<!--.*?-->', '', content, flags=re.DOTALL)
+        # XML 주석 제거 (줄바꿈은 남겨 라인 번호가 원본과 같도록)
+        content = re.sub(r'<!--.*?-->', lambda m: '\n' * m.group().count('\n'), content, flags=re.DOTALL)
         return content
     
     def parse_sql(self, sql_content: str, context: Dict[str, Any]) -> Dict[str, Any]:
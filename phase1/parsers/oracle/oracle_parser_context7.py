@@ -11,6 +11,7 @@ import re
 import hashlib
 from typing import Dict, List, Any, Set, Tuple
 from phase1.parsers.base_parser import BaseParser
+from phase1.utils.line_index import line_index_for
 
 class OracleParserContext7(BaseParser):
     """
@@ -231,8 +232,8 @@ class OracleParserContext7(BaseParser):
         return True
     
     def _get_line_number(self, content: str, position: int) -> int:
-        """위치에 해당하는 라인 번호 반환"""
-        return content[:position].count('\n') + 1
+        """위치에 해당하는 라인 번호 반환 (파일별 라인 오프셋 인덱스 재사용)"""
+        return line_index_for(content).line_of(position)
     
     def _extract_tables_enhanced(self, content: str) -> List[str]:
         """Enhanced 테이블명 추출"""
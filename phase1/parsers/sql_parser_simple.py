@@ -7,6 +7,7 @@ import re
 import hashlib
 from typing import Dict, List, Any, Set, Tuple
 from phase1.parsers.base_parser import BaseParser
+from phase1.utils.line_index import line_index_for
 
 class SimpleSQLParser(BaseParser):
     """간단한 정규식 기반 SQL 파서"""
@@ -230,6 +231,7 @@ class SimpleSQLParser(BaseParser):
     def _extract_sql_from_java(self, java_content: str, file_path: str) -> Dict[str, Any]:
         """Java 파일에서 SQL 문자열 추출"""
         sql_units = []
+        line_index = line_index_for(java_content)
         
         # Java 파일에서 SQL 문자열 패턴 찾기 (엄격한 패턴)
         sql_string_patterns = [
@@ -253,8 +255,8 @@ class SimpleSQLParser(BaseParser):
                         'id': f'java_sql_{len(sql_units)}',
                         'type': sql_type,
                         'sql': sql_text.strip(),
-                        'start_line': java_content[:match.start()].count('\n') + 1,
-                        'end_line': java_content[:match.end()].count('\n') + 1,
+                        'start_line': line_index.line_of(match.start()),
+                        'end_line': line_index.line_of(match.end()),
                         'tables': self._extract_tables_from_sql(sql_text),
                         'columns': self._extract_columns_from_sql(sql_text),
                         'joins': self._extract_joins_from_sql(sql_text),
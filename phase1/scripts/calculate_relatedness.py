@@ -1,12 +1,14 @@
 # phase1/scripts/calculate_relatedness.py
 
+import heapq
 import os
+import struct
 import sys
+import tempfile
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from itertools import combinations
 from pathlib import Path
-from typing import Callable, List, Dict, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 # Add project root to path to allow imports from phase1
 current_dir = Path(__file__).parent
@@ -15,6 +17,169 @@ sys.path.insert(0, str(project_root))
 
 from phase1.models.database import DatabaseManager, File, Class, Method, SqlUnit, Edge, DbTable, Project, Relatedness 
 
+# Node keys are packed into a single int: (type code << NODE_ID_BITS) | node id
+NODE_ID_BITS = 40
+NODE_ID_MASK = (1 << NODE_ID_BITS) - 1
+NODE_TYPE_CODES = {'file': 1, 'class': 2, 'method': 3, 'sql_unit': 4, 'table': 5}
+
+IN_CLAUSE_BATCH = 500
+
+# Callback signature used by strategies: (node1, node2, score, reason) with encoded node ints
+UpdateCallback = Callable[[int, int, float, str], None]
+
+
+class NodeCodec:
+    """
+    Encodes (node_type, node_id) pairs as single integers so that pairs can be
+    stored as fixed-size binary records instead of string tuples.
+    Node types outside NODE_TYPE_CODES get a code assigned on first use.
+    """
+
+    def __init__(self):
+        self.codes: Dict[str, int] = dict(NODE_TYPE_CODES)
+        self.types: Dict[int, str] = {code: node_type for node_type, code in self.codes.items()}
+
+    def encode(self, node_type: str, node_id: int) -> int:
+        code = self.codes.get(node_type)
+        if code is None:
+            code = max(self.types) + 1
+            self.codes[node_type] = code
+            self.types[code] = node_type
+        return (code << NODE_ID_BITS) | int(node_id)
+
+    def decode(self, node: int) -> Tuple[str, int]:
+        return self.types[node >> NODE_ID_BITS], node & NODE_ID_MASK
+
+
+class ShardedPairStore:
+    """
+    Disk-spilled store of (node1, node2, score, reason) records with bounded memory.
+
+    Pairs are appended to binary shard files partitioned by the smaller node key, so
+    each shard can be reduced independently. finalize() keeps the strongest score per
+    pair (first reason wins on ties), then keeps each node's top-k neighbours;
+    a pair is kept when either of its nodes selects it.
+    """
+
+    RECORD = struct.Struct('<qqdH')  # node_a, node_b, score, reason index
+
+    def __init__(self, spill_dir: str, shard_count: int = 16, top_k: int = 50,
+                 touched: Optional[Set[int]] = None):
+        self.spill_dir = spill_dir
+        self.shard_count = max(1, int(shard_count))
+        self.top_k = int(top_k or 0)
+        # Incremental mode: only pairs with at least one touched node are kept
+        self.touched = touched
+        self.reasons: List[str] = []
+        self._reason_index: Dict[str, int] = {}
+        self.emitted = 0
+        self._writers = self._open_shards('pairs')
+
+    def _shard_path(self, stage: str, index: int) -> str:
+        return os.path.join(self.spill_dir, f"{stage}_{index:03d}.bin")
+
+    def _open_shards(self, stage: str) -> List:
+        return [open(self._shard_path(stage, i), 'wb', buffering=1 << 16) for i in range(self.shard_count)]
+
+    @staticmethod
+    def _close_shards(writers: List) -> None:
+        for writer in writers:
+            writer.close()
+
+    def _read_shard(self, stage: str, index: int) -> Iterator[Tuple[int, int, float, int]]:
+        path = self._shard_path(stage, index)
+        with open(path, 'rb') as f:
+            data = f.read()
+        os.remove(path)
+        return self.RECORD.iter_unpack(data)
+
+    def add(self, node1: int, node2: int, score: float, reason: str) -> None:
+        """Callback for strategies. Self pairs and (in incremental mode) untouched pairs are dropped."""
+        if node1 == node2:
+            return
+        if self.touched is not None and node1 not in self.touched and node2 not in self.touched:
+            return
+        reason_index = self._reason_index.get(reason)
+        if reason_index is None:
+            reason_index = len(self.reasons)
+            self.reasons.append(reason)
+            self._reason_index[reason] = reason_index
+        lo, hi = (node1, node2) if node1 < node2 else (node2, node1)
+        self._writers[lo % self.shard_count].write(self.RECORD.pack(lo, hi, score, reason_index))
+        self.emitted += 1
+
+    def _strongest_pairs(self, stage: str, index: int) -> Dict[Tuple[int, int], Tuple[float, int]]:
+        """Reduce one shard to the strongest (score, reason) per pair, in first-seen order."""
+        best: Dict[Tuple[int, int], Tuple[float, int]] = {}
+        for lo, hi, score, reason_index in self._read_shard(stage, index):
+            current = best.get((lo, hi))
+            if current is None or score > current[0]:
+                best[(lo, hi)] = (score, reason_index)
+        return best
+
+    def finalize(self) -> Iterator[Tuple[int, int, float, str]]:
+        """Yields the final (node1, node2, score, reason) pairs, one shard at a time."""
+        self._close_shards(self._writers)
+        if self.top_k <= 0:
+            for index in range(self.shard_count):
+                for (lo, hi), (score, reason_index) in self._strongest_pairs('pairs', index).items():
+                    if score > 0.0:
+                        yield lo, hi, score, self.reasons[reason_index]
+            return
+
+        # 1) strongest score per pair → one record per endpoint, partitioned by that endpoint
+        by_node = self._open_shards('nodes')
+        try:
+            for index in range(self.shard_count):
+                for (lo, hi), (score, reason_index) in self._strongest_pairs('pairs', index).items():
+                    if score <= 0.0:
+                        continue
+                    by_node[lo % self.shard_count].write(self.RECORD.pack(lo, hi, score, reason_index))
+                    by_node[hi % self.shard_count].write(self.RECORD.pack(hi, lo, score, reason_index))
+        finally:
+            self._close_shards(by_node)
+
+        # 2) top-k neighbours per node → selected pairs, partitioned by the smaller node again
+        selected = self._open_shards('selected')
+        try:
+            for index in range(self.shard_count):
+                neighbours = defaultdict(list)
+                for node, other, score, reason_index in self._read_shard('nodes', index):
+                    neighbours[node].append((-score, other, reason_index))
+                for node, candidates in neighbours.items():
+                    if len(candidates) > self.top_k:
+                        candidates = heapq.nsmallest(self.top_k, candidates)
+                    for neg_score, other, reason_index in candidates:
+                        lo, hi = (node, other) if node < other else (other, node)
+                        selected[lo % self.shard_count].write(self.RECORD.pack(lo, hi, -neg_score, reason_index))
+        finally:
+            self._close_shards(selected)
+
+        # 3) a pair selected by both of its nodes appears twice in the same shard
+        for index in range(self.shard_count):
+            seen = set()
+            for lo, hi, score, reason_index in self._read_shard('selected', index):
+                if (lo, hi) in seen:
+                    continue
+                seen.add((lo, hi))
+                yield lo, hi, score, self.reasons[reason_index]
+
+    def close(self) -> None:
+        self._close_shards(self._writers)
+
+
+def _windowed_pairs(nodes: List[int], window: int) -> Iterator[Tuple[int, int]]:
+    """
+    Pairs each node with the next `window` nodes of an ordered group.
+    Equivalent to combinations() for groups of at most window + 1 nodes,
+    linear in group size for larger ones.
+    """
+    count = len(nodes)
+    for i in range(count - 1):
+        for j in range(i + 1, min(count, i + 1 + window)):
+            yield nodes[i], nodes[j]
+
+
 class RelatednessStrategy(ABC):
     """
     Abstract base class defining the interface for relatedness calculation strategies.
@@ -28,14 +193,17 @@ class RelatednessStrategy(ABC):
         pass
     
     @abstractmethod
-    def apply(self, session, project_id: int, update_callback: Callable[[str, str, float, str], None]):
+    def apply(self, session, project_id: int, codec: NodeCodec, update_callback: UpdateCallback,
+              touched: Optional[Set[int]] = None):
         """
         Apply this strategy to calculate relatedness scores.
         
         Args:
             session: Database session
             project_id: ID of the project to analyze
-            update_callback: Function to call with (node1_key, node2_key, score, reason)
+            codec: Encoder for (node_type, node_id) keys
+            update_callback: Function to call with (node1, node2, score, reason)
+            touched: Encoded nodes to recompute in incremental mode (None = all nodes)
         """
         pass
 
@@ -47,12 +215,14 @@ class DirectEdgeStrategy(RelatednessStrategy):
     def name(self) -> str:
         return "DirectEdge"
     
-    def apply(self, session, project_id: int, update_callback: Callable[[str, str, float, str], None]):
+    def apply(self, session, project_id: int, codec: NodeCodec, update_callback: UpdateCallback,
+              touched: Optional[Set[int]] = None):
         """Calculate relatedness based on existing direct edges."""
         print(f"  - Applying {self.name} strategy...")
         try:
-            edges = session.query(Edge).filter(Edge.project_id == project_id).all()
-            print(f"    Found {len(edges)} edges to process.")
+            edges = session.query(
+                Edge.src_type, Edge.src_id, Edge.dst_type, Edge.dst_id, Edge.edge_kind
+            ).filter(Edge.project_id == project_id).yield_per(5000)
 
             score_map = {
                 'fk': 0.95,
@@ -63,49 +233,60 @@ class DirectEdgeStrategy(RelatednessStrategy):
                 'include': 0.6
             }
 
+            edge_count = 0
             processed_count = 0
-            for edge in edges:
-                if not all([edge.src_type, edge.src_id, edge.dst_type, edge.dst_id]):
+            for src_type, src_id, dst_type, dst_id, edge_kind in edges:
+                edge_count += 1
+                if not all([src_type, src_id, dst_type, dst_id]):
                     continue
 
-                score = score_map.get(edge.edge_kind, 0.5)
-                node1_key = f"{edge.src_type}:{edge.src_id}"
-                node2_key = f"{edge.dst_type}:{edge.dst_id}"
-                update_callback(node1_key, node2_key, score, f"edge_{edge.edge_kind}")
+                score = score_map.get(edge_kind, 0.5)
+                update_callback(codec.encode(src_type, src_id), codec.encode(dst_type, dst_id),
+                                score, f"edge_{edge_kind}")
                 processed_count += 1
             
-            print(f"    Processed {processed_count} valid edges.")
+            print(f"    Processed {processed_count} valid edges out of {edge_count}.")
             
         except Exception as e:
             print(f"    Error in {self.name} strategy: {e}")
 
 
 class DirectoryProximityStrategy(RelatednessStrategy):
-    """Strategy for calculating relatedness based on directory proximity."""
+    """
+    Strategy for calculating relatedness based on directory proximity.
+    Within a directory, each file is paired with its `window` nearest siblings in path order.
+    """
+
+    def __init__(self, window: int = 20):
+        self.window = max(1, int(window))
     
     @property
     def name(self) -> str:
         return "DirectoryProximity"
     
-    def apply(self, session, project_id: int, update_callback: Callable[[str, str, float, str], None]):
+    def apply(self, session, project_id: int, codec: NodeCodec, update_callback: UpdateCallback,
+              touched: Optional[Set[int]] = None):
         """Calculate relatedness based on directory proximity."""
         print(f"  - Applying {self.name} strategy...")
         try:
             files_by_dir = defaultdict(list)
-            all_files = session.query(File).filter(File.project_id == project_id).all()
-            print(f"    Found {len(all_files)} files to process.")
-
-            for file_obj in all_files:
-                if file_obj.path:
-                    dir_name = os.path.dirname(file_obj.path)
-                    files_by_dir[dir_name].append(f"file:{file_obj.file_id}")
+            file_count = 0
+            for file_id, path in session.query(File.file_id, File.path).filter(File.project_id == project_id):
+                file_count += 1
+                if path:
+                    files_by_dir[os.path.dirname(path)].append((path, codec.encode('file', file_id)))
+            print(f"    Found {file_count} files to process.")
 
             pairs_processed = 0
-            for dir_name, nodes_in_dir in files_by_dir.items():
-                if len(nodes_in_dir) > 1:
-                    for node1_key, node2_key in combinations(nodes_in_dir, 2):
-                        update_callback(node1_key, node2_key, 0.6, 'directory_proximity')
-                        pairs_processed += 1
+            for dir_name, files_in_dir in files_by_dir.items():
+                if len(files_in_dir) < 2:
+                    continue
+                nodes_in_dir = [node for _path, node in sorted(files_in_dir)]
+                if touched is not None and touched.isdisjoint(nodes_in_dir):
+                    continue
+                for node1, node2 in _windowed_pairs(nodes_in_dir, self.window):
+                    update_callback(node1, node2, 0.6, 'directory_proximity')
+                    pairs_processed += 1
             
             print(f"    Processed {pairs_processed} file pairs from {len(files_by_dir)} directories.")
             
@@ -114,54 +295,54 @@ class DirectoryProximityStrategy(RelatednessStrategy):
 
 
 class NamingConventionStrategy(RelatednessStrategy):
-    """Strategy for calculating relatedness based on naming conventions."""
+    """
+    Strategy for calculating relatedness based on naming conventions.
+    Within a base-name group, each entity is paired with its `window` nearest members.
+    """
+
+    def __init__(self, window: int = 20):
+        self.window = max(1, int(window))
     
     @property
     def name(self) -> str:
         return "NamingConvention"
     
-    def apply(self, session, project_id: int, update_callback: Callable[[str, str, float, str], None]):
+    def apply(self, session, project_id: int, codec: NodeCodec, update_callback: UpdateCallback,
+              touched: Optional[Set[int]] = None):
         """Calculate relatedness based on naming conventions."""
         print(f"  - Applying {self.name} strategy...")
         try:
-            # Get all entities with names
-            entities = []
-            
-            # Add files
-            files = session.query(File).filter(File.project_id == project_id).all()
-            for f in files:
-                if f.path:
-                    filename = os.path.basename(f.path)
-                    name_without_ext = os.path.splitext(filename)[0]
-                    entities.append({'type': 'file', 'id': f.file_id, 'name': name_without_ext})
-            
-            # Add classes
-            classes = session.query(Class).join(File).filter(File.project_id == project_id).all()
-            for c in classes:
-                entities.append({'type': 'class', 'id': c.class_id, 'name': c.name})
-            
-            print(f"    Found {len(entities)} entities to analyze.")
-            
-            # Group entities by base name
-            nodes_by_base_name = defaultdict(list)
             common_suffixes = ['Service', 'Controller', 'Repository', 'DAO', 'DTO', 'VO', 'Impl', 'Test']
-            
-            for entity in entities:
-                base_name = entity['name']
+
+            def base_name_of(name: str) -> str:
                 for suffix in common_suffixes:
-                    if base_name.endswith(suffix):
-                        base_name = base_name[:-len(suffix)]
-                        break
-                nodes_by_base_name[base_name].append(entity)
+                    if name.endswith(suffix):
+                        return name[:-len(suffix)]
+                return name
+
+            # Group entities by base name (files first, then classes, as encoded ints)
+            nodes_by_base_name = defaultdict(list)
+            entity_count = 0
+            for file_id, path in session.query(File.file_id, File.path).filter(File.project_id == project_id):
+                if path:
+                    name_without_ext = os.path.splitext(os.path.basename(path))[0]
+                    nodes_by_base_name[base_name_of(name_without_ext)].append(codec.encode('file', file_id))
+                    entity_count += 1
+            for class_id, class_name in session.query(Class.class_id, Class.name).filter(Class.project_id == project_id):
+                nodes_by_base_name[base_name_of(class_name)].append(codec.encode('class', class_id))
+                entity_count += 1
+            
+            print(f"    Found {entity_count} entities to analyze.")
             
             pairs_processed = 0
-            for base_name, related_entities in nodes_by_base_name.items():
-                if len(related_entities) > 1:
-                    for entity1, entity2 in combinations(related_entities, 2):
-                        node1_key = f"{entity1['type']}:{entity1['id']}"
-                        node2_key = f"{entity2['type']}:{entity2['id']}"
-                        update_callback(node1_key, node2_key, 0.8, 'naming_convention')
-                        pairs_processed += 1
+            for base_name, related_nodes in nodes_by_base_name.items():
+                if len(related_nodes) < 2:
+                    continue
+                if touched is not None and touched.isdisjoint(related_nodes):
+                    continue
+                for node1, node2 in _windowed_pairs(related_nodes, self.window):
+                    update_callback(node1, node2, 0.8, 'naming_convention')
+                    pairs_processed += 1
             
             print(f"    Processed {pairs_processed} related pairs from naming patterns.")
             
@@ -173,6 +354,11 @@ class RelatednessCalculator:
     """
     Context class for the Strategy pattern that manages relatedness calculation.
     Uses multiple strategies to calculate and store relatedness scores between entities.
+
+    Scores are streamed into a ShardedPairStore on disk instead of an in-memory dict,
+    so memory stays bounded by one shard regardless of project size.
+    Settings (config['relatedness']): top_k, window, shard_count, batch_size, spill_dir,
+    incremental_max_ratio.
     """
     
     def __init__(self, project_name: str, config: dict):
@@ -181,20 +367,29 @@ class RelatednessCalculator:
         db_config = self.config.get('database', {})
         self.dbm = DatabaseManager(db_config)
         self.dbm.initialize()  # Ensure database is initialized
-        self.session = self.dbm.get_auto_commit_session()
+        # Plain session: deletes and batched inserts are committed together at the end
+        self.session = self.dbm.get_session()
         self.project_id = self._get_project_id()
 
         if not self.project_id:
             raise ValueError(f"Project '{self.project_name}' not found in the database.")
 
-        # Memory storage for final scores: {(node1_key, node2_key): (score, reason)}
-        self.relatedness_scores = defaultdict(lambda: (0.0, 'none'))
+        relatedness_config = self.config.get('relatedness', {})
+        self.top_k = int(relatedness_config.get('top_k', 50))
+        self.shard_count = int(relatedness_config.get('shard_count', 16))
+        self.batch_size = max(1, int(relatedness_config.get('batch_size', 5000)))
+        self.spill_dir = relatedness_config.get('spill_dir')
+        # Incremental runs fall back to a full run when more than this share of the files changed
+        self.incremental_max_ratio = float(relatedness_config.get('incremental_max_ratio', 0.2))
+        window = int(relatedness_config.get('window', 20))
+
+        self.codec = NodeCodec()
         
         # Initialize strategies
         self.strategies: List[RelatednessStrategy] = [
             DirectEdgeStrategy(),
-            DirectoryProximityStrategy(), 
-            NamingConventionStrategy(),
+            DirectoryProximityStrategy(window), 
+            NamingConventionStrategy(window),
             # LLMStrategy() can be added later
         ]
 
@@ -203,87 +398,163 @@ class RelatednessCalculator:
         project = self.session.query(Project).filter_by(name=self.project_name).first()
         return project.project_id if project else None
 
-    def run(self):
-        """Execute the entire relatedness calculation pipeline using all strategies."""
-        print(f"Starting relatedness calculation for project: {self.project_name} (ID: {self.project_id})")
-        
-        # Execute all strategies
-        for strategy in self.strategies:
-            try:
-                strategy.apply(self.session, self.project_id, self._update_score)
-            except Exception as e:
-                print(f"Error in strategy {strategy.name}: {e}")
-                continue
-
-        print(f"Total related pairs found: {len(self.relatedness_scores)}")
-        
-        # Store final results to database
-        self.store_scores_to_db()
-        print("Relatedness calculation completed successfully.")
-
-    def _update_score(self, node1_key: str, node2_key: str, score: float, reason: str):
+    def run(self, changed_file_ids: Optional[Iterable[int]] = None):
         """
-        Callback function for strategies to update scores.
-        Only updates if the new score is higher (strongest relationship wins).
+        Execute the entire relatedness calculation pipeline using all strategies.
+
+        Args:
+            changed_file_ids: If given, only pairs involving nodes of these files
+                (the files and their classes, methods and SQL units) are recomputed;
+                relatedness rows between other nodes are kept as they are, and rows
+                whose node no longer exists (deleted files and their entities) are removed.
+
+        The incremental top-k is approximate: an untouched node keeps its stored
+        neighbour list, so it may still hold a partner that a full run would now rank
+        below its top_k, or miss a new changed partner that ranks above one it keeps.
+        When more than incremental_max_ratio of the project's files changed, a full run
+        is performed instead.
         """
-        if not node1_key or not node2_key or node1_key == node2_key:
-            return
-            
-        # Ensure consistent ordering for the key
-        key = tuple(sorted((node1_key, node2_key)))
-        
-        current_score, _ = self.relatedness_scores[key]
-        if score > current_score:
-            self.relatedness_scores[key] = (score, reason)
+        touched = None
+        if changed_file_ids is not None:
+            changed_file_ids = set(changed_file_ids)
+            file_count = self.session.query(File).filter(File.project_id == self.project_id).count()
+            if file_count and len(changed_file_ids) > self.incremental_max_ratio * file_count:
+                print(f"{len(changed_file_ids)} of {file_count} files changed; running a full calculation instead.")
+                changed_file_ids = None
+        if changed_file_ids is not None:
+            touched = self._touched_nodes(changed_file_ids)
+            print(f"Starting incremental relatedness calculation for project: {self.project_name} "
+                  f"(ID: {self.project_id}, {len(touched)} touched nodes)")
+        else:
+            print(f"Starting relatedness calculation for project: {self.project_name} (ID: {self.project_id})")
+
+        if self.spill_dir:
+            os.makedirs(self.spill_dir, exist_ok=True)
+        with tempfile.TemporaryDirectory(prefix='relatedness_', dir=self.spill_dir) as spill_dir:
+            store = ShardedPairStore(spill_dir, self.shard_count, self.top_k, touched)
+            try:
+                # Execute all strategies
+                for strategy in self.strategies:
+                    try:
+                        strategy.apply(self.session, self.project_id, self.codec, store.add, touched)
+                    except Exception as e:
+                        print(f"Error in strategy {strategy.name}: {e}")
+                        continue
+
+                print(f"Total candidate pairs emitted: {store.emitted}")
+
+                # Store final results to database
+                self.store_scores_to_db(store.finalize(), touched)
+            finally:
+                store.close()
+        print("Relatedness calculation completed successfully.")
 
-    def store_scores_to_db(self):
-        """Store all calculated relatedness scores to the database efficiently."""
+    def _touched_nodes(self, file_ids: Set[int]) -> Set[int]:
+        """Encoded nodes owned by the given files: files, classes, methods and SQL units."""
+        touched = {self.codec.encode('file', file_id) for file_id in file_ids}
+        file_id_list = sorted(file_ids)
+        class_ids = []
+        for i in range(0, len(file_id_list), IN_CLAUSE_BATCH):
+            batch = file_id_list[i:i + IN_CLAUSE_BATCH]
+            class_ids.extend(row[0] for row in self.session.query(Class.class_id).filter(Class.file_id.in_(batch)))
+            for (sql_id,) in self.session.query(SqlUnit.sql_id).filter(SqlUnit.file_id.in_(batch)):
+                touched.add(self.codec.encode('sql_unit', sql_id))
+        for i in range(0, len(class_ids), IN_CLAUSE_BATCH):
+            batch = class_ids[i:i + IN_CLAUSE_BATCH]
+            for (method_id,) in self.session.query(Method.method_id).filter(Method.class_id.in_(batch)):
+                touched.add(self.codec.encode('method', method_id))
+        touched.update(self.codec.encode('class', class_id) for class_id in class_ids)
+        return touched
+
+    def _delete_touched_rows(self, touched: Set[int]) -> int:
+        """Deletes stored relatedness rows that have a touched node on either side."""
+        ids_by_type = defaultdict(list)
+        for node in touched:
+            node_type, node_id = self.codec.decode(node)
+            ids_by_type[node_type].append(node_id)
+
+        deleted = 0
+        for node_type, node_ids in ids_by_type.items():
+            node_ids.sort()
+            for i in range(0, len(node_ids), IN_CLAUSE_BATCH):
+                batch = node_ids[i:i + IN_CLAUSE_BATCH]
+                for type_column, id_column in ((Relatedness.node1_type, Relatedness.node1_id),
+                                               (Relatedness.node2_type, Relatedness.node2_id)):
+                    deleted += self.session.query(Relatedness).filter(
+                        Relatedness.project_id == self.project_id,
+                        type_column == node_type,
+                        id_column.in_(batch)
+                    ).delete(synchronize_session=False)
+        return deleted
+
+    def _delete_orphan_rows(self) -> int:
+        """Deletes stored relatedness rows whose node (on either side) no longer exists."""
+        existing = {
+            'file': self.session.query(File.file_id).filter(File.project_id == self.project_id),
+            'class': self.session.query(Class.class_id),
+            'method': self.session.query(Method.method_id),
+            'sql_unit': self.session.query(SqlUnit.sql_id),
+            'table': self.session.query(DbTable.table_id),
+        }
+        deleted = 0
+        for node_type, ids_query in existing.items():
+            for type_column, id_column in ((Relatedness.node1_type, Relatedness.node1_id),
+                                           (Relatedness.node2_type, Relatedness.node2_id)):
+                deleted += self.session.query(Relatedness).filter(
+                    Relatedness.project_id == self.project_id,
+                    type_column == node_type,
+                    ~id_column.in_(ids_query.scalar_subquery())
+                ).delete(synchronize_session=False)
+        return deleted
+
+    def store_scores_to_db(self, pairs: Iterator[Tuple[int, int, float, str]],
+                           touched: Optional[Set[int]] = None):
+        """Store the final pairs to the database in batches of bulk_insert_mappings."""
         print("  - Storing scores to database...")
-        
-        if not self.relatedness_scores:
-            print("    No relatedness scores to store.")
-            return
 
         try:
-            # First, delete existing relatedness data for this project for a clean slate
-            self.session.query(Relatedness).filter(
-                Relatedness.project_id == self.project_id
-            ).delete(synchronize_session=False)
-            print(f"    Deleted old relatedness data for project {self.project_id}.")
-
-            # Prepare data for bulk insert
-            insert_data = []
-            for (node1_key, node2_key), (score, reason) in self.relatedness_scores.items():
-                if score <= 0.0:
-                    continue
-                
-                try:
-                    node1_type, node1_id_str = node1_key.split(':', 1)
-                    node2_type, node2_id_str = node2_key.split(':', 1)
-                    node1_id = int(node1_id_str)
-                    node2_id = int(node2_id_str)
-                    
-                    insert_data.append({
-                        'project_id': self.project_id,
-                        'node1_type': node1_type,
-                        'node1_id': node1_id,
-                        'node2_type': node2_type,
-                        'node2_id': node2_id,
-                        'score': score,
-                        'reason': reason
-                    })
-                except (ValueError, IndexError) as e:
-                    print(f"    Skipping invalid key format: {node1_key}, {node2_key} - Error: {e}")
-                    continue
-            
-            # Bulk insert the data
-            if insert_data:
-                self.session.bulk_insert_mappings(Relatedness, insert_data)
-                print(f"    Successfully stored {len(insert_data)} new relatedness records.")
+            if touched is None:
+                # First, delete existing relatedness data for this project for a clean slate
+                self.session.query(Relatedness).filter(
+                    Relatedness.project_id == self.project_id
+                ).delete(synchronize_session=False)
+                print(f"    Deleted old relatedness data for project {self.project_id}.")
+            else:
+                deleted = self._delete_touched_rows(touched)
+                print(f"    Deleted {deleted} relatedness records of touched nodes.")
+                orphans = self._delete_orphan_rows()
+                print(f"    Deleted {orphans} relatedness records of removed nodes.")
+
+            stored = 0
+            batch = []
+            for node1, node2, score, reason in pairs:
+                node1_type, node1_id = self.codec.decode(node1)
+                node2_type, node2_id = self.codec.decode(node2)
+                batch.append({
+                    'project_id': self.project_id,
+                    'node1_type': node1_type,
+                    'node1_id': node1_id,
+                    'node2_type': node2_type,
+                    'node2_id': node2_id,
+                    'score': score,
+                    'reason': reason
+                })
+                if len(batch) >= self.batch_size:
+                    self.session.bulk_insert_mappings(Relatedness, batch)
+                    stored += len(batch)
+                    batch = []
+            if batch:
+                self.session.bulk_insert_mappings(Relatedness, batch)
+                stored += len(batch)
+
+            self.session.commit()
+            if stored:
+                print(f"    Successfully stored {stored} new relatedness records.")
             else:
                 print("    No valid new relatedness data to store.")
                 
         except Exception as e:
+            self.session.rollback()
             print(f"    Error storing scores to database: {e}")
             raise
 
@@ -296,6 +567,7 @@ if __name__ == '__main__':
 
     parser = argparse.ArgumentParser(description='코드 연관성 계산 도구')
     parser.add_argument('--project-name', required=True, help='분석 대상 프로젝트 이름')
+    parser.add_argument('--changed-files', nargs='*', help='변경된 파일 경로 (지정 시 해당 파일의 노드만 증분 재계산)')
     args = parser.parse_args()
 
     config_path = project_root / "config" / "config.yaml"
@@ -316,7 +588,16 @@ if __name__ == '__main__':
     
     try:
         calculator = RelatednessCalculator(project_name_to_analyze, config)
-        calculator.run()
+        changed_file_ids = None
+        if args.changed_files is not None:
+            changed_paths = [os.path.abspath(path) for path in args.changed_files]
+            changed_file_ids = [
+                file_id for (file_id,) in calculator.session.query(File.file_id).filter(
+                    File.project_id == calculator.project_id,
+                    File.path.in_(changed_paths + list(args.changed_files))
+                )
+            ]
+        calculator.run(changed_file_ids)
     except ValueError as ve:
         print(f"Error: {ve}")
     except Exception as e:
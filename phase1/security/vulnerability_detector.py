@@ -16,6 +16,8 @@ from typing import Dict, List, Optional, Tuple
 from enum import Enum
 from dataclasses import dataclass
 
+from phase1.utils.line_index import line_index_for
+
 
 class VulnerabilityType(Enum):
     """취약점 유형"""
@@ -126,6 +128,7 @@ class SqlInjectionDetector:
     def detect_jsp_sql_injection(self, content: str, file_path: str) -> List[Vulnerability]:
         """JSP 파일에서 SQL Injection 패턴 탐지"""
         vulnerabilities = []
+        line_index = line_index_for(content)
         
         for pattern_info in self.jsp_patterns:
             pattern = pattern_info['pattern']
@@ -136,9 +139,9 @@ class SqlInjectionDetector:
             matches = re.finditer(pattern, content, re.IGNORECASE | re.DOTALL)
             
             for match in matches:
-                line_number = content[:match.start()].count('\n') + 1
-                column_start = match.start() - content.rfind('\n', 0, match.start())
-                column_end = match.end() - content.rfind('\n', 0, match.end())
+                line_number = line_index.line_of(match.start())
+                column_start = line_index.column_of(match.start())
+                column_end = line_index.column_of(match.end())
                 
                 # 패턴 길이에 따른 신뢰도 조정
                 confidence = min(0.95, 0.7 + (len(match.group()) / 200))
@@ -167,6 +170,7 @@ class SqlInjectionDetector:
     def detect_mybatis_sql_injection(self, content: str, file_path: str) -> List[Vulnerability]:
         """MyBatis XML에서 SQL Injection 패턴 탐지"""
         vulnerabilities = []
+        line_index = line_index_for(content)
         
         for pattern_info in self.mybatis_patterns:
             pattern = pattern_info['pattern']
@@ -177,9 +181,9 @@ class SqlInjectionDetector:
             matches = re.finditer(pattern, content, re.IGNORECASE | re.DOTALL)
             
             for match in matches:
-                line_number = content[:match.start()].count('\n') + 1
-                column_start = match.start() - content.rfind('\n', 0, match.start())
-                column_end = match.end() - content.rfind('\n', 0, match.end())
+                line_number = line_index.line_of(match.start())
+                column_start = line_index.column_of(match.start())
+                column_end = line_index.column_of(match.end())
                 
                 # ${} 패턴은 높은 신뢰도
                 confidence = 0.95 if '${' in match.group() else 0.8
@@ -237,6 +241,7 @@ class XssDetector:
     def detect_jsp_xss(self, content: str, file_path: str) -> List[Vulnerability]:
         """JSP 파일에서 XSS 패턴 탐지"""
         vulnerabilities = []
+        line_index = line_index_for(content)
         
         for pattern_info in self.jsp_xss_patterns:
             pattern = pattern_info['pattern']
@@ -247,9 +252,9 @@ class XssDetector:
             matches = re.finditer(pattern, content, re.IGNORECASE | re.DOTALL)
             
             for match in matches:
-                line_number = content[:match.start()].count('\n') + 1
-                column_start = match.start() - content.rfind('\n', 0, match.start())
-                column_end = match.end() - content.rfind('\n', 0, match.end())
+                line_number = line_index.line_of(match.start())
+                column_start = line_index.column_of(match.start())
+                column_end = line_index.column_of(match.end())
                 
                 vuln = Vulnerability(
                     file_path=file_path,
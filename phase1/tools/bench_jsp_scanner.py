@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JSP 스캐너 벤치마크 (정규식 추출 vs 단일 패스 스캐너)
+
+스크립틀릿, 표현식, JSTL/EL, HTML 테이블, include가 섞인 레거시 JSP를 합성하거나(--lines)
+지정한 JSP 파일들(--files)을 읽어, 같은 본문을 두 경로로 파싱했을 때의 시간과 추출 건수를 비교합니다.
+
+Usage:
+  python phase1/tools/bench_jsp_scanner.py --lines 5000 --repeat 5
+  python phase1/tools/bench_jsp_scanner.py --files testcase/**/*.jsp
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from phase1.parsers.jsp.jsp_parser import JSPParser
+
+CATEGORIES = ['jsp_directives', 'jsp_actions', 'jsp_scriptlets', 'jsp_expressions', 'jsp_declarations',
+              'jstl_tags', 'custom_tags', 'html_tags', 'jsp_errors', 'sql_units']
+
+HEADER = """<%@ page contentType="text/html; charset=UTF-8" pageEncoding="UTF-8" %>
+<%@ page import="java.util.*, java.sql.*" %>
+<%@ taglib prefix="c" uri="http://java.sun.com/jsp/jstl/core" %>
+<%@ taglib prefix="fmt" uri="http://java.sun.com/jsp/jstl/fmt" %>
+<%! private static final int PAGE_SIZE = 20; %>
+<jsp:include page="/common/header.jsp" flush="true"/>
+"""
+
+BLOCK = """<%-- 주문 목록 영역 {i} --%>
+<%
+    String sql{i} = "SELECT o.ORDER_ID, o.STATUS FROM ORDERS o WHERE o.USER_ID = ? AND o.SEQ > " + {i};
+    List<Map<String, Object>> rows{i} = dao.query(sql{i}, userId);
+    if (rows{i}.size() > PAGE_SIZE) {{ rows{i} = rows{i}.subList(0, PAGE_SIZE); }}
+%>
+<div class="section" id="section{i}">
+  <h3><%= title + " {i}" %></h3>
+  <c:if test="${{not empty orders and orders.size() > {i}}}">
+    <table class="grid">
+      <tr><th>번호</th><th>상태</th><th>금액</th></tr>
+      <c:forEach var="order" items="${{orders}}" varStatus="st">
+        <tr class="${{st.index % 2 == 0 ? 'even' : 'odd'}}">
+          <td><a href="<c:url value='/order/detail'/>?id=${{order.id}}">${{order.id}}</a></td>
+          <td>${{order.status}}</td>
+          <td><fmt:formatNumber value="${{order.amount}}" pattern="#,###"/></td>
+        </tr>
+      </c:forEach>
+    </table>
+  </c:if>
+  <c:choose>
+    <c:when test="${{empty orders}}"><p>주문이 없습니다.</p></c:when>
+    <c:otherwise><p>총 <%= rows{i}.size() %>건</p></c:otherwise>
+  </c:choose>
+  <!-- <% out.println("debug {i}"); %> -->
+  <jsp:include page="/common/pager.jsp"><jsp:param name="page" value="{i}"/></jsp:include>
+</div>
+"""
+
+
+def synthetic_jsp(lines: int) -> str:
+    """약 lines줄 분량의 레거시 JSP 본문 생성"""
+    block_lines = BLOCK.count('\n')
+    blocks = [BLOCK.format(i=i) for i in range(max(1, lines // block_lines))]
+    return HEADER + ''.join(blocks)
+
+
+def best_time(run, repeat: int):
+    """repeat회 실행 중 최소 시간(초)과 마지막 결과"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = run()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def bench(method, contents, repeat: int):
+    elapsed, result = best_time(lambda: [method(content, {}) for content in contents], repeat)
+    counts = {key: sum(len(r.get(key, [])) for r in result) for key in CATEGORIES}
+    return elapsed, counts
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='JSP 스캐너 벤치마크')
+    arg_parser.add_argument('--lines', type=int, default=5000, help='합성 JSP 줄 수 (--files가 없을 때)')
+    arg_parser.add_argument('--files', nargs='*', help='측정할 JSP 파일 경로')
+    arg_parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (최솟값 사용)')
+    args = arg_parser.parse_args()
+
+    if args.files:
+        contents = [Path(path).read_text(encoding='utf-8', errors='ignore') for path in args.files]
+    else:
+        contents = [synthetic_jsp(args.lines)]
+    total_lines = sum(content.count('\n') + 1 for content in contents)
+    print(f"JSP {len(contents)}개, {total_lines}줄, 반복 {args.repeat}회")
+
+    parser = JSPParser({'parsers': {'jsp': {}}})
+    regex_time, regex_counts = bench(parser._parse_content_regex, contents, args.repeat)
+    lexer_time, lexer_counts = bench(parser._parse_content_lexer, contents, args.repeat)
+
+    print(f"{'':<18}{'regex':>12}{'lexer':>12}")
+    print(f"{'time (ms)':<18}{regex_time * 1000:>12.1f}{lexer_time * 1000:>12.1f}")
+    for key in CATEGORIES:
+        print(f"{key:<18}{regex_counts[key]:>12}{lexer_counts[key]:>12}")
+    print(f"speedup: {regex_time / lexer_time:.1f}x")
+
+if __name__ == '__main__':
+    main()
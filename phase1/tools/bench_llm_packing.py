@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+메서드 요약 패킹 모드 벤치마크 (로컬 스텁 모델 서버 사용)
+
+요청마다 고정 지연(overhead)과 응답 항목당 지연(per_item)이 있는 Ollama 호환 스텁 서버를 띄우고,
+같은 메서드 집합을 단건 요청 / 패킹 모드로 요약했을 때의 요청 수와 처리량을 비교합니다.
+
+Usage:
+  python phase1/tools/bench_llm_packing.py --methods 200 --overhead 0.08 --per-item 0.01
+"""
+
+import argparse
+import json
+import re
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from phase1.llm.summarizer import CodeSummarizer
+from phase1.models.database import DatabaseManager, Project, File, Class, Method
+
+
+class StubModelServer:
+    """/api/show, /api/chat 스텁. 묶음 프롬프트([id=N] 머리글)에는 JSON 배열로 응답"""
+
+    def __init__(self, overhead: float, per_item: float):
+        self.requests = 0
+        self.lock = threading.Lock()
+        # Ollama 기본 설정처럼 한 번에 요청 하나만 처리
+        self.model_lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                if self.path == '/api/show':
+                    content = {}
+                else:
+                    messages = json.loads(body or b'{}').get('messages', [])
+                    ids = re.findall(r'### \[id=(\d+)\]', messages[-1]['content'] if messages else '')
+                    with server.model_lock:
+                        time.sleep(overhead + per_item * max(1, len(ids)))
+                    with server.lock:
+                        server.requests += 1
+                    if ids:
+                        text = json.dumps([{'id': int(i), 'summary': f'요약 {i}'} for i in ids], ensure_ascii=False)
+                    else:
+                        text = '요약'
+                    content = {'message': {'content': text}}
+                data = json.dumps(content).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def build_project(work_dir: Path, method_count: int) -> dict:
+    """작은 메서드 method_count개를 가진 Java 파일 하나와 메타DB 생성"""
+    lines = ['public class Bench {']
+    spans = []
+    for i in range(method_count):
+        spans.append((f'op{i}', len(lines) + 1))
+        lines += [f'    public int op{i}(int a) {{', f'        return a * {i} + {i % 7};', '    }']
+    lines.append('}')
+    source = work_dir / 'Bench.java'
+    source.write_text('\n'.join(lines), encoding='utf-8')
+
+    db_config = {'type': 'sqlite', 'sqlite': {'path': str(work_dir / 'metadata.db')}}
+    db_manager = DatabaseManager(db_config)
+    db_manager.initialize()
+    session = db_manager.get_session()
+    project = Project(root_path=str(work_dir), name='bench')
+    session.add(project)
+    session.flush()
+    file_obj = File(project_id=project.project_id, path=str(source), language='java', hash='bench')
+    session.add(file_obj)
+    session.flush()
+    cls = Class(file_id=file_obj.file_id, project_id=project.project_id, fqn='Bench', name='Bench')
+    session.add(cls)
+    session.flush()
+    session.add_all([Method(class_id=cls.class_id, project_id=project.project_id, name=name,
+                            start_line=start, end_line=start + 2) for name, start in spans])
+    session.commit()
+    project_id = project.project_id
+    session.close()
+    return {'db_config': db_config, 'project_id': project_id}
+
+
+def run(label: str, method_count: int, packing: dict, args) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        project = build_project(Path(tmp), method_count)
+        server = StubModelServer(args.overhead, args.per_item)
+        try:
+            config = {
+                'database': {'project': project['db_config']},
+                'llm': {'provider': 'ollama', 'ollama_host': server.url,
+                        'scheduler': {'max_concurrency': args.concurrency}, 'packing': packing},
+                'llm_cache': {'enabled': False},
+            }
+            summarizer = CodeSummarizer(config)
+            summarizer.summarize_file = lambda file: None  # 메서드 요약만 측정
+            started = time.perf_counter()
+            stored = summarizer.process_project_summaries(project['project_id'], batch_size=50)
+            elapsed = time.perf_counter() - started
+        finally:
+            server.close()
+    print(f"{label:<10} 요약 {stored['method']:>5}개  요청 {server.requests:>5}회  "
+          f"{elapsed:7.2f}초  {stored['method'] / elapsed:8.1f}개/초")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='메서드 요약 패킹 모드 벤치마크')
+    parser.add_argument('--methods', type=int, default=200, help='요약할 메서드 수')
+    parser.add_argument('--overhead', type=float, default=0.08, help='스텁 모델의 요청당 고정 지연(초)')
+    parser.add_argument('--per-item', type=float, default=0.01, help='스텁 모델의 응답 항목당 지연(초)')
+    parser.add_argument('--concurrency', type=int, default=4, help='llm.scheduler.max_concurrency')
+    parser.add_argument('--max-items', type=int, default=8, help='llm.packing.max_items')
+    args = parser.parse_args()
+
+    run('single', args.methods, {'enabled': False}, args)
+    run('packed', args.methods, {'enabled': True, 'max_items': args.max_items}, args)
+
+
+if __name__ == '__main__':
+    main()
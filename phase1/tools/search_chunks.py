@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+청크 벡터 검색 (오프라인)
+
+Usage examples:
+  python tools/search_chunks.py --project-name sampleSrc "사용자 목록 조회"
+  python tools/search_chunks.py --db ../project/sampleSrc/metadata.db --types method,sql_unit --top-k 5 "order status"
+  python tools/search_chunks.py --project-name sampleSrc --update "insert order"
+"""
+
+import os
+import sys
+import argparse
+from pathlib import Path
+from typing import Dict, Any
+import yaml
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+PHASE1_ROOT = REPO_ROOT / 'phase1'
+for p in (REPO_ROOT, PHASE1_ROOT):
+    if str(p) not in sys.path:
+        sys.path.insert(0, str(p))
+
+from phase1.models.database import DatabaseManager, Chunk
+from phase1.llm.embedding_index import ChunkEmbeddingIndex
+
+
+def load_config() -> Dict[str, Any]:
+    cfg_path = PHASE1_ROOT / 'config' / 'config.yaml'
+    if not cfg_path.exists():
+        return {}
+    return yaml.safe_load(os.path.expandvars(cfg_path.read_text(encoding='utf-8'))) or {}
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description='청크 임베딩 top-k 유사도 검색')
+    ap.add_argument('query', help='검색할 텍스트')
+    ap.add_argument('--project-name', help='프로젝트명 (../project/<이름>/metadata.db 사용)')
+    ap.add_argument('--db', help='metadata.db 경로 (--project-name보다 우선)')
+    ap.add_argument('--top-k', type=int, default=10, help='반환할 청크 수')
+    ap.add_argument('--types', help='대상 유형 필터 (쉼표 구분, 예: method,class,sql_unit)')
+    ap.add_argument('--update', action='store_true', help='검색 전에 임베딩이 없는 청크를 임베딩')
+    args = ap.parse_args(argv)
+
+    if args.db:
+        db_path = args.db
+    elif args.project_name:
+        db_path = str(REPO_ROOT / 'project' / args.project_name / 'metadata.db')
+    else:
+        ap.error('--db 또는 --project-name이 필요합니다')
+    if not os.path.exists(db_path):
+        print(f"메타데이터베이스가 없습니다: {db_path}")
+        return 1
+
+    cfg = load_config()
+    dbm = DatabaseManager({'type': 'sqlite', 'sqlite': {'path': db_path}})
+    dbm.initialize()
+    index = ChunkEmbeddingIndex(dbm, cfg)
+    if args.update:
+        index.update()
+
+    target_types = [t.strip() for t in args.types.split(',') if t.strip()] if args.types else None
+    results = index.search(args.query, top_k=args.top_k, target_types=target_types)
+    if not results:
+        print("검색 결과가 없습니다. (임베딩이 없으면 --update로 먼저 생성하세요)")
+        return 0
+
+    session = dbm.get_session()
+    try:
+        contents = dict(session.query(Chunk.chunk_id, Chunk.content).filter(
+            Chunk.chunk_id.in_([r['chunk_id'] for r in results])))
+    finally:
+        session.close()
+    for rank, result in enumerate(results, 1):
+        first_line = next((line.strip() for line in (contents.get(result['chunk_id']) or '').splitlines()
+                           if line.strip()), '')
+        print(f"{rank:>3}. {result['score']:.4f}  {result['target_type']}:{result['target_id']}  "
+              f"chunk={result['chunk_id']}  {first_line[:100]}")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
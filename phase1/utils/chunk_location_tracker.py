@@ -14,6 +14,7 @@ from pathlib import Path
 from dataclasses import dataclass
 from sqlalchemy.orm import Session
 from phase1.models.database import Class, Method, File, SqlUnit, Chunk
+from phase1.utils.line_index import LineIndex
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +52,7 @@ class ChunkLocationTracker:
     def __init__(self, db_session: Session):
         self.db_session = db_session
         self.file_content_cache: Dict[str, List[str]] = {}  # 파일별 라인 캐시
+        self.file_index_cache: Dict[str, Tuple[str, LineIndex]] = {}  # 파일별 (전체 내용, 라인 오프셋 인덱스)
         
     def track_java_method_location(self, method_id: int, class_fqn: str, method_name: str) -> Optional[ChunkLocation]:
         """Java 메서드의 위치 정보 추적"""
@@ -217,25 +219,24 @@ class ChunkLocationTracker:
                 rf'^\s*@\w+.*\n\s*(public|private|protected)?\s*(static)?\s*\w+\s+{re.escape(method_name)}\s*\(',  # 어노테이션 포함
             ]
             
-            for i, line in enumerate(lines):
-                for pattern in patterns:
-                    if re.search(pattern, line, re.MULTILINE):
-                        # 메서드 시작점 찾음
-                        start_line = i + 1
-                        
-                        # 메서드 끝점 찾기 (중괄호 매칭)
-                        end_line = self._find_method_end_line(lines, i)
-                        
-                        content_preview = self._extract_content_preview(lines, i, min(i + 3, len(lines)))
-                        
-                        return ChunkLocation(
-                            file_path=file_path,
-                            start_line=start_line,
-                            end_line=end_line,
-                            content_preview=content_preview
-                        )
+            i = self._find_first_line(file_path, patterns, re.MULTILINE)
+            if i is None:
+                return None
             
-            return None
+            # 메서드 시작점 찾음
+            start_line = i + 1
+            
+            # 메서드 끝점 찾기 (중괄호 매칭)
+            end_line = self._find_method_end_line(lines, i)
+            
+            content_preview = self._extract_content_preview(lines, i, min(i + 3, len(lines)))
+            
+            return ChunkLocation(
+                file_path=file_path,
+                start_line=start_line,
+                end_line=end_line,
+                content_preview=content_preview
+            )
             
         except Exception as e:
             logger.error(f"메서드 위치 찾기 실패 {file_path}: {e}")
@@ -251,24 +252,24 @@ class ChunkLocationTracker:
             # SQL 문 태그 패턴 (select, insert, update, delete)
             tag_pattern = rf'<{re.escape(stmt_kind)}\s+.*id=["\']({re.escape(stmt_id)})["\']'
             
-            for i, line in enumerate(lines):
-                if re.search(tag_pattern, line, re.IGNORECASE):
-                    # SQL 문 시작점 찾음
-                    start_line = i + 1
-                    
-                    # 해당 태그의 끝점 찾기
-                    end_line = self._find_xml_tag_end_line(lines, i, stmt_kind)
-                    
-                    content_preview = self._extract_content_preview(lines, i, min(i + 5, len(lines)))
-                    
-                    return ChunkLocation(
-                        file_path=file_path,
-                        start_line=start_line,
-                        end_line=end_line,
-                        content_preview=content_preview
-                    )
+            i = self._find_first_line(file_path, [tag_pattern], re.IGNORECASE)
+            if i is None:
+                return None
             
-            return None
+            # SQL 문 시작점 찾음
+            start_line = i + 1
+            
+            # 해당 태그의 끝점 찾기
+            end_line = self._find_xml_tag_end_line(lines, i, stmt_kind)
+            
+            content_preview = self._extract_content_preview(lines, i, min(i + 5, len(lines)))
+            
+            return ChunkLocation(
+                file_path=file_path,
+                start_line=start_line,
+                end_line=end_line,
+                content_preview=content_preview
+            )
             
         except Exception as e:
             logger.error(f"SQL Unit 위치 찾기 실패 {file_path}: {e}")
@@ -288,25 +289,24 @@ class ChunkLocationTracker:
                 rf'^\s*(public|private|protected)?\s*enum\s+{re.escape(class_name)}\s*'
             ]
             
-            for i, line in enumerate(lines):
-                for pattern in patterns:
-                    if re.search(pattern, line):
-                        # 클래스 시작점 찾음
-                        start_line = i + 1
-                        
-                        # 클래스 끝점 찾기 (파일 끝까지 또는 다음 클래스까지)
-                        end_line = self._find_class_end_line(lines, i)
-                        
-                        content_preview = self._extract_content_preview(lines, i, min(i + 3, len(lines)))
-                        
-                        return ChunkLocation(
-                            file_path=file_path,
-                            start_line=start_line,
-                            end_line=end_line,
-                            content_preview=content_preview
-                        )
+            i = self._find_first_line(file_path, patterns, re.MULTILINE)
+            if i is None:
+                return None
+            
+            # 클래스 시작점 찾음
+            start_line = i + 1
             
-            return None
+            # 클래스 끝점 찾기 (파일 끝까지 또는 다음 클래스까지)
+            end_line = self._find_class_end_line(lines, i)
+            
+            content_preview = self._extract_content_preview(lines, i, min(i + 3, len(lines)))
+            
+            return ChunkLocation(
+                file_path=file_path,
+                start_line=start_line,
+                end_line=end_line,
+                content_preview=content_preview
+            )
             
         except Exception as e:
             logger.error(f"클래스 위치 찾기 실패 {file_path}: {e}")
@@ -327,6 +327,37 @@ class ChunkLocationTracker:
             logger.warning(f"파일 읽기 실패 {file_path}: {e}")
             return None
     
+    def _get_file_index(self, file_path: str) -> Optional[Tuple[str, LineIndex]]:
+        """파일 전체 내용과 라인 오프셋 인덱스 (캐시 사용)"""
+        if file_path in self.file_index_cache:
+            return self.file_index_cache[file_path]
+        
+        lines = self._get_file_lines(file_path)
+        if lines is None:
+            return None
+        content = ''.join(lines)
+        indexed = (content, LineIndex(content))
+        self.file_index_cache[file_path] = indexed
+        return indexed
+    
+    def _find_first_line(self, file_path: str, patterns: List[str], flags: int = 0) -> Optional[int]:
+        """파일 전체에서 패턴들을 한 번씩 검색해 가장 앞선 매치의 라인 인덱스(0-based)를 반환"""
+        indexed = self._get_file_index(file_path)
+        if indexed is None:
+            return None
+        content, line_index = indexed
+        
+        positions = []
+        for pattern in patterns:
+            match = re.search(pattern, content, flags)
+            if match:
+                # 패턴 앞쪽의 \s*가 빈 줄을 건너뛴 경우 실제 선언이 시작되는 위치 기준
+                matched = match.group()
+                positions.append(match.start() + len(matched) - len(matched.lstrip()))
+        if not positions:
+            return None
+        return line_index.line_of(min(positions)) - 1
+    
     def _find_method_end_line(self, lines: List[str], start_idx: int) -> int:
         """메서드 끝 라인 찾기 (중괄호 매칭)"""
         brace_count = 0
@@ -10,6 +10,7 @@ import logging
 from datetime import datetime
 
 from phase1.models.database import DbTable, DbColumn, DbPk, DbView
+from phase1.database.bulk_writer import BulkWriter
 from phase1.utils.logger import handle_critical_error, handle_non_critical_error
 
 class CsvLoader:
@@ -86,7 +87,13 @@ class CsvLoader:
             raise ValueError("데이터베이스 세션이 필요합니다")
         
         try:
-            loaded_count = 0
+            writer = BulkWriter.from_config(session, self.config)
+            
+            # 기존 테이블을 한 번에 조회 (행마다 조회하지 않음)
+            existing_tables = {
+                (t.owner, t.table_name): t for t in session.query(DbTable).all()
+            }
+            new_tables = []
             
             for row in rows:
                 owner = row.get('OWNER', '').strip()
@@ -95,10 +102,7 @@ class CsvLoader:
                 status = (row.get('STATUS') or 'VALID').strip()
 
                 # 기존 레코드 확인 (중복 방지 강화)
-                existing = session.query(DbTable).filter(
-                    DbTable.owner == owner,
-                    DbTable.table_name == table_name
-                ).first()
+                existing = existing_tables.get((owner, table_name))
 
                 if existing:
                     # CSV 업로드는 최신 정보이므로 기존 정보를 모든 필드 덮어쓰기
@@ -123,11 +127,12 @@ class CsvLoader:
                         status=status,
                         table_comment=comments
                     )
-                    session.add(table)
-                    session.flush()
-                    loaded_count += 1
-                    
-            return {'records': loaded_count}
+                    # 같은 CSV 안의 중복 행도 기존 레코드로 취급
+                    existing_tables[(owner, table_name)] = table
+                    new_tables.append(table)
+            
+            writer.insert_objects(new_tables, return_ids=False)
+            return {'records': len(new_tables)}
             
         except Exception as e:
             handle_critical_error(self.logger, "테이블 정보 저장 실패", e)
@@ -139,41 +144,46 @@ class CsvLoader:
             raise ValueError("데이터베이스 세션이 필요합니다")
         
         try:
-            loaded_count = 0
+            writer = BulkWriter.from_config(session, self.config)
             
             # 테이블 ID 매핑 생성
             tables = session.query(DbTable).all()
             table_map = {(t.owner, t.table_name): t.table_id for t in tables}
             
+            # 누락된 테이블을 먼저 모아서 일괄 생성 (table_id는 배치 단위로 확보)
+            missing_tables = {}
             for row in rows:
                 owner = row.get('OWNER', '').strip()
                 table_name = row.get('TABLE_NAME', '').strip()
-                column_name = row.get('COLUMN_NAME', '').strip()
-                col_comments = (row.get('COLUMN_COMMENTS') or '').strip()
-                
-                # 테이블 ID 찾기
                 table_key = (owner, table_name)
-                if table_key not in table_map:
-                    # 누락된 테이블을 자동으로 생성
+                if table_key not in table_map and table_key not in missing_tables:
                     self.logger.warning(f"테이블을 찾을 수 없어 자동 생성: {owner}.{table_name}")
-                    
-                    # 누락된 테이블을 db_tables에 추가
-                    missing_table = DbTable(
+                    missing_tables[table_key] = DbTable(
                         owner=owner,
                         table_name=table_name,
                         status='INFERRED_FROM_COLUMNS',
                         table_comment=f'{table_name} (컬럼 정보에서 자동 생성)'
                     )
-                    session.add(missing_table)
-                    session.flush()  # table_id 생성을 위해 flush
-                    
-                    # table_map 업데이트
+            if missing_tables:
+                writer.insert_objects(list(missing_tables.values()))
+                for table_key, missing_table in missing_tables.items():
                     table_map[table_key] = missing_table.table_id
-                    
-                    self.logger.info(f"누락된 테이블 자동 생성 완료: {owner}.{table_name} (ID: {missing_table.table_id})")
-                    
+                    self.logger.info(f"누락된 테이블 자동 생성 완료: {table_key[0]}.{table_key[1]} (ID: {missing_table.table_id})")
+            
+            # 기존 컬럼을 한 번에 조회 (행마다 조회하지 않음)
+            existing_columns = {
+                (c.table_id, c.column_name): c for c in session.query(DbColumn).all()
+            }
+            new_columns = []
+            
+            for row in rows:
+                owner = row.get('OWNER', '').strip()
+                table_name = row.get('TABLE_NAME', '').strip()
+                column_name = row.get('COLUMN_NAME', '').strip()
+                col_comments = (row.get('COLUMN_COMMENTS') or '').strip()
+                
                 column = DbColumn(
-                    table_id=table_map[table_key],
+                    table_id=table_map[(owner, table_name)],
                     column_name=column_name,
                     data_type=row.get('DATA_TYPE', '').strip(),
                     nullable=row.get('NULLABLE', 'Y').strip(),
@@ -181,10 +191,7 @@ class CsvLoader:
                 )
                 
                 # 기존 컬럼 확인 및 업데이트 (중복 방지 강화)
-                existing = session.query(DbColumn).filter(
-                    DbColumn.table_id == column.table_id,
-                    DbColumn.column_name == column.column_name
-                ).first()
+                existing = existing_columns.get((column.table_id, column.column_name))
                 
                 if existing:
                     # CSV는 최신 정보이므로 기존 컬럼 정보 덮어쓰기
@@ -204,11 +211,12 @@ class CsvLoader:
                         else:
                             self.logger.debug(f"CSV 컬럼 정보 동일하여 건너뛰기: {owner}.{table_name}.{column_name}")
                 else:
-                    session.add(column)
-                    session.flush()
-                    loaded_count += 1
-                    
-            return {'records': loaded_count}
+                    # 같은 CSV 안의 중복 행도 기존 레코드로 취급
+                    existing_columns[(column.table_id, column.column_name)] = column
+                    new_columns.append(column)
+            
+            writer.insert_objects(new_columns, return_ids=False)
+            return {'records': len(new_columns)}
             
         except Exception as e:
             handle_critical_error(self.logger, "테이블 정보 저장 실패", e)
@@ -7,25 +7,78 @@
 """
 
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
 from phase1.models.database import Edge, Class, Method, File, SqlUnit, DbTable, DbColumn, DbPk
+from phase1.database.bulk_writer import BulkWriter
+from phase1.utils.file_content_cache import FileContentCache
+from phase1.utils.symbol_index import SymbolIndex, ClassSymbol
 
 logger = logging.getLogger(__name__)
 
 
 class EdgeGenerator:
-    """엣지 생성기 클래스"""
+    """
+    엣지 생성기 클래스
     
-    def __init__(self, db_session: Session, project_id: int, config: dict = None):
+    생성하는 모든 엣지에는 도출 근거가 된 소스 파일(src_file_id)을 기록합니다.
+    changed_file_ids가 주어지면 해당 파일에서 도출된 엣지만 삭제 후 다시 생성하고(증분),
+    주어지지 않으면 이 생성기가 만든 프로젝트 엣지 전체를 다시 생성합니다 (파싱 단계 엣지는 유지).
+    DB 스키마에서 도출되는 테이블 간 엣지는 소스 파일이 없으므로 매번 다시 생성합니다.
+    """
+    
+    # 소스 파일 없이 DB 스키마에서 도출되는 엣지 유형
+    SCHEMA_EDGE_KINDS = ('foreign_key',)
+    
+    def __init__(self, db_session: Session, project_id: int, config: dict = None,
+                 file_cache: Optional[FileContentCache] = None,
+                 changed_file_ids: Optional[Iterable[int]] = None):
         self.db_session = db_session
         self.project_id = project_id
+        # None이면 전체 재생성, 집합이면 해당 파일에서 도출된 엣지만 재생성
+        self.changed_file_ids = set(changed_file_ids) if changed_file_ids is not None else None
         self.edge_count = 0
         self.config = config or {}
+        # 같은 파일을 여러 엣지 유형에서 반복해서 읽지 않도록 내용 캐시 사용
+        self.file_cache = file_cache or FileContentCache.from_config(self.config)
+        # 엣지는 버퍼에 모았다가 배치 INSERT로 저장
+        self.bulk_writer = BulkWriter.from_config(db_session, self.config)
+        self._pending_edges: List[dict] = []
+        # 클래스/메서드 조회용 심볼 인덱스 (첫 사용 시 한 번 구축)
+        self._symbols: Optional[SymbolIndex] = None
         
+    @property
+    def symbols(self) -> SymbolIndex:
+        """프로젝트 심볼 인덱스 (지연 구축)"""
+        if self._symbols is None:
+            self._symbols = SymbolIndex.build(self.db_session, self.project_id)
+            logger.info(f"심볼 인덱스 구축 완료: 클래스 {len(self._symbols.classes_by_id)}개, "
+                        f"메서드 {len(self._symbols.methods_by_id)}개")
+        return self._symbols
+    
+    @property
+    def incremental(self) -> bool:
+        return self.changed_file_ids is not None
+    
+    def _in_scope(self, file_id: Optional[int]) -> bool:
+        """이번 실행에서 엣지를 다시 생성할 소스 파일인지 여부"""
+        return self.changed_file_ids is None or file_id in self.changed_file_ids
+    
+    def _source_classes(self) -> List[ClassSymbol]:
+        """엣지를 다시 생성할 소스 클래스 목록 (대상 클래스 조회는 프로젝트 전체 인덱스 사용)"""
+        return [c for c in self.symbols.classes_by_id.values() if self._in_scope(c.file_id)]
+    
+    def _class_file_path(self, cls) -> Optional[str]:
+        """클래스가 속한 파일 경로 (파일 조회 쿼리 대신 인덱스 사용)"""
+        return self.symbols.file_path(cls.file_id)
+    
     def generate_all_edges(self) -> int:
         """모든 엣지를 생성합니다."""
-        logger.info("엣지 생성 시작")
+        if self.incremental:
+            logger.info(f"엣지 생성 시작 (증분: 소스 파일 {len(self.changed_file_ids)}개)")
+        else:
+            logger.info("엣지 생성 시작")
         
         try:
             # 기존 엣지 삭제
@@ -40,6 +93,7 @@ class EdgeGenerator:
             self._generate_jsp_controller_edges()
             self._generate_db_table_edges()
             self._generate_sql_unit_edges()
+            self._flush_edges()
             
             # AutoCommitSession은 자동으로 커밋되므로 별도 커밋 불필요
             logger.info(f"엣지 생성 완료: {self.edge_count}개")
@@ -51,16 +105,30 @@ class EdgeGenerator:
             raise
     
     def _clear_existing_edges(self):
-        """기존 엣지를 삭제합니다."""
-        self.db_session.query(Edge).delete()
-        logger.info("기존 엣지 삭제 완료")
+        """이번 실행에서 다시 생성할 기존 엣지를 삭제합니다 (현재 프로젝트 범위).
+        
+        전체/증분 모두 이 생성기가 만든 엣지(src_file_id가 있는 엣지와 스키마 엣지)만 삭제하며,
+        파싱 단계에서 저장한 엣지(src_file_id 없음)는 purge_file_artifacts()가 파일 단위로 정리합니다.
+        """
+        query = self.db_session.query(Edge).filter(Edge.project_id == self.project_id)
+        schema_edges = and_(Edge.src_file_id.is_(None), Edge.src_type == 'table',
+                            Edge.edge_kind.in_(self.SCHEMA_EDGE_KINDS))
+        if self.incremental:
+            deleted = 0
+            file_ids = list(self.changed_file_ids)
+            for i in range(0, len(file_ids), 500):
+                deleted += query.filter(Edge.src_file_id.in_(file_ids[i:i + 500])).delete(synchronize_session=False)
+            deleted += query.filter(schema_edges).delete(synchronize_session=False)
+        else:
+            deleted = query.filter(or_(Edge.src_file_id.isnot(None), schema_edges)).delete(synchronize_session=False)
+        logger.info(f"기존 엣지 삭제 완료: {deleted}개")
     
     def _generate_java_dependency_edges(self):
         """Java 클래스 간 의존성 엣지를 동적으로 생성합니다."""
         logger.info("Java 의존성 엣지 동적 생성 시작")
         
-        # 모든 클래스를 가져와서 동적 분석
-        all_classes = self.db_session.query(Class).all()
+        # 대상 소스 클래스를 가져와서 동적 분석
+        all_classes = self._source_classes()
         
         for source_class in all_classes:
             # 각 클래스의 소스 코드를 분석하여 의존성 찾기
@@ -75,7 +143,8 @@ class EdgeGenerator:
                         target_type='class', 
                         target_id=target_class.class_id,
                         edge_type=dep['relation_type'],
-                        description=f"{source_class.name} {dep['relation_type']} {target_class.name}"
+                        description=f"{source_class.name} {dep['relation_type']} {target_class.name}",
+                        source_file_id=source_class.file_id
                     )
     
     def _generate_xml_mapper_edges(self):
@@ -84,10 +153,13 @@ class EdgeGenerator:
         
         # XML 파일들을 동적 분석
         xml_files = self.db_session.query(File).filter(
+            File.project_id == self.project_id,
             File.language == 'xml'
         ).all()
         
         for xml_file in xml_files:
+            if not self._in_scope(xml_file.file_id):
+                continue
             # 동적으로 XML 매퍼 관계 분석
             mapper_relations = self._analyze_xml_mapper_relations(xml_file)
             
@@ -101,7 +173,8 @@ class EdgeGenerator:
                             target_type='class',
                             target_id=target_class.class_id,
                             edge_type=relation['relation_type'],
-                            description=f"{xml_file.path.split('/')[-1]} {relation['relation_type']} {target_class.name}"
+                            description=f"{xml_file.path.split('/')[-1]} {relation['relation_type']} {target_class.name}",
+                            source_file_id=xml_file.file_id
                         )
                 
                 elif relation['target_type'] == 'table':
@@ -113,7 +186,8 @@ class EdgeGenerator:
                             target_type='table',
                             target_id=table.table_id,
                             edge_type='references',
-                            description=f"{relation['source_name']} → {table.table_name}"
+                            description=f"{relation['source_name']} → {table.table_name}",
+                            source_file_id=xml_file.file_id
                         )
     
     def _generate_jsp_controller_edges(self):
@@ -121,10 +195,13 @@ class EdgeGenerator:
         logger.info("JSP Controller 엣지 생성 시작")
         
         jsp_files = self.db_session.query(File).filter(
+            File.project_id == self.project_id,
             File.language == 'jsp'
         ).all()
         
         for jsp_file in jsp_files:
+            if not self._in_scope(jsp_file.file_id):
+                continue
             # JSP 파일의 Controller 관계를 동적 분석
             controller_relations = self._analyze_jsp_controller_relations(jsp_file)
             
@@ -137,7 +214,8 @@ class EdgeGenerator:
                         target_type='class',
                         target_id=target_class.class_id,
                         edge_type=relation['relation_type'],
-                        description=f"{jsp_file.path.split('/')[-1]} {relation['relation_type']} {target_class.name}"
+                        description=f"{jsp_file.path.split('/')[-1]} {relation['relation_type']} {target_class.name}",
+                        source_file_id=jsp_file.file_id
                     )
     
     def _generate_db_table_edges(self):
@@ -187,9 +265,13 @@ class EdgeGenerator:
         logger.info("SQL Unit 엣지 생성 시작")
         
         # 같은 파일 내 SQL Units 간 관계
-        sql_units = self.db_session.query(SqlUnit).all()
+        sql_units = self.db_session.query(SqlUnit).join(File, SqlUnit.file_id == File.file_id).filter(
+            File.project_id == self.project_id
+        ).all()
         
         for sql_unit in sql_units:
+            if not self._in_scope(sql_unit.file_id):
+                continue
             # INSERT → SELECT 관계 (같은 테이블)
             if sql_unit.stmt_kind == 'insert':
                 table_name = self._extract_table_from_sql(sql_unit.normalized_fingerprint)
@@ -207,7 +289,8 @@ class EdgeGenerator:
                             target_type='sql_unit',
                             target_id=select_unit.sql_id,
                             edge_type='data_flow',
-                            description=f'{sql_unit.stmt_id} → {select_unit.stmt_id}'
+                            description=f'{sql_unit.stmt_id} → {select_unit.stmt_id}',
+                            source_file_id=sql_unit.file_id
                         )
     
     def _find_service_dependencies(self, controller: Class) -> List[int]:
@@ -217,10 +300,9 @@ class EdgeGenerator:
         try:
             # 파일을 읽어서 @Autowired 필드 분석
             if hasattr(controller, 'file_id'):
-                file_obj = self.db_session.query(File).filter_by(file_id=controller.file_id).first()
-                if file_obj and file_obj.path:
-                    with open(file_obj.path, 'r', encoding='utf-8') as f:
-                        content = f.read()
+                file_path = self._class_file_path(controller)
+                if file_path:
+                    content = self.file_cache.get_text(file_path)
                     
                     # @Autowired 또는 @Resource가 있는 Service 필드 찾기
                     import re
@@ -233,9 +315,7 @@ class EdgeGenerator:
                         matches = re.findall(pattern, content, re.MULTILINE)
                         for service_type, field_name in matches:
                             # Service 클래스 찾기
-                            service = self.db_session.query(Class).filter(
-                                Class.name == service_type
-                            ).first()
+                            service = next(iter(self.symbols.classes_named(service_type)), None)
                             if service:
                                 service_deps.append(service.class_id)
                                 logger.debug(f"발견된 의존성: {controller.name} → {service_type}")
@@ -251,10 +331,9 @@ class EdgeGenerator:
         try:
             # 파일을 읽어서 @Autowired Mapper 필드 분석
             if hasattr(service, 'file_id'):
-                file_obj = self.db_session.query(File).filter_by(file_id=service.file_id).first()
-                if file_obj and file_obj.path:
-                    with open(file_obj.path, 'r', encoding='utf-8') as f:
-                        content = f.read()
+                file_path = self._class_file_path(service)
+                if file_path:
+                    content = self.file_cache.get_text(file_path)
                     
                     # @Autowired 또는 @Resource가 있는 Mapper 필드 찾기
                     import re
@@ -267,9 +346,7 @@ class EdgeGenerator:
                         matches = re.findall(pattern, content, re.MULTILINE)
                         for mapper_type, field_name in matches:
                             # Mapper 클래스 찾기
-                            mapper = self.db_session.query(Class).filter(
-                                Class.name == mapper_type
-                            ).first()
+                            mapper = next(iter(self.symbols.classes_named(mapper_type)), None)
                             if mapper:
                                 mapper_deps.append(mapper.class_id)
                                 logger.debug(f"발견된 의존성: {service.name} → {mapper_type}")
@@ -285,10 +362,9 @@ class EdgeGenerator:
         try:
             # 파일을 읽어서 import 및 사용 분석
             if hasattr(cls, 'file_id'):
-                file_obj = self.db_session.query(File).filter_by(file_id=cls.file_id).first()
-                if file_obj and file_obj.path:
-                    with open(file_obj.path, 'r', encoding='utf-8') as f:
-                        content = f.read()
+                file_path = self._class_file_path(cls)
+                if file_path:
+                    content = self.file_cache.get_text(file_path)
                     
                     # import문에서 model 클래스 찾기
                     import re
@@ -297,10 +373,8 @@ class EdgeGenerator:
                     
                     for model_name in import_matches:
                         # Model 클래스 찾기
-                        model = self.db_session.query(Class).filter(
-                            Class.name == model_name,
-                            Class.fqn.like('%.model.%')
-                        ).first()
+                        model = next((c for c in self.symbols.classes_named(model_name)
+                                      if c.fqn and '.model.' in c.fqn.lower()), None)
                         if model:
                             model_deps.append(model.class_id)
                             logger.debug(f"발견된 Model 의존성: {cls.name} → {model_name}")
@@ -312,8 +386,7 @@ class EdgeGenerator:
     def _extract_namespace_from_xml(self, file_path: str) -> Optional[str]:
         """XML 파일에서 네임스페이스를 추출합니다."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self.file_cache.get_text(file_path)
                 
             # MyBatis XML에서 namespace 추출
             import re
@@ -354,8 +427,7 @@ class EdgeGenerator:
     def _extract_controller_references(self, jsp_path: str) -> List[str]:
         """JSP 파일에서 Controller 참조를 추출합니다."""
         try:
-            with open(jsp_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self.file_cache.get_text(jsp_path)
                 
             # Controller 참조 패턴들
             import re
@@ -422,28 +494,39 @@ class EdgeGenerator:
         return None
     
     def _create_edge(self, source_type: str, source_id: int, target_type: str, 
-                    target_id: int, edge_type: str, description: str):
-        """엣지를 생성합니다."""
+                    target_id: int, edge_type: str, description: str,
+                    source_file_id: Optional[int] = None):
+        """엣지를 생성합니다. (버퍼에 추가 후 batch_size마다 일괄 저장)
+        
+        source_file_id: 엣지를 도출한 소스 파일 (증분 재생성 시 삭제 단위)
+        """
+        self._pending_edges.append({
+            'project_id': self.project_id,
+            'src_type': source_type,
+            'src_id': source_id,
+            'dst_type': target_type,
+            'dst_id': target_id,
+            'edge_kind': edge_type,
+            'meta': description,
+            'src_file_id': source_file_id,
+        })
+        self.edge_count += 1
+        
+        if self.edge_count % 10 == 0:
+            logger.debug(f"엣지 생성 진행: {self.edge_count}개")
+        if len(self._pending_edges) >= self.bulk_writer.batch_size:
+            self._flush_edges()
+    
+    def _flush_edges(self):
+        """버퍼에 쌓인 엣지를 일괄 저장합니다."""
+        if not self._pending_edges:
+            return
         try:
-            edge = Edge(
-                project_id=self.project_id,
-                src_type=source_type,
-                src_id=source_id,
-                dst_type=target_type,
-                dst_id=target_id,
-                edge_kind=edge_type,
-                meta=description
-            )
-            self.db_session.add(edge)
-            self.db_session.flush()  # 즉시 DB에 반영하여 제약조건 위반 감지
-            self.edge_count += 1
-            
-            if self.edge_count % 10 == 0:
-                logger.debug(f"엣지 생성 진행: {self.edge_count}개")
-                
+            self.bulk_writer.insert_rows(Edge, self._pending_edges)
+            self._pending_edges = []
         except Exception as e:
             logger.error(f"엣지 생성 실패: {e}")
-            logger.error(f"실패한 엣지 정보: src_type={source_type}, src_id={source_id}, dst_type={target_type}, dst_id={target_id}, edge_kind={edge_type}")
+            logger.error(f"실패한 엣지 배치: {len(self._pending_edges)}개 (첫 엣지: {self._pending_edges[0]})")
             logger.error(f"프로젝트 ID: {self.project_id}")
             # 지침규정에 따라 에러 발생 시 즉시 중단
             import sys
@@ -484,12 +567,11 @@ class EdgeGenerator:
         
         try:
             # 파일 경로에서 소스 코드 읽기
-            file_obj = self.db_session.query(File).filter_by(file_id=source_class.file_id).first()
-            if not file_obj or not file_obj.path:
+            file_path = self._class_file_path(source_class)
+            if not file_path:
                 return dependencies
                 
-            with open(file_obj.path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self.file_cache.get_text(file_path)
             
             # 1. Import 문 분석
             import_deps = self._analyze_imports(content)
@@ -609,28 +691,16 @@ class EdgeGenerator:
         
         return dependencies
     
-    def _find_class_by_name_or_fqn(self, class_name: str) -> Class:
-        """클래스명 또는 FQN으로 클래스를 찾습니다."""
-        # 먼저 정확한 클래스명으로 찾기
-        target_class = self.db_session.query(Class).filter(
-            Class.name == class_name
-        ).first()
-        
-        if not target_class:
-            # FQN 끝부분이 일치하는 것 찾기
-            target_class = self.db_session.query(Class).filter(
-                Class.fqn.like(f'%.{class_name}')
-            ).first()
-        
-        return target_class
+    def _find_class_by_name_or_fqn(self, class_name: str) -> Optional[ClassSymbol]:
+        """클래스명 또는 FQN으로 클래스를 찾습니다. (정확한 클래스명 → FQN 끝부분 순, 인덱스 조회)"""
+        return self.symbols.find_class(class_name)
     
     def _analyze_xml_mapper_relations(self, xml_file: File) -> List[dict]:
         """XML 매퍼 파일의 관계를 동적으로 분석합니다."""
         relations = []
         
         try:
-            with open(xml_file.path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self.file_cache.get_text(xml_file.path)
             
             # 1. 네임스페이스 분석 (Java 인터페이스와의 매핑)
             namespace_match = re.search(r'<mapper\s+namespace="([^"]+)"', content)
@@ -726,8 +796,7 @@ class EdgeGenerator:
         relations = []
         
         try:
-            with open(jsp_file.path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self.file_cache.get_text(jsp_file.path)
             
             import re
             
@@ -922,18 +991,17 @@ class EdgeGenerator:
         """메서드 간 호출 관계 엣지를 생성합니다."""
         logger.info("메서드 호출 관계 엣지 생성 시작")
         
-        # 모든 클래스를 가져와서 메서드 호출 관계 분석
-        all_classes = self.db_session.query(Class).all()
+        # 대상 소스 클래스를 가져와서 메서드 호출 관계 분석
+        all_classes = self._source_classes()
         
         for source_class in all_classes:
             try:
                 # 클래스 파일을 읽어서 메서드 호출 분석
-                file_obj = self.db_session.query(File).filter_by(file_id=source_class.file_id).first()
-                if not file_obj or not file_obj.path:
+                file_path = self._class_file_path(source_class)
+                if not file_path:
                     continue
                     
-                with open(file_obj.path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = self.file_cache.get_text(file_path)
                 
                 # 메서드 호출 패턴 찾기
                 method_calls = self._extract_method_calls(content)
@@ -948,7 +1016,8 @@ class EdgeGenerator:
                             target_type='class',
                             target_id=source_class.class_id,
                             edge_type='calls',
-                            description=f"{source_class.name} 내부 메서드 호출: {call['method_name']}"
+                            description=f"{source_class.name} 내부 메서드 호출: {call['method_name']}",
+                            source_file_id=source_class.file_id
                         )
                     else:
                         # 다른 클래스 메서드 호출
@@ -960,7 +1029,8 @@ class EdgeGenerator:
                                 target_type='class',
                                 target_id=target_class.class_id,
                                 edge_type='calls',
-                                description=f"{source_class.name} → {target_class.name}.{call['method_name']}()"
+                                description=f"{source_class.name} → {target_class.name}.{call['method_name']}()",
+                                source_file_id=source_class.file_id
                             )
                             
             except Exception as e:
@@ -1028,17 +1098,16 @@ class EdgeGenerator:
         """데이터 흐름 관계 엣지를 생성합니다."""
         logger.info("데이터 흐름 관계 엣지 생성 시작")
         
-        # 모든 클래스에 대해 데이터 흐름 분석
-        all_classes = self.db_session.query(Class).all()
+        # 대상 소스 클래스에 대해 데이터 흐름 분석
+        all_classes = self._source_classes()
         
         for source_class in all_classes:
             try:
-                file_obj = self.db_session.query(File).filter_by(file_id=source_class.file_id).first()
-                if not file_obj or not file_obj.path:
+                file_path = self._class_file_path(source_class)
+                if not file_path:
                     continue
                     
-                with open(file_obj.path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = self.file_cache.get_text(file_path)
                 
                 # 데이터 변환 패턴 찾기
                 data_flows = self._extract_data_flows(content)
@@ -1053,7 +1122,8 @@ class EdgeGenerator:
                                 target_type='class',
                                 target_id=target_class.class_id,
                                 edge_type='data_flow',
-                                description=f"데이터 흐름: {source_class.name} → {target_class.name} ({flow['flow_type']})"
+                                description=f"데이터 흐름: {source_class.name} → {target_class.name} ({flow['flow_type']})",
+                                source_file_id=source_class.file_id
                             )
                             
             except Exception as e:
@@ -1100,9 +1170,7 @@ class EdgeGenerator:
         logger.info("서비스 계층 관계 엣지 생성 시작")
         
         # Controller → Service 관계
-        controllers = self.db_session.query(Class).filter(
-            Class.name.like('%Controller%')
-        ).all()
+        controllers = [c for c in self._source_classes() if c.name and 'controller' in c.name.lower()]
         
         for controller in controllers:
             service_deps = self._find_service_dependencies(controller)
@@ -1113,13 +1181,12 @@ class EdgeGenerator:
                     target_type='class',
                     target_id=service_id,
                     edge_type='uses_service',
-                    description=f"{controller.name} uses service"
+                    description=f"{controller.name} uses service",
+                    source_file_id=controller.file_id
                 )
         
         # Service → Repository/Mapper 관계
-        services = self.db_session.query(Class).filter(
-            Class.name.like('%Service%')
-        ).all()
+        services = [c for c in self._source_classes() if c.name and 'service' in c.name.lower()]
         
         for service in services:
             mapper_deps = self._find_mapper_dependencies(service)
@@ -1130,5 +1197,6 @@ class EdgeGenerator:
                     target_type='class',
                     target_id=mapper_id,
                     edge_type='uses_repository',
-                    description=f"{service.name} uses mapper/repository"
+                    description=f"{service.name} uses mapper/repository",
+                    source_file_id=service.file_id
                 )
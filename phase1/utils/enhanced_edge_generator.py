@@ -20,6 +20,7 @@ from phase1.parsers.jsp.jsp_parser import JSPParser
 from phase1.parsers.mybatis.mybatis_parser import MyBatisParser
 from phase1.llm.enricher import LLMMetadataEnricher
 from phase1.utils.chunk_location_tracker import ChunkLocationTracker
+from phase1.utils.symbol_index import SymbolIndex, ClassSymbol, MethodSymbol
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +48,15 @@ class EnhancedEdgeGenerator:
         self.file_cache: Dict[str, Any] = {}
         self.import_cache: Dict[str, Set[str]] = {}
         self.annotation_cache: Dict[str, List[str]] = {}
+        # 클래스/메서드 DB 조회 대신 사용하는 심볼 인덱스 (첫 사용 시 구축)
+        self._symbols: Optional[SymbolIndex] = None
+    
+    @property
+    def symbols(self) -> SymbolIndex:
+        """프로젝트 심볼 인덱스 (지연 구축)"""
+        if self._symbols is None:
+            self._symbols = SymbolIndex.build(self.db_session, self.project_id)
+        return self._symbols
         
     def generate_all_edges(self) -> int:
         """모든 엣지를 동적으로 생성합니다."""
@@ -402,9 +412,9 @@ class EnhancedEdgeGenerator:
     
     # 헬퍼 메서드들
     
-    def _get_class_from_db(self, fqn: str) -> Optional[Class]:
-        """FQN으로 클래스를 DB에서 조회"""
-        return self.db_session.query(Class).filter(Class.fqn == fqn).first()
+    def _get_class_from_db(self, fqn: str) -> Optional[ClassSymbol]:
+        """FQN으로 클래스를 조회 (심볼 인덱스)"""
+        return self.symbols.class_by_fqn(fqn)
     
     def _get_file_from_db(self, file_path: str) -> Optional[File]:
         """파일 경로로 파일을 DB에서 조회"""
@@ -412,8 +422,11 @@ class EnhancedEdgeGenerator:
         full_path = str(self.project_path / file_path)
         return self.db_session.query(File).filter(File.path == full_path).first()
     
-    def _get_method_from_db(self, method_signature: str) -> Optional[Method]:
-        """메서드 시그니처로 메서드를 DB에서 조회"""
+    def _get_method_from_db(self, method_signature: str) -> Optional[Any]:
+        """메서드 시그니처로 메서드를 조회 ('클래스FQN.메서드'는 인덱스, 그 외는 DB 검색)"""
+        method = self.symbols.find_method_by_fqn(method_signature)
+        if method:
+            return method
         return self.db_session.query(Method).filter(
             Method.signature.like(f'%{method_signature}%')
         ).first()
@@ -0,0 +1,153 @@
+"""
+파일 내용 캐시
+한 실행(run) 동안 같은 파일을 여러 번 읽지 않도록, 경로+mtime 기준으로 디코딩된 내용을 보관합니다.
+해시(MD5), 라인 수, 인코딩은 파일을 읽는 한 번의 패스에서 함께 계산합니다.
+"""
+
+import hashlib
+import os
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+# 순서대로 시도할 인코딩 (모두 실패하면 utf-8로 깨진 바이트를 무시하고 디코딩)
+DEFAULT_ENCODINGS = ('utf-8', 'cp949')
+
+
+@dataclass(frozen=True)
+class FileContent:
+    """한 번 읽은 파일의 내용과 파생 정보"""
+    path: str
+    text: str          # 줄바꿈이 '\n'으로 정규화된 디코딩 결과
+    hash: str          # 원본 바이트의 MD5 (증분 분석 변경 감지와 동일 기준)
+    loc: int
+    encoding: str
+    mtime: datetime
+    size: int
+
+    @property
+    def file_info(self) -> Dict[str, Any]:
+        """File 레코드 저장용 정보 (hash, loc, mtime)"""
+        return {'hash': self.hash, 'loc': self.loc, 'mtime': self.mtime}
+
+
+def decode_bytes(raw: bytes, encodings: Tuple[str, ...] = DEFAULT_ENCODINGS) -> Tuple[str, str]:
+    """바이트를 디코딩하고 (텍스트, 인코딩명)을 반환합니다."""
+    for encoding in encodings:
+        try:
+            text = raw.decode(encoding)
+            if encoding == 'utf-8' and text.startswith('\ufeff'):
+                text = text[1:]
+            return text, encoding
+        except UnicodeDecodeError:
+            continue
+    return raw.decode('utf-8', errors='ignore'), 'utf-8'
+
+
+def read_file_content(path: str, encodings: Tuple[str, ...] = DEFAULT_ENCODINGS) -> FileContent:
+    """캐시 없이 파일을 한 번 읽어 FileContent를 생성합니다."""
+    stat = os.stat(path)
+    with open(path, 'rb') as f:
+        raw = f.read()
+    text, encoding = decode_bytes(raw, encodings)
+    # open(..., 'r')의 universal newline 동작과 동일하게 정규화
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return FileContent(
+        path=path,
+        text=text,
+        hash=hashlib.md5(raw).hexdigest(),
+        loc=len(text.splitlines()),
+        encoding=encoding,
+        mtime=datetime.fromtimestamp(stat.st_mtime),
+        size=stat.st_size,
+    )
+
+
+class FileContentCache:
+    """
+    경로+mtime 키 기반 LRU 파일 내용 캐시
+
+    - get()은 매번 os.stat()으로 mtime/크기를 확인하므로, 실행 중 파일이 바뀌면 다시 읽습니다.
+    - 메모리 예산(max_bytes)을 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다.
+    - 예산보다 큰 단일 파일은 캐시하지 않고 그대로 반환합니다.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, encodings: Tuple[str, ...] = DEFAULT_ENCODINGS):
+        self.max_bytes = max(0, int(max_bytes))
+        self.encodings = tuple(encodings)
+        self._entries: 'OrderedDict[str, Tuple[Tuple[int, int], FileContent, int]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> 'FileContentCache':
+        """processing.file_cache_mb / processing.file_encodings 설정으로 생성"""
+        processing = (config or {}).get('processing', {})
+        max_mb = processing.get('file_cache_mb', 256)
+        encodings = tuple(processing.get('file_encodings', DEFAULT_ENCODINGS))
+        return cls(max_bytes=int(max_mb * 1024 * 1024), encodings=encodings)
+
+    def get(self, path: str) -> FileContent:
+        """파일 내용을 반환합니다 (캐시에 없거나 파일이 바뀌었으면 새로 읽음)."""
+        stat = os.stat(path)
+        key = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == key:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        content = read_file_content(path, self.encodings)
+        self._store(path, key, content)
+        return content
+
+    def get_text(self, path: str) -> str:
+        """디코딩된 파일 텍스트만 반환합니다."""
+        return self.get(path).text
+
+    def _store(self, path: str, key: Tuple[int, int], content: FileContent) -> None:
+        cost = sys.getsizeof(content.text)
+        with self._lock:
+            old = self._entries.pop(path, None)
+            if old is not None:
+                self.current_bytes -= old[2]
+            if cost > self.max_bytes:
+                return
+            self._entries[path] = (key, content, cost)
+            self.current_bytes += cost
+            while self.current_bytes > self.max_bytes and self._entries:
+                _, (_, _, evicted_cost) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_cost
+                self.evictions += 1
+
+    def invalidate(self, path: str) -> None:
+        """특정 파일의 캐시 항목을 제거합니다."""
+        with self._lock:
+            old = self._entries.pop(path, None)
+            if old is not None:
+                self.current_bytes -= old[2]
+
+    def clear(self) -> None:
+        """캐시를 비웁니다 (통계는 유지)."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계 (로그 출력용)"""
+        return {
+            'entries': len(self._entries),
+            'bytes': self.current_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
@@ -0,0 +1,51 @@
+"""
+라인 오프셋 인덱스
+파일 내용의 줄 시작 위치 배열을 한 번 만들어 두고, 문자 위치 → 라인/컬럼 조회를 bisect로 처리합니다.
+매치마다 content[:pos].count('\\n')으로 앞부분을 복사해 세는 O(n·매치 수) 계산을 대체합니다.
+"""
+
+from bisect import bisect_right
+from functools import lru_cache
+from typing import List, Tuple
+
+
+class LineIndex:
+    """문자 위치(0-based) → 라인 번호(1-based) 조회용 인덱스"""
+
+    __slots__ = ('_starts', '_length')
+
+    def __init__(self, content: str):
+        starts: List[int] = [0]
+        find = content.find
+        position = find('\n')
+        while position >= 0:
+            starts.append(position + 1)
+            position = find('\n', position + 1)
+        self._starts = starts
+        self._length = len(content)
+
+    @property
+    def line_count(self) -> int:
+        return len(self._starts)
+
+    def line_of(self, position: int) -> int:
+        """position이 속한 라인 번호 (1-based, content[:position].count('\\n') + 1과 같음)"""
+        return bisect_right(self._starts, position)
+
+    def column_of(self, position: int) -> int:
+        """position의 컬럼 (1-based, 줄 시작 문자가 1)"""
+        return position - self._starts[self.line_of(position) - 1] + 1
+
+    def line_start(self, line: int) -> int:
+        """라인(1-based)의 시작 위치"""
+        return self._starts[min(max(line, 1), len(self._starts)) - 1]
+
+    def span(self, start: int, end: int) -> Tuple[int, int]:
+        """[start, end) 범위의 (시작 라인, 끝 라인)"""
+        return self.line_of(start), self.line_of(end)
+
+
+@lru_cache(maxsize=16)
+def line_index_for(content: str) -> LineIndex:
+    """같은 내용에 대한 인덱스를 재사용 (파서 메서드들이 같은 content로 반복 조회하는 경우)"""
+    return LineIndex(content)
@@ -0,0 +1,158 @@
+"""
+프로젝트 심볼 인덱스
+클래스/메서드 조회를 엣지마다 SQL(특히 선행 와일드카드 LIKE)로 하지 않도록,
+프로젝트의 클래스·메서드를 한 번 읽어 딕셔너리로 색인합니다.
+
+- 단순 클래스명 → 후보 클래스 목록
+- FQN(및 FQN의 점(.) 단위 접미사) → 클래스
+- (class_id, 메서드명, 인자 수) → 메서드
+"""
+
+from collections import defaultdict, namedtuple
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from phase1.models.database import Class, Method, File
+
+ClassSymbol = namedtuple('ClassSymbol', 'class_id fqn name file_id')
+MethodSymbol = namedtuple('MethodSymbol', 'method_id class_id name arity')
+
+
+def count_parameters(parameters: Optional[str]) -> int:
+    """Method.parameters 문자열의 인자 수를 계산합니다 (제네릭 내부의 쉼표는 무시)."""
+    if not parameters or not parameters.strip():
+        return 0
+    depth = 0
+    count = 1
+    for ch in parameters:
+        if ch in '<([':
+            depth += 1
+        elif ch in '>)]':
+            depth -= 1
+        elif ch == ',' and depth == 0:
+            count += 1
+    return count
+
+
+class SymbolIndex:
+    """프로젝트 단위 클래스/메서드 심볼 테이블 (한 번 구축 후 O(1) 조회)"""
+
+    def __init__(self, classes: Iterable[ClassSymbol] = (), methods: Iterable[MethodSymbol] = (),
+                 files: Optional[Dict[int, Tuple[str, str]]] = None):
+        self.classes_by_id: Dict[int, ClassSymbol] = {}
+        self._by_fqn: Dict[str, ClassSymbol] = {}
+        self._by_name: Dict[str, List[ClassSymbol]] = defaultdict(list)
+        self._by_suffix: Dict[str, List[ClassSymbol]] = defaultdict(list)
+        self.methods_by_id: Dict[int, MethodSymbol] = {}
+        self._methods_by_key: Dict[Tuple[int, str, int], List[MethodSymbol]] = defaultdict(list)
+        self._methods_by_class_name: Dict[Tuple[int, str], List[MethodSymbol]] = defaultdict(list)
+        self._methods_by_name: Dict[str, List[MethodSymbol]] = defaultdict(list)
+        # file_id → (path, language)
+        self.files: Dict[int, Tuple[str, str]] = dict(files or {})
+
+        # ID 순서로 추가해야 "첫 번째 후보"가 기존 .first() 조회 결과와 같아짐
+        for cls in sorted(classes, key=lambda c: c.class_id):
+            self.add_class(cls)
+        for method in sorted(methods, key=lambda m: m.method_id):
+            self.add_method(method)
+
+    @classmethod
+    def build(cls, session, project_id: int) -> 'SymbolIndex':
+        """프로젝트의 파일/클래스/메서드를 각각 한 번의 쿼리로 읽어 인덱스를 구축합니다."""
+        files = {
+            file_id: (path, language)
+            for file_id, path, language in session.query(File.file_id, File.path, File.language).filter(
+                File.project_id == project_id
+            )
+        }
+        classes = [
+            ClassSymbol(class_id, fqn, name, file_id)
+            for class_id, fqn, name, file_id in session.query(
+                Class.class_id, Class.fqn, Class.name, Class.file_id
+            ).join(File, Class.file_id == File.file_id).filter(File.project_id == project_id)
+        ]
+        methods = [
+            MethodSymbol(method_id, class_id, name, count_parameters(parameters))
+            for method_id, class_id, name, parameters in session.query(
+                Method.method_id, Method.class_id, Method.name, Method.parameters
+            ).join(Class, Method.class_id == Class.class_id)
+             .join(File, Class.file_id == File.file_id)
+             .filter(File.project_id == project_id)
+        ]
+        return cls(classes, methods, files)
+
+    # ------------------------------------------------------------------ 구축
+
+    def add_class(self, cls: ClassSymbol) -> None:
+        """클래스 심볼을 인덱스에 추가합니다."""
+        self.classes_by_id[cls.class_id] = cls
+        if cls.name:
+            self._by_name[cls.name].append(cls)
+        if cls.fqn:
+            self._by_fqn.setdefault(cls.fqn, cls)
+            # 'a.b.C' → 'b.C', 'C' 접미사 색인 (LIKE '%.X' 대체, SQLite LIKE처럼 대소문자 무시)
+            parts = cls.fqn.lower().split('.')
+            for i in range(1, len(parts)):
+                self._by_suffix['.'.join(parts[i:])].append(cls)
+
+    def add_method(self, method: MethodSymbol) -> None:
+        """메서드 심볼을 인덱스에 추가합니다."""
+        self.methods_by_id[method.method_id] = method
+        if not method.name:
+            return
+        self._methods_by_key[(method.class_id, method.name, method.arity)].append(method)
+        self._methods_by_class_name[(method.class_id, method.name)].append(method)
+        self._methods_by_name[method.name].append(method)
+
+    # ------------------------------------------------------------------ 클래스 조회
+
+    def class_by_fqn(self, fqn: str) -> Optional[ClassSymbol]:
+        """정확한 FQN으로 클래스를 찾습니다."""
+        return self._by_fqn.get(fqn) if fqn else None
+
+    def classes_named(self, name: str) -> List[ClassSymbol]:
+        """단순 클래스명이 같은 후보 클래스 목록"""
+        return self._by_name.get(name, []) if name else []
+
+    def classes_with_suffix(self, name: str) -> List[ClassSymbol]:
+        """FQN이 '.{name}'으로 끝나는 클래스 목록 (대소문자 무시)"""
+        return self._by_suffix.get(name.lower(), []) if name else []
+
+    def find_class(self, name_or_fqn: str) -> Optional[ClassSymbol]:
+        """단순 클래스명 → FQN 접미사 순으로 클래스를 찾습니다 (_find_class_by_name_or_fqn 대체)."""
+        candidates = self.classes_named(name_or_fqn) or self.classes_with_suffix(name_or_fqn)
+        if candidates:
+            return candidates[0]
+        return self.class_by_fqn(name_or_fqn)
+
+    def file_path(self, file_id: int) -> Optional[str]:
+        """file_id에 해당하는 파일 경로"""
+        entry = self.files.get(file_id)
+        return entry[0] if entry else None
+
+    def file_language(self, file_id: int) -> Optional[str]:
+        """file_id에 해당하는 파일 언어"""
+        entry = self.files.get(file_id)
+        return entry[1] if entry else None
+
+    # ------------------------------------------------------------------ 메서드 조회
+
+    def find_method(self, class_id: int, name: str, arity: Optional[int] = None) -> Optional[MethodSymbol]:
+        """클래스 내 메서드를 (이름, 인자 수)로 찾습니다. arity가 없거나 일치 항목이 없으면 이름만으로 찾습니다."""
+        if arity is not None:
+            exact = self._methods_by_key.get((class_id, name, arity))
+            if exact:
+                return exact[0]
+        candidates = self._methods_by_class_name.get((class_id, name))
+        return candidates[0] if candidates else None
+
+    def find_method_by_fqn(self, method_fqn: str, arity: Optional[int] = None) -> Optional[MethodSymbol]:
+        """'패키지.클래스.메서드' 형태의 이름으로 메서드를 찾습니다."""
+        if not method_fqn or '.' not in method_fqn:
+            return None
+        class_fqn, name = method_fqn.rsplit('.', 1)
+        cls = self.class_by_fqn(class_fqn)
+        return self.find_method(cls.class_id, name, arity) if cls else None
+
+    def methods_named(self, name: str) -> List[MethodSymbol]:
+        """이름이 같은 모든 메서드 (method_id 순)"""
+        return self._methods_by_name.get(name, []) if name else []
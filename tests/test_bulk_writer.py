@@ -0,0 +1,40 @@
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from phase1.database.bulk_writer import BulkWriter
+from phase1.models.database import DatabaseManager, Project, File, Class, Method
+
+
+def test_insert_objects_assigns_ids_per_batch(tmp_path):
+    db_manager = DatabaseManager({'type': 'sqlite', 'sqlite': {'path': str(tmp_path / 'metadata.db')}})
+    db_manager.initialize()
+    session = db_manager.get_auto_commit_session()
+
+    writer = BulkWriter(session, batch_size=2, commit_every=2)
+    project = Project(root_path='/src', name='p')
+    session.add(project)
+    session.flush()
+    files = [File(project_id=project.project_id, path=f'/src/F{i}.java') for i in range(3)]
+    writer.insert_objects(files)
+
+    classes = [Class(file_id=f.file_id, fqn=f'pkg.C{i}', name=f'C{i}') for i, f in enumerate(files)]
+    ids = writer.insert_objects(classes)
+    assert ids == [c.class_id for c in classes] and len(set(ids)) == 3
+
+    methods = [Method(class_id=c.class_id, name='run') for c in classes]
+    assert writer.insert_objects(methods, return_ids=False) == []
+
+    writer.file_done()
+    assert writer.pending_files == 1
+    writer.file_done()
+    assert writer.pending_files == 0  # commit_every개 파일마다 커밋
+
+    check = db_manager.get_session()
+    rows = check.query(Class.fqn, File.path).join(File, Class.file_id == File.file_id).order_by(Class.class_id).all()
+    assert rows == [(f'pkg.C{i}', f'/src/F{i}.java') for i in range(3)]
+    assert check.query(Method).count() == 3
+    check.close()
+    session.session.close()
@@ -0,0 +1,72 @@
+import json
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from phase1.database.call_resolver import MethodCallResolver
+from phase1.models.database import DatabaseManager, Project, File, Class, Method, Edge, EdgeHint
+
+
+def test_resolves_calls_through_inheritance_closure(tmp_path):
+    db_manager = DatabaseManager({'type': 'sqlite', 'sqlite': {'path': str(tmp_path / 'metadata.db')}})
+    db_manager.initialize()
+    session = db_manager.get_session()
+
+    project = Project(root_path='/src', name='p')
+    session.add(project)
+    session.flush()
+    pid = project.project_id
+    f = File(project_id=pid, path='/src/App.java', language='java')
+    session.add(f)
+    session.flush()
+
+    classes = {}
+    for fqn in ('app.Controller', 'app.Repo', 'app.BaseRepo', 'app.JdbcRepo'):
+        classes[fqn] = Class(file_id=f.file_id, fqn=fqn, name=fqn.split('.')[-1])
+    session.add_all(classes.values())
+    session.flush()
+    caller = Method(class_id=classes['app.Controller'].class_id, name='handle')
+    save = Method(class_id=classes['app.JdbcRepo'].class_id, name='save', parameters='Object o')
+    session.add_all([caller, save])
+    session.flush()
+
+    # JdbcRepo extends BaseRepo implements Repo → Repo.save는 JdbcRepo.save로 해결
+    session.add_all([
+        Edge(project_id=pid, src_type='class', src_id=classes['app.BaseRepo'].class_id, dst_type='class',
+             dst_id=classes['app.Repo'].class_id, edge_kind='implements', meta=json.dumps({'target': 'app.Repo'})),
+        Edge(project_id=pid, src_type='class', src_id=classes['app.JdbcRepo'].class_id, dst_type='class',
+             dst_id=classes['app.BaseRepo'].class_id, edge_kind='extends', meta=json.dumps({'target': 'BaseRepo'})),
+    ])
+    resolved = Edge(project_id=pid, src_type='method', src_id=caller.method_id, dst_type='method', dst_id=None,
+                    edge_kind='call', confidence=0.5,
+                    meta=json.dumps({'called_name': 'save', 'callee_qualifier_type': 'Repo'}))
+    missing = Edge(project_id=pid, src_type='method', src_id=caller.method_id, dst_type='method', dst_id=None,
+                   edge_kind='call', confidence=0.5, meta=json.dumps({'called_name': 'nowhere'}))
+    session.add_all([resolved, missing])
+    session.commit()
+
+    stats = MethodCallResolver(session, pid).resolve()
+    session.commit()
+    session.expire_all()
+
+    assert stats == {'processed': 2, 'resolved': 1, 'external': 0, 'unresolved': 1}
+    assert (resolved.dst_type, resolved.dst_id) == ('method', save.method_id)
+    assert resolved.confidence == 0.7
+    assert missing.dst_id is None and abs(missing.confidence - 0.2) < 1e-9
+    hint = session.query(EdgeHint).one()
+    assert json.loads(hint.hint)['called_name'] == 'nowhere'
+
+    # 다시 실행해도 신뢰도 감소와 힌트는 한 번만 (끊어졌다 다시 해결된 엣지도 파싱 시점 신뢰도 기준)
+    resolved.dst_id = None
+    session.commit()
+    for _ in range(2):
+        stats = MethodCallResolver(session, pid).resolve()
+        session.commit()
+    session.expire_all()
+    assert stats == {'processed': 1, 'resolved': 0, 'external': 0, 'unresolved': 1}
+    assert resolved.dst_id == save.method_id and resolved.confidence == 0.7
+    assert abs(missing.confidence - 0.2) < 1e-9
+    assert session.query(EdgeHint).count() == 1
+    session.close()
@@ -0,0 +1,68 @@
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from phase1.llm.intelligent_chunker import IntelligentChunker, ChunkSpan
+from phase1.parsers.java.javaparser_enhanced import JavaParserEnhanced
+from phase1.parsers.mybatis.mybatis_parser import MyBatisParser
+
+JAVA = """package com.example;
+
+import java.util.List;
+
+@Service
+public class OrderService {
+    private OrderMapper mapper;
+
+    @Transactional
+    public List<Order> find(String status) {
+        if (status == null) { return mapper.all("}"); }
+        return mapper.byStatus(status);
+    }
+
+    public abstract void close();
+}
+"""
+
+MAPPER = """<mapper namespace="app.OrderMapper">
+  <!-- 주문 조회
+       (여러 줄 주석) -->
+  <select id="byStatus" resultType="Order">
+    SELECT * FROM ORDERS
+    WHERE STATUS = #{status}
+  </select>
+</mapper>
+"""
+
+
+def test_java_spans_slice_methods_and_class_with_target_ids():
+    parsed = JavaParserEnhanced({}).parse_content(JAVA, {})
+    assert [(c['fqn'], c['start_line'], c['end_line']) for c in parsed['classes']] == [('com.example.OrderService', 5, 16)]
+    assert [(m['name'], m['owner_fqn'], m['start_line'], m['end_line']) for m in parsed['methods']] == [
+        ('find', 'com.example.OrderService', 9, 13), ('close', 'com.example.OrderService', 15, 15)]
+
+    spans = [ChunkSpan('class', 7, 'OrderService', 5, 16),
+             ChunkSpan('method', 70, 'find', 9, 13, class_id=7),
+             ChunkSpan('method', 71, 'close', 15, 15, class_id=7),
+             ChunkSpan('method', 72, 'stale', 40, 45, class_id=7)]   # 파일 밖 범위는 건너뜀
+    chunks = IntelligentChunker().chunk_from_spans('OrderService.java', JAVA, spans)
+
+    targets = [(c.chunk_type, c.metadata['target_type'], c.metadata['target_id']) for c in chunks]
+    assert targets == [('import', 'file', None), ('method', 'method', 70), ('method', 'method', 71), ('class', 'class', 7)]
+    find = chunks[1]
+    assert find.name == 'OrderService.find'
+    assert find.content.startswith('    @Transactional') and find.content.endswith('return mapper.byStatus(status);\n    }')
+    assert 'public class OrderService' in chunks[3].content
+
+
+def test_mybatis_spans_survive_multiline_comments():
+    sql_units = MyBatisParser({}).parse_content(MAPPER, {'file_path': 'OrderMapper.xml'})['sql_units']
+    assert [(u['id'], u['start_line'], u['end_line']) for u in sql_units] == [('byStatus', 4, 7)]
+
+    chunks = IntelligentChunker().chunk_from_spans(
+        'OrderMapper.xml', MAPPER, [ChunkSpan('sql_unit', 3, 'byStatus', 4, 7, kind='select')])
+    assert [(c.chunk_type, c.metadata['target_id']) for c in chunks] == [('mybatis_select', 3)]
+    assert chunks[0].content.splitlines()[0].strip() == '<select id="byStatus" resultType="Order">'
+    assert chunks[0].content.rstrip().endswith('</select>')
@@ -0,0 +1,132 @@
+import asyncio
+import logging
+import pickle
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from phase1.core.chunk_stage import ParallelChunkStage
+from phase1.core.parse_stage import build_parsers
+from phase1.database.metadata_engine import MetadataEngine
+from phase1.llm.intelligent_chunker import ChunkSpan
+from phase1.main import SourceAnalyzer
+from phase1.models.database import DatabaseManager, Project, File, Chunk, ParseResultModel
+from phase1.database.bulk_writer import BulkWriter
+from phase1.utils.file_content_cache import FileContentCache
+
+SAMPLE_ROOT = REPO_ROOT / 'PROJECT' / 'sampleSrc' / 'src' / 'main'
+
+
+def test_parallel_chunking_matches_sequential_and_reports_failures(tmp_path):
+    paths = sorted(SAMPLE_ROOT.glob('**/*.java')) + sorted(SAMPLE_ROOT.glob('**/*.xml'))
+    tasks = [(i + 1, str(path), None) for i, path in enumerate(paths)]
+    java = tasks[0][1]
+    # 범위가 있는 파일, 없는 파일, 읽을 수 없는 경로(디렉토리), 사라진 파일을 섞음
+    tasks += [(100, java, [ChunkSpan('class', 9, 'Sample', 1, 3)]),
+              (101, str(tmp_path), None),
+              (102, str(tmp_path / 'gone.java'), None)]
+
+    with ParallelChunkStage({}, max_workers=1) as stage:
+        sequential = list(stage.run(tasks))
+    with ParallelChunkStage({}, max_workers=2) as stage:
+        parallel = list(stage.run(tasks)) + list(stage.run(tasks[:3]))   # 페이지마다 같은 풀 재사용
+
+    assert [p['file_id'] for p in parallel] == [t[0] for t in tasks] + [1, 2, 3]
+    for seq, par in zip(sequential, parallel):
+        assert par['status'] == seq['status']
+        assert [c['hash'] for c in par['chunks']] == [c['hash'] for c in seq['chunks']]
+        pickle.dumps(par)
+
+    by_id = {p['file_id']: p for p in sequential}
+    assert by_id[100]['chunks'][-1]['chunk'].metadata['target_id'] == 9
+    assert by_id[101]['status'] == 'error' and by_id[101]['error_type'] == 'IsADirectoryError'
+    assert by_id[102]['status'] == 'missing'
+    assert all(p['status'] == 'ok' and p['chunks'] for p in sequential[:len(paths)])
+
+
+JAVA_TEMPLATE = """package app;
+
+public class {name} {{
+    public int first() {{
+        return 1;
+    }}
+
+    public int second() {{
+        return 2;
+    }}
+}}
+"""
+
+
+def test_run_intelligent_chunking_pages_filters_and_records_failures(tmp_path, monkeypatch):
+    names = ['Alpha', 'Beta', 'Gamma', 'Delta', 'Omega']
+    paths = []
+    for name in names:
+        path = tmp_path / f'{name}.java'
+        path.write_text(JAVA_TEMPLATE.format(name=name), encoding='utf-8')
+        paths.append(str(path))
+    db_manager = DatabaseManager({'type': 'sqlite', 'sqlite': {'path': str(tmp_path / 'metadata.db')}})
+    db_manager.initialize()
+    session = db_manager.get_session()
+    project = Project(root_path=str(tmp_path), name='p')
+    session.add(project)
+    session.commit()
+    project_id = project.project_id
+    session.close()
+
+    # 페이지 2개 파일, 배치 2행 (파일당 청크 3개 이상이므로 페이지 안에서 여러 번 나눠 저장)
+    config = {'processing': {'max_workers': 1, 'chunk_page_files': 2, 'bulk_batch_size': 2}}
+    analyzer = SourceAnalyzer.__new__(SourceAnalyzer)
+    analyzer.config = config
+    analyzer.logger = logging.getLogger('test')
+    analyzer.db_manager = db_manager
+    analyzer.metadata_engine = MetadataEngine({}, db_manager)
+    analyzer.parsers = build_parsers(config)
+    analyzer.file_cache = FileContentCache(max_bytes=0)
+    analyzer._bulk_session = analyzer._bulk_writer = None
+    asyncio.run(analyzer._analyze_files(paths, project_id))
+
+    session = db_manager.get_session()
+    file_ids = {Path(path).stem: file_id for file_id, path in session.query(File.file_id, File.path)}
+    session.close()
+    assert sorted(file_ids) == sorted(names)
+    # 저장 후 읽을 수 없게 된 파일 (디렉토리) → 청킹 실패 행
+    Path(paths[2]).unlink()
+    Path(paths[2]).mkdir()
+
+    pages, inserts = [], []
+    stage_run, insert_rows = ParallelChunkStage.run, BulkWriter.insert_rows
+
+    def run_spy(stage, tasks):
+        pages.append([Path(path).stem for _file_id, path, _spans in tasks])
+        return stage_run(stage, tasks)
+
+    def insert_spy(writer, model, rows):
+        inserts.append((model.__name__, len(rows)))
+        return insert_rows(writer, model, rows)
+
+    monkeypatch.setattr(ParallelChunkStage, 'run', run_spy)
+    monkeypatch.setattr(BulkWriter, 'insert_rows', insert_spy)
+
+    # Delta는 대상에서 제외: file_id 순 페이지 [Alpha, Beta] [Gamma, Delta→제외] [Omega]
+    asyncio.run(analyzer._run_intelligent_chunking(project_id, [p for p in paths if 'Delta' not in p]))
+    assert pages == [['Alpha', 'Beta'], ['Gamma'], ['Omega']]
+
+    session = db_manager.get_session()
+    try:
+        chunks = session.query(Chunk).filter(Chunk.project_id == project_id).all()
+        chunked = {name for name in names if any(f'class {name}' in c.content for c in chunks)}
+        assert chunked == {'Alpha', 'Beta', 'Omega'}
+        assert all(c.hash and c.token_count for c in chunks)
+        failures = session.query(ParseResultModel).filter(ParseResultModel.parser_type == 'chunker').all()
+        assert [(f.file_id, f.success) for f in failures] == [(file_ids['Gamma'], False)]
+        assert failures[0].error_message.startswith('IsADirectoryError')
+    finally:
+        session.close()
+
+    # 배치 크기(2)를 넘으면 파일마다 저장: 첫 페이지는 페이지 안에서 두 번, 실패만 있는 페이지는 0번
+    chunk_batches = [n for model, n in inserts if model == 'Chunk' and n]
+    assert chunk_batches == [4, 4, 4] and sum(chunk_batches) == len(chunks)
+    assert ('ParseResultModel', 1) in inserts
@@ -0,0 +1,95 @@
+import struct
+import sys
+import zipfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from phase1.parsers.classfile_reader import parse_method_descriptor, read_class
+from phase1.parsers.jar_parser import JarParser, jar_sha256
+from phase1.parsers.jar_signature_cache import JarSignatureStore
+
+
+def _class_bytes(this_name, methods):
+    """상수 풀과 메서드 테이블만 있는 최소 class 파일을 만든다."""
+    pool = []
+
+    def utf8(text):
+        raw = text.encode('utf-8')
+        pool.append(b'\x01' + struct.pack('>H', len(raw)) + raw)
+        return len(pool)
+
+    def class_ref(name):
+        name_index = utf8(name)
+        pool.append(b'\x07' + struct.pack('>H', name_index))
+        return len(pool)
+
+    this_index = class_ref(this_name)
+    super_index = class_ref('java/lang/Object')
+    pool.append(b'\x05' + struct.pack('>q', 42))  # Long: 슬롯 2개
+    pool.append(b'')
+    method_entries = []
+    for name, descriptor in methods:
+        method_entries.append(struct.pack('>HHHH', 0x0001, utf8(name), utf8(descriptor), 0))
+
+    body = struct.pack('>IHHH', 0xCAFEBABE, 0, 52, len(pool) + 1) + b''.join(pool)
+    body += struct.pack('>HHHH', 0x0021, this_index, super_index, 0)
+    body += struct.pack('>H', 0)  # fields
+    body += struct.pack('>H', len(method_entries)) + b''.join(method_entries)
+    return body + struct.pack('>H', 0)
+
+
+def test_parse_method_descriptor():
+    assert parse_method_descriptor('(I[Ljava/lang/String;J)V') == (['int', 'java.lang.String[]', 'long'], 'void')
+
+
+def test_jar_parser_reads_class_files_in_process(tmp_path):
+    data = _class_bytes('com/example/Hello', [
+        ('<init>', '()V'),
+        ('sayHi', '()V'),
+        ('add', '(II)I'),
+        ('names', '(Ljava/util/Map;)[Ljava/lang/String;'),
+    ])
+    info = read_class(data)
+    assert info.fqn == 'com.example.Hello' and info.super_fqn == 'java.lang.Object'
+
+    jar_path = tmp_path / 'hello.jar'
+    with zipfile.ZipFile(jar_path, 'w') as jar:
+        jar.writestr('com/example/Hello.class', data)
+        jar.writestr('META-INF/MANIFEST.MF', 'Manifest-Version: 1.0\n')
+
+    parser = JarParser({})
+    file_obj, classes, methods, _ = parser.parse_file(str(jar_path), project_id=1)
+    assert [c.fqn for c in classes] == ['com.example.Hello']
+    assert [m.signature for m in methods] == ['void sayHi()', 'int add(int, int)', 'String[] names(java.util.Map)']
+    assert all(m.owner_fqn == 'com.example.Hello' for m in methods)
+
+    # 같은 sha256의 JAR은 다시 읽지 않고 캐시에서 새 객체를 만든다
+    parser.extract_signatures = None
+    _, cached_classes, cached_methods, _ = parser.parse_file(str(jar_path), project_id=2)
+    assert [m.signature for m in cached_methods] == [m.signature for m in methods]
+    assert cached_classes[0] is not classes[0]
+
+
+def test_signature_store_round_trip(tmp_path):
+    data = _class_bytes('com/example/Hello', [('add', '(II)I')])
+    jar_path = tmp_path / 'lib.jar'
+    with zipfile.ZipFile(jar_path, 'w') as jar:
+        jar.writestr('com/example/Hello.class', data)
+        jar.writestr('com/example/Other.class', b'not a class')
+
+    config = {'parsers': {'jar': {'signature_cache_dir': str(tmp_path / 'cache'), 'memory_cache_entries': 0}}}
+    parser = JarParser(config)
+    file_hash = jar_sha256(str(jar_path))
+    parsed, source = parser.load_signatures(str(jar_path), file_hash)
+    assert source == 'parsed'
+    assert parsed.classes == [('com.example.Hello', 'Hello'), ('com.example.Other', 'Other')]
+
+    # 새 파서(다른 실행)는 class 파일을 읽지 않고 디스크 캐시에서 같은 결과를 얻는다
+    other_run = JarParser(config)
+    other_run.extract_signatures = None
+    cached, source = other_run.load_signatures(str(jar_path), file_hash)
+    assert source == 'disk'
+    assert cached == parsed
+    assert JarSignatureStore(str(tmp_path / 'cache')).load('0' * 64) is None
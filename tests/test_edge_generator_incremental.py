@@ -0,0 +1,122 @@
+import asyncio
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from phase1.database.metadata_engine import MetadataEngine
+from phase1.models.database import DatabaseManager, Project, File, Class, Edge
+from phase1.utils.edge_generator import EdgeGenerator
+
+
+def _edges(session, project_id):
+    return sorted(
+        (e.src_type, e.src_id, e.dst_id, e.edge_kind, e.src_file_id)
+        for e in session.query(Edge).filter(Edge.project_id == project_id)
+    )
+
+
+def test_regenerates_only_changed_source_files(tmp_path):
+    a_path = tmp_path / 'Alpha.java'
+    b_path = tmp_path / 'Beta.java'
+    a_path.write_text('package app;\nimport app.Beta;\npublic class Alpha {}\n')
+    b_path.write_text('package app;\npublic class Beta {}\n')
+
+    db_manager = DatabaseManager({'type': 'sqlite', 'sqlite': {'path': str(tmp_path / 'metadata.db')}})
+    db_manager.initialize()
+    session = db_manager.get_session()
+
+    project = Project(root_path=str(tmp_path), name='p')
+    other = Project(root_path='/other', name='q')
+    session.add_all([project, other])
+    session.flush()
+    fa = File(project_id=project.project_id, path=str(a_path), language='java')
+    fb = File(project_id=project.project_id, path=str(b_path), language='java')
+    session.add_all([fa, fb])
+    session.flush()
+    ca = Class(file_id=fa.file_id, fqn='app.Alpha', name='Alpha')
+    cb = Class(file_id=fb.file_id, fqn='app.Beta', name='Beta')
+    session.add_all([ca, cb])
+    session.add(Edge(project_id=other.project_id, src_type='class', src_id=1, dst_type='class', dst_id=2,
+                     edge_kind='import'))
+    session.commit()
+
+    EdgeGenerator(session, project.project_id).generate_all_edges()
+    session.commit()
+    full = _edges(session, project.project_id)
+    assert ('class', ca.class_id, cb.class_id, 'import', fa.file_id) in full
+
+    # Beta만 변경: Alpha에서 도출된 엣지는 그대로 유지되고 중복 생성되지 않음
+    generator = EdgeGenerator(session, project.project_id, changed_file_ids=[fb.file_id])
+    generator.generate_all_edges()
+    session.commit()
+    assert generator.edge_count == 0
+    assert _edges(session, project.project_id) == full
+
+    # Alpha 변경: Alpha의 엣지만 삭제 후 재생성
+    EdgeGenerator(session, project.project_id, changed_file_ids=[fa.file_id]).generate_all_edges()
+    session.commit()
+    assert _edges(session, project.project_id) == full
+
+    # 다른 프로젝트의 엣지는 삭제되지 않음
+    EdgeGenerator(session, project.project_id).generate_all_edges()
+    session.commit()
+    assert session.query(Edge).filter(Edge.project_id == other.project_id).count() == 1
+    session.close()
+
+
+def test_incremental_run_after_one_file_change_matches_full_run(tmp_path):
+    paths = {name: tmp_path / f'{name}.java' for name in ('Alpha', 'Beta', 'Gamma')}
+    paths['Alpha'].write_text('package app;\nimport app.Beta;\npublic class Alpha {}\n')
+    paths['Beta'].write_text('package app;\npublic class Beta {}\n')
+    paths['Gamma'].write_text('package app;\npublic class Gamma {}\n')
+
+    db_manager = DatabaseManager({'type': 'sqlite', 'sqlite': {'path': str(tmp_path / 'metadata.db')}})
+    db_manager.initialize()
+    session = db_manager.get_session()
+    project = Project(root_path=str(tmp_path), name='p')
+    session.add(project)
+    session.flush()
+    pid = project.project_id
+    files, classes = {}, {}
+    for name, path in paths.items():
+        files[name] = File(project_id=pid, path=str(path), language='java')
+        session.add(files[name])
+        session.flush()
+        classes[name] = Class(file_id=files[name].file_id, fqn=f'app.{name}', name=name)
+        session.add(classes[name])
+    session.flush()
+    # 파싱 단계에서 저장한 엣지 (src_file_id 없음): 엣지 생성기는 전체/증분 모두 유지해야 함
+    parse_edge = ('class', classes['Alpha'].class_id, classes['Gamma'].class_id, 'call', None)
+    session.add(Edge(project_id=pid, src_type='class', src_id=parse_edge[1], dst_type='class',
+                     dst_id=parse_edge[2], edge_kind='call'))
+    session.commit()
+    EdgeGenerator(session, pid).generate_all_edges()
+    session.commit()
+    assert parse_edge in _edges(session, pid)
+    session.close()
+
+    # Beta 변경: Beta를 가리키던 Alpha의 엣지도 purge로 삭제되므로 Alpha도 다시 생성해야 함
+    paths['Beta'].write_text('package app;\nimport app.Gamma;\npublic class Beta {}\n')
+    engine = MetadataEngine({}, db_manager)
+    dependents = asyncio.run(engine.find_edge_dependent_files(pid, [str(paths['Beta'])]))
+    assert dependents == {files['Alpha'].file_id}
+    asyncio.run(engine.purge_file_artifacts(pid, [str(paths['Beta'])]))
+
+    session = db_manager.get_session()
+    beta = File(project_id=pid, path=str(paths['Beta']), language='java')
+    session.add(beta)
+    session.flush()
+    session.add(Class(file_id=beta.file_id, fqn='app.Beta', name='Beta'))
+    session.commit()
+
+    EdgeGenerator(session, pid, changed_file_ids={beta.file_id} | dependents).generate_all_edges()
+    session.commit()
+    incremental = _edges(session, pid)
+    EdgeGenerator(session, pid).generate_all_edges()
+    session.commit()
+    assert _edges(session, pid) == incremental
+    assert parse_edge in incremental
+    assert {e[3] for e in incremental if e[4] == beta.file_id} == {'import'}
+    session.close()
@@ -0,0 +1,75 @@
+import hashlib
+import sys
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from phase1.models.database import DatabaseManager, Chunk, Embedding
+from phase1.llm.embedding_index import ChunkEmbeddingIndex, HashingEmbedder, IVFIndex, top_k_rows
+
+CONFIG = {'embedding': {'backend': 'hashing', 'hashing_dim': 256, 'batch_size': 2}}
+
+TEXTS = [
+    ('method', 'public List<Order> findOrdersByStatus(String status) { return orderMapper.selectByStatus(status); }'),
+    ('method', 'public void saveCustomer(Customer customer) { customerMapper.insertCustomer(customer); }'),
+    ('sql_unit', 'SELECT * FROM ORDERS WHERE STATUS = #{status}'),
+    ('sql_unit', 'INSERT INTO CUSTOMERS (NAME, EMAIL) VALUES (#{name}, #{email})'),
+    ('class', 'public class OrderService { private OrderMapper orderMapper; }'),
+]
+
+
+def _add_chunks(db_manager, texts, project_id=1):
+    session = db_manager.get_session()
+    for i, (target_type, text) in enumerate(texts):
+        session.add(Chunk(project_id=project_id, target_type=target_type, target_id=i + 1, content=text,
+                          hash=hashlib.md5(text.encode('utf-8')).hexdigest() if text else ''))
+    session.commit()
+    session.close()
+
+
+def test_incremental_update_reuses_vectors_by_hash_and_searches(tmp_path):
+    db_manager = DatabaseManager({'type': 'sqlite', 'sqlite': {'path': str(tmp_path / 'metadata.db')}})
+    db_manager.initialize()
+    _add_chunks(db_manager, TEXTS + [('method', TEXTS[0][1]), ('file', '')])   # 같은 내용 1개, 빈 청크 1개
+
+    index = ChunkEmbeddingIndex(db_manager, CONFIG)
+    assert index.update() == {'embedded': 5, 'reused': 1, 'skipped': 1}
+    assert index.store.matrix_path == str(tmp_path / 'chunk_vectors.hashing-256.f32')
+    assert index.update() == {'embedded': 0, 'reused': 0, 'skipped': 1}
+
+    results = index.search('order status select', top_k=3)
+    assert len(results) == 3 and results[0]['score'] >= results[-1]['score']
+    assert {r['chunk_id'] for r in results[:2]} == {1, 6}   # 같은 벡터 행을 공유
+    sql = index.search('insert customers email', top_k=1, target_types=['sql_unit'])
+    assert [(r['target_type'], r['chunk_id']) for r in sql] == [('sql_unit', 4)]
+
+    # 재분석으로 청크가 다시 만들어져도 해시가 같으면 다시 임베딩하지 않음 (새 프로세스 = 새 인덱스 객체)
+    session = db_manager.get_session()
+    session.query(Embedding).delete()
+    session.query(Chunk).delete()
+    session.commit()
+    session.close()
+    _add_chunks(db_manager, TEXTS[:2] + [('method', 'public void cancelOrder(Long orderId) {}')])
+    reopened = ChunkEmbeddingIndex(db_manager, CONFIG)
+    assert reopened.update() == {'embedded': 1, 'reused': 2, 'skipped': 0}
+    assert reopened.store.row_count == 6
+    assert reopened.search('find orders by status', top_k=1)[0]['target_id'] == 1
+
+
+def test_ivf_candidates_match_brute_force_top_hit():
+    embedder = HashingEmbedder(64)
+    texts = [f"table{i} column{i % 7} select{i % 3} value{i}" for i in range(200)]
+    matrix = embedder.embed(texts)
+    assert np.allclose(np.linalg.norm(matrix, axis=1), 1.0, atol=1e-5)
+    np.testing.assert_array_equal(embedder.embed(texts[:3]), HashingEmbedder(64).embed(texts[:3]))
+
+    rows = np.arange(len(texts))
+    ivf = IVFIndex(matrix, rows, nlist=8)
+    assert sorted(np.concatenate(ivf.lists).tolist()) == rows.tolist()
+    for text in texts[:20]:
+        query = embedder.embed([text])[0]
+        exact = top_k_rows(matrix, query, 1)
+        assert top_k_rows(matrix, query, 1, ivf.candidates(query, nprobe=8)) == exact
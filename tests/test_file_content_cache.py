@@ -0,0 +1,48 @@
+import hashlib
+import os
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from phase1.utils.file_content_cache import FileContentCache
+
+
+def test_cache_reads_once_and_tracks_mtime(tmp_path):
+    path = tmp_path / 'A.java'
+    raw = 'class A {\r\n  // 한글 주석\r\n}\r\n'.encode('cp949')
+    path.write_bytes(raw)
+
+    cache = FileContentCache()
+    first = cache.get(str(path))
+    assert first.text == 'class A {\n  // 한글 주석\n}\n'
+    assert first.encoding == 'cp949'
+    assert first.hash == hashlib.md5(raw).hexdigest()
+    assert first.loc == 3
+    assert cache.get(str(path)) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    path.write_text('class A {}\n', encoding='utf-8')
+    os.utime(path, ns=(os.stat(path).st_atime_ns, os.stat(path).st_mtime_ns + 1_000_000_000))
+    assert cache.get_text(str(path)) == 'class A {}\n'
+    assert cache.misses == 2
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    paths = []
+    for name in ('a', 'b', 'c'):
+        p = tmp_path / f'{name}.txt'
+        p.write_text(name * 1000)
+        paths.append(str(p))
+
+    cache = FileContentCache(max_bytes=2500)
+    cache.get(paths[0])
+    cache.get(paths[1])
+    cache.get(paths[0])  # a를 최근 사용으로 갱신
+    cache.get(paths[2])  # 예산 초과 → b 제거
+
+    assert cache.evictions == 1
+    assert cache.current_bytes <= cache.max_bytes
+    cache.get(paths[0])
+    assert cache.hits == 2
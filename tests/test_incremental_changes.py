@@ -0,0 +1,154 @@
+import asyncio
+import hashlib
+import json
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from phase1.database.metadata_engine import MetadataEngine
+from phase1.models.database import DatabaseManager, Project, File, Class, Method, SqlUnit, Join, Edge, Chunk
+from tests.test_llm_summary_dirty import _analyzer
+
+
+def _engine(tmp_path):
+    db_manager = DatabaseManager({'type': 'sqlite', 'sqlite': {'path': str(tmp_path / 'metadata.db')}})
+    db_manager.initialize()
+    return MetadataEngine({}, db_manager), db_manager
+
+
+def _store(session, project_id, path):
+    file_obj = File(project_id=project_id, path=str(path), language='.java',
+                    hash=hashlib.md5(path.read_bytes()).hexdigest(), loc=1,
+                    mtime=datetime.fromtimestamp(os.path.getmtime(path)))
+    session.add(file_obj)
+    session.flush()
+    return file_obj
+
+
+def test_check_file_changes_and_purge(tmp_path):
+    engine, db_manager = _engine(tmp_path)
+    src = tmp_path / 'src'
+    src.mkdir()
+    same, touched, modified, deleted, added = (src / f'{n}.java' for n in ('Same', 'Touched', 'Modified', 'Deleted', 'Added'))
+    for f in (same, touched, modified, deleted):
+        f.write_text(f'class {f.stem} {{}}\n')
+
+    session = db_manager.get_session()
+    project = Project(root_path=str(src), name='p')
+    session.add(project)
+    session.flush()
+    pid = project.project_id
+    rows = {f: _store(session, pid, f) for f in (same, touched, modified, deleted)}
+    cls = Class(file_id=rows[modified].file_id, fqn='Modified', name='Modified')
+    session.add(cls)
+    session.flush()
+    method = Method(class_id=cls.class_id, name='run')
+    sql = SqlUnit(file_id=rows[deleted].file_id, stmt_id='q', stmt_kind='select')
+    session.add_all([method, sql])
+    session.flush()
+    session.add_all([
+        Join(sql_id=sql.sql_id, l_table='A', l_col='ID', op='=', r_table='B', r_col='ID'),
+        Edge(project_id=pid, src_type='method', src_id=method.method_id, dst_type='class',
+             dst_id=cls.class_id, edge_kind='call', confidence=1.0),
+        Chunk(target_type='class', target_id=cls.class_id, content='x'),
+        Chunk(target_type='file', target_id=rows[same].file_id, content='y'),
+    ])
+    session.commit()
+    session.close()
+
+    os.utime(touched, (os.path.getatime(touched), os.path.getmtime(touched) + 10))
+    modified.write_text('class Modified { void run() {} }\n')
+    os.utime(modified, (os.path.getatime(modified), os.path.getmtime(modified) + 10))
+    deleted.unlink()
+    added.write_text('class Added {}\n')
+
+    current = [str(f) for f in (same, touched, modified, added)]
+    changes = dict(asyncio.run(engine.check_file_changes(pid, current)))
+    assert changes == {str(modified): 'modified', str(added): 'added', str(deleted): 'deleted'}
+
+    purged = asyncio.run(engine.purge_file_artifacts(pid, [str(modified), str(deleted)]))
+    assert purged == 2
+
+    session = db_manager.get_session()
+    assert {f.path for f in session.query(File)} == {str(same), str(touched)}
+    for model in (Class, Method, SqlUnit, Join, Edge):
+        assert session.query(model).count() == 0
+    assert [c.content for c in session.query(Chunk)] == ['y']
+    session.close()
+
+    # 두 번째 확인에서는 mtime만 바뀐 파일도 변경 없음으로 처리
+    assert asyncio.run(engine.check_file_changes(pid, [str(same), str(touched)])) == []
+
+
+CALLEE = """package app;
+
+public class Callee {
+    public int compute(int x) {
+        return x + 1;
+    }
+}
+"""
+
+CALLER = """package app;
+
+public class Caller {
+    private Callee callee = new Callee();
+
+    public int run() {
+        return callee.compute(2);
+    }
+}
+"""
+
+
+def test_changing_callee_file_keeps_incoming_call_edges(tmp_path):
+    engine, db_manager = _engine(tmp_path)
+    callee, caller = tmp_path / 'Callee.java', tmp_path / 'Caller.java'
+    callee.write_text(CALLEE, encoding='utf-8')
+    caller.write_text(CALLER, encoding='utf-8')
+    session = db_manager.get_session()
+    project = Project(root_path=str(tmp_path), name='p')
+    session.add(project)
+    session.commit()
+    pid = project.project_id
+    session.close()
+
+    analyzer = _analyzer(db_manager)
+    analyzer.metadata_engine = engine
+    asyncio.run(analyzer._analyze_files([str(callee), str(caller)], pid))
+
+    def method_id(name):
+        with db_manager.get_auto_commit_session() as s:
+            return s.query(Method.method_id).filter(Method.name == name).scalar()
+
+    # 파싱 단계 호출 엣지 (src_file_id 없음): run() → compute()
+    session = db_manager.get_session()
+    session.add(Edge(project_id=pid, src_type='method', src_id=method_id('run'), dst_type='method', dst_id=None,
+                     edge_kind='call', confidence=0.6,
+                     meta=json.dumps({'called_name': 'compute', 'callee_qualifier_type': 'Callee'})))
+    session.commit()
+    session.close()
+    asyncio.run(engine.build_dependency_graph(pid))
+
+    def call_edge():
+        with db_manager.get_auto_commit_session() as s:
+            return s.query(Edge.dst_id, Edge.confidence).filter(Edge.edge_kind == 'call').one()
+
+    assert call_edge() == (method_id('compute'), 0.8)
+    old_compute = method_id('compute')
+
+    # 호출되는 파일만 변경 → 증분 경로 (정리 → 재파싱 → 호출 해결)
+    callee.write_text(CALLEE.replace('x + 1', 'x + 2'), encoding='utf-8')
+    os.utime(callee, (os.path.getatime(callee), os.path.getmtime(callee) + 10))
+    changed, _removed, dependents = asyncio.run(analyzer._filter_changed_files([str(callee), str(caller)], pid))
+    assert changed == [str(callee)] and dependents == set()
+    assert call_edge() == (None, 0.8)   # 호출 파일은 다시 파싱하지 않으므로 엣지를 지우지 않고 끊기만 함
+    asyncio.run(analyzer._analyze_files(changed, pid))
+    asyncio.run(engine.build_dependency_graph(pid))
+
+    assert method_id('compute') != old_compute
+    assert call_edge() == (method_id('compute'), 0.8)
@@ -0,0 +1,77 @@
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from phase1.parsers.jsp.jsp_parser import JSPParser
+from phase1.parsers.jsp.jsp_scanner import scan_jsp
+
+PAGE = """<%@ page contentType="text/html; charset=UTF-8" %>
+<%@ taglib prefix="c" uri="http://java.sun.com/jsp/jstl/core" %>
+<%-- <jsp:include page="commented.jsp"/> --%>
+<!-- <% String hidden = "x"; %> -->
+<%! private int count = 0; %>
+<% String sql = "SELECT * FROM ORDERS WHERE id = ?"; if (a > b) { count++; } %>
+<jsp:include page="<%= header %>" flush="true"/>
+<jsp:forward page="next.jsp"/>
+<a href="<c:url value='/order/list'/>">목록</a>
+<input type="text" title="Select from list"/>
+<c:if test="${count > 0}">
+  <c:forEach var="user" items="${users}">
+    <td>${user.name}</td>
+  </c:forEach>
+  <p>${user.email}</p>
+</c:if>
+<c:choose><c:otherwise>-</c:otherwise></c:choose>
+<ui:grid id="orders"/>
+"""
+
+
+def test_scanner_tokenizes_every_element_kind_in_one_pass():
+    scan = scan_jsp(PAGE)
+    kinds = [token.kind for token in scan.tokens]
+    assert kinds.count('directive') == 2
+    assert kinds.count('declaration') == 1
+    assert kinds.count('scriptlet') == 1          # 주석 안의 스크립틀릿은 제외
+    assert 'commented.jsp' not in scan.code and 'hidden' not in scan.code
+
+    # 속성 안의 표현식/접두사 태그는 별도 토큰이고, 바깥 태그는 그 안의 '>'에서 끝나지 않음
+    include = next(t for t in scan.tokens if t.kind == 'tag' and t.name == 'include')
+    assert include.text == '<jsp:include page="<%= header %>" flush="true"/>' and include.self_closing
+    anchor = next(t for t in scan.tokens if t.kind == 'tag' and t.name == 'a')
+    assert anchor.text.endswith("/order/list'/>\">")
+    assert any(t.kind == 'tag' and t.prefix == 'c' and t.name == 'url' for t in scan.tokens)
+    c_if = next(t for t in scan.tokens if t.kind == 'tag' and t.name == 'if')
+    assert c_if.text == '<c:if test="${count > 0}">'
+
+    el_scope = {t.body: t.in_foreach for t in scan.tokens if t.kind == 'el'}
+    assert el_scope == {'count > 0': False, 'users': False, 'user.name': True, 'user.email': False}
+
+
+def test_lexer_and_regex_paths_agree_on_extracted_elements():
+    lexer = JSPParser({'parsers': {'jsp': {'scanner': 'lexer'}}}).parse_content(PAGE, {})
+    regex = JSPParser({'parsers': {'jsp': {'scanner': 'regex'}}}).parse_content(PAGE, {})
+
+    assert [(a['type'], a['page']) for a in lexer['jsp_actions']] == [('include', '<%= header %>'), ('forward', 'next.jsp')]
+    assert [d['type'] for d in lexer['jsp_directives']] == [d['type'] for d in regex['jsp_directives']]
+    assert lexer['java_code'] == regex['java_code']
+    # SQL은 스크립트 요소에서만 추출 (HTML 속성 문자열 오탐 제외)
+    assert [q['sql'] for q in lexer['sql_units']] == ['SELECT * FROM ORDERS WHERE id = ?']
+    assert 'Select from list' in [q['sql'] for q in regex['sql_units']]
+    # 기존 경로의 중복(같은 정규식 2회 적용) 없이 한 번씩만 추출
+    assert len(lexer['jsp_declarations']) == 1 and len(regex['jsp_declarations']) == 2
+    assert {(t['library'], t['tag']) for t in lexer['jstl_tags']} >= {('core', 'url'), ('core', 'if'), ('core', 'otherwise')}
+    assert [t['tag'] for t in lexer['custom_tags']] == ['grid']
+    # forEach 밖의 user 참조만 오류
+    assert [e['expression'] for e in lexer['jsp_errors']] == ['user.email']
+
+
+def test_unclosed_scriptlets_and_el_do_not_rescan_to_the_end():
+    # 닫히지 않은 <% / ${ 마다 끝까지 '%>' / '}'를 다시 찾지 않음 (예전에는 n=8000에서 수 초)
+    for unit in ('<% x ', '${ a ', '<a x=${ > '):
+        scan = scan_jsp('<p>${ok}</p>' + unit * 20000)
+        assert [t.text for t in scan.tokens] == ['<p>', '${ok}', '</p>']
+    # 마지막 종료 문자열 앞의 요소는 그대로 토큰
+    scan = scan_jsp('<% a %> <% b ${c} ${d')
+    assert [(t.kind, t.text) for t in scan.tokens] == [('scriptlet', '<% a %>'), ('el', '${c}')]
@@ -0,0 +1,52 @@
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from visualize.renderers.layout_algorithms import CollisionDetector, ForceDirectedLayout, NodePosition
+
+
+def test_barnes_hut_repulsion_approximates_exact_forces():
+    layout = ForceDirectedLayout()
+    rng = np.random.RandomState(0)
+    pos = np.vstack([rng.normal(size=(1500, 2)) * 3000, rng.normal(size=(500, 2)) * 100 + 5000])
+    widths = np.full(len(pos), 150.0)
+
+    exact = layout._exact_repulsion(pos, widths)
+    approx = layout._barnes_hut_repulsion(pos, widths)
+
+    error = np.linalg.norm(exact - approx, axis=1) / np.linalg.norm(exact, axis=1)
+    assert np.median(error) < 0.05
+
+
+def test_layout_uses_barnes_hut_above_threshold():
+    nodes = [{'id': f't{i}', 'label': f'TABLE_{i}'} for i in range(60)]
+    edges = [{'source': f't{i}', 'target': f't{(i + 1) % 60}', 'confidence': 0.8} for i in range(60)]
+
+    positions = ForceDirectedLayout({'iterations': 30, 'exact_threshold': 10}).calculate_layout(nodes, edges)
+
+    assert set(positions) == {node['id'] for node in nodes}
+    assert all(np.isfinite([p.x, p.y]).all() for p in positions.values())
+
+
+def test_grid_collision_detection_matches_pairwise_scan():
+    rnd = random.Random(3)
+    positions = {
+        f'n{i}': NodePosition(rnd.uniform(0, 3000), rnd.uniform(0, 3000), f'n{i}',
+                              rnd.uniform(50, 400), rnd.uniform(40, 200))
+        for i in range(300)
+    }
+    detector = CollisionDetector(padding=20)
+    ids = list(positions)
+    expected = [
+        (ids[i], ids[j])
+        for i in range(len(ids)) for j in range(i + 1, len(ids))
+        if detector._nodes_overlap(positions[ids[i]], positions[ids[j]])
+    ]
+
+    assert expected
+    assert detector.detect_collisions(positions) == expected
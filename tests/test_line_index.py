@@ -0,0 +1,34 @@
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from phase1.utils.chunk_location_tracker import ChunkLocationTracker
+from phase1.utils.line_index import LineIndex, line_index_for
+
+
+def test_line_index_matches_prefix_count():
+    for content in ['', 'a', '\n', 'ab\ncd\n\nef', '\n\nx\n']:
+        index = LineIndex(content)
+        assert index.line_count == content.count('\n') + 1
+        for position in range(len(content) + 1):
+            assert index.line_of(position) == content[:position].count('\n') + 1
+            assert index.column_of(position) == position - content.rfind('\n', 0, position)
+    assert line_index_for('a\nb') is line_index_for('a\nb')
+
+
+def test_chunk_location_tracker_finds_declarations_by_line(tmp_path):
+    source = tmp_path / 'OrderService.java'
+    source.write_text('package app;\n\npublic class OrderService {\n\n    public void save(Order order) {\n'
+                      '        dao.insert(order);\n    }\n}\n', encoding='utf-8')
+    mapper = tmp_path / 'OrderMapper.xml'
+    mapper.write_text('<mapper>\n  <select\n    id="findOrder">\n    SELECT 1\n  </select>\n</mapper>\n', encoding='utf-8')
+
+    tracker = ChunkLocationTracker(db_session=None)
+    method = tracker._find_method_in_file(str(source), 'save')
+    assert (method.start_line, method.end_line) == (5, 7)
+    assert tracker._find_class_in_file(str(source), 'OrderService', 'app.OrderService').start_line == 3
+    # 여러 줄에 걸친 시작 태그도 태그가 시작된 줄로
+    assert tracker._find_sql_unit_in_xml(str(mapper), 'findOrder', 'select').start_line == 2
+    assert tracker._find_method_in_file(str(source), 'missing') is None
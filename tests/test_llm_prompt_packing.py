@@ -0,0 +1,100 @@
+import json
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from phase1.llm.prompt_packing import PackingConfig, pack_items, parse_packed_response
+from phase1.llm.summarizer import CodeSummarizer
+from phase1.models.database import DatabaseManager, Project, File, Class, Method
+from tests.test_llm_scheduler import FakeOllamaServer
+
+
+def test_pack_items_respects_budget_groups_and_large_items():
+    config = PackingConfig(enabled=True, max_items=3, max_prompt_tokens=10, max_item_tokens=6)
+    items = [('m', 2), ('m', 2), ('m', 2), ('m', 2), ('m', 9), ('m', 5), ('m', 5), ('s', 1)]
+    batches = list(pack_items(items, cost=lambda item: item[1], config=config, group=lambda item: item[0]))
+    assert batches == [
+        [('m', 2), ('m', 2), ('m', 2)],    # max_items
+        [('m', 9)],                        # max_item_tokens 초과 → 단건
+        [('m', 2), ('m', 5)],              # 토큰 예산
+        [('m', 5)],
+        [('s', 1)],                        # 종류가 바뀌면 새 묶음
+    ]
+
+
+def test_parse_packed_response_validates_entries():
+    response = '```json\n[{"id": 0, "summary": "첫째"}, {"id": 0, "summary": "중복"}, {"id": 5, "summary": "범위 밖"}, {"id": "2", "summary": " 셋째 "}, {"id": 1, "summary": ""}]\n```'
+    assert parse_packed_response(response, 3) == {0: '첫째', 2: '셋째'}
+    with pytest.raises(ValueError):
+        parse_packed_response('요약할 수 없습니다', 3)
+    with pytest.raises(ValueError):
+        parse_packed_response('[{"id": 0}]', 1)
+
+
+def _packed_reply(messages):
+    """묶음 프롬프트에는 JSON 배열로, 단건 프롬프트에는 일반 텍스트로 응답 (id=1은 일부러 누락)"""
+    ids = [int(i) for i in re.findall(r'### \[id=(\d+)\]', messages[-1]['content'])]
+    if not ids:
+        return '단건 요약'
+    return json.dumps([{'id': i, 'summary': f'묶음 요약 {i}'} for i in ids if i != 1], ensure_ascii=False)
+
+
+def test_packed_method_summaries_use_fewer_requests(tmp_path):
+    lines = ['public class Calc {']
+    spans = []
+    for i in range(10):
+        spans.append((f'op{i}', len(lines) + 1))
+        lines += [f'    public int op{i}() {{', f'        return {i};', '    }']
+    lines.append('}')
+    source = tmp_path / 'Calc.java'
+    source.write_text('\n'.join(lines), encoding='utf-8')
+
+    db_config = {'type': 'sqlite', 'sqlite': {'path': str(tmp_path / 'metadata.db')}}
+    db_manager = DatabaseManager(db_config)
+    db_manager.initialize()
+    session = db_manager.get_session()
+    project = Project(root_path=str(tmp_path), name='p')
+    session.add(project)
+    session.flush()
+    file_obj = File(project_id=project.project_id, path=str(source), language='java', hash='h')
+    session.add(file_obj)
+    session.flush()
+    cls = Class(file_id=file_obj.file_id, project_id=project.project_id, fqn='Calc', name='Calc')
+    session.add(cls)
+    session.flush()
+    for name, start in spans:
+        session.add(Method(class_id=cls.class_id, project_id=project.project_id, name=name,
+                           start_line=start, end_line=start + 2))
+    session.commit()
+    project_id = project.project_id
+    session.close()
+
+    server = FakeOllamaServer(delay=0, reply=_packed_reply)
+    try:
+        config = {
+            'database': {'project': db_config},
+            'llm': {'provider': 'ollama', 'ollama_host': server.url,
+                    'packing': {'enabled': True, 'max_items': 5}},
+            'llm_cache': {'enabled': False},
+        }
+        summarizer = CodeSummarizer(config)
+        summarizer.summarize_file = lambda file: '파일 요약'
+        stored = summarizer.process_project_summaries(project_id)
+    finally:
+        server.close()
+
+    assert stored == {'file': 1, 'method': 10, 'sql_unit': 0}
+    # 묶음 2회 + 각 묶음에서 누락된 id=1 항목의 단건 보완 2회
+    assert server.calls == 4
+
+    session = db_manager.get_session()
+    summaries = {m.name: m.llm_summary for m in session.query(Method)}
+    session.close()
+    assert summaries['op0'] == '묶음 요약 0'
+    assert summaries['op1'] == '단건 요약'
+    assert summaries['op6'] == '단건 요약'
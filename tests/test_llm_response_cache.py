@@ -0,0 +1,91 @@
+import sys
+import threading
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from phase1.llm import enricher
+from phase1.llm.client import OllamaClient, configured_model_name
+from phase1.llm.relationship_analyzer import RelationshipAnalyzer
+from phase1.llm.response_cache import LLMResponseCache, make_cache_key, client_model_name, template_id
+
+
+def test_key_ignores_line_endings_and_trailing_whitespace():
+    assert make_cache_key('m', 't', 'SELECT 1\r\nFROM DUAL  \r\n') == make_cache_key('m', 't', 'SELECT 1\nFROM DUAL')
+    assert make_cache_key('m', 't', 'SELECT 1') != make_cache_key('m2', 't', 'SELECT 1')
+    assert make_cache_key('m', 't', 'SELECT 1') != make_cache_key('m', 't2', 'SELECT 1')
+
+
+def test_size_bounded_lru_eviction_and_persistence(tmp_path):
+    path = str(tmp_path / 'llm_cache.db')
+    cache = LLMResponseCache(path, max_bytes=300)
+    for i in range(5):
+        cache.put(f'k{i}', 'x' * 50)
+    cache.get('k0')  # 최근 사용으로 갱신
+    cache.put('k5', 'y' * 100)
+
+    stats = cache.stats()
+    assert stats['bytes'] <= 300 * 0.9 and stats['evictions'] >= 1
+    assert cache.get('k0') is not None
+    assert cache.get('k1') is None
+    cache.close()
+
+    reopened = LLMResponseCache(path, max_bytes=300)
+    assert reopened.get('k5') == 'y' * 100
+    assert reopened.stats()['bytes'] == stats['bytes']
+    reopened.close()
+
+
+def test_identical_requests_reach_model_once(tmp_path):
+    cache = LLMResponseCache(str(tmp_path / 'llm_cache.db'))
+
+    class FakeAssistant:
+        model = 'fake'
+        calls = 0
+
+        def get_completion(self, prompt, max_tokens, temperature):
+            FakeAssistant.calls += 1
+            time.sleep(0.05)
+            return '[]'
+
+    analyzer = RelationshipAnalyzer(FakeAssistant(), response_cache=cache)
+    sql = 'SELECT * FROM A JOIN B ON A.ID = B.A_ID'
+    threads = [threading.Thread(target=analyzer.analyze_sql_join_relationships, args=(sql, 'q1')) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    analyzer.analyze_sql_join_relationships(sql, 'q1')
+
+    assert FakeAssistant.calls == 1
+    assert cache.stats()['hits'] >= 4
+    cache.close()
+
+
+def test_warm_cache_answers_without_client_and_tracks_template_text(tmp_path, monkeypatch):
+    created = []
+
+    class FakeClient:
+        def chat(self, messages, **kwargs):
+            return f"answer {len(created)}"
+
+    def fake_get_client(provider=None):
+        created.append(provider)
+        return FakeClient()
+
+    monkeypatch.setattr(enricher, 'get_client', fake_get_client)
+    cache = LLMResponseCache(str(tmp_path / 'llm_cache.db'))
+    first = enricher.generate_text('요약해라', 'SELECT 1', provider='ollama', cache=cache)
+    # 캐시 적중 시 클라이언트를 만들지 않음 (Ollama 서버가 없어도 응답)
+    assert enricher.generate_text('요약해라', 'SELECT 1', provider='ollama', cache=cache) == first
+    assert len(created) == 1
+    # 시스템 프롬프트 문구를 고치면 다시 호출
+    assert enricher.generate_text('한 줄로 요약해라', 'SELECT 1', provider='ollama', cache=cache) != first
+    assert len(created) == 2
+    cache.close()
+
+    assert template_id('t', 'a') != template_id('t', 'b') and template_id('t', 'a').startswith('t@')
+    config = {'provider': 'ollama', 'ollama_model': 'qwen2:7b'}
+    assert configured_model_name(config=config) == client_model_name(OllamaClient({'ollama_model': 'qwen2:7b'}))
@@ -0,0 +1,122 @@
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from phase1.llm.scheduler import TokenRateLimiter
+from phase1.llm.summarizer import CodeSummarizer
+from phase1.models.database import DatabaseManager, Project, File, SqlUnit
+
+
+class FakeOllamaServer:
+    """/api/show, /api/chat만 흉내 내는 프로세스 내 모델 서버 (처음 fail_first개 요청은 503)"""
+
+    def __init__(self, fail_first=0, delay=0.05, reply=None):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+        self.fail_first = fail_first
+        # reply(요청 메시지 목록) -> 응답 내용, 없으면 고정 응답
+        reply = reply or (lambda messages: '요약 결과')
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, status, body):
+                data = json.dumps(body).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                if self.path == '/api/show':
+                    return self._reply(200, {})
+                with server.lock:
+                    server.calls += 1
+                    if server.calls <= server.fail_first:
+                        return self._reply(503, {'error': 'busy'})
+                    server.active += 1
+                    server.peak = max(server.peak, server.active)
+                time.sleep(delay)
+                with server.lock:
+                    server.active -= 1
+                messages = json.loads(body or b'{}').get('messages', [])
+                self._reply(200, {'message': {'content': reply(messages)}})
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def test_project_summaries_run_concurrently_over_whole_project(tmp_path):
+    db_path = tmp_path / 'metadata.db'
+    db_config = {'type': 'sqlite', 'sqlite': {'path': str(db_path)}}
+    db_manager = DatabaseManager(db_config)
+    db_manager.initialize()
+    session = db_manager.get_session()
+    project = Project(root_path=str(tmp_path), name='p')
+    session.add(project)
+    session.flush()
+    for i in range(12):
+        source = tmp_path / f'note{i}.txt'
+        source.write_text(f'line {i}', encoding='utf-8')
+        session.add(File(project_id=project.project_id, path=str(source), language='text'))
+    mapper = tmp_path / 'OrderMapper.xml'
+    mapper.write_text('<mapper><select id="selectOrder">SELECT * FROM ORDERS</select></mapper>', encoding='utf-8')
+    mapper_file = File(project_id=project.project_id, path=str(mapper), language='xml')
+    session.add(mapper_file)
+    session.flush()
+    session.add(SqlUnit(file_id=mapper_file.file_id, project_id=project.project_id,
+                        mapper_ns='app.OrderMapper', stmt_id='selectOrder', stmt_kind='select'))
+    session.commit()
+    session.close()
+
+    server = FakeOllamaServer(fail_first=2)
+    try:
+        config = {
+            'database': {'project': db_config},
+            'llm': {'provider': 'ollama', 'ollama_host': server.url,
+                    'scheduler': {'max_concurrency': 6, 'backoff_base': 0.01}},
+            'llm_cache': {'enabled': False},
+        }
+        summarizer = CodeSummarizer(config)
+        stored = summarizer.process_project_summaries(project.project_id, batch_size=5)
+    finally:
+        server.close()
+
+    # batch_size(5)개에서 멈추지 않고 프로젝트 전체를 처리
+    assert stored == {'file': 13, 'method': 0, 'sql_unit': 1}
+    assert server.peak > 1
+    assert summarizer.scheduler.stats['retries'] == 2
+
+    session = db_manager.get_session()
+    assert session.query(File).filter(File.llm_summary.is_(None)).count() == 0
+    session.close()
+
+
+def test_token_rate_limiter_waits_for_refill():
+    now = [0.0]
+
+    def sleep(seconds):
+        now[0] += seconds
+
+    limiter = TokenRateLimiter(600, clock=lambda: now[0], sleep=sleep)  # 초당 10토큰
+    assert limiter.acquire(600) == 0.0
+    assert limiter.acquire(50) == 5.0
+    # 한도보다 큰 요청은 버킷이 가득 찰 때까지만 대기
+    assert limiter.acquire(10000) == 60.0
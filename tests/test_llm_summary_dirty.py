@@ -0,0 +1,170 @@
+import asyncio
+import logging
+import os
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from phase1.core.parse_stage import build_parsers
+from phase1.database.metadata_engine import MetadataEngine
+from phase1.llm.summarizer import CodeSummarizer
+from phase1.main import SourceAnalyzer
+from phase1.models.database import DatabaseManager, Project, File, Class, Method
+from phase1.utils.file_content_cache import FileContentCache
+from tests.test_llm_scheduler import FakeOllamaServer
+
+JAVA_SOURCE = """package app;
+
+public class OrderService {
+    public int count() {
+        return 1;
+    }
+
+    public int total() {
+        return 2;
+    }
+
+    public int tax() {
+        return 3;
+    }
+}
+"""
+
+
+def _summarized(summarizer):
+    """요약 함수를 감싸 실제로 요약한 항목 이름을 기록"""
+    calls = []
+    summarize_file, summarize_method = summarizer.summarize_file, summarizer.summarize_method
+
+    def file_spy(file):
+        calls.append(Path(file.path).name)
+        return summarize_file(file)
+
+    def method_spy(method, method_code=None):
+        calls.append(method.name)
+        return summarize_method(method, method_code)
+
+    summarizer.summarize_file, summarizer.summarize_method = file_spy, method_spy
+    return calls
+
+
+def test_only_changed_spans_are_resummarized(tmp_path):
+    source = tmp_path / 'OrderService.java'
+    source.write_text(JAVA_SOURCE, encoding='utf-8')
+    db_config = {'type': 'sqlite', 'sqlite': {'path': str(tmp_path / 'metadata.db')}}
+    db_manager = DatabaseManager(db_config)
+    db_manager.initialize()
+    session = db_manager.get_session()
+    project = Project(root_path=str(tmp_path), name='p')
+    session.add(project)
+    session.flush()
+    file_obj = File(project_id=project.project_id, path=str(source), language='java', hash='v1')
+    session.add(file_obj)
+    session.flush()
+    cls = Class(file_id=file_obj.file_id, project_id=project.project_id, fqn='app.OrderService', name='OrderService')
+    session.add(cls)
+    session.flush()
+    for name, start in (('count', 4), ('total', 8), ('tax', 12)):
+        session.add(Method(class_id=cls.class_id, project_id=project.project_id, name=name,
+                           start_line=start, end_line=start + 2))
+    session.commit()
+    project_id, file_id = project.project_id, file_obj.file_id
+    session.close()
+
+    server = FakeOllamaServer(delay=0)
+    try:
+        config = {
+            'database': {'project': db_config},
+            'llm': {'provider': 'ollama', 'ollama_host': server.url},
+            'llm_cache': {'enabled': False},
+        }
+        summarizer = CodeSummarizer(config)
+        calls = _summarized(summarizer)
+        assert summarizer.process_project_summaries(project_id) == {'file': 1, 'method': 3, 'sql_unit': 0}
+        assert sorted(calls) == ['OrderService.java', 'count', 'tax', 'total']
+
+        # 소스가 그대로면 LLM을 호출하지 않음
+        calls.clear()
+        requests_before = server.calls
+        assert summarizer.process_project_summaries(project_id) == {'file': 0, 'method': 0, 'sql_unit': 0}
+        assert calls == [] and server.calls == requests_before
+
+        # total() 한 줄만 변경 (재분석으로 파일 해시도 갱신됨)
+        source.write_text(JAVA_SOURCE.replace('return 2;', 'return 20;'), encoding='utf-8')
+        session = db_manager.get_session()
+        session.query(File).filter(File.file_id == file_id).update({'hash': 'v2'})
+        # 해시 도입 이전에 저장된 요약은 다시 요약하지 않고 해시만 기록
+        session.query(Method).filter(Method.name == 'tax').update({'llm_summary_hash': None})
+        session.commit()
+        session.close()
+
+        calls.clear()
+        assert summarizer.process_project_summaries(project_id) == {'file': 1, 'method': 1, 'sql_unit': 0}
+        assert sorted(calls) == ['OrderService.java', 'total']
+    finally:
+        server.close()
+
+    session = db_manager.get_session()
+    hashes = {m.name: m.llm_summary_hash for m in session.query(Method)}
+    assert all(hashes.values()) and len(set(hashes.values())) == 3
+    session.close()
+
+
+def _analyzer(db_manager):
+    """파싱/저장/증분 정리 경로만 사용하는 SourceAnalyzer (설정 파일 없이 구성)"""
+    config = {'processing': {'max_workers': 1}}
+    analyzer = SourceAnalyzer.__new__(SourceAnalyzer)
+    analyzer.config = config
+    analyzer.logger = logging.getLogger('test')
+    analyzer.db_manager = db_manager
+    analyzer.metadata_engine = MetadataEngine({}, db_manager)
+    analyzer.parsers = build_parsers(config)
+    analyzer.file_cache = FileContentCache(max_bytes=0)
+    analyzer._bulk_session = analyzer._bulk_writer = None
+    return analyzer
+
+
+def test_incremental_purge_and_reparse_keeps_unchanged_method_summaries(tmp_path):
+    source = tmp_path / 'OrderService.java'
+    source.write_text(JAVA_SOURCE, encoding='utf-8')
+    db_config = {'type': 'sqlite', 'sqlite': {'path': str(tmp_path / 'metadata.db')}}
+    db_manager = DatabaseManager(db_config)
+    db_manager.initialize()
+    session = db_manager.get_session()
+    project = Project(root_path=str(tmp_path), name='p')
+    session.add(project)
+    session.commit()
+    project_id = project.project_id
+    session.close()
+
+    analyzer = _analyzer(db_manager)
+    asyncio.run(analyzer._analyze_files([str(source)], project_id))
+    db_manager.backfill_project_ids()
+
+    server = FakeOllamaServer(delay=0)
+    try:
+        config = {
+            'database': {'project': db_config},
+            'llm': {'provider': 'ollama', 'ollama_host': server.url},
+            'llm_cache': {'enabled': False},
+        }
+        summarizer = CodeSummarizer(config)
+        calls = _summarized(summarizer)
+        assert summarizer.process_project_summaries(project_id)['method'] == 3
+
+        # total() 한 줄만 변경 후 실제 증분 경로(변경 감지 → purge → 재파싱 → 요약 복원)로 재분석
+        source.write_text(JAVA_SOURCE.replace('return 2;', 'return 20;'), encoding='utf-8')
+        os.utime(source, (os.path.getatime(source), os.path.getmtime(source) + 10))
+        changed, _removed, _dependents = asyncio.run(analyzer._filter_changed_files([str(source)], project_id))
+        assert changed == [str(source)]
+        asyncio.run(analyzer._analyze_files(changed, project_id))
+        assert asyncio.run(analyzer.metadata_engine.restore_llm_summaries(project_id)) == 3
+        db_manager.backfill_project_ids()
+
+        calls.clear()
+        assert summarizer.process_project_summaries(project_id) == {'file': 1, 'method': 1, 'sql_unit': 0}
+        assert sorted(calls) == ['OrderService.java', 'total']
+    finally:
+        server.close()
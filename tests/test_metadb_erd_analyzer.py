@@ -0,0 +1,60 @@
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from phase1.models.database import DatabaseManager, DbTable, DbColumn, DbPk
+from phase1.metadb_erd_analyzer import MetaDBERDAnalyzer, get_erd_structure
+
+
+def _make_metadb(tmp_path):
+    db_manager = DatabaseManager({'type': 'sqlite', 'sqlite': {'path': str(tmp_path / 'metadata.db')}})
+    db_manager.initialize()
+    session = db_manager.get_session()
+    for table_id, owner, name in [(1, 'SAMPLE', 'ORDERS'), (2, 'SAMPLE', 'CUSTOMERS'), (3, 'HR', 'CUSTOMERS'),
+                                  (4, None, 'USERS')]:
+        session.add(DbTable(table_id=table_id, owner=owner, table_name=name, status='VALID'))
+    session.flush()
+    session.add_all([
+        DbColumn(table_id=1, column_name='ORDER_ID', data_type='NUMBER', nullable='N'),
+        DbColumn(table_id=1, column_name='CUSTOMER_ID', data_type='NUMBER', nullable='N'),
+        DbColumn(table_id=1, column_name='USERID', data_type='NUMBER', nullable='Y'),
+        DbColumn(table_id=2, column_name='CUSTOMER_ID', data_type='NUMBER', nullable='N'),
+        DbColumn(table_id=3, column_name='CUSTOMER_ID', data_type='NUMBER', nullable='N'),
+        DbColumn(table_id=4, column_name='USER_ID', data_type='NUMBER', nullable='N'),
+        DbPk(table_id=1, column_name='ORDER_ID', pk_pos=1),
+        DbPk(table_id=2, column_name='CUSTOMER_ID', pk_pos=1),
+        DbPk(table_id=4, column_name='USER_ID', pk_pos=1),
+    ])
+    session.commit()
+    session.close()
+
+
+def test_analyzer_groups_columns_and_infers_foreign_keys(tmp_path):
+    _make_metadb(tmp_path)
+    erd = MetaDBERDAnalyzer(str(tmp_path)).analyze_erd()
+
+    tables = {table.full_name: table for table in erd.tables}
+    assert list(tables) == ['USERS', 'HR.CUSTOMERS', 'SAMPLE.CUSTOMERS', 'SAMPLE.ORDERS']
+    orders = tables['SAMPLE.ORDERS']
+    assert [c.name for c in orders.columns] == ['CUSTOMER_ID', 'ORDER_ID', 'USERID']
+    assert orders.primary_keys == ['ORDER_ID']
+    # 같은 이름의 테이블이 여러 스키마에 있으면 정렬 순서상 첫 테이블을 참조
+    assert orders.foreign_keys == [('CUSTOMER_ID', 'HR.CUSTOMERS', 'CUSTOMER_ID'), ('USERID', 'USERS', 'USERID')]
+    # owner가 없는 테이블도 table_id로 컬럼/PK를 가져옴
+    assert [c.name for c in tables['USERS'].columns] == ['USER_ID'] and tables['USERS'].primary_keys == ['USER_ID']
+    assert (erd.total_tables, erd.total_columns, erd.total_relationships) == (4, 6, 3)
+
+
+def test_filters_are_pushed_down_and_structure_is_shared(tmp_path):
+    _make_metadb(tmp_path)
+    erd = MetaDBERDAnalyzer(str(tmp_path), tables=['orders', 'customers'], owners=['sample']).analyze_erd()
+
+    assert [table.full_name for table in erd.tables] == ['SAMPLE.CUSTOMERS', 'SAMPLE.ORDERS']
+    assert erd.total_columns == 4
+    assert erd.tables[1].foreign_keys == [('CUSTOMER_ID', 'SAMPLE.CUSTOMERS', 'CUSTOMER_ID')]
+
+    shared = get_erd_structure(str(tmp_path), owners=['SAMPLE'])
+    assert get_erd_structure(str(tmp_path), owners=['sample ']) is shared
+    assert get_erd_structure(str(tmp_path)) is not shared
@@ -0,0 +1,42 @@
+import pickle
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from phase1.core.parse_stage import ParallelParseStage, plain_to_orm
+
+SAMPLE_ROOT = REPO_ROOT / 'PROJECT' / 'sampleSrc' / 'src' / 'main'
+
+
+def _sample_tasks():
+    tasks = []
+    for pattern, file_type in (('**/*.java', 'java'), ('**/*.jsp', 'jsp'), ('**/*.xml', 'xml')):
+        tasks.extend((str(p), file_type) for p in sorted(SAMPLE_ROOT.glob(pattern)))
+    return tasks
+
+
+def test_parallel_parse_matches_sequential():
+    tasks = _sample_tasks()
+    assert tasks
+
+    sequential = list(ParallelParseStage({}, max_workers=1).run(tasks, project_id=1))
+    parallel = list(ParallelParseStage({}, max_workers=2).run(tasks, project_id=1))
+
+    assert [p['file_path'] for p in parallel] == [path for path, _ in tasks]
+    for seq, par in zip(sequential, parallel):
+        assert par['status'] == seq['status'] == 'ok'
+        assert par['kind'] == seq['kind']
+        assert par['file_info']['hash'] == seq['file_info']['hash']
+        pickle.dumps(par)
+
+
+def test_jsp_payload_round_trips_to_orm():
+    jsp_tasks = [t for t in _sample_tasks() if t[1] == 'jsp']
+    payload = next(ParallelParseStage({}, max_workers=1).run(jsp_tasks[:1], project_id=1))
+
+    file_obj = plain_to_orm(payload['result']['file_obj'])
+    assert type(file_obj).__name__ == 'File'
+    assert file_obj.path == jsp_tasks[0][0]
+    assert file_obj.project_id == 1
@@ -0,0 +1,51 @@
+import sqlite3
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from phase1.models.database import DatabaseManager
+
+
+def test_existing_db_gets_project_id_columns_backfilled(tmp_path):
+    db_path = tmp_path / 'metadata.db'
+    # project_id 컬럼이 없던 이전 스키마의 DB
+    conn = sqlite3.connect(db_path)
+    conn.executescript("""
+        CREATE TABLE projects (project_id INTEGER PRIMARY KEY, root_path TEXT NOT NULL, name TEXT NOT NULL);
+        CREATE TABLE files (file_id INTEGER PRIMARY KEY, project_id INTEGER NOT NULL, path TEXT NOT NULL, language TEXT);
+        CREATE TABLE classes (class_id INTEGER PRIMARY KEY, file_id INTEGER NOT NULL, fqn TEXT, name TEXT NOT NULL);
+        CREATE TABLE methods (method_id INTEGER PRIMARY KEY, class_id INTEGER NOT NULL, name TEXT NOT NULL);
+        CREATE TABLE chunks (chunk_id INTEGER PRIMARY KEY, target_type TEXT NOT NULL, target_id INTEGER NOT NULL);
+        INSERT INTO projects VALUES (1, '/a', 'a'), (2, '/b', 'b');
+        INSERT INTO files VALUES (10, 1, '/a/A.java', 'java'), (20, 2, '/b/B.java', 'java');
+        INSERT INTO classes VALUES (100, 10, 'a.A', 'A'), (200, 20, 'b.B', 'B');
+        INSERT INTO methods VALUES (1000, 100, 'run'), (2000, 200, 'run');
+        INSERT INTO chunks VALUES (1, 'method', 2000), (2, 'file', 10), (3, 'method', 9999);
+    """)
+    conn.commit()
+    conn.close()
+
+    db_manager = DatabaseManager({'type': 'sqlite', 'sqlite': {'path': str(db_path)}})
+    db_manager.initialize()
+
+    def project_ids(table, pk):
+        conn = sqlite3.connect(db_path)
+        try:
+            return dict(conn.execute(f"SELECT {pk}, project_id FROM {table}"))
+        finally:
+            conn.close()
+
+    assert project_ids('classes', 'class_id') == {100: 1, 200: 2}
+    assert project_ids('methods', 'method_id') == {1000: 1, 2000: 2}
+    assert project_ids('chunks', 'chunk_id') == {1: 2, 2: 1, 3: None}
+
+    # 이후 project_id 없이 저장된 행도 보정됨
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT INTO classes (class_id, file_id, fqn, name) VALUES (300, 20, 'b.C', 'C')")
+    conn.commit()
+    conn.close()
+    assert db_manager.backfill_project_ids() == 1
+    assert project_ids('classes', 'class_id')[300] == 2
+    assert db_manager.backfill_project_ids() == 0
@@ -0,0 +1,110 @@
+import sys
+from collections import Counter
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from phase1.models.database import DatabaseManager, Project, File, Class, Relatedness
+from phase1.scripts.calculate_relatedness import RelatednessCalculator
+
+
+def _make_db(tmp_path, files_in_dir=30):
+    db_path = tmp_path / 'metadata.db'
+    db_manager = DatabaseManager({'type': 'sqlite', 'sqlite': {'path': str(db_path)}})
+    db_manager.initialize()
+    session = db_manager.get_session()
+    project = Project(root_path='/src', name='p')
+    session.add(project)
+    session.flush()
+    files = [File(project_id=project.project_id, path=f'/src/controller/Screen{i:03d}.java', language='java')
+             for i in range(files_in_dir)]
+    files.append(File(project_id=project.project_id, path='/src/service/OrderService.java', language='java'))
+    session.add_all(files)
+    session.flush()
+    session.add(Class(file_id=files[-1].file_id, project_id=project.project_id, fqn='app.Order', name='Order'))
+    session.commit()
+    file_ids = [f.file_id for f in files]
+    session.close()
+    return db_manager, file_ids
+
+
+def _rows(db_manager):
+    session = db_manager.get_session()
+    try:
+        return {(r.node1_type, r.node1_id, r.node2_type, r.node2_id): (r.score, r.reason)
+                for r in session.query(Relatedness)}
+    finally:
+        session.close()
+
+
+def _config(tmp_path, **relatedness):
+    return {'database': {'type': 'sqlite', 'sqlite': {'path': str(tmp_path / 'metadata.db')}},
+            'relatedness': dict({'shard_count': 3, 'batch_size': 7}, **relatedness)}
+
+
+def test_large_directory_is_windowed_and_capped(tmp_path):
+    db_manager, file_ids = _make_db(tmp_path)
+    RelatednessCalculator('p', _config(tmp_path, window=4, top_k=5)).run()
+    rows = _rows(db_manager)
+
+    # 디렉토리 전체 조합(435쌍) 대신 경로 순서상 인접한 4개와만 짝지음
+    proximity = [key for key, (_score, reason) in rows.items() if reason == 'directory_proximity']
+    assert 0 < len(proximity) < 30 * 4
+    degree = Counter()
+    for node1_type, node1_id, node2_type, node2_id in proximity:
+        degree[node1_id] += 1
+        degree[node2_id] += 1
+    # 한쪽 노드라도 상위 k에 선택한 쌍만 저장되므로 각 노드는 최대 2k
+    assert max(degree.values()) <= 2 * 5
+    assert ('file', file_ids[0], 'file', file_ids[1]) in rows
+    assert ('file', file_ids[0], 'file', file_ids[10]) not in rows
+    # 파일 OrderService 와 클래스 Order 는 이름 규칙으로 연결
+    assert any(reason == 'naming_convention' for _score, reason in rows.values())
+
+
+def test_incremental_run_recomputes_only_touched_nodes(tmp_path):
+    db_manager, file_ids = _make_db(tmp_path, files_in_dir=6)
+    config = _config(tmp_path)
+    RelatednessCalculator('p', config).run()
+    full = _rows(db_manager)
+
+    session = db_manager.get_session()
+    session.query(Relatedness).filter(Relatedness.node1_id == file_ids[4]).update({'score': 0.1})
+    untouched_key = ('file', file_ids[0], 'file', file_ids[1])
+    session.query(Relatedness).filter(Relatedness.node1_id == file_ids[0],
+                                      Relatedness.node2_id == file_ids[1]).update({'score': 0.2})
+    session.commit()
+    session.close()
+
+    RelatednessCalculator('p', config).run(changed_file_ids=[file_ids[4]])
+    rows = _rows(db_manager)
+
+    assert set(rows) == set(full)
+    assert rows[('file', file_ids[4], 'file', file_ids[5])] == full[('file', file_ids[4], 'file', file_ids[5])]
+    # 변경되지 않은 노드 사이의 행은 그대로 유지
+    assert rows[untouched_key][0] == 0.2
+
+
+def test_incremental_run_removes_deleted_nodes_and_falls_back_to_full(tmp_path):
+    db_manager, file_ids = _make_db(tmp_path, files_in_dir=6)
+    config = _config(tmp_path)
+    RelatednessCalculator('p', config).run()
+    full = _rows(db_manager)
+
+    session = db_manager.get_session()
+    session.query(File).filter(File.file_id == file_ids[5]).delete()
+    session.commit()
+    session.close()
+    RelatednessCalculator('p', config).run(changed_file_ids=[file_ids[5]])
+    rows = _rows(db_manager)
+    assert rows and all(file_ids[5] not in (key[1], key[3]) for key in rows if key[0] == key[2] == 'file')
+
+    # 변경 파일이 incremental_max_ratio를 넘으면 전체 재계산 (변경되지 않은 노드 사이의 행도 다시 계산)
+    session = db_manager.get_session()
+    session.query(Relatedness).update({'score': 0.2})
+    session.commit()
+    session.close()
+    RelatednessCalculator('p', config).run(changed_file_ids=file_ids[:3])
+    assert all(score != 0.2 for score, _reason in _rows(db_manager).values())
+    assert set(_rows(db_manager)) < set(full)
@@ -0,0 +1,54 @@
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from phase1.models.database import DatabaseManager, Project, File, Class, Method
+from phase1.utils.symbol_index import SymbolIndex, count_parameters
+
+
+def test_count_parameters_ignores_generic_commas():
+    assert count_parameters(None) == 0
+    assert count_parameters('') == 0
+    assert count_parameters('String id') == 1
+    assert count_parameters('Map<String, List<Integer>> m, int n') == 2
+
+
+def test_build_indexes_project_symbols(tmp_path):
+    db_manager = DatabaseManager({'type': 'sqlite', 'sqlite': {'path': str(tmp_path / 'metadata.db')}})
+    db_manager.initialize()
+    session = db_manager.get_session()
+
+    project = Project(root_path='/src', name='p')
+    other = Project(root_path='/other', name='q')
+    session.add_all([project, other])
+    session.flush()
+    f1 = File(project_id=project.project_id, path='/src/UserService.java', language='java')
+    f2 = File(project_id=other.project_id, path='/other/UserService.java', language='java')
+    session.add_all([f1, f2])
+    session.flush()
+    svc = Class(file_id=f1.file_id, fqn='com.example.service.UserService', name='UserService')
+    foreign = Class(file_id=f2.file_id, fqn='org.other.UserService', name='UserService')
+    session.add_all([svc, foreign])
+    session.flush()
+    session.add_all([
+        Method(class_id=svc.class_id, name='find', parameters='String id'),
+        Method(class_id=svc.class_id, name='find', parameters='String id, Map<String, Object> opts'),
+    ])
+    session.commit()
+
+    symbols = SymbolIndex.build(session, project.project_id)
+
+    assert [c.fqn for c in symbols.classes_named('UserService')] == ['com.example.service.UserService']
+    assert symbols.find_class('service.UserService').class_id == svc.class_id
+    assert symbols.find_class('com.example.service.UserService').class_id == svc.class_id
+    assert symbols.find_class('Missing') is None
+    assert symbols.file_path(svc.file_id) == '/src/UserService.java'
+
+    two_args = symbols.find_method(svc.class_id, 'find', 2)
+    assert two_args.arity == 2
+    assert symbols.find_method(svc.class_id, 'find', 5).arity == 1  # 인자 수 불일치 시 이름으로 대체
+    assert symbols.find_method_by_fqn('com.example.service.UserService.find', 2) == two_args
+    assert symbols.find_method_by_fqn('org.other.UserService.find') is None
+    session.close()
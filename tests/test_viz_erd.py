@@ -0,0 +1,67 @@
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from phase1.models.database import DatabaseManager, Project, File, SqlUnit, Join, DbTable, DbColumn, DbPk
+from visualize.builders.erd import build_erd_json
+
+
+def _make_schema(tmp_path):
+    db_path = tmp_path / 'metadata.db'
+    db_manager = DatabaseManager({'type': 'sqlite', 'sqlite': {'path': str(db_path)}})
+    db_manager.initialize()
+    session = db_manager.get_session()
+    project = Project(root_path='/src', name='p')
+    session.add(project)
+    session.flush()
+    mapper = File(project_id=project.project_id, path='/src/OrderMapper.xml', language='xml')
+    session.add(mapper)
+    session.flush()
+    sql = SqlUnit(file_id=mapper.file_id, project_id=project.project_id, mapper_ns='app.OrderMapper',
+                  stmt_id='selectOrder', stmt_kind='select')
+    session.add(sql)
+    for table_id, owner, name in [(1, 'SAMPLE', 'ORDERS'), (2, 'SAMPLE', 'CUSTOMERS'), (3, 'HR', 'EMPLOYEES')]:
+        session.add(DbTable(table_id=table_id, owner=owner, table_name=name, status='VALID'))
+    session.flush()
+    session.add_all([
+        DbColumn(table_id=1, column_name='ORDER_ID', data_type='NUMBER', nullable='N'),
+        DbColumn(table_id=1, column_name='CUSTOMER_ID', data_type='NUMBER', nullable='N'),
+        DbColumn(table_id=2, column_name='CUSTOMER_ID', data_type='NUMBER', nullable='N', column_comment='고객 ID'),
+        DbColumn(table_id=3, column_name='EMP_ID', data_type='NUMBER', nullable='N'),
+        DbPk(table_id=1, column_name='ORDER_ID', pk_pos=1),
+        DbPk(table_id=2, column_name='CUSTOMER_ID', pk_pos=1),
+        Join(sql_id=sql.sql_id, project_id=project.project_id, l_table='o', l_col='CUSTOMER_ID', op='=',
+             r_table='c', r_col='CUSTOMER_ID', confidence=0.8),
+    ])
+    session.commit()
+    project_id = project.project_id
+    session.close()
+    return {'database': {'type': 'sqlite', 'sqlite': {'path': str(db_path)}}}, project_id
+
+
+def test_erd_groups_columns_and_resolves_join_edges(tmp_path):
+    config, project_id = _make_schema(tmp_path)
+    graph = build_erd_json(config, project_id, None)
+
+    nodes = {node['id']: node['meta'] for node in graph['nodes']}
+    assert set(nodes) == {'table:SAMPLE.ORDERS', 'table:SAMPLE.CUSTOMERS', 'table:HR.EMPLOYEES'}
+    orders = nodes['table:SAMPLE.ORDERS']
+    assert orders['pk_columns'] == ['ORDER_ID']
+    assert [(c['name'], c['is_pk']) for c in orders['columns']] == [('ORDER_ID', True), ('CUSTOMER_ID', False)]
+    assert nodes['table:SAMPLE.CUSTOMERS']['columns'][0]['comment'] == '고객 ID'
+
+    # 축약 별칭 o, c가 ORDERS, CUSTOMERS로 해석되고 한쪽만 PK이므로 FK 관계
+    [edge] = graph['edges']
+    assert {edge['source'], edge['target']} == {'table:SAMPLE.ORDERS', 'table:SAMPLE.CUSTOMERS'}
+    assert edge['kind'] == 'foreign_key'
+
+
+def test_erd_table_and_owner_filters_are_case_insensitive(tmp_path):
+    config, project_id = _make_schema(tmp_path)
+
+    graph = build_erd_json(config, project_id, None, tables='orders, Employees', owners='sample')
+    assert [node['id'] for node in graph['nodes']] == ['table:SAMPLE.ORDERS']
+    assert graph['nodes'][0]['meta']['pk_columns'] == ['ORDER_ID']
+    assert graph['edges'] == []
@@ -0,0 +1,93 @@
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from phase1.models.database import DatabaseManager, Project, File, Class, Method, SqlUnit, DbTable
+from visualize.data_access import VizDB, _node_details_cache
+
+
+def _make_db(tmp_path):
+    db_path = tmp_path / 'metadata.db'
+    db_manager = DatabaseManager({'type': 'sqlite', 'sqlite': {'path': str(db_path)}})
+    db_manager.initialize()
+    session = db_manager.get_session()
+    project = Project(root_path='/src', name='p')
+    session.add(project)
+    session.flush()
+    f = File(project_id=project.project_id, path='/src/app/OrderService.java', language='java', loc=42)
+    x = File(project_id=project.project_id, path='/src/mapper/Order.xml', language='xml')
+    session.add_all([f, x])
+    session.flush()
+    cls = Class(file_id=f.file_id, fqn='app.OrderService', name='OrderService', start_line=3, llm_summary='주문 서비스')
+    sql = SqlUnit(file_id=x.file_id, mapper_ns='app.OrderMapper', stmt_id='selectOrder', stmt_kind='select', start_line=7)
+    table = DbTable(owner='SAMPLE', table_name='ORDERS', status='VALID', table_comment='주문')
+    session.add_all([cls, sql, table])
+    session.flush()
+    method = Method(class_id=cls.class_id, name='placeOrder', signature='void placeOrder()', start_line=10)
+    session.add(method)
+    session.commit()
+    ids = {'file': f.file_id, 'class': cls.class_id, 'method': method.method_id, 'sql_unit': sql.sql_id,
+           'table': table.table_id}
+    session.close()
+    return str(db_path), ids
+
+
+def test_get_nodes_details_resolves_each_type_in_bulk(tmp_path):
+    db_path, ids = _make_db(tmp_path)
+    db = VizDB({'database': {'type': 'sqlite', 'sqlite': {'path': db_path}}})
+
+    keys = [(node_type, node_id) for node_type, node_id in ids.items()] + [('method', 999), ('method', ids['method'])]
+    details = db.get_nodes_details(keys)
+
+    assert ('method', 999) not in details
+    assert details[('method', ids['method'])] == {
+        'name': 'placeOrder', 'signature': 'void placeOrder()', 'class': 'app.OrderService',
+        'file': '/src/app/OrderService.java', 'line': 10, 'llm_summary': None,
+    }
+    assert details[('class', ids['class'])]['llm_summary'] == '주문 서비스'
+    assert details[('file', ids['file'])]['loc'] == 42
+    assert details[('sql_unit', ids['sql_unit'])]['file'] == '/src/mapper/Order.xml'
+    assert details[('table', ids['table'])]['name'] == 'SAMPLE.ORDERS'
+    assert db.get_node_details('class', ids['class']) == details[('class', ids['class'])]
+    assert db.get_node_details('table', 'ORD')['table_id'] == ids['table']
+
+
+def test_node_details_lru_is_optional(tmp_path):
+    db_path, ids = _make_db(tmp_path)
+    _node_details_cache.clear()
+    config = {'database': {'type': 'sqlite', 'sqlite': {'path': db_path}, 'node_details_cache_size': 10}}
+    cached_db = VizDB(config)
+    plain_db = VizDB({'database': {'type': 'sqlite', 'sqlite': {'path': db_path}}})
+    key = ('method', ids['method'])
+    assert key in cached_db.get_nodes_details([key])
+
+    session = cached_db.session()
+    session.query(Method).delete()
+    session.commit()
+    session.close()
+
+    # 캐시를 켠 경우에만 같은 프로세스에서 이전 조회 결과를 재사용
+    assert key in cached_db.get_nodes_details([key])
+    assert key not in plain_db.get_nodes_details([key])
+    _node_details_cache.clear()
+
+
+def test_method_details_by_project_keeps_methods_with_dangling_class(tmp_path):
+    db_path, ids = _make_db(tmp_path)
+    db = VizDB({'database': {'type': 'sqlite', 'sqlite': {'path': db_path}}})
+    session = db.session()
+    session.query(Method).update({Method.project_id: 1})
+    stray = Class(file_id=999, fqn='app.Stray', name='Stray')   # 파일 행이 없는 클래스
+    session.add(stray)
+    session.flush()
+    session.add_all([Method(project_id=1, class_id=999, name='dangling', start_line=1),
+                     Method(project_id=1, class_id=stray.class_id, name='stray', start_line=2)])
+    session.commit()
+    session.close()
+
+    details = db.fetch_method_details_by_project(1)
+    assert [(d['name'], d['class'], d['file']) for d in details.values()] == [
+        ('placeOrder', 'app.OrderService', '/src/app/OrderService.java'),
+        ('dangling', None, None), ('stray', 'app.Stray', None)]
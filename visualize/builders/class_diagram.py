@@ -10,6 +10,7 @@ Source Analyzer Class Diagram Builder
 import logging
 import ast
 import os
+from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Set, Tuple
 from ..data_access import VizDB
@@ -370,7 +371,7 @@ def build_java_class_diagram_json(
     
     try:
         # Get all classes from database
-        query = session.query(Class).join(File).filter(File.project_id == project_id).order_by(Class.fqn)
+        query = session.query(Class).join(File).filter(Class.project_id == project_id).order_by(Class.fqn)
         
         # Filter by modules if specified
         if modules_filter:
@@ -388,25 +389,37 @@ def build_java_class_diagram_json(
             logger.warning("분석할 Java 클래스를 찾을 수 없습니다")
             return {'nodes': [], 'edges': [], 'stats': {'total_classes': 0}}
         
+        # 클래스 파일 경로와 메서드 목록은 클래스별 조회 대신 일괄 조회
+        class_details = db.get_nodes_details([('class', cls.class_id) for cls in classes])
+        methods_by_class = defaultdict(list)
+        class_id_list = [cls.class_id for cls in classes]
+        for start in range(0, len(class_id_list), 500):
+            method_rows = session.query(Method.class_id, Method.name, Method.signature, Method.start_line).filter(
+                Method.class_id.in_(class_id_list[start:start + 500])
+            ).order_by(Method.method_id)
+            for row in method_rows:
+                methods_by_class[row.class_id].append(row)
+        
         # Create nodes for classes
         nodes = []
         for cls in classes:
-            file = session.query(File).filter(File.file_id == cls.file_id).first()
-            methods = session.query(Method).filter(Method.class_id == cls.class_id).limit(max_methods).all()
+            file_path = (class_details.get(('class', cls.class_id)) or {}).get('file')
+            all_methods = methods_by_class.get(cls.class_id, [])
+            methods = all_methods[:max_methods]
             
             node = create_node(
                 f"class:{cls.class_id}",
                 "class",
                 cls.name,
-                guess_group("class", file.path if file else None, cls.fqn),
+                guess_group("class", file_path, cls.fqn),
                 {
                     'fqn': cls.fqn,
-                    'file_path': file.path if file else None,
+                    'file_path': file_path,
                     'line_number': cls.start_line,
                     'line_range': f"{cls.start_line}-{cls.end_line}" if cls.end_line else str(cls.start_line),
                     'methods': [{'name': m.name, 'signature': m.signature, 'line': m.start_line} for m in methods],
                     'method_count': len(methods),
-                    'total_methods': session.query(Method).filter(Method.class_id == cls.class_id).count(),
+                    'total_methods': len(all_methods),
                     'modifiers': cls.modifiers
                 }
             )
@@ -93,6 +93,13 @@ def build_component_graph_json(config: Dict[str, Any], project_id: int, project_
     
     print(f"  Found {len(edges)} edges, {len(files)} files")
     
+    # 메서드/SQL 단위 상세 정보를 타입별로 한 번에 조회 (호출 대상 메서드 포함)
+    node_keys = [('method', method.method_id) for method in methods]
+    node_keys.extend(('sql_unit', sql_unit.sql_id) for sql_unit in sql_units)
+    node_keys.extend(('method', edge.dst_id) for edge in edges
+                     if edge.src_type == 'method' and edge.dst_type == 'method' and edge.dst_id)
+    node_details = db.get_nodes_details(node_keys)
+    
     # Build component mapping
     entity_to_component = {}
     component_entities = defaultdict(list)
@@ -112,7 +119,7 @@ def build_component_graph_json(config: Dict[str, Any], project_id: int, project_
     # Classify methods (through their classes/files)
     for method in methods:
         # Get method's class and file info
-        method_details = db.get_node_details('method', method.method_id)
+        method_details = node_details.get(('method', method.method_id))
         if method_details and method_details.get('file'):
             component = decide_component_group(method_details['file'], method_details.get('class'))
         else:
@@ -129,7 +136,7 @@ def build_component_graph_json(config: Dict[str, Any], project_id: int, project_
     
     # Classify SQL units
     for sql_unit in sql_units:
-        sql_details = db.get_node_details('sql_unit', sql_unit.sql_id)
+        sql_details = node_details.get(('sql_unit', sql_unit.sql_id))
         if sql_details and sql_details.get('file'):
             component = decide_component_group(sql_details['file'], None)
         else:
@@ -209,7 +216,7 @@ def build_component_graph_json(config: Dict[str, Any], project_id: int, project_
             try:
                 dst_method_id = edge.dst_id
                 # 데이터베이스에서 대상 메서드의 클래스 정보 조회
-                dst_method_details = db.get_node_details('method', dst_method_id)
+                dst_method_details = node_details.get(('method', dst_method_id))
                 if dst_method_details and dst_method_details.get('file'):
                     dst_component_inferred = decide_component_group(dst_method_details['file'], dst_method_details.get('class'))
                     if dst_component_inferred != 'Other':
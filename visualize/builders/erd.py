@@ -5,79 +5,101 @@ ERD (Entity Relationship Diagram) 생성 모듈
 데이터베이스 테이블 관계를 시각화하기 위한 노드와 엣지 데이터를 생성합니다.
 """
 
-from typing import Dict, Any, List, Optional
+import logging
+from typing import Dict, Any, List, Optional, Tuple
 from collections import Counter
 from ..data_access import VizDB  
 from ..schema import create_node, create_edge, create_graph
 
-# 축약된 테이블 이름을 노드 ID로 해석하는 헬퍼 함수
-def resolve_abbreviation_to_node_id(abbreviated_name: str, nodes_dict: Dict[str, Any]) -> Optional[str]:
-    owner_abbr, table_abbr = abbreviated_name.split('.') if '.' in abbreviated_name else ('', abbreviated_name)
+logger = logging.getLogger(__name__)
 
-    potential_matches = []
-    exact_matches = []
 
+def _table_abbreviations(full_table: str) -> List[str]:
+    """테이블 이름에 대해 조인에서 쓰일 수 있는 축약 후보 생성"""
+    table_abbrev_candidates = []
+    if full_table:
+        # 1. 첫 글자 축약
+        table_abbrev_candidates.append(full_table[0])
+        
+        # 2. 복합어의 각 단어 첫 글자 조합 (ORDER_ITEMS -> OI)
+        if '_' in full_table:
+            parts = full_table.split('_')
+            if len(parts) >= 2:
+                # 모든 단어의 첫 글자
+                initials = ''.join([part[0] for part in parts if part])
+                table_abbrev_candidates.append(initials)
+                
+                # 첫 두 단어의 조합
+                if parts[0] and parts[1]:
+                    table_abbrev_candidates.append(parts[0][0] + parts[1][0])
+        
+        # 3. 일반적인 축약 패턴 동적 생성
+        # 복수형 제거 (ORDERS -> ORDER, USERS -> USER)
+        if full_table.endswith('S') and len(full_table) > 3:
+            singular = full_table[:-1]
+            table_abbrev_candidates.append(singular)
+        
+        # 4. 일반적인 단축어 패턴
+        if len(full_table) >= 4:
+            # 첫 3-4글자 (CUSTOMERS -> CUST)
+            table_abbrev_candidates.append(full_table[:4])
+            table_abbrev_candidates.append(full_table[:3])
+        
+        # 5. 전체 이름도 허용
+        table_abbrev_candidates.append(full_table)
+    return table_abbrev_candidates
+
+
+def build_abbreviation_index(nodes_dict: Dict[str, Any]) -> Dict[str, List[Tuple[str, str, str]]]:
+    """축약 후보 → [(node_id, OWNER, TABLE_NAME)] 인덱스 (nodes_dict 순서 유지)
+
+    조인 패턴마다 전체 노드를 훑으며 후보를 다시 만드는 대신 한 번만 만들어 둡니다.
+    """
+    index: Dict[str, List[Tuple[str, str, str]]] = {}
     for node_id, node_data in nodes_dict.items():
         if node_data is None:
             continue
         if not isinstance(node_data, dict) or 'meta' not in node_data or not isinstance(node_data['meta'], dict):
             continue
 
-        full_owner = node_data['meta'].get('owner', '').upper()
-        full_table = node_data['meta'].get('table_name', '').upper()
-        
-        # Create common abbreviations for the table name dynamically
-        table_abbrev_candidates = []
-        if full_table:
-            # 1. 첫 글자 축약
-            table_abbrev_candidates.append(full_table[0])
-            
-            # 2. 복합어의 각 단어 첫 글자 조합 (ORDER_ITEMS -> OI)
-            if '_' in full_table:
-                parts = full_table.split('_')
-                if len(parts) >= 2:
-                    # 모든 단어의 첫 글자
-                    initials = ''.join([part[0] for part in parts if part])
-                    table_abbrev_candidates.append(initials)
-                    
-                    # 첫 두 단어의 조합
-                    if len(parts) >= 2:
-                        table_abbrev_candidates.append(parts[0][0] + parts[1][0])
-            
-            # 3. 일반적인 축약 패턴 동적 생성
-            # 복수형 제거 (ORDERS -> ORDER, USERS -> USER)
-            if full_table.endswith('S') and len(full_table) > 3:
-                singular = full_table[:-1]
-                table_abbrev_candidates.append(singular)
-            
-            # 4. 일반적인 단축어 패턴
-            if len(full_table) >= 4:
-                # 첫 3-4글자 (CUSTOMERS -> CUST)
-                table_abbrev_candidates.append(full_table[:4])
-                table_abbrev_candidates.append(full_table[:3])
-            
-            # 5. 전체 이름도 허용
-            table_abbrev_candidates.append(full_table)
-            
+        full_owner = (node_data['meta'].get('owner') or '').upper()
+        full_table = (node_data['meta'].get('table_name') or '').upper()
+        for candidate in dict.fromkeys(_table_abbreviations(full_table)):
+            index.setdefault(candidate, []).append((node_id, full_owner, full_table))
+    return index
+
+
+# 축약된 테이블 이름을 노드 ID로 해석하는 헬퍼 함수
+def resolve_abbreviation_to_node_id(abbreviated_name: str, nodes_dict: Dict[str, Any],
+                                    abbreviation_index: Optional[Dict[str, List[Tuple[str, str, str]]]] = None) -> Optional[str]:
+    owner_abbr, table_abbr = abbreviated_name.split('.') if '.' in abbreviated_name else ('', abbreviated_name)
+    if abbreviation_index is None:
+        abbreviation_index = build_abbreviation_index(nodes_dict)
+
+    potential_matches = []
+    exact_matches = []
+    full_tables = {}
+
+    # Check if the abbreviation matches any of our candidates
+    table_abbr_upper = table_abbr.upper()
+    for node_id, full_owner, full_table in abbreviation_index.get(table_abbr_upper, ()):
         match_found = False
         is_exact_match = False
         
-        # Check if the abbreviation matches any of our candidates
-        table_abbr_upper = table_abbr.upper()
-        if table_abbr_upper in table_abbrev_candidates:
-            # Check owner matching - PUBLIC 스키마 별칭은 모든 실제 스키마와 매칭
-            if owner_abbr.upper() in ["PUBLIC", ""]:
-                # PUBLIC은 와일드카드, 모든 owner와 매칭
+        # Check owner matching - PUBLIC 스키마 별칭은 모든 실제 스키마와 매칭
+        if owner_abbr.upper() in ["PUBLIC", ""]:
+            # PUBLIC은 와일드카드, 모든 owner와 매칭
+            match_found = True
+            # Prefer exact length matches for disambiguation
+            if table_abbr_upper == full_table or len(table_abbr_upper) > 1:
+                is_exact_match = True
+        else:
+            if full_owner == owner_abbr.upper():
                 match_found = True
-                # Prefer exact length matches for disambiguation
-                if table_abbr_upper == full_table or len(table_abbr_upper) > 1:
-                    is_exact_match = True
-            else:
-                if full_owner == owner_abbr.upper():
-                    match_found = True
-                    is_exact_match = True
+                is_exact_match = True
         
         if match_found:
+            full_tables[node_id] = full_table
             if is_exact_match:
                 exact_matches.append(node_id)
             else:
@@ -91,9 +113,7 @@ def resolve_abbreviation_to_node_id(abbreviated_name: str, nodes_dict: Dict[str,
     elif len(all_matches) > 1:
         # 스마트 우선순위: 축약어와 테이블 이름의 정확도로 정렬
         def match_score(node_id):
-            node_data = nodes_dict[node_id]
-            full_table = node_data['meta'].get('table_name', '').upper()
-            table_abbr_upper = table_abbr.upper()
+            full_table = full_tables[node_id]
             
             # 정확한 이름 매칭이 최우선
             if table_abbr_upper == full_table:
@@ -119,22 +139,10 @@ def resolve_abbreviation_to_node_id(abbreviated_name: str, nodes_dict: Dict[str,
 
 def build_erd_json(config: Dict[str, Any], project_id: int, project_name: Optional[str], tables: str = None, owners: str = None, 
                    from_sql: str = None) -> Dict[str, Any]:
-    print("""Build ERD JSON for visualization""")
+    """Build ERD JSON for visualization"""
     
     db = VizDB(config, project_name)
     
-    # Get database schema information
-    db_tables = db.fetch_tables()
-    pk_info = db.fetch_pk()
-    columns_info = db.fetch_columns()
-    
-    # joins 테이블에서 직접 테이블 관계 정보 가져오기
-    joins = db.fetch_joins_for_project(project_id)
-    print(f"# joins 테이블 개수: {len(joins)}")
-    
-    print('# Special handling for --from-sql (SQLERD mode)')
-    sqlerd_mode = bool(from_sql)
-    
     # Parse filters
     wanted_tables = set()
     if tables:
@@ -144,45 +152,42 @@ def build_erd_json(config: Dict[str, Any], project_id: int, project_name: Option
     if owners:
         wanted_owners = {o.strip().upper() for o in owners.split(',')}
     
+    # Get database schema information: --tables/--owners 필터는 SQL에서 적용하고,
+    # PK/컬럼은 table_id별로 묶어 받아 테이블마다 전체 목록을 훑지 않음
+    db_tables, pk_by_table, columns_by_table = db.fetch_erd_schema(wanted_tables, wanted_owners)
+    logger.info("ERD 스키마 로드: 테이블 %d개, 컬럼 %d개",
+                len(db_tables), sum(len(cols) for cols in columns_by_table.values()))
+    
+    # joins 테이블에서 직접 테이블 관계 정보 가져오기
+    joins = db.fetch_joins_for_project(project_id)
+    logger.debug("joins 테이블 개수: %d", len(joins))
+    
+    # Special handling for --from-sql (SQLERD mode)
+    sqlerd_mode = bool(from_sql)
+    
     # Build table nodes
     nodes_dict = {}
     
-    #print('# Add database tables')
     for table in db_tables:
         table_key = f"{table.owner}.{table.table_name}" if table.owner else table.table_name
-        table_key_upper = table_key.upper()
-        
-        print(f'# Apply filters - table.table_name = {table.table_name}')
-        if wanted_tables and table.table_name.upper() not in wanted_tables:
-            continue
-        if wanted_owners and (table.owner or '').upper() not in wanted_owners:
-            continue
-        
         
-        pk_columns = []
-        for pk in pk_info:
-            if pk.table_id == table.table_id:
-                print(f'# Get primary key info for this table - pk.column_name={pk.column_name}')
-                pk_columns.append(pk.column_name)
+        pk_columns = pk_by_table.get(table.table_id, [])
+        pk_set = set(pk_columns)
         
-        table_columns = []
-        for col in columns_info:
-            if col.table_id == table.table_id:
-                print(f'# Get column details for this table - {col.column_name}')
-                table_columns.append({
-                    'name': col.column_name,
-                    'data_type': col.data_type,
-                    'nullable': col.nullable,
-                    'is_pk': col.column_name in pk_columns,
-                    'comment': getattr(col, 'column_comment', None)
-                })
+        table_columns = [{
+            'name': col.column_name,
+            'data_type': col.data_type,
+            'nullable': col.nullable,
+            'is_pk': col.column_name in pk_set,
+            'comment': col.column_comment
+        } for col in columns_by_table.get(table.table_id, [])]
         
         table_meta = {
             'owner': table.owner,
             'table_name': table.table_name,
-            'status': getattr(table, 'status', 'VALID'),
+            'status': table.status,
             'pk_columns': pk_columns,
-            'comment': getattr(table, 'table_comment', None),
+            'comment': table.table_comment,
             'columns': table_columns
         }
         
@@ -192,8 +197,8 @@ def build_erd_json(config: Dict[str, Any], project_id: int, project_name: Option
     # Create a mapping from full table name (OWNER.TABLE_NAME) to node_id
     full_name_to_node_id_map = {}
     for node_id, node_data in nodes_dict.items():
-        owner = node_data['meta'].get('owner', '').upper()
-        table_name = node_data['meta'].get('table_name', '').upper()
+        owner = (node_data['meta'].get('owner') or '').upper()
+        table_name = (node_data['meta'].get('table_name') or '').upper()
         full_table_name = f"{owner}.{table_name}" if owner else table_name
         full_name_to_node_id_map[full_table_name] = node_id
 
@@ -241,9 +246,9 @@ def build_erd_json(config: Dict[str, Any], project_id: int, project_name: Option
         }
     
     # joins 테이블에서 테이블 관계 추출
-    print(f"# joins 테이블에서 테이블 관계 추출 시작")
-    
     if joins:
+        abbreviation_index = build_abbreviation_index(nodes_dict)
+        
         # Count join frequency to infer FK relationships
         join_patterns = Counter()
         for join in joins:
@@ -252,20 +257,18 @@ def build_erd_json(config: Dict[str, Any], project_id: int, project_name: Option
                           join.r_table.upper(), join.r_col.upper())
                 join_patterns[pattern] += 1
         
-        print(f"# 조인 패턴 분석: {len(join_patterns)}개 패턴")
+        logger.debug("조인 패턴 분석: %d개 패턴", len(join_patterns))
         
         # Create FK edges for frequently used joins
         edge_id = 1
         for (l_table, l_col, r_table, r_col), frequency in join_patterns.items():
             if frequency >= 1:  # 임계값을 1로 설정 - 더 많은 관계 인식
-                print(f"# 조인 패턴: {l_table}.{l_col} -> {r_table}.{r_col} (빈도: {frequency})")
-                
                 # Use the helper function to resolve abbreviated table names to node_ids
-                l_node_id = resolve_abbreviation_to_node_id(l_table, nodes_dict)
-                r_node_id = resolve_abbreviation_to_node_id(r_table, nodes_dict)
+                l_node_id = resolve_abbreviation_to_node_id(l_table, nodes_dict, abbreviation_index)
+                r_node_id = resolve_abbreviation_to_node_id(r_table, nodes_dict, abbreviation_index)
 
                 if not l_node_id or not r_node_id:
-                    print(f"# 노드 ID를 찾을 수 없음: {l_table} -> {l_node_id}, {r_table} -> {r_node_id}")
+                    logger.debug("노드 ID를 찾을 수 없음: %s -> %s, %s -> %s", l_table, l_node_id, r_table, r_node_id)
                     continue
                 
                 # 중복 관계 방지 - 테이블 쌍이 이미 처리되었는지 확인
@@ -302,12 +305,7 @@ def build_erd_json(config: Dict[str, Any], project_id: int, project_name: Option
                         ))
                     edge_id += 1
     
-    print(f"# 생성된 관계선 개수: {len(edges_list)}")
-    
-    # 디버그: 생성된 관계선 상세 정보 출력
-    print(f"# === 생성된 관계선 상세 정보 ===")
-    for i, edge in enumerate(edges_list):
-        print(f"# 관계선 {i+1}: {edge['source']} -> {edge['target']} (타입: {edge['kind']})")
+    logger.debug("생성된 관계선 개수: %d", len(edges_list))
     
     # Create the final graph structure
     nodes_list = list(nodes_dict.values())
@@ -317,8 +315,7 @@ def build_erd_json(config: Dict[str, Any], project_id: int, project_name: Option
         edges_list
     )
     
-    print(f"# === 최종 그래프 구조 ===")
-    print(f"# 노드 개수: {len(result_graph.get('nodes', []))}")
-    print(f"# 엣지 개수: {len(result_graph.get('edges', []))}")
+    logger.info("ERD 그래프: 노드 %d개, 엣지 %d개",
+                len(result_graph.get('nodes', [])), len(result_graph.get('edges', [])))
     
     return result_graph
@@ -46,16 +46,29 @@ def _assign_blue_colors(cluster_id: int) -> Tuple[str, str]:
         return blue_palette[base_idx]
 
 
-def _get_node_details(db: VizDB, node_type: str, node_id: int) -> Dict[str, Any]:
-    """노드 상세 정보 조회"""
+def _is_duplicate_naming_pair(rel) -> bool:
+    """class-file 간 naming_convention 관계는 중복이므로 제외 대상"""
+    return (rel.reason == "naming_convention" and
+            ((rel.node1_type == "class" and rel.node2_type == "file") or
+             (rel.node1_type == "file" and rel.node2_type == "class")))
+
+
+def _load_node_details(db: VizDB, relatedness_pairs: List) -> Dict[Tuple[str, int], Dict[str, Any]]:
+    """연관성 쌍에 등장하는 모든 노드의 상세 정보를 타입별 일괄 조회"""
+    node_keys = []
+    for rel in relatedness_pairs:
+        node_keys.append((rel.node1_type, rel.node1_id))
+        node_keys.append((rel.node2_type, rel.node2_id))
     try:
-        if hasattr(db, 'get_node_details'):
-            return db.get_node_details(node_type, node_id) or {}
-        else:
-            # Fallback: 기본적인 상세 정보 구성
-            return {'id': node_id, 'type': node_type}
+        return db.get_nodes_details(node_keys)
     except Exception:
-        return {'id': node_id, 'type': node_type}
+        # Fallback: 기본적인 상세 정보 구성
+        return {key: {'id': key[1], 'type': key[0]} for key in node_keys}
+
+
+def _get_node_details(details_by_node: Dict[Tuple[str, int], Dict[str, Any]], node_type: str, node_id: int) -> Dict[str, Any]:
+    """노드 상세 정보 조회"""
+    return details_by_node.get((node_type, node_id)) or {}
 
 
 def _get_unified_key(node_type: str, details: Dict[str, Any] = None) -> str:
@@ -165,17 +178,15 @@ def build_relatedness_graph_json(
     # 중복 제거를 위한 식별자 매핑
     unified_nodes: Dict[str, str] = {}  # fqn/path -> unified_key
 
-    # 연관성 데이터를 그래프로 변환
-    for rel in relatedness_pairs[:max_nodes * 2]:  # 엣지 수 제한으로 노드 수 간접 제어
-        # class-file 간 naming_convention 관계는 중복이므로 먼저 제외
-        if (rel.reason == "naming_convention" and 
-            ((rel.node1_type == "class" and rel.node2_type == "file") or 
-             (rel.node1_type == "file" and rel.node2_type == "class"))):
-            continue
+    # 엣지 수 제한으로 노드 수 간접 제어
+    candidate_pairs = [rel for rel in relatedness_pairs[:max_nodes * 2] if not _is_duplicate_naming_pair(rel)]
+    details_by_node = _load_node_details(db, candidate_pairs)
 
+    # 연관성 데이터를 그래프로 변환
+    for rel in candidate_pairs:
         # 노드 정보 조회
-        src_details = _get_node_details(db, rel.node1_type, rel.node1_id)
-        dst_details = _get_node_details(db, rel.node2_type, rel.node2_id)
+        src_details = _get_node_details(details_by_node, rel.node1_type, rel.node1_id)
+        dst_details = _get_node_details(details_by_node, rel.node2_type, rel.node2_id)
         
         # 통합 키 생성
         src_unified = _get_unified_key(rel.node1_type, src_details)
@@ -14,6 +14,69 @@ from ..schema import create_node, create_edge, create_graph
 from difflib import get_close_matches
 
 
+class _MethodIndex:
+    """프로젝트 메서드 상세 정보를 한 번 읽어 (클래스 FQN, 메서드명) 등으로 조회하는 인덱스"""
+
+    def __init__(self, details_by_id: Dict[int, Dict[str, Any]]):
+        self.details_by_id = details_by_id
+        self.by_class_and_name: Dict[tuple, List[int]] = defaultdict(list)
+        self.by_name: Dict[str, List[int]] = defaultdict(list)
+        self.by_file: Dict[str, List[int]] = defaultdict(list)
+        for method_id, details in details_by_id.items():
+            self.by_class_and_name[(details.get('class') or '', details.get('name'))].append(method_id)
+            self.by_name[details.get('name')].append(method_id)
+            if details.get('file'):
+                self.by_file[Path(details['file']).as_posix()].append(method_id)
+
+    @classmethod
+    def load(cls, db: VizDB, project_id: int) -> '_MethodIndex':
+        return cls(db.fetch_method_details_by_project(project_id))
+
+    def find_in_class(self, class_fqn: str, name: str) -> Optional[int]:
+        """클래스(FQN 접두사 일치) 안에서 이름이 같은 첫 메서드"""
+        exact = self.by_class_and_name.get((class_fqn, name))
+        if exact:
+            return exact[0]
+        for method_id in self.by_name.get(name, ()):
+            if (self.details_by_id[method_id].get('class') or '').startswith(class_fqn):
+                return method_id
+        return None
+
+    def methods_in_files(self, paths: List[str]) -> List[int]:
+        """주어진 파일들의 메서드 (method_id 순)"""
+        method_ids = [mid for path in set(paths) for mid in self.by_file.get(path, ())]
+        return sorted(method_ids)
+
+
+def _parse_target_id(target_id: str) -> tuple:
+    """'type:id' 형태의 대상 ID를 (node_type, node_id)로 분리 (코드 엔티티의 숫자 ID는 int)"""
+    node_type, raw_id = target_id.split(':', 1)
+    try:
+        node_id = int(raw_id) if node_type in ('file', 'class', 'method', 'sql_unit') and raw_id.isdigit() else raw_id
+    except ValueError:
+        node_id = raw_id
+    return node_type, node_id
+
+
+def _load_target_details(db: VizDB, adjacency: Dict[str, List[Dict[str, Any]]],
+                         method_index: _MethodIndex) -> Dict[tuple, Dict[str, Any]]:
+    """탐색 대상 노드의 상세 정보를 미리 조회 (메서드는 인덱스, 나머지는 타입별 일괄 조회)"""
+    details: Dict[tuple, Dict[str, Any]] = {}
+    missing = []
+    for edge_infos in adjacency.values():
+        for edge_info in edge_infos:
+            node_type, node_id = _parse_target_id(edge_info['target'])
+            if node_type == 'unresolved' or (node_type, node_id) in details:
+                continue
+            if node_type == 'method' and node_id in method_index.details_by_id:
+                details[(node_type, node_id)] = method_index.details_by_id[node_id]
+            else:
+                missing.append((node_type, node_id))
+    if missing:
+        details.update(db.get_nodes_details(missing))
+    return details
+
+
 def build_sequence_graph_json(config: Dict[str, Any], project_id: int, project_name: Optional[str], start_file: str = None, start_method: str = None, 
                              depth: int = 3, max_nodes: int = 2000, hide_unresolved: bool = True) -> Dict[str, Any]:
     """시각화를 위한 UML 시퀀스 다이어그램 JSON 데이터 생성"""
@@ -53,8 +116,11 @@ def build_sequence_graph_json(config: Dict[str, Any], project_id: int, project_n
         else:
             edges = all_edges
     
+    # 메서드 상세 정보는 한 번에 읽어 인덱스로 사용합니다.
+    method_index = _MethodIndex.load(db, project_id)
+    
     # Find starting point
-    start_nodes = _find_start_nodes(config, db, project_id, start_file, start_method)
+    start_nodes = _find_start_nodes(config, db, project_id, start_file, start_method, method_index)
     if not start_nodes:
         print("  Warning: No start nodes found.")
         possible_files = db.get_files_with_methods(project_id, limit=20)
@@ -71,7 +137,8 @@ def build_sequence_graph_json(config: Dict[str, Any], project_id: int, project_n
     print(f"  Found {len(start_nodes)} start nodes")
     
     # Build UML sequence diagram 
-    sequence_data = _build_uml_sequence_diagram(config, db, edges, start_nodes, depth, max_nodes, hide_unresolved, project_id)
+    sequence_data = _build_uml_sequence_diagram(config, db, edges, start_nodes, depth, max_nodes, hide_unresolved, project_id,
+                                                method_index)
     
     print(f"  Generated UML sequence diagram with {len(sequence_data['participants'])} participants and {len(sequence_data['interactions'])} interactions")
     
@@ -79,9 +146,11 @@ def build_sequence_graph_json(config: Dict[str, Any], project_id: int, project_n
 
 
 def _find_start_nodes(config: Dict[str, Any], db: VizDB, project_id: int, start_file: str = None, 
-                     start_method: str = None) -> List[Dict[str, Any]]:
+                     start_method: str = None, method_index: Optional[_MethodIndex] = None) -> List[Dict[str, Any]]:
     """Find starting nodes for sequence tracing"""
     start_nodes = []
+    if method_index is None:
+        method_index = _MethodIndex.load(db, project_id)
     
     if start_file:
         files = db.load_project_files(project_id)
@@ -96,47 +165,31 @@ def _find_start_nodes(config: Dict[str, Any], db: VizDB, project_id: int, start_
 
         matching_paths = [Path(f.path).as_posix() for f in matching_files]
         
-        if start_method:
-            # Find specific method in file
-            methods = db.fetch_methods_by_project(project_id)
-            for method in methods:
-                method_details = db.get_node_details('method', method.method_id)
-                if (method_details and
-                    method_details.get('file') and
-                    Path(method_details['file']).as_posix() in matching_paths and
-                    start_method in method.name):
-                    
-                    start_nodes.append({
-                        'id': f"method:{method.method_id}",
-                        'type': 'method',
-                        'label': f"{method.name}()",
-                        'layer': 0,
-                        'details': method_details
-                    })
-        else:
-            # Use all methods in the file
-            methods = db.fetch_methods_by_project(project_id)
-            for method in methods:
-                method_details = db.get_node_details('method', method.method_id)
-                if (method_details and
-                    method_details.get('file') and
-                    Path(method_details['file']).as_posix() in matching_paths):
-                    
-                    start_nodes.append({
-                        'id': f"method:{method.method_id}",
-                        'type': 'method',
-                        'label': f"{method.name}()",
-                        'layer': 0,
-                        'details': method_details
-                    })
+        # 일치하는 파일의 메서드 (start_method가 있으면 이름이 포함된 메서드만)
+        for method_id in method_index.methods_in_files(matching_paths):
+            method_details = method_index.details_by_id[method_id]
+            method_name = method_details.get('name') or ''
+            if start_method and start_method not in method_name:
+                continue
+            start_nodes.append({
+                'id': f"method:{method_id}",
+                'type': 'method',
+                'label': f"{method_name}()",
+                'layer': 0,
+                'details': method_details
+            })
     
     return start_nodes
 
 
 def _build_uml_sequence_diagram(config: Dict[str, Any], db: VizDB, edges: List, start_nodes: List[Dict[str, Any]], 
-                               max_depth: int, max_nodes: int, hide_unresolved: bool = True, project_id: int = None) -> Dict[str, Any]:
+                               max_depth: int, max_nodes: int, hide_unresolved: bool = True, project_id: int = None,
+                               method_index: Optional[_MethodIndex] = None) -> Dict[str, Any]:
     """Build proper UML sequence diagram data structure"""
     
+    if method_index is None:
+        method_index = _MethodIndex.load(db, project_id)
+    
     # Build adjacency map
     adjacency = defaultdict(list)
     unknown_counter = 0
@@ -164,14 +217,9 @@ def _build_uml_sequence_diagram(config: Dict[str, Any], db: VizDB, edges: List,
                     if not qualifier_type and src_method_fqn:
                         # 같은 클래스에서 메소드 찾기
                         class_fqn = ".".join(src_method_fqn.split(".")[:-1])
-                        methods = db.fetch_methods_by_project(project_id)
-                        for method in methods:
-                            method_details = db.get_node_details('method', method.method_id)
-                            if (method_details and 
-                                method_details.get('name') == called_name and
-                                method_details.get('class', '').startswith(class_fqn)):
-                                dst_id = f"method:{method.method_id}"
-                                break
+                        target_method_id = method_index.find_in_class(class_fqn, called_name)
+                        if target_method_id is not None:
+                            dst_id = f"method:{target_method_id}"
                         else:
                             # 찾지 못한 경우 unresolved로 처리
                             dst_id = f"unresolved:{called_name}"
@@ -230,6 +278,9 @@ def _build_uml_sequence_diagram(config: Dict[str, Any], db: VizDB, edges: List,
             print(f"  Created {len(method_adjacency)} method connections")
             adjacency.update(method_adjacency)
     
+    # 탐색 대상 노드 상세 정보는 한 번에 조회
+    target_details_by_node = _load_target_details(db, adjacency, method_index)
+    
     # Track participants and interactions for UML sequence
     participants = {}  # id -> participant info
     interactions = []  # chronological list of interactions
@@ -268,11 +319,8 @@ def _build_uml_sequence_diagram(config: Dict[str, Any], db: VizDB, edges: List,
             target_id = edge_info['target']
             
             # Get target node details
-            node_type, raw_id = target_id.split(':', 1)
-            try:
-                node_id = int(raw_id) if node_type in ('file', 'class', 'method', 'sql_unit') and raw_id.isdigit() else raw_id
-            except ValueError:
-                node_id = raw_id
+            node_type, node_id = _parse_target_id(target_id)
+            raw_id = str(node_id)
             # unresolved 노드인 경우 가상의 details 생성
             if node_type == "unresolved":
                 # 더 의미있는 라벨 생성
@@ -292,7 +340,7 @@ def _build_uml_sequence_diagram(config: Dict[str, Any], db: VizDB, edges: List,
                     'label': label
                 }
             else:
-                target_details = db.get_node_details(node_type, node_id)
+                target_details = target_details_by_node.get((node_type, node_id))
             
             if target_details:
                 # Add participant if not exists
@@ -6,10 +6,12 @@
 노드, 엣지, 테이블, 관계 등의 정보를 추출하는 쿼리 인터페이스를 제공합니다.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from collections import OrderedDict
 from pathlib import Path
 import sys
 import os
+import threading
 
 # phase1 모듈 경로를 시스템 경로에 추가합니다.
 current_dir = Path(__file__).parent
@@ -39,6 +41,39 @@ def DatabaseManager(config: str | Dict[str, Any]) -> _DatabaseManager:
     return dbm
 
 
+# get_nodes_details에서 IN 절 하나에 넣는 최대 ID 수 (SQLite 바인드 변수 제한 고려)
+NODE_DETAILS_BATCH_SIZE = 500
+
+
+class _NodeDetailsLRU:
+    """프로세스 단위 노드 상세 정보 LRU 캐시 (키: DB URL, 노드 타입, 노드 ID)"""
+
+    def __init__(self):
+        self._entries: 'OrderedDict[tuple, Dict[str, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: tuple, value: Dict[str, Any], max_entries: int) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_node_details_cache = _NodeDetailsLRU()
+
+
 class VizDB:
     def __init__(self, config: Dict[str, Any], project_name: Optional[str] = None):
         self.config = config
@@ -54,6 +89,10 @@ class VizDB:
         # DatabaseManager를 초기화합니다.
         self.dbm = _DatabaseManager(db_config)
         self.dbm.initialize()
+        # (테이블, 컬럼) → 존재 여부
+        self._column_cache: Dict[tuple, bool] = {}
+        # database.node_details_cache_size > 0이면 노드 상세 정보를 프로세스 단위 LRU에 보관
+        self.node_details_cache_size = int(db_config.get('node_details_cache_size', 0) or 0)
 
     def session(self):
         """데이터베이스 세션을 가져옵니다."""
@@ -78,76 +117,37 @@ class VizDB:
         finally:
             session.close()
 
-    def _get_project_scoped_ids(self, session, project_id: int) -> Dict[str, List[int]]:
-        """효율적인 엣지 필터링을 위해 모든 프로젝트 범위 ID를 가져옵니다."""
-        # 파일 ID를 가져옵니다.
-        file_ids = [f.file_id for f in session.query(File.file_id).filter(File.project_id == project_id).all()]
-        
-        # 클래스 ID를 가져옵니다.
-        class_ids = [c.class_id for c in session.query(Class.class_id).join(File).filter(File.project_id == project_id).all()]
-        
-        # 메서드 ID를 가져옵니다.
-        method_ids = [m.method_id for m in session.query(Method.method_id).join(Class).join(File).filter(File.project_id == project_id).all()]
-        
-        # SQL 단위 ID를 가져옵니다.
-        sql_ids = [s.sql_id for s in session.query(SqlUnit.sql_id).join(File).filter(File.project_id == project_id).all()]
-        
-        return {
-            'file_ids': file_ids,
-            'class_ids': class_ids,
-            'method_ids': method_ids,
-            'sql_ids': sql_ids
-        }
+    # 프로젝트 엣지로 조회하는 소스 엔티티 타입 (테이블 등 프로젝트 밖 엔티티가 소스인 엣지는 제외)
+    PROJECT_EDGE_SRC_TYPES = ('file', 'class', 'method', 'sql_unit')
 
     def fetch_edges(self, project_id: int, kinds: List[str] = None, min_conf: float = 0.0) -> List[Edge]:
-        """종류 및 신뢰도별 선택적 필터링을 사용하여 엣지를 가져옵니다 (최적화됨)."""
+        """종류 및 신뢰도별 선택적 필터링을 사용하여 엣지를 가져옵니다.
+
+        edges.project_id로 바로 필터링하므로 (project_id, edge_kind, confidence) 인덱스를 사용합니다.
+        """
         session = self.session()
         try:
-            # 1단계: 모든 프로젝트 범위 ID를 메모리에 가져옵니다 (훨씬 빠름).
-            project_ids = self._get_project_scoped_ids(session, project_id)
-            
-            # 2단계: 간단한 IN 절을 사용하여 엣지를 필터링합니다.
             query = session.query(Edge).filter(
-                or_(
-                    and_(Edge.src_type == 'file', Edge.src_id.in_(project_ids['file_ids'])),
-                    and_(Edge.src_type == 'class', Edge.src_id.in_(project_ids['class_ids'])),
-                    and_(Edge.src_type == 'method', Edge.src_id.in_(project_ids['method_ids'])),
-                    and_(Edge.src_type == 'sql_unit', Edge.src_id.in_(project_ids['sql_ids']))
-                )
+                Edge.project_id == project_id,
+                Edge.src_type.in_(self.PROJECT_EDGE_SRC_TYPES)
             )
             
+            # 종류 필터를 적용합니다.
+            if kinds:
+                query = query.filter(Edge.edge_kind.in_(kinds))
+            
             # 신뢰도 필터를 적용합니다.
             if min_conf > 0:
                 query = query.filter(Edge.confidence >= min_conf)
             
-            # 종류 필터를 적용합니다.
-            if kinds:
-                query = query.filter(Edge.edge_kind.in_(kinds))
-                
-            return query.all()
+            # 인덱스 순서와 무관하게 생성 순서(edge_id)로 반환합니다.
+            return query.order_by(Edge.edge_id).all()
         finally:
             session.close()
 
     def fetch_all_edges(self, project_id: int) -> List[Edge]:
         """사용 가능한 엣지 종류를 결정하기 위해 프로젝트의 모든 엣지를 가져옵니다."""
-        session = self.session()
-        try:
-            # 모든 프로젝트 범위 ID를 가져옵니다.
-            project_ids = self._get_project_scoped_ids(session, project_id)
-            
-            # 이 프로젝트의 모든 엣지를 가져옵니다.
-            query = session.query(Edge).filter(
-                or_(
-                    and_(Edge.src_type == 'file', Edge.src_id.in_(project_ids['file_ids'])),
-                    and_(Edge.src_type == 'class', Edge.src_id.in_(project_ids['class_ids'])),
-                    and_(Edge.src_type == 'method', Edge.src_id.in_(project_ids['method_ids'])),
-                    and_(Edge.src_type == 'sql_unit', Edge.src_id.in_(project_ids['sql_ids']))
-                )
-            )
-            
-            return query.all()
-        finally:
-            session.close()
+        return self.fetch_edges(project_id)
 
     def fetch_tables(self) -> List[DbTable]:
         """모든 데이터베이스 테이블을 가져옵니다."""
@@ -172,7 +172,47 @@ class VizDB:
             return session.query(DbColumn).all()
         finally:
             session.close()
-    
+
+    def fetch_erd_schema(self, tables: Optional[Iterable[str]] = None,
+                         owners: Optional[Iterable[str]] = None) -> Tuple[list, Dict[int, List[str]], Dict[int, list]]:
+        """ERD용 테이블, table_id별 PK 컬럼명, table_id별 컬럼을 종류마다 쿼리 한 번으로 가져옵니다.
+
+        tables/owners(대소문자 무시)가 주어지면 세 쿼리 모두 SQL에서 필터링합니다.
+        반환 행은 ERD에 필요한 컬럼만 담은 Row 객체입니다.
+        """
+        session = self.session()
+        try:
+            table_filters = []
+            if tables:
+                table_filters.append(func.upper(DbTable.table_name).in_([t.upper() for t in tables]))
+            if owners:
+                table_filters.append(func.upper(func.coalesce(DbTable.owner, '')).in_([o.upper() for o in owners]))
+
+            table_rows = (session.query(DbTable.table_id, DbTable.owner, DbTable.table_name,
+                                        DbTable.status, DbTable.table_comment)
+                          .filter(*table_filters)
+                          .order_by(DbTable.table_id)
+                          .all())
+
+            pk_query = session.query(DbPk.table_id, DbPk.column_name)
+            column_query = session.query(DbColumn.table_id, DbColumn.column_name, DbColumn.data_type,
+                                         DbColumn.nullable, DbColumn.column_comment)
+            if table_filters:
+                pk_query = pk_query.join(DbTable, DbTable.table_id == DbPk.table_id).filter(*table_filters)
+                column_query = column_query.join(DbTable, DbTable.table_id == DbColumn.table_id).filter(*table_filters)
+
+            pk_by_table: Dict[int, List[str]] = {}
+            for table_id, column_name in pk_query.order_by(DbPk.table_id, DbPk.pk_pos):
+                pk_by_table.setdefault(table_id, []).append(column_name)
+
+            columns_by_table: Dict[int, list] = {}
+            for row in column_query.order_by(DbColumn.table_id, DbColumn.column_id):
+                columns_by_table.setdefault(row.table_id, []).append(row)
+
+            return table_rows, pk_by_table, columns_by_table
+        finally:
+            session.close()
+
     def fetch_sample_joins_for_table(self, table_id: int, limit: int = 5) -> List[Dict[str, Any]]:
         print("""특정 테이블에 대한 샘플 조인 정보를 가져옵니다.""")
         session = self.session()
@@ -225,7 +265,7 @@ class VizDB:
         """필요한 필터를 가져옵니다. 선택적으로 특정 SQL 단위에 대한 필터를 가져올 수 있습니다."""
         session = self.session()
         try:
-            query = session.query(RequiredFilter).join(SqlUnit).join(File).filter(File.project_id == project_id)
+            query = session.query(RequiredFilter).join(SqlUnit).filter(SqlUnit.project_id == project_id)
             
             # SQL ID가 지정된 경우 해당 SQL 단위에 대한 필터를 추가합니다.
             if sql_id:
@@ -239,8 +279,7 @@ class VizDB:
         """특정 프로젝트의 모든 조인을 가져옵니다."""
         session = self.session()
         try:
-            return session.query(Join).join(SqlUnit).join(File).\
-                filter(File.project_id == project_id).all()
+            return session.query(Join).filter(Join.project_id == project_id).all()
         finally:
             session.close()
 
@@ -248,8 +287,48 @@ class VizDB:
         """프로젝트의 모든 메서드를 가져옵니다."""
         session = self.session()
         try:
-            return session.query(Method).join(Class).join(File).\
-                filter(File.project_id == project_id).all()
+            return session.query(Method).filter(Method.project_id == project_id).all()
+        finally:
+            session.close()
+
+    def _has_column(self, session, table_name: str, column_name: str) -> bool:
+        """테이블에 컬럼이 있는지 확인합니다 (llm_summary 등 선택 컬럼용, 결과 캐시)."""
+        key = (table_name, column_name)
+        if key not in self._column_cache:
+            from sqlalchemy import inspect as sa_inspect
+            columns = {col['name'] for col in sa_inspect(session.get_bind()).get_columns(table_name)}
+            self._column_cache[key] = column_name in columns
+        return self._column_cache[key]
+
+    def fetch_method_details_by_project(self, project_id: int) -> Dict[int, Dict[str, Any]]:
+        """프로젝트의 모든 메서드 상세 정보를 한 번의 조인 쿼리로 가져옵니다.
+
+        Returns:
+            method_id → get_node_details('method', ...)와 같은 형태의 dict (method_id 순)
+            클래스/파일 행이 없는 메서드도 포함하며 class/file은 None입니다.
+        """
+        session = self.session()
+        try:
+            columns = [Method.method_id, Method.name, Method.signature, Method.start_line, Class.fqn, File.path]
+            has_summary = self._has_column(session, 'methods', 'llm_summary')
+            if has_summary:
+                columns.append(text('methods.llm_summary'))
+            rows = (session.query(*columns)
+                    .outerjoin(Class, Method.class_id == Class.class_id)
+                    .outerjoin(File, Class.file_id == File.file_id)
+                    .filter(Method.project_id == project_id)
+                    .order_by(Method.method_id))
+            details = {}
+            for row in rows:
+                details[row[0]] = {
+                    'name': row[1],
+                    'signature': row[2],
+                    'class': row[4],
+                    'file': row[5],
+                    'line': row[3],
+                    'llm_summary': (row[6] or None) if has_summary else None
+                }
+            return details
         finally:
             session.close()
 
@@ -257,8 +336,7 @@ class VizDB:
         """프로젝트의 모든 SQL 단위를 가져옵니다."""
         session = self.session()
         try:
-            return session.query(SqlUnit).join(File).\
-                filter(File.project_id == project_id).all()
+            return session.query(SqlUnit).filter(SqlUnit.project_id == project_id).all()
         finally:
             session.close()
 
@@ -267,9 +345,9 @@ class VizDB:
 
         주어진 프로젝트에 항목이 속하도록 대상 유형별로 조인합니다:
         - file -> File.project_id
-        - class -> Class -> File.project_id
-        - method -> Method -> Class -> File.project_id
-        - sql_unit -> SqlUnit -> File.project_id
+        - class -> Class.project_id
+        - method -> Method.project_id
+        - sql_unit -> SqlUnit.project_id
         """
         session = self.session()
         try:
@@ -284,174 +362,209 @@ class VizDB:
             # 클래스 대상을 조회합니다.
             q_class = session.query(VulnerabilityFix).join(
                 Class, (VulnerabilityFix.target_type == 'class') & (VulnerabilityFix.target_id == Class.class_id)
-            ).join(File, Class.file_id == File.file_id).filter(File.project_id == project_id)
+            ).filter(Class.project_id == project_id)
             results.extend(q_class.all())
 
             # 메서드 대상을 조회합니다.
             q_method = session.query(VulnerabilityFix).join(
                 Method, (VulnerabilityFix.target_type == 'method') & (VulnerabilityFix.target_id == Method.method_id)
-            ).join(Class, Method.class_id == Class.class_id).join(File, Class.file_id == File.file_id).filter(File.project_id == project_id)
+            ).filter(Method.project_id == project_id)
             results.extend(q_method.all())
 
             # SQL 단위 대상을 조회합니다.
             q_sql = session.query(VulnerabilityFix).join(
                 SqlUnit, (VulnerabilityFix.target_type == 'sql_unit') & (VulnerabilityFix.target_id == SqlUnit.sql_id)
-            ).join(File, SqlUnit.file_id == File.file_id).filter(File.project_id == project_id)
+            ).filter(SqlUnit.project_id == project_id)
             results.extend(q_sql.all())
 
             return results
         finally:
             session.close()
 
-    def get_node_details(self, node_type: str, node_id: int) -> Optional[Dict[str, Any]]:
-        """LLM 요약을 포함하여 특정 노드에 대한 상세 정보를 가져옵니다."""
+    def get_nodes_details(self, nodes: Iterable[Tuple[str, Any]]) -> Dict[Tuple[str, Any], Dict[str, Any]]:
+        """여러 노드의 상세 정보를 노드 타입별 조인 IN 쿼리 한 번으로 가져옵니다.
+
+        Args:
+            nodes: (node_type, node_id) 목록 (중복 허용)
+
+        Returns:
+            (node_type, node_id) → get_node_details와 같은 형태의 dict. 찾지 못한 노드는 포함되지 않습니다
+            (table은 get_node_details와 같이 대체 값을 반환).
+        """
+        results: Dict[Tuple[str, Any], Dict[str, Any]] = {}
+        pending: Dict[str, List[Any]] = {}
+        cache_url = self._details_cache_url()
+        for node_type, node_id in dict.fromkeys(nodes):
+            if cache_url:
+                cached = _node_details_cache.get((cache_url, node_type, node_id))
+                if cached is not None:
+                    results[(node_type, node_id)] = cached
+                    continue
+            pending.setdefault(node_type, []).append(node_id)
+        if not pending:
+            return results
+
+        loaders = {
+            'method': self._load_method_details,
+            'class': self._load_class_details,
+            'file': self._load_file_details,
+            'sql_unit': self._load_sql_unit_details,
+        }
+        fetched: Dict[Tuple[str, Any], Dict[str, Any]] = {}
         session = self.session()
         try:
-            if node_type == 'method':
-                # 메서드 ID로 메서드를 조회합니다.
-                method = session.query(Method).filter(Method.method_id == node_id).first()
-                if method:
-                    # 메서드와 관련된 클래스 및 파일을 조회합니다.
-                    cls = session.query(Class).filter(Class.class_id == method.class_id).first()
-                    file = session.query(File).filter(File.file_id == cls.file_id).first() if cls else None
-                    
-                    # 사용 가능한 경우 LLM 요약을 가져옵니다.
-                    llm_summary = None
-                    try:
-                        result = session.execute(
-                            text("SELECT llm_summary FROM methods WHERE method_id = :method_id"),
-                            {"method_id": method.method_id}
-                        ).fetchone()
-                        if result and result[0]:
-                            llm_summary = result[0]
-                    except Exception:
-                        pass
-                    
-                    return {
-                        'name': method.name,
-                        'signature': method.signature,
-                        'class': cls.fqn if cls else None,
-                        'file': file.path if file else None,
-                        'line': method.start_line,
-                        'llm_summary': llm_summary
-                    }
-            elif node_type == 'class':
-                # 클래스 ID로 클래스를 조회합니다.
-                cls = session.query(Class).filter(Class.class_id == node_id).first()
-                if cls:
-                    # 클래스와 관련된 파일을 조회합니다.
-                    file = session.query(File).filter(File.file_id == cls.file_id).first()
-                    
-                    # 사용 가능한 경우 LLM 요약을 가져옵니다.
-                    llm_summary = None
-                    try:
-                        result = session.execute(
-                            text("SELECT llm_summary FROM classes WHERE class_id = :class_id"),
-                            {"class_id": cls.class_id}
-                        ).fetchone()
-                        if result and result[0]:
-                            llm_summary = result[0]
-                    except Exception:
-                        pass
-                    
-                    return {
-                        'name': cls.name,
-                        'fqn': cls.fqn,
-                        'file': file.path if file else None,
-                        'line': cls.start_line,
-                        'llm_summary': llm_summary
-                    }
-            elif node_type == 'file':
-                # 파일 ID로 파일을 조회합니다.
-                file = session.query(File).filter(File.file_id == node_id).first()
-                if file:
-                    # 사용 가능한 경우 LLM 요약을 가져옵니다.
-                    llm_summary = None
-                    try:
-                        result = session.execute(
-                            text("SELECT llm_summary FROM files WHERE file_id = :file_id"),
-                            {"file_id": file.file_id}
-                        ).fetchone()
-                        if result and result[0]:
-                            llm_summary = result[0]
-                    except Exception:
-                        pass
-                    
-                    return {
-                        'path': file.path,
-                        'language': file.language,
-                        'loc': file.loc,
-                        'llm_summary': llm_summary
-                    }
-            elif node_type == 'sql_unit':
-                # SQL ID로 SQL 단위를 조회합니다.
-                sql = session.query(SqlUnit).filter(SqlUnit.sql_id == node_id).first()
-                if sql:
-                    # SQL 단위와 관련된 파일을 조회합니다.
-                    file = session.query(File).filter(File.file_id == sql.file_id).first()
-                    
-                    # 사용 가능한 경우 LLM 요약을 가져옵니다.
-                    llm_summary = None
-                    try:
-                        result = session.execute(
-                            text("SELECT llm_summary FROM sql_units WHERE sql_id = :sql_id"),
-                            {"sql_id": sql.sql_id}
-                        ).fetchone()
-                        if result and result[0]:
-                            llm_summary = result[0]
-                    except Exception:
-                        pass
-                    
-                    return {
-                        'stmt_id': sql.stmt_id,
-                        'mapper_ns': sql.mapper_ns,
-                        'stmt_kind': sql.stmt_kind,
-                        'file': file.path if file else None,
-                        'line': sql.start_line,
-                        'llm_summary': llm_summary
-                    }
-            elif node_type == 'table':
-                # table_id 또는 이름으로 테이블 노드를 처리합니다.
-                if isinstance(node_id, int):
-                    # table_id로 조회합니다.
-                    table = session.query(DbTable).filter(DbTable.table_id == node_id).first()
-                else:
-                    # 테이블 이름으로 조회합니다 (대체).
-                    table = session.query(DbTable).filter(DbTable.table_name.ilike(f'%{node_id}%')).first()
-                
-                if table:
-                    # 사용 가능한 경우 LLM 주석을 가져옵니다.
-                    llm_comment = None
-                    try:
-                        result = session.execute(
-                            text("SELECT llm_comment FROM db_tables WHERE table_id = :table_id"),
-                            {"table_id": table.table_id}
-                        ).fetchone()
-                        if result and result[0]:
-                            llm_comment = result[0]
-                    except Exception:
-                        pass
-                    
-                    return {
-                        'name': f"{table.owner}.{table.table_name}" if table.owner else table.table_name,
-                        'type': 'table',
-                        'owner': table.owner,
-                        'table_name': table.table_name,
-                        'table_id': table.table_id,
-                        'status': getattr(table, 'status', 'VALID'),
-                        'comment': table.comment,
-                        'llm_comment': llm_comment
-                    }
-                else:
-                    # 알 수 없는 테이블에 대한 대체 값을 반환합니다.
-                    return {
-                        'name': str(node_id),
-                        'type': 'table'
-                    }
+            for node_type, node_ids in pending.items():
+                if node_type == 'table':
+                    table_ids = [node_id for node_id in node_ids if isinstance(node_id, int)]
+                    for node_id, details in self._load_table_details(session, table_ids).items():
+                        fetched[('table', node_id)] = details
+                    # 이름으로 지정된 테이블은 부분 일치로 조회
+                    for node_id in node_ids:
+                        if not isinstance(node_id, int):
+                            fetched[('table', node_id)] = self._get_table_details_by_name(node_id)
+                elif node_type in loaders:
+                    for node_id, details in loaders[node_type](session, node_ids).items():
+                        fetched[(node_type, node_id)] = details
         finally:
             session.close()
+
+        for key, details in fetched.items():
+            if details is None:
+                continue
+            results[key] = details
+            if cache_url:
+                _node_details_cache.put((cache_url,) + key, details, self.node_details_cache_size)
+        return results
+
+    def _details_cache_url(self) -> Optional[str]:
+        if self.node_details_cache_size <= 0 or self.dbm.engine is None:
+            return None
+        return str(self.dbm.engine.url)
+
+    @staticmethod
+    def _id_batches(node_ids: List[Any]):
+        for start in range(0, len(node_ids), NODE_DETAILS_BATCH_SIZE):
+            yield node_ids[start:start + NODE_DETAILS_BATCH_SIZE]
+
+    def _summary_column(self, session, table_name: str, column_name: str = 'llm_summary'):
+        """선택 컬럼(llm_summary/llm_comment)이 있으면 조회 컬럼으로, 없으면 None"""
+        if self._has_column(session, table_name, column_name):
+            return text(f'{table_name}.{column_name}')
         return None
 
+    def _load_method_details(self, session, method_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        summary = self._summary_column(session, 'methods')
+        columns = [Method.method_id, Method.name, Method.signature, Method.start_line, Class.fqn, File.path]
+        details = {}
+        for batch in self._id_batches(method_ids):
+            query = (session.query(*columns, *([summary] if summary is not None else []))
+                     .outerjoin(Class, Method.class_id == Class.class_id)
+                     .outerjoin(File, Class.file_id == File.file_id)
+                     .filter(Method.method_id.in_(batch)))
+            for row in query:
+                details[row[0]] = {
+                    'name': row[1],
+                    'signature': row[2],
+                    'class': row[4],
+                    'file': row[5],
+                    'line': row[3],
+                    'llm_summary': (row[6] or None) if summary is not None else None
+                }
+        return details
+
+    def _load_class_details(self, session, class_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        summary = self._summary_column(session, 'classes')
+        columns = [Class.class_id, Class.name, Class.fqn, Class.start_line, File.path]
+        details = {}
+        for batch in self._id_batches(class_ids):
+            query = (session.query(*columns, *([summary] if summary is not None else []))
+                     .outerjoin(File, Class.file_id == File.file_id)
+                     .filter(Class.class_id.in_(batch)))
+            for row in query:
+                details[row[0]] = {
+                    'name': row[1],
+                    'fqn': row[2],
+                    'file': row[4],
+                    'line': row[3],
+                    'llm_summary': (row[5] or None) if summary is not None else None
+                }
+        return details
+
+    def _load_file_details(self, session, file_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        summary = self._summary_column(session, 'files')
+        columns = [File.file_id, File.path, File.language, File.loc]
+        details = {}
+        for batch in self._id_batches(file_ids):
+            query = (session.query(*columns, *([summary] if summary is not None else []))
+                     .filter(File.file_id.in_(batch)))
+            for row in query:
+                details[row[0]] = {
+                    'path': row[1],
+                    'language': row[2],
+                    'loc': row[3],
+                    'llm_summary': (row[4] or None) if summary is not None else None
+                }
+        return details
+
+    def _load_sql_unit_details(self, session, sql_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        summary = self._summary_column(session, 'sql_units')
+        columns = [SqlUnit.sql_id, SqlUnit.stmt_id, SqlUnit.mapper_ns, SqlUnit.stmt_kind, SqlUnit.start_line, File.path]
+        details = {}
+        for batch in self._id_batches(sql_ids):
+            query = (session.query(*columns, *([summary] if summary is not None else []))
+                     .outerjoin(File, SqlUnit.file_id == File.file_id)
+                     .filter(SqlUnit.sql_id.in_(batch)))
+            for row in query:
+                details[row[0]] = {
+                    'stmt_id': row[1],
+                    'mapper_ns': row[2],
+                    'stmt_kind': row[3],
+                    'file': row[5],
+                    'line': row[4],
+                    'llm_summary': (row[6] or None) if summary is not None else None
+                }
+        return details
+
+    def _load_table_details(self, session, table_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        details = {}
+        for batch in self._id_batches(table_ids):
+            for table in session.query(DbTable).filter(DbTable.table_id.in_(batch)):
+                details[table.table_id] = {
+                    'name': f"{table.owner}.{table.table_name}" if table.owner else table.table_name,
+                    'type': 'table',
+                    'owner': table.owner,
+                    'table_name': table.table_name,
+                    'table_id': table.table_id,
+                    'status': getattr(table, 'status', 'VALID'),
+                    'comment': table.table_comment,
+                    'llm_comment': table.llm_comment or None
+                }
+        # 알 수 없는 테이블은 대체 값을 반환합니다.
+        for node_id in table_ids:
+            details.setdefault(node_id, {'name': str(node_id), 'type': 'table'})
+        return details
+
+    def get_node_details(self, node_type: str, node_id: int) -> Optional[Dict[str, Any]]:
+        """LLM 요약을 포함하여 특정 노드에 대한 상세 정보를 가져옵니다 (여러 노드는 get_nodes_details 사용)."""
+        if node_type == 'table' and not isinstance(node_id, int):
+            return self._get_table_details_by_name(node_id)
+        return self.get_nodes_details([(node_type, node_id)]).get((node_type, node_id))
+
+    def _get_table_details_by_name(self, table_name: str) -> Dict[str, Any]:
+        """테이블 이름(부분 일치)으로 테이블 노드 상세 정보를 가져옵니다."""
+        session = self.session()
+        try:
+            table = session.query(DbTable).filter(DbTable.table_name.ilike(f'%{table_name}%')).first()
+            if table:
+                return self._load_table_details(session, [table.table_id])[table.table_id]
+        finally:
+            session.close()
+        # 알 수 없는 테이블에 대한 대체 값을 반환합니다.
+        return {
+            'name': str(table_name),
+            'type': 'table'
+        }
+
     def fetch_relatedness(self, project_id: int, min_score: float = 0.0) -> List[Relatedness]:
         """
         연관성 데이터 조회
@@ -61,7 +61,8 @@ class EnhancedVisualizationFactory:
                             'edge_attraction': 0.1,
                             'damping': 0.9,
                             'min_distance': 150,
-                            'center_gravity': 0.01
+                            'center_gravity': 0.01,
+                            'exact_threshold': 500
                         },
                         'hierarchical': {
                             'level_height': 220,
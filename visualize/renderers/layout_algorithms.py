@@ -2,8 +2,11 @@
 from typing import Dict, List, Any, Tuple, Optional
 import math
 import random
+from collections import defaultdict
 from dataclasses import dataclass
 
+import numpy as np
+
 @dataclass
 class NodePosition:
     x: float
@@ -19,6 +22,27 @@ class EdgeInfo:
     weight: float = 1.0
     length: float = 150
 
+def _build_interaction_offsets() -> 'np.ndarray':
+    """
+    Barnes-Hut 레벨별 근사 대상 셀의 상대 오프셋 (셀 좌표 홀짝 4가지 × 27개)
+    부모의 인접 셀(3x3)의 자식 36개 중 자신과 인접한 9개를 제외한 셀들입니다.
+    """
+    table = np.zeros((4, 27, 2), dtype=np.int64)
+    for parity_y in (0, 1):
+        for parity_x in (0, 1):
+            offsets = [
+                (ox, oy)
+                for ox in range(-2 - parity_x, 4 - parity_x)
+                for oy in range(-2 - parity_y, 4 - parity_y)
+                if abs(ox) > 1 or abs(oy) > 1
+            ]
+            table[parity_y * 2 + parity_x] = offsets
+    return table
+
+
+_INTERACTION_OFFSETS = _build_interaction_offsets()
+
+
 class LayoutAlgorithm:
     """레이아웃 알고리즘 기본 클래스"""
     
@@ -40,122 +64,219 @@ class ForceDirectedLayout(LayoutAlgorithm):
         self.damping = self.config.get('damping', 0.9)
         self.min_distance = self.config.get('min_distance', 100)
         self.center_gravity = self.config.get('center_gravity', 0.01)
+        # 노드 수가 exact_threshold를 넘으면 척력을 Barnes-Hut(쿼드트리)로 근사
+        self.exact_threshold = self.config.get('exact_threshold', 500)
+        self.leaf_size = self.config.get('leaf_size', 8)
+        self.max_depth = self.config.get('max_depth', 16)
     
     def calculate_layout(self, nodes: List[Dict], edges: List[Dict]) -> Dict[str, NodePosition]:
         """포스 디렉티드 알고리즘으로 노드 위치 계산"""
         
-        # 노드 위치 초기화 (원형 배치)
-        positions = {}
         node_count = len(nodes)
-        radius = max(200, node_count * 30)
+        if node_count == 0:
+            return {}
         
-        for i, node in enumerate(nodes):
-            angle = 2 * math.pi * i / node_count if node_count > 0 else 0
-            x = radius * math.cos(angle)
-            y = radius * math.sin(angle)
-            
-            # 노드 크기 계산
-            width = self._calculate_node_width(node)
-            height = self._calculate_node_height(node)
-            
-            positions[node['id']] = NodePosition(x, y, node['id'], width, height)
+        # 노드 위치 초기화 (원형 배치)
+        radius = max(200, node_count * 30)
+        angles = 2 * np.pi * np.arange(node_count) / node_count
+        pos = np.column_stack((radius * np.cos(angles), radius * np.sin(angles)))
+        velocity = np.zeros_like(pos)
         
-        # 속도 벡터 초기화
-        velocities = {node_id: {'x': 0, 'y': 0} for node_id in positions.keys()}
+        node_ids = [node['id'] for node in nodes]
+        widths = np.array([self._calculate_node_width(node) for node in nodes], dtype=float)
+        heights = [self._calculate_node_height(node) for node in nodes]
         
-        # 엣지 정보 전처리
-        edge_map = {}
+        # 엣지 정보 전처리 (무방향 그래프, 같은 노드 쌍은 마지막 가중치 사용)
+        index_of = {node_id: i for i, node_id in enumerate(node_ids)}
+        pair_weights = {}
         for edge in edges:
             source_id = edge['source']
             target_id = edge['target']
             weight = edge.get('confidence', 0.5)
-            
-            edge_map[(source_id, target_id)] = weight
-            edge_map[(target_id, source_id)] = weight  # 무방향 그래프로 처리
+            key = (source_id, target_id) if source_id <= target_id else (target_id, source_id)
+            pair_weights[key] = weight
+        pairs = [(index_of[a], index_of[b], w) for (a, b), w in pair_weights.items()
+                 if a in index_of and b in index_of and a != b]
+        edge_src = np.array([p[0] for p in pairs], dtype=np.int64)
+        edge_dst = np.array([p[1] for p in pairs], dtype=np.int64)
+        ideal_length = np.array([150 + p[2] * 100 for p in pairs], dtype=float)  # 가중치에 따른 이상적 거리
         
         # 포스 디렉티드 시뮬레이션
         for iteration in range(self.iterations):
-            forces = {node_id: {'x': 0, 'y': 0} for node_id in positions.keys()}
+            forces = self._repulsion_forces(pos, widths)
             
-            # 척력 계산 (모든 노드 쌍)
-            node_ids = list(positions.keys())
-            for i in range(len(node_ids)):
-                for j in range(i + 1, len(node_ids)):
-                    node1_id = node_ids[i]
-                    node2_id = node_ids[j]
-                    
-                    pos1 = positions[node1_id]
-                    pos2 = positions[node2_id]
-                    
-                    dx = pos1.x - pos2.x
-                    dy = pos1.y - pos2.y
-                    distance = math.sqrt(dx*dx + dy*dy)
-                    
-                    if distance > 0:
-                        # 겹침 방지를 위한 최소 거리
-                        min_dist = max(self.min_distance, 
-                                     (pos1.width + pos2.width) / 2 + 20)
-                        
-                        if distance < min_dist:
-                            # 매우 가까운 경우 강한 척력 적용
-                            force_magnitude = self.node_repulsion / (distance * distance) * 2
-                        else:
-                            force_magnitude = self.node_repulsion / (distance * distance)
-                        
-                        fx = (dx / distance) * force_magnitude
-                        fy = (dy / distance) * force_magnitude
-                        
-                        forces[node1_id]['x'] += fx
-                        forces[node1_id]['y'] += fy
-                        forces[node2_id]['x'] -= fx
-                        forces[node2_id]['y'] -= fy
-            
-            # 인력 계산 (연결된 노드들)
-            for (source_id, target_id), weight in edge_map.items():
-                if source_id in positions and target_id in positions:
-                    pos1 = positions[source_id]
-                    pos2 = positions[target_id]
-                    
-                    dx = pos2.x - pos1.x
-                    dy = pos2.y - pos1.y
-                    distance = math.sqrt(dx*dx + dy*dy)
-                    
-                    if distance > 0:
-                        ideal_distance = 150 + weight * 100  # 가중치에 따른 이상적 거리
-                        force_magnitude = self.edge_attraction * (distance - ideal_distance)
-                        
-                        fx = (dx / distance) * force_magnitude
-                        fy = (dy / distance) * force_magnitude
-                        
-                        forces[source_id]['x'] += fx
-                        forces[source_id]['y'] += fy
-                        forces[target_id]['x'] -= fx
-                        forces[target_id]['y'] -= fy
+            # 인력 계산 (연결된 노드들, 양방향으로 두 번 적용)
+            if len(edge_src):
+                delta = pos[edge_dst] - pos[edge_src]
+                distance = np.hypot(delta[:, 0], delta[:, 1])
+                safe = np.where(distance > 0, distance, 1.0)
+                magnitude = np.where(distance > 0, 2 * self.edge_attraction * (distance - ideal_length) / safe, 0.0)
+                pull = delta * magnitude[:, None]
+                for axis in (0, 1):
+                    forces[:, axis] += np.bincount(edge_src, weights=pull[:, axis], minlength=node_count)
+                    forces[:, axis] -= np.bincount(edge_dst, weights=pull[:, axis], minlength=node_count)
             
             # 중심으로 끌어당기는 힘
-            for node_id, pos in positions.items():
-                forces[node_id]['x'] -= pos.x * self.center_gravity
-                forces[node_id]['y'] -= pos.y * self.center_gravity
+            forces -= pos * self.center_gravity
             
             # 속도 및 위치 업데이트
-            total_energy = 0
-            for node_id in positions.keys():
-                # 속도 업데이트
-                velocities[node_id]['x'] = velocities[node_id]['x'] * self.damping + forces[node_id]['x'] * 0.1
-                velocities[node_id]['y'] = velocities[node_id]['y'] * self.damping + forces[node_id]['y'] * 0.1
-                
-                # 위치 업데이트
-                positions[node_id].x += velocities[node_id]['x'] * 0.1
-                positions[node_id].y += velocities[node_id]['y'] * 0.1
-                
-                # 에너지 계산
-                total_energy += velocities[node_id]['x']**2 + velocities[node_id]['y']**2
+            velocity = velocity * self.damping + forces * 0.1
+            pos += velocity * 0.1
             
             # 수렴 체크
+            total_energy = float(np.sum(velocity * velocity))
             if iteration > 50 and total_energy < 1.0:
                 break
         
-        return positions
+        return {
+            node_id: NodePosition(float(pos[i, 0]), float(pos[i, 1]), node_id, float(widths[i]), heights[i])
+            for i, node_id in enumerate(node_ids)
+        }
+    
+    def _repulsion_forces(self, pos: 'np.ndarray', widths: 'np.ndarray') -> 'np.ndarray':
+        """노드 간 척력 (노드 수가 많으면 Barnes-Hut 근사)"""
+        if len(pos) <= self.exact_threshold:
+            return self._exact_repulsion(pos, widths)
+        return self._barnes_hut_repulsion(pos, widths)
+    
+    def _pair_repulsion(self, delta: 'np.ndarray', pair_widths: 'np.ndarray') -> 'np.ndarray':
+        """노드 쌍(delta = 자신 - 상대)이 자신에게 주는 척력"""
+        dist_sq = delta[..., 0] ** 2 + delta[..., 1] ** 2
+        distance = np.sqrt(dist_sq)
+        valid = distance > 0
+        safe = np.where(valid, distance, 1.0)
+        # 겹침 방지를 위한 최소 거리보다 가까우면 강한 척력 적용
+        min_dist = np.maximum(self.min_distance, pair_widths / 2 + 20)
+        magnitude = self.node_repulsion / (safe * safe) * np.where(distance < min_dist, 2.0, 1.0)
+        magnitude = np.where(valid, magnitude / safe, 0.0)
+        return delta * magnitude[..., None]
+    
+    def _exact_repulsion(self, pos: 'np.ndarray', widths: 'np.ndarray') -> 'np.ndarray':
+        """모든 노드 쌍의 척력 (메모리 사용을 제한하기 위해 행 단위로 나누어 계산)"""
+        forces = np.zeros_like(pos)
+        chunk = max(1, 1_000_000 // len(pos))
+        for start in range(0, len(pos), chunk):
+            rows = slice(start, start + chunk)
+            dx = pos[rows, 0, None] - pos[None, :, 0]
+            dy = pos[rows, 1, None] - pos[None, :, 1]
+            distance = np.hypot(dx, dy)
+            valid = distance > 0
+            safe = np.where(valid, distance, 1.0)
+            min_dist = np.maximum(self.min_distance, (widths[rows, None] + widths[None, :]) / 2 + 20)
+            magnitude = self.node_repulsion / (safe * safe * safe) * np.where(distance < min_dist, 2.0, 1.0)
+            magnitude[~valid] = 0.0
+            forces[rows, 0] = (dx * magnitude).sum(axis=1)
+            forces[rows, 1] = (dy * magnitude).sum(axis=1)
+        return forces
+    
+    def _barnes_hut_repulsion(self, pos: 'np.ndarray', widths: 'np.ndarray') -> 'np.ndarray':
+        """
+        쿼드트리(Barnes-Hut) 근사 척력
+        각 레벨에서 인접하지 않은 셀은 질량 중심 하나로 근사하고, 가장 깊은 레벨에서
+        인접한 셀(자신 포함 3x3)의 노드들만 노드 쌍으로 직접 계산합니다.
+        레벨 l의 근사 대상은 "부모의 인접 셀의 자식 중 자신과 인접하지 않은 셀"이므로
+        모든 노드 쌍은 정확히 한 번(근사 또는 직접)만 계산됩니다.
+        """
+        n = len(pos)
+        origin = pos.min(axis=0)
+        size = float((pos.max(axis=0) - origin).max()) * (1 + 1e-9) or 1.0
+        unit = (pos - origin) / size  # [0, 1) 정규화 좌표
+        
+        # 가장 깊은 레벨: 셀당 평균 노드 수가 leaf_size 근처가 되도록, 한 셀에 몰린 경우 더 깊게.
+        # 단, 셀 크기는 최소 거리 이상으로 유지해 강한 척력 구간의 쌍은 항상 직접 계산되도록 함
+        spacing = max(self.min_distance, float(widths.max()) + 20)
+        depth_limit = min(self.max_depth, max(0, int(math.log2(size / spacing))))
+        depth = min(depth_limit, max(2, math.ceil(math.log(max(n / self.leaf_size, 1.0), 4))))
+        while depth < depth_limit:
+            cells = self._cell_coords(unit, depth)
+            occupancy = np.unique(cells[:, 1] * (1 << depth) + cells[:, 0], return_counts=True)[1]
+            if occupancy.max() <= 4 * self.leaf_size:
+                break
+            depth += 1
+        
+        forces = np.zeros_like(pos)
+        for level in range(2, depth + 1):
+            forces += self._far_field(pos, unit, level)
+        forces += self._near_field(pos, unit, widths, depth)
+        return forces
+    
+    @staticmethod
+    def _cell_coords(unit: 'np.ndarray', level: int) -> 'np.ndarray':
+        grid = 1 << level
+        return np.minimum((unit * grid).astype(np.int64), grid - 1)
+    
+    def _far_field(self, pos: 'np.ndarray', unit: 'np.ndarray', level: int) -> 'np.ndarray':
+        """레벨 level에서 인접하지 않은(부모는 인접한) 셀의 질량 중심이 주는 척력"""
+        n = len(pos)
+        grid = 1 << level
+        cells = self._cell_coords(unit, level)
+        occupied, node_cell, mass = np.unique(cells[:, 1] * grid + cells[:, 0],
+                                              return_inverse=True, return_counts=True)
+        node_cell = node_cell.reshape(-1)
+        center = np.column_stack([
+            np.bincount(node_cell, weights=pos[:, axis], minlength=len(occupied)) / mass
+            for axis in (0, 1)
+        ])
+        
+        # 노드가 있는 셀끼리만 상호작용 목록 구성: 셀 좌표의 홀짝에 따라 상대 오프셋 27개가 정해짐
+        cell_xy = np.column_stack((occupied % grid, occupied // grid))
+        target = cell_xy[:, None, :] + _INTERACTION_OFFSETS[(cell_xy[:, 1] & 1) * 2 + (cell_xy[:, 0] & 1)]
+        inside = ((target >= 0) & (target < grid)).all(axis=2)
+        target_ids = target[..., 1] * grid + target[..., 0]
+        slot = np.minimum(np.searchsorted(occupied, target_ids), len(occupied) - 1)
+        hit = inside & (occupied[slot] == target_ids)
+        pair_cell, pair_slot = np.nonzero(hit)
+        pair_target = slot[pair_cell, pair_slot]
+        if len(pair_cell) == 0:
+            return np.zeros_like(pos)
+        
+        # 노드별로 자기 셀의 상호작용 목록을 펼침 (pair_cell은 정렬되어 있음)
+        starts = np.searchsorted(pair_cell, np.arange(len(occupied)), side='left')
+        counts = np.bincount(pair_cell, minlength=len(occupied))[node_cell]
+        total = int(counts.sum())
+        if total == 0:
+            return np.zeros_like(pos)
+        src = np.repeat(np.arange(n), counts)
+        within = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        dst_cell = pair_target[np.repeat(starts[node_cell], counts) + within]
+        
+        delta = pos[src] - center[dst_cell]
+        dist_sq = delta[:, 0] ** 2 + delta[:, 1] ** 2
+        magnitude = mass[dst_cell] * self.node_repulsion / (dist_sq * np.sqrt(dist_sq))
+        push = delta * magnitude[:, None]
+        return np.column_stack([np.bincount(src, weights=push[:, axis], minlength=n) for axis in (0, 1)])
+    
+    def _near_field(self, pos: 'np.ndarray', unit: 'np.ndarray', widths: 'np.ndarray', level: int) -> 'np.ndarray':
+        """가장 깊은 레벨에서 자신과 인접한 셀(3x3)의 노드 쌍 척력 (직접 계산)"""
+        n = len(pos)
+        grid = 1 << level
+        cells = self._cell_coords(unit, level)
+        cell_ids = cells[:, 1] * grid + cells[:, 0]
+        order = np.argsort(cell_ids, kind='stable')
+        sorted_ids = cell_ids[order]
+        
+        forces = np.zeros_like(pos)
+        for ox in (-1, 0, 1):
+            for oy in (-1, 0, 1):
+                nx = cells[:, 0] + ox
+                ny = cells[:, 1] + oy
+                inside = (nx >= 0) & (nx < grid) & (ny >= 0) & (ny < grid)
+                neighbor_ids = np.where(inside, ny * grid + nx, -1)
+                lo = np.searchsorted(sorted_ids, neighbor_ids, side='left')
+                hi = np.searchsorted(sorted_ids, neighbor_ids, side='right')
+                counts = np.where(inside, hi - lo, 0)
+                total = int(counts.sum())
+                if total == 0:
+                    continue
+                src = np.repeat(np.arange(n), counts)
+                within = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+                dst = order[np.repeat(lo, counts) + within]
+                keep = src != dst
+                src, dst = src[keep], dst[keep]
+                push = self._pair_repulsion(pos[src] - pos[dst], widths[src] + widths[dst])
+                for axis in (0, 1):
+                    forces[:, axis] += np.bincount(src, weights=push[:, axis], minlength=n)
+        return forces
     
     def _calculate_node_width(self, node: Dict) -> float:
         """노드 너비 계산"""
@@ -369,17 +490,39 @@ class CollisionDetector:
         self.padding = padding
     
     def detect_collisions(self, positions: Dict[str, NodePosition]) -> List[Tuple[str, str]]:
-        """노드 간 겹침 감지"""
-        collisions = []
+        """
+        노드 간 겹침 감지
+        공간 격자에 노드 경계(패딩 포함)를 등록하고 같은 셀을 공유하는 노드 쌍만 검사합니다.
+        결과 순서는 노드 쌍 전수 검사와 같습니다(입력 순서 기준 (i, j), i < j).
+        """
         node_ids = list(positions.keys())
+        if len(node_ids) < 2:
+            return []
+        
+        nodes = [positions[node_id] for node_id in node_ids]
+        # 셀 크기: 평균 노드 크기(패딩 포함). 큰 노드는 여러 셀에 등록됨
+        cell_size = max(
+            sum(max(n.width, n.height) for n in nodes) / len(nodes) + self.padding * 2,
+            1.0
+        )
+        
+        grid: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        for index, node in enumerate(nodes):
+            left, right, top, bottom = self._bounds(node)
+            for cx in range(math.floor(left / cell_size), math.floor(right / cell_size) + 1):
+                for cy in range(math.floor(top / cell_size), math.floor(bottom / cell_size) + 1):
+                    grid[(cx, cy)].append(index)
+        
+        candidates = set()
+        for members in grid.values():
+            for a in range(len(members)):
+                for b in range(a + 1, len(members)):
+                    candidates.add((members[a], members[b]))
         
-        for i in range(len(node_ids)):
-            for j in range(i + 1, len(node_ids)):
-                node1_id = node_ids[i]
-                node2_id = node_ids[j]
-                
-                if self._nodes_overlap(positions[node1_id], positions[node2_id]):
-                    collisions.append((node1_id, node2_id))
+        collisions = []
+        for i, j in sorted(candidates):
+            if self._nodes_overlap(nodes[i], nodes[j]):
+                collisions.append((node_ids[i], node_ids[j]))
         
         return collisions
     
@@ -401,18 +544,18 @@ class CollisionDetector:
         
         return positions
     
+    def _bounds(self, node: NodePosition) -> Tuple[float, float, float, float]:
+        """노드 경계 (left, right, top, bottom, 패딩 포함)"""
+        return (node.x - node.width/2 - self.padding,
+                node.x + node.width/2 + self.padding,
+                node.y - node.height/2 - self.padding,
+                node.y + node.height/2 + self.padding)
+    
     def _nodes_overlap(self, node1: NodePosition, node2: NodePosition) -> bool:
         """두 노드가 겹치는지 확인"""
         # 노드 경계 계산 (패딩 포함)
-        left1 = node1.x - node1.width/2 - self.padding
-        right1 = node1.x + node1.width/2 + self.padding
-        top1 = node1.y - node1.height/2 - self.padding
-        bottom1 = node1.y + node1.height/2 + self.padding
-        
-        left2 = node2.x - node2.width/2 - self.padding
-        right2 = node2.x + node2.width/2 + self.padding
-        top2 = node2.y - node2.height/2 - self.padding
-        bottom2 = node2.y + node2.height/2 + self.padding
+        left1, right1, top1, bottom1 = self._bounds(node1)
+        left2, right2, top2, bottom2 = self._bounds(node2)
         
         # 겹침 확인
         return not (right1 < left2 or right2 < left1 or bottom1 < top2 or bottom2 < top1)